@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class ChatConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'chat'
+
+    def ready(self):
+        from pdnportal.cache import track_model_versions
+        from .models import Chat, ChatMember, Message, MessageRead, Reaction
+
+        track_model_versions(Chat, ChatMember, Message, MessageRead, Reaction)
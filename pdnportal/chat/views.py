@@ -12,6 +12,15 @@ from .models import Chat, Contact, Message, ChatFile, ChatMember, Reaction, Mess
 import json
 import os
 import datetime
+from pdnportal.cache import conditional_etag
+
+CHAT_CHANGE_MODELS = ['chat.chat', 'chat.chatmember', 'chat.message', 'chat.messageread', 'chat.reaction']
+
+
+def online_status_window(request):
+    # Online status is refreshed on every request and is not versioned, let it go stale for a minute at most
+    return timezone.now().strftime('%Y%m%d%H%M')
+
 
 # HTML Views
 @login_required
@@ -32,6 +41,7 @@ def chat_view(request):
 
 @login_required
 @require_GET
+@conditional_etag(CHAT_CHANGE_MODELS, vary=online_status_window)
 def get_chats(request):
     # Store the request in the get_user_online_status function
     get_user_online_status.request = request
@@ -41,6 +51,7 @@ def get_chats(request):
 
 @login_required
 @require_GET
+@conditional_etag(CHAT_CHANGE_MODELS, vary=online_status_window)
 def get_chat(request, chat_id):
     try:
         # Store the request in the get_user_online_status function
@@ -1,6 +1,5 @@
 from django.contrib import admin
-from .models import DCF, DCFApprovalTimeline, DCFNumberSetting
+from .models import DCF, DCFApprovalTimeline
 
 admin.site.register(DCF)
-admin.site.register(DCFApprovalTimeline)
-admin.site.register(DCFNumberSetting)
+admin.site.register(DCFApprovalTimeline)
\ No newline at end of file
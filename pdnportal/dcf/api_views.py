@@ -3,8 +3,10 @@ from django.db.models import Count
 from django.utils import timezone
 from datetime import timedelta
 from .models import DCF
+from pdnportal.cache import cached_aggregate
 import json
 
+@cached_aggregate('dcf', ['dcf.dcf'])
 def get_requestor_chart_data(request, period='6month'):
     """
     Get chart data for DCF requestor dashboard
@@ -172,6 +174,7 @@ def get_requestor_chart_data(request, period='6month'):
 
     return JsonResponse(response_data)
 
+@cached_aggregate('dcf', ['dcf.dcf'], scope='global')
 def get_approver_chart_data(request, period='6month'):  # request param used in real implementation
     """
     Get chart data for DCF approver dashboard
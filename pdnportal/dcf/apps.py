@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class DcfConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'dcf'
+
+    def ready(self):
+        from pdnportal.cache import track_model_versions
+        from .models import DCF
+
+        track_model_versions(DCF)
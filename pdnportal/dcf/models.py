@@ -1,23 +1,10 @@
 from django.db import models
 from django.utils import timezone
 from portalusers.models import Users
+from settings.sequences import next_value
 
-class DCFNumberSetting(models.Model):
-    current_number = models.PositiveIntegerField(default=1000)
-    prefix = models.CharField(max_length=10, default="DCF-")
-    
-    def __str__(self):
-        return f"{self.prefix}{self.current_number}"
-    
-    def generate_next_number(self):
-        self.current_number += 1
-        self.save()
-        return f"{self.prefix}{self.current_number-1}"
-    
-    class Meta:
-        verbose_name = "DCF Number Setting"
-        verbose_name_plural = "DCF Number Settings"
-
+DCF_NUMBER_PREFIX = "DCF-"
+DCF_NUMBER_START = 1000
 
 class DCF(models.Model):
     STATUS_CHOICES = [
@@ -55,8 +42,7 @@ class DCF(models.Model):
     
     def save(self, *args, **kwargs):
         if not self.dcf_number:
-            dcf_number_setting, created = DCFNumberSetting.objects.get_or_create(pk=1)
-            self.dcf_number = dcf_number_setting.generate_next_number()
+            self.dcf_number = f"{DCF_NUMBER_PREFIX}{next_value('dcf', start=DCF_NUMBER_START - 1)}"
         super().save(*args, **kwargs)
     
     def get_current_approval_step(self):
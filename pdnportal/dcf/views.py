@@ -8,10 +8,11 @@ from django.views.decorators.http import require_POST
 from django.core.paginator import Paginator
 from django.db import transaction
 
-from .models import DCF, DCFApprovalTimeline, DCFNumberSetting
+from .models import DCF, DCFApprovalTimeline
 from .forms import DCFForm, DCFApprovalForm
 from portalusers.models import Users
 from .utils import retry_on_db_lock
+from pdnportal.cache import cached_aggregate, conditional_etag
 
 import datetime
 import json
@@ -330,6 +331,8 @@ def reject_dcf(request, pk):
 #  API endpoints for charts and statistics 
 
 @login_required(login_url="user-login")
+@conditional_etag(['dcf.dcf'])
+@cached_aggregate('dcf', ['dcf.dcf'])
 def dcf_stats_chart(request):
     if not check_dcf_user(request.user):
         return JsonResponse({'error': 'Permission denied'}, status=403)
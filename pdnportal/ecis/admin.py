@@ -1,5 +1,4 @@
 from django.contrib import admin
-from .models import ECIS, CategoryCounter     
+from .models import ECIS
 
 admin.site.register(ECIS)
-admin.site.register(CategoryCounter)
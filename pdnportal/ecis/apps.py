@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class EcisConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'ecis'
+
+    def ready(self):
+        from pdnportal.cache import track_model_versions
+        from .models import ECIS
+
+        track_model_versions(ECIS)
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.3 on 2026-10-19 11:25
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ecis', '0004_delete_facilitatorremark'),
+        ('settings', '0003_seed_sequences'),
+    ]
+
+    operations = [
+        migrations.DeleteModel(
+            name='CategoryCounter',
+        ),
+    ]
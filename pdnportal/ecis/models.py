@@ -44,15 +44,3 @@ class ECIS(models.Model):
         verbose_name = "ECIS"
         verbose_name_plural = "ECIS"
         ordering = ['-last_updated']
-
-
-class CategoryCounter(models.Model):
-    category = models.CharField(max_length=2, unique=True)
-    current_sequence = models.PositiveIntegerField(default=1)
-    year = models.CharField(max_length=2)
-
-    def __str__(self):
-        return f"{self.category} - {self.year} - {self.current_sequence}"
-
-    class Meta:
-        unique_together = ('category', 'year')
\ No newline at end of file
@@ -1,23 +1,8 @@
 from django.utils import timezone
-from .models import CategoryCounter, ECIS
+from settings.sequences import next_value, YEARLY
 
 def generate_ecis_number(category_code):
-    year = timezone.now().strftime('%y')
-    
-    counter, created = CategoryCounter.objects.get_or_create(
-        category=category_code,
-        year=year,
-        defaults={'current_sequence': 1}
-    )
-    
-    if not created and counter.year != year:
-        counter.year = year
-        counter.current_sequence = 1
-        counter.save()
-    
-    ecis_number = f"{category_code}-{year}-{counter.current_sequence:03d}"
-    
-    counter.current_sequence += 1
-    counter.save()
-    
-    return ecis_number
\ No newline at end of file
+    today = timezone.localdate()
+    sequence = next_value(f'ecis.{category_code}', reset=YEARLY, day=today)
+
+    return f"{category_code}-{today.strftime('%y')}-{sequence:03d}"
\ No newline at end of file
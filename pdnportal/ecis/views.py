@@ -9,6 +9,7 @@ from dateutil.relativedelta import relativedelta
 import calendar
 from .models import ECIS
 from .forms import ECISForm, FacilitatorReviewForm, CancelRequestForm
+from pdnportal.cache import cached_aggregate
 
 # Requestor Views
 @login_required(login_url="user-login")
@@ -266,6 +267,7 @@ def ecis_review(request, pk):
     return JsonResponse({'status': 'error', 'message': 'Invalid request method'}, status=405)
 
 @login_required(login_url="user-login")
+@cached_aggregate('ecis', ['ecis.ecis'], scope='global')
 def ecis_chart_data(request):
     period = request.GET.get('period', '6month')
 
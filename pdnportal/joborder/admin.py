@@ -1,9 +1,7 @@
 from django.contrib import admin
-from .models import GreenControlNumber, YellowControlNumber, WhiteControlNumber, OrangeControlNumber, JOLogsheet, JORouting
+from .models import JOLogsheet, JORouting, ArchivedJOLogsheet, ArchivedJORouting
 
-admin.site.register(GreenControlNumber)
-admin.site.register(WhiteControlNumber)
-admin.site.register(YellowControlNumber)
-admin.site.register(OrangeControlNumber)
 admin.site.register(JOLogsheet)
 admin.site.register(JORouting)
+admin.site.register(ArchivedJOLogsheet)
+admin.site.register(ArchivedJORouting)
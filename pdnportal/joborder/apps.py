@@ -4,3 +4,12 @@ from django.apps import AppConfig
 class JoborderConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'joborder'
+
+    def ready(self):
+        from django.db.models.signals import post_migrate
+        from pdnportal.cache import track_model_versions
+        from .models import JOLogsheet, JORouting
+        from .search import ensure_search_index
+
+        track_model_versions(JOLogsheet, JORouting)
+        post_migrate.connect(ensure_search_index, sender=self)
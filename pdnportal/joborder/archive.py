@@ -0,0 +1,71 @@
+"""
+Archival of finished job orders.
+
+Closed and Cancelled job orders older than JO_ARCHIVE_AFTER_DAYS are moved,
+with their routing entries, from JOLogsheet/JORouting into the archive tables
+by `manage.py archive_job_orders`. The live tables then only hold recent and
+open work, which is what the dashboards and queues read. Archived job orders
+keep their ids and stay readable through the detail and export views.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from pdnportal.cache import bump_model_version
+from .models import JOLogsheet, JORouting, ArchivedJOLogsheet, ArchivedJORouting
+
+ARCHIVED_STATUSES = ('Closed', 'Cancelled')
+
+
+def copied_fields(archive_model):
+    """Columns an archive model shares with its live model, by attname (e.g. 'line_id')."""
+    return [field.attname for field in archive_model._meta.concrete_fields if field.name != 'archived_at']
+
+
+def archive_cutoff(days=None):
+    days = settings.JO_ARCHIVE_AFTER_DAYS if days is None else days
+    return timezone.now() - timedelta(days=days)
+
+
+def archivable_job_orders(cutoff):
+    return JOLogsheet.objects.filter(status__in=ARCHIVED_STATUSES, date_created__lt=cutoff)
+
+
+@transaction.atomic
+def archive_job_orders(ids):
+    """
+    Move the job orders `ids` and their routing entries into the archive tables.
+
+    Job orders that are no longer Closed or Cancelled are left where they are.
+    Returns (job orders moved, routing entries moved).
+    """
+    job_orders = list(
+        JOLogsheet.objects.select_for_update()
+        .filter(id__in=ids, status__in=ARCHIVED_STATUSES)
+        .values(*copied_fields(ArchivedJOLogsheet))
+    )
+    if not job_orders:
+        return 0, 0
+    moved_ids = [job_order['id'] for job_order in job_orders]
+    routings = JORouting.objects.filter(jo_number_id__in=moved_ids).values(*copied_fields(ArchivedJORouting))
+
+    ArchivedJOLogsheet.objects.bulk_create([ArchivedJOLogsheet(**job_order) for job_order in job_orders])
+    archived_routings = ArchivedJORouting.objects.bulk_create([ArchivedJORouting(**routing) for routing in routings])
+
+    JORouting.objects.filter(jo_number_id__in=moved_ids).delete()
+    JOLogsheet.objects.filter(id__in=moved_ids).delete()
+    bump_model_version(JOLogsheet)
+    bump_model_version(JORouting)
+    return len(job_orders), len(archived_routings)
+
+
+def find_job_order(jo_id):
+    """The live job order `jo_id`, or its archived copy; raises JOLogsheet.DoesNotExist if neither exists."""
+    job_order = JOLogsheet.objects.select_related('line', 'prepared_by', 'in_charge').filter(id=jo_id).first()
+    if job_order is None:
+        job_order = ArchivedJOLogsheet.objects.select_related('line', 'prepared_by', 'in_charge').filter(id=jo_id).first()
+    if job_order is None:
+        raise JOLogsheet.DoesNotExist(f'Job order {jo_id} does not exist')
+    return job_order
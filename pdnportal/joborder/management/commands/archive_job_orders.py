@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+
+from joborder.archive import archivable_job_orders, archive_cutoff, archive_job_orders
+
+
+class Command(BaseCommand):
+    help = 'Move Closed and Cancelled job orders older than JO_ARCHIVE_AFTER_DAYS, with their routing, to the archive tables'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=None,
+                            help='Archive job orders created more than this many days ago (default JO_ARCHIVE_AFTER_DAYS)')
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help='Job orders moved per transaction (default 500)')
+        parser.add_argument('--dry-run', action='store_true', help='Only report how many job orders would be archived')
+
+    def handle(self, *args, **options):
+        cutoff = archive_cutoff(options['days'])
+        queryset = archivable_job_orders(cutoff)
+
+        if options['dry_run']:
+            self.stdout.write(f'{queryset.count()} job orders created before {cutoff:%Y-%m-%d} would be archived')
+            return
+
+        # Each batch is its own transaction, so the write lock is released between batches
+        # and an interrupted run keeps what it already moved
+        job_order_count = routing_count = 0
+        while True:
+            ids = list(queryset.order_by('id').values_list('id', flat=True)[:options['batch_size']])
+            if not ids:
+                break
+            moved, routings = archive_job_orders(ids)
+            if not moved:
+                break
+            job_order_count += moved
+            routing_count += routings
+            self.stdout.write(f'Archived {job_order_count} job orders so far')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Archived {job_order_count} job orders and {routing_count} routing entries created before {cutoff:%Y-%m-%d}'))
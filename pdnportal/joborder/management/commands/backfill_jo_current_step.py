@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from joborder.models import JOLogsheet
+from joborder.utils import backfill_current_step
+
+
+class Command(BaseCommand):
+    help = 'Populate the current step, approver and SLA columns of job orders from their routing'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='Rows per bulk update (default 500)')
+        parser.add_argument('--only-missing', action='store_true',
+                            help='Only fill job orders still in routing that have no current step yet')
+
+    def handle(self, *args, **options):
+        queryset = JOLogsheet.objects.all()
+        if options['only_missing']:
+            queryset = queryset.filter(current_step__isnull=True, joRouting__status='Processing').distinct()
+
+        with transaction.atomic():
+            updated = backfill_current_step(queryset, options['batch_size'])
+
+        self.stdout.write(self.style.SUCCESS(f'Updated the current step of {updated} job orders'))
@@ -0,0 +1,45 @@
+# Generated by Django 5.0.3 on 2026-10-19 11:21
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('joborder', '0017_jologsheet_line'),
+        ('settings', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jologsheet',
+            name='current_approver',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='joCurrentlyHeld', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='jologsheet',
+            name='current_step',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='jologsheet',
+            name='step_due_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='jologsheet',
+            name='step_entered_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='jologsheet',
+            index=models.Index(fields=['current_approver', 'current_step'], name='jo_current_holder_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jologsheet',
+            index=models.Index(fields=['current_step', 'step_due_at'], name='jo_current_due_idx'),
+        ),
+    ]
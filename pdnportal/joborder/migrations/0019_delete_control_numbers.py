@@ -0,0 +1,38 @@
+# Generated by Django 5.0.3 on 2026-10-19 11:25
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('joborder', '0018_jologsheet_current_step'),
+        ('settings', '0003_seed_sequences'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='orangecontrolnumber',
+            name='prepared_by',
+        ),
+        migrations.RemoveField(
+            model_name='whitecontrolnumber',
+            name='prepared_by',
+        ),
+        migrations.RemoveField(
+            model_name='yellowcontrolnumber',
+            name='prepared_by',
+        ),
+        migrations.DeleteModel(
+            name='GreenControlNumber',
+        ),
+        migrations.DeleteModel(
+            name='OrangeControlNumber',
+        ),
+        migrations.DeleteModel(
+            name='WhiteControlNumber',
+        ),
+        migrations.DeleteModel(
+            name='YellowControlNumber',
+        ),
+    ]
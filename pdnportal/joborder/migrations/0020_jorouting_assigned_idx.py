@@ -0,0 +1,19 @@
+# Generated by Django 5.0.3 on 2026-10-19 11:53
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('joborder', '0019_delete_control_numbers'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='jorouting',
+            index=models.Index(fields=['approver', 'approver_sequence', '-request_at', '-id'], name='jo_routing_assigned_idx'),
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.0.3 on 2026-10-19 11:59
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('joborder', '0021_jologsheet_search_index'),
+        ('settings', '0004_backgroundjob'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedJOLogsheet',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('jo_number', models.CharField(max_length=50, null=True)),
+                ('requestor', models.CharField(max_length=100, null=True)),
+                ('jo_type', models.CharField(max_length=100, null=True)),
+                ('jo_tools', models.CharField(max_length=100, null=True)),
+                ('jo_color', models.CharField(max_length=100, null=True)),
+                ('details', models.TextField(null=True)),
+                ('status', models.CharField(choices=[('Routing', 'Routing'), ('Completed', 'Completed'), ('Checked', 'Checked'), ('Cancelled', 'Cancelled'), ('Closed', 'Closed'), ('Rejected', 'Rejected')], max_length=50)),
+                ('action_taken', models.TextField(null=True)),
+                ('date_created', models.DateTimeField()),
+                ('date_received', models.DateTimeField(null=True)),
+                ('target_date', models.DateTimeField(blank=True, null=True)),
+                ('target_date_reason', models.TextField(blank=True, null=True)),
+                ('date_complete', models.DateTimeField(null=True)),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('in_charge', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('line', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='settings.line')),
+                ('prepared_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ArchivedJORouting',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('first_approver', models.BooleanField(default=False)),
+                ('approver_sequence', models.IntegerField(null=True)),
+                ('status', models.CharField(max_length=50)),
+                ('remarks', models.TextField(blank=True)),
+                ('request_at', models.DateTimeField()),
+                ('approved_at', models.DateTimeField(null=True)),
+                ('approver', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('jo_number', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='joRouting', to='joborder.archivedjologsheet')),
+                ('jo_request', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='archivedjologsheet',
+            index=models.Index(fields=['date_created'], name='jo_archive_created_idx'),
+        ),
+    ]
@@ -2,30 +2,6 @@ from django.db import models
 from portalusers.models import Users, UserApprovers
 from settings.models import Line
 
-class GreenControlNumber(models.Model):
-    prepared_by = models.ForeignKey(Users, on_delete=models.SET_NULL, null=True, related_name='greenJoPreparer')
-
-    def __str__(self):
-        return f'{self.prepared_by}'
-
-class YellowControlNumber(models.Model):
-    prepared_by = models.ForeignKey(Users, on_delete=models.SET_NULL, null=True, related_name='yellowJoPreparer')
-
-    def __str__(self):
-        return f'{self.prepared_by}'
-
-class WhiteControlNumber(models.Model):
-    prepared_by = models.ForeignKey(Users, on_delete=models.SET_NULL, null=True, related_name='whiteJoPreparer')
-
-    def __str__(self):
-        return f'{self.prepared_by}'
-
-class OrangeControlNumber(models.Model):
-    prepared_by = models.ForeignKey(Users, on_delete=models.SET_NULL, null=True, related_name='orangeJoPreparer')
-
-    def __str__(self):
-        return f'{self.prepared_by}'
-
 class JOLogsheet(models.Model):
     STATUS_CHOICES = [
         ('Routing', 'Routing'),
@@ -52,6 +28,18 @@ class JOLogsheet(models.Model):
     target_date_reason = models.TextField(null=True, blank=True)
     date_complete = models.DateTimeField(null=True)
 
+    # Where the request currently sits in the routing, kept in sync by every workflow action
+    current_step = models.IntegerField(null=True, blank=True)
+    current_approver = models.ForeignKey(Users, on_delete=models.SET_NULL, null=True, blank=True, related_name='joCurrentlyHeld')
+    step_entered_at = models.DateTimeField(null=True, blank=True)
+    step_due_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['current_approver', 'current_step'], name='jo_current_holder_idx'),
+            models.Index(fields=['current_step', 'step_due_at'], name='jo_current_due_idx'),
+        ]
+
     def __str__(self):
         return f'{self.prepared_by} - {self.jo_number}'
 
@@ -66,5 +54,61 @@ class JORouting(models.Model):
     request_at = models.DateTimeField(auto_now_add=True)
     approved_at = models.DateTimeField(null=True)
 
+    class Meta:
+        indexes = [
+            # A technician's assignments newest first, read a page at a time
+            models.Index(fields=['approver', 'approver_sequence', '-request_at', '-id'], name='jo_routing_assigned_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.jo_number.jo_number} - {self.approver}'
+
+
+class ArchivedJOLogsheet(models.Model):
+    """
+    A Closed or Cancelled job order moved out of JOLogsheet by `manage.py archive_job_orders`.
+
+    Rows keep their JOLogsheet id, so detail links to an archived job order keep working.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    jo_number = models.CharField(max_length=50, null=True)
+    prepared_by = models.ForeignKey(Users, on_delete=models.SET_NULL, null=True, related_name='+')
+    requestor = models.CharField(max_length=100, null=True)
+    jo_type = models.CharField(max_length=100, null=True)
+    jo_tools = models.CharField(max_length=100, null=True)
+    jo_color = models.CharField(max_length=100, null=True)
+    line = models.ForeignKey(Line, on_delete=models.SET_NULL, null=True, related_name='+')
+    details = models.TextField(null=True)
+    status = models.CharField(max_length=50, choices=JOLogsheet.STATUS_CHOICES)
+    action_taken = models.TextField(null=True)
+    in_charge = models.ForeignKey(Users, on_delete=models.SET_NULL, null=True, related_name='+')
+    date_created = models.DateTimeField()
+    date_received = models.DateTimeField(null=True)
+    target_date = models.DateTimeField(null=True, blank=True)
+    target_date_reason = models.TextField(null=True, blank=True)
+    date_complete = models.DateTimeField(null=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['date_created'], name='jo_archive_created_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.prepared_by} - {self.jo_number}'
+
+class ArchivedJORouting(models.Model):
+    """A routing entry of an archived job order, under its original JORouting id."""
+    id = models.BigIntegerField(primary_key=True)
+    jo_number = models.ForeignKey(ArchivedJOLogsheet, on_delete=models.CASCADE, related_name='joRouting')
+    jo_request = models.ForeignKey(Users, on_delete=models.SET_NULL, null=True, related_name='+')
+    approver = models.ForeignKey(Users, on_delete=models.SET_NULL, null=True, related_name='+')
+    first_approver = models.BooleanField(default=False)
+    approver_sequence = models.IntegerField(null=True)
+    status = models.CharField(max_length=50)
+    remarks = models.TextField(blank=True)
+    request_at = models.DateTimeField()
+    approved_at = models.DateTimeField(null=True)
+
     def __str__(self):
         return f'{self.jo_number.jo_number} - {self.approver}'
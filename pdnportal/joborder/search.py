@@ -0,0 +1,127 @@
+"""
+Indexed search over job orders.
+
+On SQLite the searchable columns of JOLogsheet are mirrored into an FTS5 table
+(joborder_search) with the trigram tokenizer, kept current by triggers on
+joborder_jologsheet. A trigram match answers the same case-insensitive
+substring search the queues used to run as icontains ORs, without scanning
+every job order. On PostgreSQL the columns get pg_trgm GIN indexes instead,
+which serve the icontains lookups directly; other databases scan.
+
+The index is created by migration 0021. Django rebuilds a SQLite table when a
+later migration alters it, which drops the triggers, so ensure_search_index()
+re-creates them after every migrate.
+"""
+from django.db import connections
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+SEARCH_FIELDS = ('jo_number', 'requestor', 'jo_tools', 'jo_type', 'details')
+# The trigram tokenizer cannot match a term shorter than three characters
+MIN_INDEXED_LENGTH = 3
+
+SEARCH_TABLE = 'joborder_search'
+SOURCE_TABLE = 'joborder_jologsheet'
+
+_columns = ', '.join(SEARCH_FIELDS)
+_new_values = ', '.join(f'new.{field}' for field in SEARCH_FIELDS)
+_old_values = ', '.join(f'old.{field}' for field in SEARCH_FIELDS)
+
+SQLITE_TRIGGERS = {
+    'joborder_search_insert': f"""
+        CREATE TRIGGER IF NOT EXISTS joborder_search_insert AFTER INSERT ON {SOURCE_TABLE} BEGIN
+            INSERT INTO {SEARCH_TABLE}(rowid, {_columns}) VALUES (new.id, {_new_values});
+        END""",
+    'joborder_search_delete': f"""
+        CREATE TRIGGER IF NOT EXISTS joborder_search_delete AFTER DELETE ON {SOURCE_TABLE} BEGIN
+            INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, {_columns}) VALUES ('delete', old.id, {_old_values});
+        END""",
+    'joborder_search_update': f"""
+        CREATE TRIGGER IF NOT EXISTS joborder_search_update AFTER UPDATE OF {_columns} ON {SOURCE_TABLE} BEGIN
+            INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, {_columns}) VALUES ('delete', old.id, {_old_values});
+            INSERT INTO {SEARCH_TABLE}(rowid, {_columns}) VALUES (new.id, {_new_values});
+        END""",
+}
+
+
+def _sqlite_objects(cursor, kind):
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = %s", [kind])
+    return {row[0] for row in cursor.fetchall()}
+
+
+def _install_triggers(cursor):
+    """Create any missing trigger; the index is rebuilt if one was missing since it may have missed changes."""
+    missing = set(SQLITE_TRIGGERS) - _sqlite_objects(cursor, 'trigger')
+    for name in missing:
+        cursor.execute(SQLITE_TRIGGERS[name])
+    if missing:
+        cursor.execute(f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('rebuild')")
+    return missing
+
+
+def install_search_index(connection):
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            cursor.execute(f"""
+                CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5(
+                    {_columns}, content='{SOURCE_TABLE}', content_rowid='id', tokenize='trigram'
+                )""")
+            _install_triggers(cursor)
+        elif connection.vendor == 'postgresql':
+            cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+            for field in SEARCH_FIELDS:
+                # Same expression Django compiles icontains to, so the planner can use the index
+                cursor.execute(
+                    f'CREATE INDEX IF NOT EXISTS jo_search_{field}_trgm ON {SOURCE_TABLE} '
+                    f'USING gin (UPPER("{field}"::text) gin_trgm_ops)'
+                )
+
+
+def remove_search_index(connection):
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            for name in SQLITE_TRIGGERS:
+                cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+            cursor.execute(f"DROP TABLE IF EXISTS {SEARCH_TABLE}")
+        elif connection.vendor == 'postgresql':
+            for field in SEARCH_FIELDS:
+                cursor.execute(f"DROP INDEX IF EXISTS jo_search_{field}_trgm")
+
+
+def ensure_search_index(sender, using='default', **kwargs):
+    """post_migrate handler, puts back triggers a table rebuild dropped."""
+    connection = connections[using]
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        if SEARCH_TABLE in _sqlite_objects(cursor, 'table'):
+            _install_triggers(cursor)
+
+
+def fts_phrase(text):
+    """Quote `text` as one FTS5 phrase so operators and punctuation in it are matched literally."""
+    return '"' + text.replace('"', '""') + '"'
+
+
+def search_filter(text, prefix=''):
+    """
+    Q for the job orders whose searchable columns contain `text`.
+
+    Args:
+        text: The search box value, matched case-insensitively as a substring.
+        prefix: Path from the queried model to JOLogsheet, e.g. 'jo_number__'
+            when filtering JORouting.
+    """
+    text = text.strip()
+    if not text:
+        return Q()
+
+    connection = connections['default']
+    if connection.vendor == 'sqlite' and len(text) >= MIN_INDEXED_LENGTH:
+        matches = RawSQL(f"SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s", (fts_phrase(text),))
+        return Q(**{f'{prefix}id__in': matches})
+
+    condition = Q()
+    for field in SEARCH_FIELDS:
+        condition |= Q(**{f'{prefix}{field}__icontains': text})
+    return condition
@@ -1,3 +1,229 @@
-from django.test import TestCase
+import io
+import json
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+import openpyxl
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, RequestFactory
+from django.urls import reverse
+from django.utils import timezone
+
+from portalusers.models import Users
+from settings.models import Line
+from .models import JOLogsheet, JORouting, ArchivedJOLogsheet, ArchivedJORouting
+from .search import search_filter
+from .utils import set_current_step, MAINTENANCE_STEP
+from . import views
+
+
+class DashboardFeedQueryBudgetTests(TestCase):
+    """The dashboard feeds must run a fixed number of queries however many job orders are open."""
+
+    @classmethod
+    def setUpTestData(cls):
+        line = Line.objects.create(line_name='Line 1')
+        requestor = Users.objects.create(username='requestor', name='Requestor', line=line)
+        cls.staff = [
+            Users.objects.create(username=f'maintenance{i}', name=f'Maintenance {i}', job_order_maintenance=True)
+            for i in range(2)
+        ]
+
+        now = timezone.now()
+        for i in range(8):
+            in_charge = cls.staff[i % 2]
+            job_order = JOLogsheet.objects.create(
+                jo_number=f'G-{i + 1:04}', prepared_by=requestor, requestor='Requestor', jo_type='repair',
+                jo_tools='Jig', jo_color='Green', line=line, in_charge=in_charge,
+                target_date=now + timedelta(days=i - 3))
+            routing = JORouting.objects.create(
+                jo_number=job_order, jo_request=requestor, approver=in_charge,
+                approver_sequence=MAINTENANCE_STEP, status='Processing')
+            set_current_step(job_order, routing)
+
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+
+    def get(self, view, *args):
+        request = self.factory.get('/')
+        request.user = self.staff[0]
+        return view(request, *args)
+
+    def test_timeline_runs_one_query(self):
+        for view_type in ('timeline-today', 'timeline-week', 'timeline-month'):
+            with self.assertNumQueries(1):
+                response = self.get(views.job_order_timeline_api, view_type)
+            self.assertEqual(response.status_code, 200)
+
+    def test_deadlines_runs_one_query(self):
+        with self.assertNumQueries(1):
+            response = self.get(views.job_order_deadlines_api)
+        self.assertEqual(response.status_code, 200)
+
+    def test_alerts_run_two_queries(self):
+        with self.assertNumQueries(2):
+            response = self.get(views.job_order_alerts_api)
+        self.assertContains(response, 'Resource Bottleneck: Maintenance 0')
+
+    def test_upcoming_deadlines_runs_one_query(self):
+        with self.assertNumQueries(1):
+            response = self.get(views.get_upcoming_deadlines)
+        self.assertEqual(sum(json.loads(response.content)['datasets'][0]['data']), 4)
+
+    def test_charts_run_one_query(self):
+        for period in ('3month', '6month', '1year'):
+            with self.assertNumQueries(1):
+                response = self.get(views.approver_job_order_chart_data, period)
+            self.assertEqual(sum(json.loads(response.content)['green']), 4)
+
+        request = self.factory.get('/', {'period': '3month'})
+        request.user = self.staff[0]
+        with self.assertNumQueries(1):
+            response = views.job_order_analytics(request)
+        data = json.loads(response.content)
+        self.assertEqual(len(data['labels']), 3)
+        self.assertEqual(data['total_by_month'][-1], 8)
+
+    def test_trends_run_one_query(self):
+        for period, buckets in (('month', None), ('quarter', 3), ('year', 12)):
+            request = self.factory.get('/', {'period': period})
+            request.user = self.staff[0]
+            with self.assertNumQueries(1):
+                response = views.get_job_order_trends(request)
+            data = json.loads(response.content)
+            if buckets:
+                self.assertEqual(len(data['labels']), buckets)
+            self.assertEqual(sum(data['datasets'][0]['data']), 4)
+
+    def test_workload_runs_one_query(self):
+        with self.assertNumQueries(1):
+            response = self.get(views.maintenance_workload)
+        workload = {row['name']: row['active_tasks'] for row in json.loads(response.content)['workload_data']}
+        self.assertEqual(workload, {'Maintenance 0': 4, 'Maintenance 1': 4})
+
+    def test_stats_etag_follows_the_snapshot_body(self):
+        url = reverse('job-order-stats-api')
+        first = self.client.get(url)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag']).status_code, 304)
+
+        # A write bumps the version counters, but the snapshot (and so the body) is unchanged until it refreshes
+        routing = JORouting.objects.first()
+        routing.status = 'Approved'
+        routing.save()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag']).status_code, 304)
+
+        cache.delete('snapshot:joborder-stats')
+        refreshed = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(refreshed.status_code, 200)
+        self.assertNotEqual(refreshed['ETag'], first['ETag'])
+        self.assertNotEqual(refreshed.json(), first.json())
+
+    def test_alerts_etag_expires_as_time_passes(self):
+        url = reverse('job-order-alerts-api')
+        now = timezone.now().replace(second=0)
+        with mock.patch('django.utils.timezone.now', return_value=now):
+            first = self.client.get(url)
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag']).status_code, 304)
+
+        # Nothing was written, but a job order may have become overdue since
+        with mock.patch('django.utils.timezone.now', return_value=now + timedelta(minutes=1)):
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag']).status_code, 200)
+
+    def test_assignments_are_keyset_paged(self):
+        seen, cursor = [], None
+        while True:
+            params = {'limit': 3, **({'cursor': cursor} if cursor else {})}
+            request = self.factory.get('/', params)
+            request.user = self.staff[0]
+            with self.assertNumQueries(2):
+                data = json.loads(views.maintenance_job_orders_api(request).content)
+            self.assertEqual(data['total'], 4)
+            seen += [job['jo_number'] for job in data['job_orders']]
+            cursor = data['next_cursor']
+            if not cursor:
+                break
+        self.assertEqual(seen, ['G-0007', 'G-0005', 'G-0003', 'G-0001'])
+
+
+class JobOrderSearchTests(TestCase):
+    """The queue search reads the maintained index, so it must follow inserts, edits and deletes."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.line = Line.objects.create(line_name='Line 1')
+        cls.requestor = Users.objects.create(username='requestor', name='Requestor', line=cls.line)
+        for i in range(12):
+            JOLogsheet.objects.create(
+                jo_number=f'G-{i + 1:04}', prepared_by=cls.requestor, requestor='Juan Dela Cruz',
+                jo_type='Repair', jo_tools='Jig' if i % 2 else 'Fixture', jo_color='Green', line=cls.line,
+                details='Worn locator pin')
+
+    def matches(self, text):
+        return set(JOLogsheet.objects.filter(search_filter(text)).values_list('jo_number', flat=True))
+
+    def test_search_follows_changes(self):
+        self.assertEqual(len(self.matches('fixt')), 6)
+        self.assertEqual(self.matches('G-0012'), {'G-0012'})
+        self.assertEqual(len(self.matches('dela CRUZ')), 12)
+
+        JOLogsheet.objects.filter(jo_number='G-0001').update(jo_tools='Gauge')
+        JOLogsheet.objects.filter(jo_number='G-0003').delete()
+        self.assertEqual(len(self.matches('fixt')), 4)
+        self.assertEqual(self.matches('gauge'), {'G-0001'})
+
+        # Shorter than a trigram, answered without the index
+        self.assertEqual(self.matches('11'), {'G-0011'})
+
+    def test_requestor_table_renders_one_page(self):
+        self.client.force_login(self.requestor)
+
+        response = self.client.get(reverse('requestor-homepage'))
+        self.assertEqual(len(response.context['all_requests']), 10)
+        self.assertEqual(response.context['all_requests'].paginator.count, 12)
+
+        response = self.client.get(reverse('requestor-homepage'), {'search': 'jig', 'page': 2})
+        self.assertEqual(response.context['all_requests'].number, 1)
+        self.assertEqual(response.context['all_requests'].paginator.count, 6)
+        self.assertEqual(response.context['page_query'], 'search=jig')
+
+
+class JobOrderArchiveTests(TestCase):
+    """Old finished job orders leave the live tables but stay readable."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.requestor = Users.objects.create(username='requestor', name='Requestor')
+        cls.approver = Users.objects.create(username='approver', name='Approver')
+        old = timezone.now() - timedelta(days=500)
+        for number, status in (('G-0001', 'Closed'), ('G-0002', 'Cancelled'), ('G-0003', 'Routing'), ('G-0004', 'Closed')):
+            job_order = JOLogsheet.objects.create(
+                jo_number=number, prepared_by=cls.requestor, requestor='Requestor', jo_color='Green', status=status)
+            JORouting.objects.create(jo_number=job_order, jo_request=cls.requestor, approver=cls.approver,
+                                     approver_sequence=1, status='Approved', remarks=f'{number} ok')
+            if number != 'G-0004':
+                JOLogsheet.objects.filter(id=job_order.id).update(date_created=old)
+
+    def test_archive_moves_old_finished_job_orders(self):
+        closed = JOLogsheet.objects.get(jo_number='G-0001')
+        call_command('archive_job_orders', batch_size=1, stdout=io.StringIO())
+
+        self.assertEqual(set(JOLogsheet.objects.values_list('jo_number', flat=True)), {'G-0003', 'G-0004'})
+        self.assertEqual(JORouting.objects.count(), 2)
+        self.assertEqual(set(ArchivedJOLogsheet.objects.values_list('jo_number', flat=True)), {'G-0001', 'G-0002'})
+        self.assertEqual(ArchivedJORouting.objects.get(jo_number_id=closed.id).remarks, 'G-0001 ok')
+
+        self.client.force_login(self.requestor)
+        data = json.loads(self.client.get(reverse('job-order-details', args=[closed.id])).content)
+        self.assertEqual(data['jo_number'], 'G-0001')
+        self.assertTrue(data['is_archived'])
+        self.assertEqual(data['routing'][0]['approver_name'], 'Approver')
+
+        response = self.client.post(reverse('export-job-orders'), {
+            'date_from': (timezone.now() - timedelta(days=600)).strftime('%Y-%m-%d'),
+            'status': 'all', 'category': 'all',
+        })
+        sheet = openpyxl.load_workbook(io.BytesIO(b''.join(response.streaming_content)))['Job Orders']
+        self.assertEqual(sorted(row[1] for row in sheet.iter_rows(min_row=2, values_only=True)),
+                         ['G-0001', 'G-0002', 'G-0003', 'G-0004'])
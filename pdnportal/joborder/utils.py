@@ -0,0 +1,175 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Avg, Count, DurationField, ExpressionWrapper, F, OuterRef, Q, Subquery
+from django.utils import timezone
+
+from pdnportal.charts import bucket_counts, local_midnight, month_starts
+from settings.sequences import next_value
+from .models import JOLogsheet, JORouting
+
+
+JO_NUMBER_PREFIXES = {'green': 'G', 'yellow': 'Y', 'white': 'W', 'orange': 'O'}
+MAINTENANCE_STEP = 6
+CURRENT_STEP_FIELDS = ['current_step', 'current_approver', 'step_entered_at', 'step_due_at']
+
+
+def next_jo_number(category):
+    """Allocate the next control number of a job order category, None for unknown categories."""
+    prefix = JO_NUMBER_PREFIXES.get(category)
+    if not prefix:
+        return None
+    return f'{prefix}-{next_value(f"joborder.{category}"):04}'
+
+
+def step_due_at(job_order, step, entered_at):
+    if step == MAINTENANCE_STEP:
+        return job_order.target_date
+    hours = settings.JO_STEP_SLA_HOURS.get(step)
+    return entered_at + timedelta(hours=hours) if hours and entered_at else None
+
+
+def set_current_step(job_order, routing=None, entered_at=None, save=True):
+    """
+    Point the job order's current-step columns at `routing`, the entry now waiting
+    on its approver, or clear them when the routing has ended.
+
+    `entered_at` defaults to the routing's request time, pass it when an earlier
+    entry is reopened.
+    """
+    if routing is None:
+        job_order.current_step = None
+        job_order.current_approver = None
+        job_order.step_entered_at = None
+        job_order.step_due_at = None
+    else:
+        job_order.current_step = routing.approver_sequence
+        job_order.current_approver_id = routing.approver_id
+        job_order.step_entered_at = entered_at or routing.request_at
+        job_order.step_due_at = step_due_at(job_order, routing.approver_sequence, job_order.step_entered_at)
+
+    if save:
+        job_order.save(update_fields=CURRENT_STEP_FIELDS)
+
+
+def backfill_current_step(queryset, batch_size=500):
+    """Recompute the current-step columns of `queryset` from the routing table. Returns the row count."""
+    processing = JORouting.objects.filter(jo_number=OuterRef('pk'), status='Processing').order_by('-id')
+    rows = queryset.annotate(
+        routing_step=Subquery(processing.values('approver_sequence')[:1]),
+        routing_approver=Subquery(processing.values('approver_id')[:1]),
+        routing_request_at=Subquery(processing.values('request_at')[:1]),
+    ).only('id', 'target_date').order_by('id')
+
+    updated = 0
+    batch = []
+    for job_order in rows.iterator(chunk_size=batch_size):
+        if job_order.routing_step is None:
+            set_current_step(job_order, save=False)
+        else:
+            routing = JORouting(approver_sequence=job_order.routing_step, approver_id=job_order.routing_approver,
+                                request_at=job_order.routing_request_at)
+            set_current_step(job_order, routing, save=False)
+        batch.append(job_order)
+
+        if len(batch) >= batch_size:
+            JOLogsheet.objects.bulk_update(batch, CURRENT_STEP_FIELDS)
+            updated += len(batch)
+            batch = []
+
+    if batch:
+        JOLogsheet.objects.bulk_update(batch, CURRENT_STEP_FIELDS)
+        updated += len(batch)
+    return updated
+
+
+def resolution_days(duration):
+    return duration.total_seconds() / 86400 if duration is not None else None
+
+
+def compute_job_order_stats():
+    """Overall dashboard stats in two aggregate queries, one per table."""
+    now = timezone.now()
+    today = timezone.localtime(now).replace(hour=0, minute=0, second=0, microsecond=0)
+    thirty_days_ago = today - timedelta(days=30)
+    sixty_days_ago = today - timedelta(days=60)
+    last_period = Q(jo_number__date_created__gte=thirty_days_ago)
+    prev_period = Q(jo_number__date_created__range=[sixty_days_ago, thirty_days_ago])
+    completed = Q(status='Approved', approved_at__isnull=False)
+
+    routing = JORouting.objects.filter(approver__job_order_maintenance=True).aggregate(
+        active=Count('id', filter=Q(status='Processing')),
+        prev_active=Count('id', filter=Q(status='Processing', request_at__range=[sixty_days_ago, thirty_days_ago])),
+        completed=Count('id', filter=completed & last_period),
+        prev_completed=Count('id', filter=completed & prev_period),
+        overdue=Count('id', filter=Q(status='Pending', jo_number__target_date__lt=now)),
+        prev_overdue=Count('id', filter=Q(status='Pending', jo_number__target_date__lt=sixty_days_ago,
+                                          request_at__lt=thirty_days_ago)),
+        no_target_date=Count('id', filter=Q(status='Pending', jo_number__target_date__isnull=True)),
+    )
+
+    resolved = Q(status__in=['Completed', 'Checked', 'Closed'], date_complete__isnull=False)
+    resolution = ExpressionWrapper(F('date_complete') - F('date_created'), output_field=DurationField())
+    logsheet = JOLogsheet.objects.aggregate(
+        total=Count('id', filter=Q(date_created__gte=thirty_days_ago)),
+        prev_total=Count('id', filter=Q(date_created__range=[sixty_days_ago, thirty_days_ago])),
+        avg_resolution=Avg(resolution, filter=resolved & Q(date_created__gte=thirty_days_ago)),
+        prev_avg_resolution=Avg(resolution, filter=resolved & Q(date_created__range=[sixty_days_ago, thirty_days_ago])),
+    )
+
+    active_jo_count = routing['active']
+    prev_active_jo_count = routing['prev_active']
+    if prev_active_jo_count > 0:
+        active_jo_percentage = round(((active_jo_count - prev_active_jo_count) / prev_active_jo_count) * 100)
+    else:
+        active_jo_percentage = 100 if active_jo_count > 0 else 0
+
+    completion_rate = int((routing['completed'] / logsheet['total']) * 100) if logsheet['total'] > 0 else 0
+    prev_completion_rate = (
+        round((routing['prev_completed'] / logsheet['prev_total']) * 100)
+        if logsheet['prev_total'] > 0 else 0
+    )
+
+    avg_resolution_days = 0
+    resolution_time_change = 0
+    resolution_time_improved = False
+    current_avg = resolution_days(logsheet['avg_resolution'])
+    prev_avg = resolution_days(logsheet['prev_avg_resolution'])
+    if current_avg is not None:
+        avg_resolution_days = round(current_avg, 1)
+        if prev_avg:
+            resolution_time_change = round(abs((avg_resolution_days - prev_avg) / prev_avg * 100))
+            resolution_time_improved = avg_resolution_days < prev_avg
+
+    overdue_tasks = routing['overdue']
+    prev_overdue_tasks = routing['prev_overdue']
+
+    return {
+        'status': 'success',
+        'active_jo_count': active_jo_count,
+        'active_jo_percentage': active_jo_percentage,
+        'completion_rate': completion_rate,
+        'completion_rate_change': completion_rate - prev_completion_rate,
+        'avg_resolution_time': avg_resolution_days,
+        'resolution_time_improved': resolution_time_improved,
+        'resolution_time_change': resolution_time_change,
+        'overdue_tasks': overdue_tasks,
+        'overdue_tasks_change': (
+            round(abs((overdue_tasks - prev_overdue_tasks) / prev_overdue_tasks * 100))
+            if prev_overdue_tasks > 0 else 0
+        ),
+        'overdue_tasks_reduced': overdue_tasks < prev_overdue_tasks,
+        'no_target_date_count': routing['no_target_date'],
+        'last_updated': timezone.now().strftime("%Y-%m-%d %H:%M:%S")
+    }
+
+
+def color_chart(queryset, field, months, color_field='jo_color'):
+    """Monthly job order counts per category color for the request and approver dashboards."""
+    buckets = month_starts(timezone.localdate(), months)
+    start = local_midnight(buckets[0])
+
+    counts = bucket_counts(queryset.filter(**{f'{field}__gte': start, f'{field}__lte': timezone.now()}), 'month', buckets, {
+        color: (field, Q(**{f'{color_field}__iexact': color})) for color in JO_NUMBER_PREFIXES
+    })
+    return {'labels': [bucket.strftime('%b %Y') for bucket in buckets], **counts}
@@ -14,23 +14,124 @@ from .serializers import JORequestSerializer, JORoutingSerializer, JORequestAppr
 from django.db.models.functions import TruncMonth
 from django.db.models import Q
 from django.contrib.auth.decorators import login_required
-from .models import GreenControlNumber, YellowControlNumber, WhiteControlNumber, OrangeControlNumber, JOLogsheet, JORouting
+from .models import JOLogsheet, JORouting, ArchivedJOLogsheet
 from portalusers.models import UserApprovers, Users
 from notification.models import Notification
 import calendar
 import datetime
-import openpyxl
 import json
-import io
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-from openpyxl.utils import get_column_letter
+from urllib.parse import urlencode
+from openpyxl.styles import Font, Alignment
 from django.http import HttpResponse, JsonResponse
 from datetime import datetime
 from django.db.models import Count, Q
 from django.views.decorators.http import require_GET, require_POST
 from django.db.models.functions import ExtractMonth, ExtractYear
 from django.core.paginator import Paginator
+from django.conf import settings
+from django.db import transaction
 from settings.models import Line
+from pdnportal.cache import conditional_etag, content_etag, shared_snapshot, bump_model_version
+from pdnportal.exports import XlsxExport, THIN_BORDER, fill, rows_of
+from pdnportal.paging import keyset_page
+from pdnportal.charts import bucket_counts, local_midnight, month_starts
+from .archive import find_job_order
+from .search import search_filter
+from .utils import compute_job_order_stats, set_current_step, next_jo_number, MAINTENANCE_STEP, color_chart
+
+JO_CHANGE_MODELS = ['joborder.jologsheet', 'joborder.jorouting']
+
+
+def deadline_window(request):
+    # Job orders turn due or overdue as time passes without any write, let those feeds go stale for a minute at most
+    return timezone.now().strftime('%Y%m%d%H%M')
+
+
+# Rows per page of the requestor and approver job order tables
+QUEUE_PAGE_SIZE = 10
+
+# The maintenance workload table is paged by assignment time, see maintenance_assignments()
+MAINTENANCE_PAGE_SIZE = 10
+MAINTENANCE_ORDERING = ['-request_at', '-id']
+
+# Columns the dashboard timeline, deadline and alert feeds read, fetched in one query per feed
+TIMELINE_EVENT_FIELDS = (
+    'request_at', 'status', 'approver__name', 'jo_number__jo_number', 'jo_number__requestor',
+    'jo_number__target_date', 'jo_number__prepared_by__line__line_name',
+)
+DEADLINE_FIELDS = (
+    'jo_number', 'jo_color', 'jo_tools', 'jo_type', 'requestor', 'target_date',
+    'in_charge__name', 'prepared_by__line__line_name',
+)
+
+# Job order export layout: (header, column width) in sheet order
+EXPORT_COLUMNS = [
+    ('Date Submitted', 15),
+    ('JO Number', 15),
+    ('Requested By', 20),
+    ('Category', 12),
+    ('Tool', 15),
+    ('Nature of Changes', 15),
+    ('Details', 30),
+    ('Status', 12),
+    ('Person In Charge', 20),
+    ('Date Received', 15),
+    ('Expected Date', 15),
+    ('Date Completed', 15),
+    ('Action Taken', 30),
+    ('Remarks', 30),
+]
+EXPORT_FIELDS = (
+    'date_created', 'jo_number', 'requestor', 'jo_color', 'jo_tools', 'jo_type', 'details', 'status',
+    'in_charge__name', 'in_charge__username', 'date_received', 'target_date', 'date_complete',
+    'action_taken', 'target_date_reason',
+)
+# status/category: (fill, font color)
+JO_STATUS_COLORS = {
+    'Routing': ('FFF8E1', 'FFC107'),
+    'Completed': ('E8F5E9', '4CAF50'),
+    'Checked': ('E3F2FD', '2196F3'),
+    'Cancelled': ('FBE9E7', 'FF5722'),
+    'Closed': ('E0F2F1', '009688'),
+    'Rejected': ('FFEBEE', 'F44336'),
+}
+JO_CATEGORY_COLORS = {
+    'green': ('E8F5E9', '4CAF50'),
+    'yellow': ('FFF8E1', 'FFC107'),
+    'white': ('ECEFF1', '607D8B'),
+    'orange': ('FBE9E7', 'FF5722'),
+}
+CENTERED = Alignment(horizontal='center', vertical='center')
+
+
+def colored_styles(prefix, colors):
+    """A filled cell style and a plain text style per status or category."""
+    styles = {}
+    for name, (background, color) in colors.items():
+        styles[f'{prefix}_{name}'] = dict(fill=fill(background), font=Font(color=color), border=THIN_BORDER, alignment=CENTERED)
+        styles[f'{prefix}_text_{name}'] = dict(font=Font(color=color))
+    return styles
+
+
+EXPORT_STYLES = {
+    'jo_header': dict(font=Font(bold=True, color="FFFFFF"), fill=fill("3366FF"), border=THIN_BORDER,
+                      alignment=Alignment(horizontal='center', vertical='center', wrap_text=True)),
+    'jo_cell': dict(border=THIN_BORDER, alignment=Alignment(vertical='top', wrap_text=True)),
+    'jo_centered': dict(border=THIN_BORDER, alignment=CENTERED),
+    'jo_title': dict(font=Font(bold=True, size=14)),
+    'jo_bold': dict(font=Font(bold=True)),
+    **colored_styles('jo_status', JO_STATUS_COLORS),
+    **colored_styles('jo_category', JO_CATEGORY_COLORS),
+}
+
+def queue_query(search_query, filter_value):
+    """Query string that keeps the search and filter on the queue page links."""
+    params = {}
+    if search_query:
+        params['search'] = search_query
+    if filter_value and filter_value != 'all':
+        params['filter'] = filter_value
+    return urlencode(params)
 
 # REQUESTORS VIEW
 @login_required(login_url="user-login")
@@ -38,8 +139,18 @@ def requestor_page(request):
     current_month = now().month
     current_year = now().year
 
+    search_query = request.GET.get('search', '').strip()
+    filter_value = request.GET.get('filter', 'all')
+
     pendingJO = JOLogsheet.objects.filter(Q(status="Routing") | Q(status="Completed") | Q(status="Checked"), prepared_by=request.user).order_by("-date_created")
-    joRequests = JOLogsheet.objects.filter(prepared_by=request.user).order_by("-date_created")
+    joRequests = JOLogsheet.objects.filter(prepared_by=request.user).select_related('line')
+
+    if search_query:
+        joRequests = joRequests.filter(search_filter(search_query))
+    if filter_value and filter_value != 'all':
+        joRequests = joRequests.filter(status__iexact=filter_value)
+
+    all_requests = Paginator(joRequests.order_by("-date_created", "-id"), QUEUE_PAGE_SIZE).get_page(request.GET.get('page'))
 
     joRequestsCount = JOLogsheet.objects.filter(prepared_by=request.user, date_created__year=current_year, date_created__month=current_month).count()
     pendingJOCount = JOLogsheet.objects.filter(status = "Routing", prepared_by=request.user, date_created__year=current_year, date_created__month=current_month).count()
@@ -48,7 +159,10 @@ def requestor_page(request):
 
     context={
         'pendingJO':pendingJO,
-        'all_requests':joRequests,
+        'all_requests':all_requests,
+        'search_query': search_query,
+        'filter_value': filter_value,
+        'page_query': queue_query(search_query, filter_value),
         'joRequestsCount':joRequestsCount,
         'pendingJOCount':pendingJOCount,
         'approvedJOCount':approvedJOCount,
@@ -59,8 +173,6 @@ def requestor_page(request):
 @login_required
 @require_GET
 def job_order_chart_data(request, period):
-    today = timezone.now().date()
-
     if period == '3month':
         months_back = 3
     elif period == '1year':
@@ -68,70 +180,8 @@ def job_order_chart_data(request, period):
     else:
         months_back = 6
 
-    start_date = today.replace(day=1)
-    for _ in range(months_back - 1):
-        prev_month = start_date.month - 1
-        year = start_date.year
-        if prev_month == 0:
-            prev_month = 12
-            year -= 1
-        start_date = start_date.replace(year=year, month=prev_month, day=1)
-
-    months = []
-    month_year_map = {}
-
-    current = start_date
-    index = 0
-    while current <= today.replace(day=28):
-        month_name = calendar.month_name[current.month][:3]
-        year = current.year
-        month_year = f"{month_name} {year}"
-
-        months.append(month_year)
-        month_year_map[f"{current.year}-{current.month:02d}"] = index
-
-        if current.month == 12:
-            current = current.replace(year=current.year + 1, month=1)
-        else:
-            current = current.replace(month=current.month + 1)
-
-        index += 1
-
-    green_data = [0] * len(months)
-    yellow_data = [0] * len(months)
-    white_data = [0] * len(months)
-    orange_data = [0] * len(months)
-
-    job_orders = JOLogsheet.objects.filter(
-        prepared_by=request.user,
-        date_created__gte=timezone.make_aware(timezone.datetime.combine(start_date, timezone.datetime.min.time())),
-        date_created__lte=timezone.now()
-    )
-
-    for order in job_orders:
-        date = order.date_created.date()
-        month_year_key = f"{date.year}-{date.month:02d}"
-
-        if month_year_key in month_year_map:
-            idx = month_year_map[month_year_key]
-            category = order.jo_color.lower() if order.jo_color else "unknown"
-
-            if category == 'green':
-                green_data[idx] += 1
-            elif category == 'yellow':
-                yellow_data[idx] += 1
-            elif category == 'white':
-                white_data[idx] += 1
-            elif category == 'orange':
-                orange_data[idx] += 1
-
-    return JsonResponse({
-        'labels': months,
-        'green': green_data,
-        'yellow': yellow_data,
-        'white': white_data,
-        'orange': orange_data
-    })
+    job_orders = JOLogsheet.objects.filter(prepared_by=request.user)
+    return JsonResponse(color_chart(job_orders, 'date_created', months_back))
 
 @login_required(login_url="user-login")
 def create_jo_request(request):
@@ -211,19 +261,8 @@ def create_jo_request(request):
 
             control_number = None
             try:
-                if category == "green":
-                    instance = GreenControlNumber.objects.create(prepared_by=request.user)
-                    control_number = f'G-{instance.id:04}'
-                elif category == "yellow":
-                    instance = YellowControlNumber.objects.create(prepared_by=request.user)
-                    control_number = f'Y-{instance.id:04}'
-                elif category == "white":
-                    instance = WhiteControlNumber.objects.create(prepared_by=request.user)
-                    control_number = f'W-{instance.id:04}'
-                elif category == "orange":
-                    instance = OrangeControlNumber.objects.create(prepared_by=request.user)
-                    control_number = f'O-{instance.id:04}'
-                else:
+                control_number = next_jo_number(category)
+                if not control_number:
                     error_message = "Invalid category selected."
 
                     if is_ajax:
@@ -260,22 +299,24 @@ def create_jo_request(request):
                 return redirect("requestor-homepage")
 
             try:
-                JORouting.objects.create(
-                    jo_number=new_request,
-                    jo_request=request.user,
-                    approver=request.user,
-                    approver_sequence=0,
-                    status="Submitted"
-                )
-
-                JORouting.objects.create(
-                    jo_number=new_request,
-                    jo_request=request.user,
-                    approver=jo_approver.approver,
-                    first_approver=True,
-                    approver_sequence=1,
-                    status="Processing"
-                )
+                with transaction.atomic():
+                    JORouting.objects.create(
+                        jo_number=new_request,
+                        jo_request=request.user,
+                        approver=request.user,
+                        approver_sequence=0,
+                        status="Submitted"
+                    )
+
+                    first_routing = JORouting.objects.create(
+                        jo_number=new_request,
+                        jo_request=request.user,
+                        approver=jo_approver.approver,
+                        first_approver=True,
+                        approver_sequence=1,
+                        status="Processing"
+                    )
+                    set_current_step(new_request, first_routing)
             except Exception as e:
                 error_message = f"Routing creation failed: {str(e)}"
 
@@ -324,11 +365,12 @@ def get_job_order_details(request, jo_id):
     try:
         print(f"Looking for job order with ID: {jo_id}")
 
-        job_order = JOLogsheet.objects.get(id=jo_id)
+        # Closed and cancelled job orders may have been moved to the archive tables
+        job_order = find_job_order(jo_id)
         print(f"Found job order: {job_order.jo_number}")
 
-        routing_entries = JORouting.objects.filter(jo_number=job_order)
-        print(f"Found {routing_entries.count()} routing entries")
+        routing_entries = list(job_order.joRouting.select_related('approver').order_by('id'))
+        print(f"Found {len(routing_entries)} routing entries")
 
         routing_data = []
         for entry in routing_entries:
@@ -362,6 +404,7 @@ def get_job_order_details(request, jo_id):
             'action_taken': job_order.action_taken if job_order.action_taken else None,
             'target_date_reason': job_order.target_date_reason if job_order.target_date_reason else None,
             'is_creator': request.user == job_order.prepared_by,
+            'is_archived': isinstance(job_order, ArchivedJOLogsheet),
             'routing': routing_data
         }
 
@@ -407,10 +450,12 @@ def cancel_jo_request(request, jo_id):
             return redirect("requestor-homepage")
 
         job_order.status = 'Cancelled'
+        set_current_step(job_order, save=False)
         job_order.save()
 
 
         JORouting.objects.filter(jo_number=job_order, status='Pending').update(status='Cancelled')
+        bump_model_version(JORouting)
 
         if is_ajax:
             return JsonResponse({
@@ -471,10 +516,13 @@ def close_transaction(request, jo_id):
                 routing_entry.remarks = request.POST.get('remarks')
 
             routing_entry.approved_at = timezone.now()
-            routing_entry.save()
 
-            job_order.status = "Closed"
-            job_order.save()
+            with transaction.atomic():
+                routing_entry.save()
+
+                job_order.status = "Closed"
+                set_current_step(job_order, save=False)
+                job_order.save()
 
             if is_ajax:
                 return JsonResponse({
@@ -503,34 +551,23 @@ def supervisor_view(request):
     current_month = now().month
     current_year = now().year
 
-    search_query = request.GET.get('search', '')
+    search_query = request.GET.get('search', '').strip()
     filter_value = request.GET.get('filter', 'all')
 
-    pending_approvals = JORouting.objects.filter(status="Processing", approver=request.user).order_by("-request_at")
-    approval_history = JORouting.objects.filter(approver=request.user).order_by("-request_at")
+    # The Action Required list is the approver's whole work queue, search and paging only apply to the history
+    pending_approvals = (JORouting.objects.filter(status="Processing", approver=request.user)
+                         .select_related('jo_number', 'jo_request__line').order_by("-request_at"))
+    approval_history = JORouting.objects.filter(approver=request.user).select_related('jo_number')
 
     if search_query:
-        pending_approvals = pending_approvals.filter(
-            Q(jo_number__jo_number__icontains=search_query) |
-            Q(jo_request__first_name__icontains=search_query) |
-            Q(jo_request__last_name__icontains=search_query) |
-            Q(jo_number__jo_tools__icontains=search_query) |
-            Q(jo_number__jo_type__icontains=search_query)
-        )
-
-        approval_history = approval_history.filter(
-            Q(jo_number__jo_number__icontains=search_query) |
-            Q(jo_request__first_name__icontains=search_query) |
-            Q(jo_request__last_name__icontains=search_query) |
-            Q(jo_number__jo_tools__icontains=search_query) |
-            Q(jo_number__jo_type__icontains=search_query)
-        )
+        approval_history = approval_history.filter(search_filter(search_query, prefix='jo_number__'))
 
     # Apply category filter if provided
     if filter_value and filter_value != 'all':
-        pending_approvals = pending_approvals.filter(jo_number__jo_color__iexact=filter_value)
         approval_history = approval_history.filter(jo_number__jo_color__iexact=filter_value)
 
+    approval_history = Paginator(approval_history.order_by("-request_at", "-id"), QUEUE_PAGE_SIZE).get_page(request.GET.get('page'))
+
     # Get statistics
     joRequestsCount = JORouting.objects.filter(approver=request.user, request_at__year=current_year, request_at__month=current_month).count()
     pendingJOCount = JORouting.objects.filter(status="Processing", approver=request.user, request_at__year=current_year, request_at__month=current_month).count()
@@ -547,15 +584,13 @@ def supervisor_view(request):
         'rejectedJOCount': rejectedJOCount,
         'search_query': search_query,
         'filter_value': filter_value,
+        'page_query': queue_query(search_query, filter_value),
     }
     return render(request, 'joborder/jo-approver.html', context)
 
 @login_required(login_url="user-login")
 @require_GET
 def approver_job_order_chart_data(request, period):
-    today = timezone.now().date()
-    current_user = request.user
-
     if period == '3month':
         months_back = 3
     elif period == '1year':
@@ -563,71 +598,8 @@ def approver_job_order_chart_data(request, period):
     else:
         months_back = 6
 
-    start_date = today.replace(day=1)
-    for _ in range(months_back - 1):
-        prev_month = start_date.month - 1
-        year = start_date.year
-        if prev_month == 0:
-            prev_month = 12
-            year -= 1
-        start_date = start_date.replace(year=year, month=prev_month, day=1)
-
-    months = []
-    month_year_map = {}
-
-    current = start_date
-    index = 0
-    while current <= today.replace(day=28):
-        month_name = calendar.month_name[current.month][:3]
-        year = current.year
-        month_year = f"{month_name} {year}"
-
-        months.append(month_year)
-        month_year_map[f"{current.year}-{current.month:02d}"] = index
-
-        if current.month == 12:
-            current = current.replace(year=current.year + 1, month=1)
-        else:
-            current = current.replace(month=current.month + 1)
-
-        index += 1
-
-    green_data = [0] * len(months)
-    yellow_data = [0] * len(months)
-    white_data = [0] * len(months)
-    orange_data = [0] * len(months)
-
-    routing_entries = JORouting.objects.filter(
-        approver=current_user,
-        request_at__gte=timezone.make_aware(timezone.datetime.combine(start_date, timezone.datetime.min.time())),
-        request_at__lte=timezone.now()
-    ).select_related('jo_number')
-
-    for entry in routing_entries:
-        if entry.jo_number:
-            date = entry.request_at.date()
-            month_year_key = f"{date.year}-{date.month:02d}"
-
-            if month_year_key in month_year_map:
-                idx = month_year_map[month_year_key]
-                category = entry.jo_number.jo_color.lower() if entry.jo_number.jo_color else "unknown"
-
-                if category == 'green':
-                    green_data[idx] += 1
-                elif category == 'yellow':
-                    yellow_data[idx] += 1
-                elif category == 'white':
-                    white_data[idx] += 1
-                elif category == 'orange':
-                    orange_data[idx] += 1
-
-    return JsonResponse({
-        'labels': months,
-        'green': green_data,
-        'yellow': yellow_data,
-        'white': white_data,
-        'orange': orange_data
-    })
+    routing_entries = JORouting.objects.filter(approver=request.user, jo_number__isnull=False)
+    return JsonResponse(color_chart(routing_entries, 'request_at', months_back, color_field='jo_number__jo_color'))
 
 @login_required(login_url="user-login")
 def approve_job_order(request):
@@ -661,15 +633,18 @@ def approve_job_order(request):
             routing.status = 'Approved'
             routing.remarks = remarks
             routing.approved_at = timezone.now()
-            routing.save()
 
-            JORouting.objects.create(
-                jo_number=jo,
-                jo_request=jo.prepared_by,
-                approver=next_approver_user,
-                approver_sequence=routing.approver_sequence + 1,
-                status='Processing'
-            )
+            with transaction.atomic():
+                routing.save()
+
+                next_routing = JORouting.objects.create(
+                    jo_number=jo,
+                    jo_request=jo.prepared_by,
+                    approver=next_approver_user,
+                    approver_sequence=routing.approver_sequence + 1,
+                    status='Processing'
+                )
+                set_current_step(jo, next_routing)
 
             messages.success(request, f"Job Order {jo.jo_number} has been approved successfully.")
         else:
@@ -712,10 +687,13 @@ def reject_job_order(request):
         routing.status = 'Rejected'
         routing.remarks = remarks
         routing.approved_at = timezone.now()
-        routing.save()
 
-        jo.status = 'Rejected'
-        jo.save()
+        with transaction.atomic():
+            routing.save()
+
+            jo.status = 'Rejected'
+            set_current_step(jo, save=False)
+            jo.save()
 
         try:
             Notification.objects.create(
@@ -763,18 +741,21 @@ def approve_checking(request):
         routing.status = 'Approved'
         routing.remarks = remarks
         routing.approved_at = timezone.now()
-        routing.save()
 
-        jo.status = 'Checked'
-        jo.save()
+        with transaction.atomic():
+            routing.save()
 
-        JORouting.objects.create(
-            jo_number=jo,
-            jo_request=jo.prepared_by,
-            approver=jo.prepared_by,
-            approver_sequence=routing.approver_sequence + 1,
-            status='Processing'
-        )
+            closing_routing = JORouting.objects.create(
+                jo_number=jo,
+                jo_request=jo.prepared_by,
+                approver=jo.prepared_by,
+                approver_sequence=routing.approver_sequence + 1,
+                status='Processing'
+            )
+
+            jo.status = 'Checked'
+            set_current_step(jo, closing_routing, save=False)
+            jo.save()
 
         messages.success(request, f"Job Order {jo.jo_number} has been checked and returned to the preparer.")
 
@@ -822,15 +803,18 @@ def reject_checking(request):
         routing.status = 'Rejected'
         routing.remarks = remarks
         routing.approved_at = timezone.now()
-        routing.save()
 
         last_routing.status = 'Processing'
         last_routing.approved_at = None
-        last_routing.save()
 
-        jo.status = 'Routing'
-        jo.date_complete= None
-        jo.save()
+        with transaction.atomic():
+            routing.save()
+            last_routing.save()
+
+            jo.status = 'Routing'
+            jo.date_complete= None
+            set_current_step(jo, last_routing, entered_at=timezone.now(), save=False)
+            jo.save()
 
         try:
             Notification.objects.create(
@@ -896,7 +880,6 @@ def job_order_facilitator(request):
 def job_order_analytics(request):
     try:
         period = request.GET.get('period', '6month')
-        today = timezone.now()
         default_labels = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun']
         default_data = [0, 0, 0, 0, 0, 0]
 
@@ -907,72 +890,20 @@ def job_order_analytics(request):
         else:
             months = 6
 
-        # Calculate the first day of the current month
-        first_of_this_month = today.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        # Calculate the first month to include
-        start_month = first_of_this_month
-        for _ in range(months - 1):
-            prev_month = start_month.month - 1 or 12
-            prev_year = start_month.year if start_month.month > 1 else start_month.year - 1
-            start_month = start_month.replace(year=prev_year, month=prev_month, day=1)
-
-        # Now, for each month, calculate the start and end
-        labels = []
-        total_by_month = []
-        completed_by_month = []
-        for i in range(months):
-            # Move forward i months from start_month
-            month = (start_month.month - 1 + i) % 12 + 1
-            year = start_month.year + ((start_month.month - 1 + i) // 12)
-            month_start = start_month.replace(year=year, month=month, day=1)
-            # Calculate the first day of the next month
-            if month == 12:
-                next_month = month_start.replace(year=year+1, month=1, day=1)
-            else:
-                next_month = month_start.replace(month=month+1, day=1)
-            month_end = next_month
-            month_label = month_start.strftime('%b')
-            try:
-                total_count = JOLogsheet.objects.filter(
-                    date_created__gte=month_start,
-                    date_created__lt=month_end
-                ).count()
-            except Exception as db_error:
-                print(f"Database error when fetching total count: {str(db_error)}")
-                total_count = 0
-            try:
-                completed_count = JOLogsheet.objects.filter(
-                    date_created__gte=month_start,
-                    date_created__lt=month_end,
-                    date_complete__isnull=False
-                ).count()
-            except Exception as db_error:
-                print(f"Database error when fetching completed count: {str(db_error)}")
-                completed_count = 0
-            labels.append(month_label)
-            total_by_month.append(total_count)
-            completed_by_month.append(completed_count)
-
-        if not labels or len(labels) < months:
-            if months == 1:
-                labels = [default_labels[0]]
-                total_by_month = [default_data[0]]
-                completed_by_month = [default_data[0]]
-            elif months == 3:
-                labels = default_labels[:3]
-                total_by_month = default_data[:3]
-                completed_by_month = default_data[:3]
-            else:
-                labels = default_labels
-                total_by_month = default_data
-                completed_by_month = default_data
+        buckets = month_starts(timezone.localdate(), months)
+
+        # Created and completed job orders per creation month, one grouped query
+        counts = bucket_counts(JOLogsheet.objects.filter(date_created__gte=local_midnight(buckets[0])), 'month', buckets, {
+            'total': ('date_created', None),
+            'completed': ('date_created', Q(date_complete__isnull=False)),
+        })
 
         data = {
             'status': 'success',
             'period': period,
-            'labels': labels,
-            'total_by_month': total_by_month,
-            'completed_by_month': completed_by_month
+            'labels': [bucket.strftime('%b') for bucket in buckets],
+            'total_by_month': counts['total'],
+            'completed_by_month': counts['completed']
         }
         return JsonResponse(data)
     except Exception as e:
@@ -991,47 +922,18 @@ def job_order_analytics(request):
 @login_required(login_url="user-login")
 def maintenance_workload(request):
     try:
-        # Get all maintenance staff
-        maintenance_staff = Users.objects.filter(job_order_maintenance=True)
+        max_capacity = 10  # Default capacity
 
-        workload_data = []
-        for staff in maintenance_staff:
-            try:
-                # Count active tasks for this staff member
-                active_tasks = JOLogsheet.objects.filter(
-                    in_charge=staff,
-                    status__in=['Routing', 'Completed']
-                ).count()
-
-                # Calculate workload percentage with safety checks
-                max_capacity = 10  # Default capacity
-
-                # Prevent division by zero
-                if max_capacity > 0:
-                    workload_percentage = min(int((active_tasks / max_capacity) * 100), 100)
-                else:
-                    workload_percentage = 0
-
-                # Add staff member's data to the result
-                workload_data.append({
-                    'name': f"{staff.name}" if hasattr(staff, 'name') and staff.name else f"Staff #{staff.id}",
-                    'active_tasks': active_tasks,
-                    'workload_percentage': workload_percentage
-                })
+        # Active tasks of every maintenance staff member in one grouped query
+        maintenance_staff = Users.objects.filter(job_order_maintenance=True).annotate(
+            active_tasks=Count('JORequestInCharge', filter=Q(JORequestInCharge__status__in=['Routing', 'Completed']))
+        ).values('id', 'name', 'active_tasks')
 
-            except Exception as staff_error:
-                # Log error for this staff member but continue processing others
-                import traceback
-                print(f"Error processing workload for staff {staff.id}: {str(staff_error)}")
-                traceback.print_exc()
-
-                # Add a placeholder entry for this staff member
-                workload_data.append({
-                    'name': f"Staff #{staff.id}" if hasattr(staff, 'id') else "Unknown Staff",
-                    'active_tasks': 0,
-                    'workload_percentage': 0,
-                    'error': True
-                })
+        workload_data = [{
+            'name': staff['name'] or f"Staff #{staff['id']}",
+            'active_tasks': staff['active_tasks'],
+            'workload_percentage': min(int((staff['active_tasks'] / max_capacity) * 100), 100),
+        } for staff in maintenance_staff]
 
         # Return successful response
         return JsonResponse({
@@ -1066,22 +968,24 @@ def assign_person_in_charge(request):
         job_order = JOLogsheet.objects.get(id=jo_id)
         assignee = Users.objects.get(id=assignee_id)
 
-        job_order.in_charge = assignee
-        job_order.date_received=timezone.now()
-        job_order.save()
+        with transaction.atomic():
+            routing_entry = JORouting.objects.filter(jo_number=job_order, approver_sequence=5, approver=request.user).first()
+            routing_entry.status='Approved'
+            routing_entry.approved_at=timezone.now()
+            routing_entry.save()
 
-        routing_entry = JORouting.objects.filter(jo_number=job_order, approver_sequence=5, approver=request.user).first()
-        routing_entry.status='Approved'
-        routing_entry.approved_at=timezone.now()
-        routing_entry.save()
+            new_routing = JORouting.objects.create(
+                jo_number=job_order,
+                jo_request=job_order.prepared_by,
+                approver=assignee,
+                approver_sequence=MAINTENANCE_STEP,
+                status='Processing'
+            )
 
-        new_routing = JORouting.objects.create(
-            jo_number=job_order,
-            jo_request=job_order.prepared_by,
-            approver=assignee,
-            approver_sequence=6,
-            status='Processing'
-        )
+            job_order.in_charge = assignee
+            job_order.date_received=timezone.now()
+            set_current_step(job_order, new_routing, save=False)
+            job_order.save()
 
         messages.success(request, f'Job Order {job_order.jo_number} successfully assigned to {assignee.first_name} {assignee.last_name}.')
         return redirect('facilitator')
@@ -1144,320 +1048,84 @@ def export_job_orders(request):
         if category_filters and 'all' not in request.POST.getlist('category'):
             query_filters['jo_color__in'] = category_filters
 
-        job_orders = JOLogsheet.objects.filter(**query_filters).order_by('-date_created')
-
-        workbook = openpyxl.Workbook()
-        worksheet = workbook.active
-        worksheet.title = 'Job Orders'
-
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="3366FF", end_color="3366FF", fill_type="solid")
-        header_alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-
-        thin_border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
+        # Archived job orders are exported along with the live ones
+        job_orders = (JOLogsheet.objects.filter(**query_filters).values(*EXPORT_FIELDS)
+                      .union(ArchivedJOLogsheet.objects.filter(**query_filters).values(*EXPORT_FIELDS), all=True)
+                      .order_by('-date_created'))
+
+        export = XlsxExport(EXPORT_STYLES)
+        worksheet = export.add_sheet(
+            'Job Orders',
+            headers=[header for header, _ in EXPORT_COLUMNS],
+            widths=[width for _, width in EXPORT_COLUMNS],
+            header_style='jo_header',
         )
 
-        cell_alignment = Alignment(vertical='top', wrap_text=True)
-
-        status_styles = {
-            'Routing': {
-                'fill': PatternFill(start_color="FFF8E1", end_color="FFF8E1", fill_type="solid"),
-                'font': Font(color="FFC107")
-            },
-            'Completed': {
-                'fill': PatternFill(start_color="E8F5E9", end_color="E8F5E9", fill_type="solid"),
-                'font': Font(color="4CAF50")
-            },
-            'Checked': {
-                'fill': PatternFill(start_color="E3F2FD", end_color="E3F2FD", fill_type="solid"),
-                'font': Font(color="2196F3")
-            },
-            'Cancelled': {
-                'fill': PatternFill(start_color="FBE9E7", end_color="FBE9E7", fill_type="solid"),
-                'font': Font(color="FF5722")
-            },
-            'Closed': {
-                'fill': PatternFill(start_color="E0F2F1", end_color="E0F2F1", fill_type="solid"),
-                'font': Font(color="009688")
-            },
-            'Rejected': {
-                'fill': PatternFill(start_color="FFEBEE", end_color="FFEBEE", fill_type="solid"),
-                'font': Font(color="F44336")
-            }
-        }
-
-        category_styles = {
-            'green': {
-                'fill': PatternFill(start_color="E8F5E9", end_color="E8F5E9", fill_type="solid"),
-                'font': Font(color="4CAF50")
-            },
-            'yellow': {
-                'fill': PatternFill(start_color="FFF8E1", end_color="FFF8E1", fill_type="solid"),
-                'font': Font(color="FFC107")
-            },
-            'white': {
-                'fill': PatternFill(start_color="ECEFF1", end_color="ECEFF1", fill_type="solid"),
-                'font': Font(color="607D8B")
-            },
-            'orange': {
-                'fill': PatternFill(start_color="FBE9E7", end_color="FBE9E7", fill_type="solid"),
-                'font': Font(color="FF5722")
-            }
-        }
-
-        column_widths = {
-            'A': 15,  # Date Submitted
-            'B': 15,  # JO Number
-            'C': 20,  # Requested By
-            'D': 12,  # Category
-            'E': 15,  # Tool
-            'F': 15,  # Nature of Changes
-            'G': 30,  # Details
-            'H': 12,  # Status
-            'I': 20,  # Person In Charge
-            'J': 15,  # Date Received
-            'K': 15,  # Expected Date
-            'L': 15,  # Date Completed
-            'M': 30,  # Action Taken
-            'N': 30,  # Remarks
-        }
-
-        for col, width in column_widths.items():
-            worksheet.column_dimensions[col].width = width
-
-        headers = [
-            'Date Submitted',
-            'JO Number',
-            'Requested By',
-            'Category',
-            'Tool',
-            'Nature of Changes',
-            'Details',
-            'Status',
-            'Person In Charge',
-            'Date Received',
-            'Expected Date',
-            'Date Completed',
-            'Action Taken',
-            'Remarks',
-        ]
-
-        for col, header in enumerate(headers, start=1):
-            cell = worksheet.cell(row=1, column=col, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_alignment
-            cell.border = thin_border
-
-        for row_idx, jo in enumerate(job_orders, start=2):
-            # Date Created
-            formatted_date = jo.date_created.strftime('%Y-%m-%d') if jo.date_created else ''
-            cell = worksheet.cell(row=row_idx, column=1, value=formatted_date)
-            cell.border = thin_border
-            cell.alignment = cell_alignment
-
-            # JO Number
-            cell = worksheet.cell(row=row_idx, column=2, value=jo.jo_number)
-            cell.border = thin_border
-            cell.alignment = cell_alignment
-
-            # Requested By
-            cell = worksheet.cell(row=row_idx, column=3, value=jo.requestor)
-            cell.border = thin_border
-            cell.alignment = cell_alignment
-
-            # Category with color formatting
-            cell = worksheet.cell(row=row_idx, column=4, value=jo.jo_color)
-            if jo.jo_color and jo.jo_color.lower() in category_styles:
-                style = category_styles[jo.jo_color.lower()]
-                cell.fill = style['fill']
-                cell.font = style['font']
-            cell.border = thin_border
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-
-            # Tool
-            cell = worksheet.cell(row=row_idx, column=5, value=jo.jo_tools)
-            cell.border = thin_border
-            cell.alignment = cell_alignment
-
-            # Nature
-            cell = worksheet.cell(row=row_idx, column=6, value=jo.jo_type)
-            cell.border = thin_border
-            cell.alignment = cell_alignment
-
-            # Details
-            cell = worksheet.cell(row=row_idx, column=7, value=jo.details)
-            cell.border = thin_border
-            cell.alignment = cell_alignment
-
-            # Status with color formatting
-            cell = worksheet.cell(row=row_idx, column=8, value=jo.status)
-            if jo.status in status_styles:
-                style = status_styles[jo.status]
-                cell.fill = style['fill']
-                cell.font = style['font']
-            cell.border = thin_border
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-
-            # Person In Charge
-            in_charge_name = ''
-            if jo.in_charge:
-                try:
-                    if hasattr(jo.in_charge, 'name') and jo.in_charge.name:
-                        in_charge_name = jo.in_charge.name
-                    else:
-                        in_charge_name = jo.in_charge.username
-                except:
-                    in_charge_name = str(jo.in_charge.id) if jo.in_charge.id else 'Unknown'
-
-            cell = worksheet.cell(row=row_idx, column=9, value=in_charge_name)
-            cell.border = thin_border
-            cell.alignment = cell_alignment
-
-            # Date Received
-            # Details
-            cell = worksheet.cell(row=row_idx, column=7, value=jo.details)
-            cell.border = thin_border
-            cell.alignment = cell_alignment
-
-            # Status with color formatting
-            cell = worksheet.cell(row=row_idx, column=8, value=jo.status)
-            if jo.status in status_styles:
-                style = status_styles[jo.status]
-                cell.fill = style['fill']
-                cell.font = style['font']
-            cell.border = thin_border
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-
-            # Person In Charge
-            in_charge_name = ''
-            if jo.in_charge:
-                try:
-                    if hasattr(jo.in_charge, 'name') and jo.in_charge.name:
-                        in_charge_name = jo.in_charge.name
-                    else:
-                        in_charge_name = jo.in_charge.username
-                except:
-                    in_charge_name = str(jo.in_charge.id) if jo.in_charge.id else 'Unknown'
-
-            cell = worksheet.cell(row=row_idx, column=9, value=in_charge_name)
-            cell.border = thin_border
-            cell.alignment = cell_alignment
-
-            # Date Received
-            if jo.date_received:
-                formatted_date = jo.date_received.strftime('%Y-%m-%d')
-                cell = worksheet.cell(row=row_idx, column=10, value=formatted_date)
-            else:
-                cell = worksheet.cell(row=row_idx, column=10, value='')
-            cell.border = thin_border
-            cell.alignment = cell_alignment
-
-            # Expected Date
-            if jo.target_date:
-                formatted_date = jo.target_date.strftime('%Y-%m-%d')
-                cell = worksheet.cell(row=row_idx, column=11, value=formatted_date)
-            else:
-                cell = worksheet.cell(row=row_idx, column=11, value='')
-            cell.border = thin_border
-            cell.alignment = cell_alignment
-
-            # Date Completed
-            if jo.date_complete:
-                formatted_date = jo.date_complete.strftime('%Y-%m-%d')
-                cell = worksheet.cell(row=row_idx, column=12, value=formatted_date)
-            else:
-                cell = worksheet.cell(row=row_idx, column=12, value='')
-            cell.border = thin_border
-            cell.alignment = cell_alignment
-
-            # Action Taken
-            cell = worksheet.cell(row=row_idx, column=13, value=jo.action_taken if jo.action_taken else '')
-            cell.border = thin_border
-            cell.alignment = cell_alignment
-
-            # Remarks
-            cell = worksheet.cell(row=row_idx, column=14, value=jo.target_date_reason if jo.target_date_reason else '')
-            cell.border = thin_border
-            cell.alignment = cell_alignment
+        def date_value(value):
+            return value.strftime('%Y-%m-%d') if value else ''
 
-        summary_sheet = workbook.create_sheet(title="Summary")
-
-        summary_sheet.column_dimensions['A'].width = 40
-        summary_sheet.column_dimensions['B'].width = 15
-
-        # Title
-        title_cell = summary_sheet.cell(row=1, column=1, value='Job Orders Export Summary')
-        title_cell.font = Font(bold=True, size=14)
-        summary_sheet.merge_cells('A1:B1')
-        title_cell.alignment = Alignment(horizontal='center', vertical='center')
+        status_counts = {}
+        category_counts = {}
+        total = 0
+
+        for jo in rows_of(job_orders):
+            color = jo['jo_color']
+            status = jo['status']
+            worksheet.append([
+                date_value(jo['date_created']),
+                jo['jo_number'],
+                jo['requestor'],
+                color,
+                jo['jo_tools'],
+                jo['jo_type'],
+                jo['details'],
+                status,
+                jo['in_charge__name'] or jo['in_charge__username'] or '',
+                date_value(jo['date_received']),
+                date_value(jo['target_date']),
+                date_value(jo['date_complete']),
+                jo['action_taken'] or '',
+                jo['target_date_reason'] or '',
+            ], style='jo_cell', styles={
+                3: f'jo_category_{color.lower()}' if color and color.lower() in JO_CATEGORY_COLORS else 'jo_centered',
+                7: f'jo_status_{status}' if status in JO_STATUS_COLORS else 'jo_centered',
+            })
 
-        # Date range
-        summary_sheet.cell(row=3, column=1, value='Date Range:').font = Font(bold=True)
-        summary_sheet.cell(row=3, column=2, value=f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
+            total += 1
+            status_counts[status] = status_counts.get(status, 0) + 1
+            if color:
+                category_counts[color] = category_counts.get(color, 0) + 1
 
-        # Total count
-        summary_sheet.cell(row=4, column=1, value='Total Job Orders:').font = Font(bold=True)
-        summary_sheet.cell(row=4, column=2, value=len(job_orders))
+        summary_sheet = export.add_sheet('Summary', widths=[40, 15], preamble=[
+            (['Job Orders Export Summary'], 'jo_title'),
+            ([], None),
+        ])
+        summary_sheet.append(['Date Range:', f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"],
+                             styles={0: 'jo_bold'})
+        summary_sheet.append(['Total Job Orders:', total], styles={0: 'jo_bold'})
+        summary_sheet.append([])
 
         # Status breakdown
-        status_counts = {}
-        for jo in job_orders:
-            status_counts[jo.status] = status_counts.get(jo.status, 0) + 1
-
-        summary_sheet.cell(row=6, column=1, value='Status Breakdown:').font = Font(bold=True)
-
-        summary_row = 7
+        summary_sheet.append(['Status Breakdown:'], style='jo_bold')
         for status, count in status_counts.items():
-            summary_sheet.cell(row=summary_row, column=1, value=status)
-            summary_sheet.cell(row=summary_row, column=2, value=count)
-            if status in status_styles:
-                summary_sheet.cell(row=summary_row, column=1).font = status_styles[status]['font']
-
-            summary_row += 1
-
-        category_counts = {}
-        for jo in job_orders:
-            if jo.jo_color:
-                category_counts[jo.jo_color] = category_counts.get(jo.jo_color, 0) + 1
-
-        summary_sheet.cell(row=summary_row + 1, column=1, value='Category Breakdown:').font = Font(bold=True)
+            summary_sheet.append([status, count],
+                                 styles={0: f'jo_status_text_{status}'} if status in JO_STATUS_COLORS else None)
+        summary_sheet.append([])
 
-        summary_row += 2
+        summary_sheet.append(['Category Breakdown:'], style='jo_bold')
         for category, count in category_counts.items():
-            summary_sheet.cell(row=summary_row, column=1, value=category)
-            summary_sheet.cell(row=summary_row, column=2, value=count)
-
-            if category.lower() in category_styles:
-                summary_sheet.cell(row=summary_row, column=1).font = category_styles[category.lower()]['font']
-
-            summary_row += 1
-
-        # Save workbook to BytesIO object
-        output = io.BytesIO()
-        workbook.save(output)
-        output.seek(0)
+            summary_sheet.append([category, count], styles={0: f'jo_category_text_{category.lower()}'}
+                                 if category.lower() in JO_CATEGORY_COLORS else None)
 
         # Generate a unique filename with timestamp
         filename = f"job_orders_{timezone.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
 
-        # Create response with proper headers
-        response = HttpResponse(
-            output.read(),
-            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-        )
-
-        # Set headers for file download
-        response['Content-Disposition'] = f'attachment; filename="{filename}"'
-        response['Content-Length'] = str(len(response.content))
+        # Stream the workbook from a temporary file
+        response = export.response(filename)
         response['Access-Control-Expose-Headers'] = 'Content-Disposition, Content-Length, X-Export-Success'
         response['X-Export-Success'] = 'true'
 
-        print(f"Export successful, returning file: {filename}, size: {len(response.content)} bytes")
+        print(f"Export successful, returning file: {filename}, size: {response.get('Content-Length')} bytes")
         return response
 
     except Exception as e:
@@ -1504,157 +1172,13 @@ def queue_overview(request):
     return render(request, 'joborder/overall-dashboard.html', context)
 
 @require_GET
+@content_etag
 def job_order_stats_api(request):
     try:
-        now = timezone.now()
-        today = now.date()
-        thirty_days_ago = today - timedelta(days=30)
-        sixty_days_ago = today - timedelta(days=60)
-
-        # Get all users with job_order_maintenance = True
-        maintenance_users = Users.objects.filter(job_order_maintenance=True)
-
-        # Active JO count - specifically count JORouting entries where:
-        # - approver has job_order_maintenance=True
-        # - status="Pending"
-        active_jo_count = JORouting.objects.filter(
-            approver__in=maintenance_users,
-            status='Processing'
-        ).count()
-
-        # Previous 30-day active JO count (using the same criteria)
-        prev_active_jo_count = JORouting.objects.filter(
-            approver__in=maintenance_users,
-            status='Processing',
-            request_at__range=[sixty_days_ago, thirty_days_ago]
-        ).count()
-
-        # Calculate percentage change
-        if prev_active_jo_count > 0:
-            active_jo_percentage = round(((active_jo_count - prev_active_jo_count) / prev_active_jo_count) * 100)
-        else:
-            active_jo_percentage = 100 if active_jo_count > 0 else 0
-
-        # Completion rate
-        total_jo_last_30_days = JOLogsheet.objects.filter(
-            date_created__gte=thirty_days_ago
-        ).count()
-
-        completed_jo_last_30_days = JORouting.objects.filter(
-            jo_number__date_created__gte=thirty_days_ago,
-            approver__in=maintenance_users,
-            status="Approved",
-            approved_at__isnull=False
-        ).count()
-
-        completion_rate = (
-            int((completed_jo_last_30_days / total_jo_last_30_days) * 100)
-            if total_jo_last_30_days > 0 else 0
-        )
-
-        # Previous period completion rate
-        total_jo_prev_period = JOLogsheet.objects.filter(
-            date_created__range=[sixty_days_ago, thirty_days_ago]
-        ).count()
-
-        completed_jo_prev_period = JORouting.objects.filter(
-            jo_number__date_created__range=[sixty_days_ago, thirty_days_ago],
-            approver__in=maintenance_users,
-            status="Approved",
-            approved_at__isnull=False
-        ).count()
-
-        prev_completion_rate = (
-            round((completed_jo_prev_period / total_jo_prev_period) * 100)
-            if total_jo_prev_period > 0 else 0
-        )
-
-        completion_rate_change = completion_rate - prev_completion_rate
-
-        # Resolution time (in days)
-        completed_jobs = JOLogsheet.objects.filter(
-            status__in=['Completed', 'Checked', 'Closed'],
-            date_created__gte=thirty_days_ago,
-            date_complete__isnull=False
-        )
-
-        avg_resolution_days = 0
-        resolution_time_change = 0
-        resolution_time_improved = False
-
-        resolution_times = [
-            (job.date_complete - job.date_created).days
-            for job in completed_jobs
-            if job.date_complete and job.date_created
-        ]
-
-        if resolution_times:
-            avg_resolution_days = round(sum(resolution_times) / len(resolution_times), 1)
-
-            prev_completed_jobs = JOLogsheet.objects.filter(
-                status__in=['Completed', 'Checked', 'Closed'],
-                date_created__range=[sixty_days_ago, thirty_days_ago],
-                date_complete__isnull=False
-            )
-
-            prev_resolution_times = [
-                (job.date_complete - job.date_created).days
-                for job in prev_completed_jobs
-                if job.date_complete and job.date_created
-            ]
-
-            if prev_resolution_times:
-                prev_avg = sum(prev_resolution_times) / len(prev_resolution_times)
-                resolution_time_change = round(abs((avg_resolution_days - prev_avg) / prev_avg * 100))
-                resolution_time_improved = avg_resolution_days < prev_avg
-
-        # Overdue tasks - count JORouting entries where:
-        # - approver has job_order_maintenance=True
-        # - status="Pending"
-        # - target_date from JOLogsheet is in the past
-        overdue_tasks = JORouting.objects.filter(
-            approver__in=maintenance_users,
-            status='Pending',
-            jo_number__target_date__lt=now
-        ).count()
-
-        # Previous period overdue tasks
-        prev_overdue_date = sixty_days_ago
-        prev_overdue_tasks = JORouting.objects.filter(
-            approver__in=maintenance_users,
-            status='Pending',
-            jo_number__target_date__lt=prev_overdue_date,
-            request_at__lt=thirty_days_ago
-        ).count()
-
-        overdue_tasks_change = (
-            round(abs((overdue_tasks - prev_overdue_tasks) / prev_overdue_tasks * 100))
-            if prev_overdue_tasks > 0 else 0
-        )
-        overdue_tasks_reduced = overdue_tasks < prev_overdue_tasks
-
-        # Count jobs with no target date
-        no_target_date_count = JORouting.objects.filter(
-            approver__in=maintenance_users,
-            status='Pending',
-            jo_number__target_date__isnull=True
-        ).count()
-
-        return JsonResponse({
-            'status': 'success',
-            'active_jo_count': active_jo_count,
-            'active_jo_percentage': active_jo_percentage,
-            'completion_rate': completion_rate,
-            'completion_rate_change': completion_rate_change,
-            'avg_resolution_time': avg_resolution_days,
-            'resolution_time_improved': resolution_time_improved,
-            'resolution_time_change': resolution_time_change,
-            'overdue_tasks': overdue_tasks,
-            'overdue_tasks_change': overdue_tasks_change,
-            'overdue_tasks_reduced': overdue_tasks_reduced,
-            'no_target_date_count': no_target_date_count,
-            'last_updated': timezone.now().strftime("%Y-%m-%d %H:%M:%S")
-        })
+        # Every open overall dashboard polls this, so all viewers share one periodically refreshed snapshot
+        stats = shared_snapshot('joborder-stats', compute_job_order_stats,
+                                refresh_every=settings.JO_STATS_SNAPSHOT_SECONDS)
+        return JsonResponse(stats)
 
     except Exception as e:
         import traceback
@@ -1662,11 +1186,11 @@ def job_order_stats_api(request):
         return JsonResponse({'status': 'error', 'message': str(e)})
 
 @require_GET
+@conditional_etag(JO_CHANGE_MODELS, scope='global')
 def job_order_timeline_api(request, view_type):
     try:
         now = timezone.now()
         today = now.date()
-        maintenance = Users.objects.filter(job_order_maintenance=True)
 
         response_data = {
             'status': 'success',
@@ -1676,20 +1200,13 @@ def job_order_timeline_api(request, view_type):
 
         # Get all pending job orders assigned to maintenance users regardless of date
         all_pending_jobs = JORouting.objects.filter(
-            approver__in=maintenance,
+            approver__job_order_maintenance=True,
             status='Processing'
-        ).order_by('-request_at')
+        ).order_by('-request_at').values(*TIMELINE_EVENT_FIELDS)
 
         # Helper function to create event data with common fields
         def create_event_data(job, additional_fields=None):
-            # Get the JO number
-            jo_number = job.jo_number.jo_number if hasattr(job.jo_number, 'jo_number') else str(job.jo_number)
-
-            # Get the requestor name
-            requestor = job.jo_number.requestor if hasattr(job.jo_number, 'requestor') else "Unknown"
-
-            # Get target date for color coding
-            target_date = job.jo_number.target_date if hasattr(job.jo_number, 'target_date') else None
+            target_date = job['jo_number__target_date']
 
             # Calculate days until target date for color coding
             days_until_target = None
@@ -1702,34 +1219,22 @@ def job_order_timeline_api(request, view_type):
                 is_overdue = days_until_target < 0
                 is_approaching = 0 <= days_until_target <= 3
 
-            # Format the time with AM/PM
-            time_str = job.request_at.strftime("%I:%M %p").strip()
-
-            # Format the date for month view
-            date_str = job.request_at.strftime("%b %d")
-
-            # Get department/line information
-            department_line = "N/A"
-            try:
-                if job.jo_number.prepared_by and job.jo_number.prepared_by.line:
-                    department_line = job.jo_number.prepared_by.line.line_name
-            except Exception as e:
-                print(f"Error getting line information: {str(e)}")
+            request_at = job['request_at']
 
             # Create the base event data
             event_data = {
-                'jo_number': jo_number,
-                'time': time_str,
-                'date': date_str,
-                'title': f"Assigned to {job.approver.name}",
-                'requestor': requestor,
-                'requestor_dept': department_line,
-                'status': job.status,
+                'jo_number': job['jo_number__jo_number'],
+                'time': request_at.strftime("%I:%M %p").strip(),
+                'date': request_at.strftime("%b %d"),
+                'title': f"Assigned to {job['approver__name']}",
+                'requestor': job['jo_number__requestor'] or "Unknown",
+                'requestor_dept': job['jo_number__prepared_by__line__line_name'] or "N/A",
+                'status': job['status'],
                 'has_target_date': has_target_date,
                 'is_overdue': is_overdue,
                 'is_approaching': is_approaching,
                 'days_until_target': days_until_target,
-                'event_date': job.request_at.strftime("%Y-%m-%d")  # For date filtering
+                'event_date': request_at.strftime("%Y-%m-%d")  # For date filtering
             }
 
             # Add any additional fields
@@ -1744,12 +1249,12 @@ def job_order_timeline_api(request, view_type):
             today_end = timezone.make_aware(datetime.combine(today, datetime.max.time()))
 
             # Get jobs created today
-            today_jobs = all_pending_jobs.filter(
+            today_jobs = list(all_pending_jobs.filter(
                 request_at__range=[today_start, today_end]
-            )
+            ))
 
             # If no jobs today, show some of the most recent pending jobs
-            if not today_jobs.exists():
+            if not today_jobs:
                 today_jobs = all_pending_jobs[:5]  # Show up to 5 recent pending jobs
 
             for job in today_jobs:
@@ -1765,13 +1270,13 @@ def job_order_timeline_api(request, view_type):
             day_rows = {i+1: 1 for i in range(7)}
 
             # Get jobs from this week
-            week_jobs = all_pending_jobs.filter(
+            week_jobs = list(all_pending_jobs.filter(
                 request_at__date__gte=start_of_week,
                 request_at__date__lte=end_of_week
-            )
+            ))
 
             # If no jobs this week, show some of the most recent pending jobs
-            if not week_jobs.exists():
+            if not week_jobs:
                 week_jobs = all_pending_jobs[:10]  # Show up to 10 recent pending jobs
 
                 # For jobs outside the current week, distribute them evenly across the week
@@ -1787,7 +1292,7 @@ def job_order_timeline_api(request, view_type):
             else:
                 # For jobs within the current week, place them on the correct day
                 for job in week_jobs:
-                    job_day = job.request_at.day
+                    job_day = job['request_at'].day
                     # Find the closest day column if the exact day isn't in our columns
                     closest_day = min(day_columns.keys(), key=lambda x: abs(x - job_day))
                     day_column = day_columns.get(closest_day, 1)
@@ -1809,13 +1314,13 @@ def job_order_timeline_api(request, view_type):
             week_rows = {i+1: 1 for i in range(weeks_in_month)}
 
             # Get jobs from this month
-            month_jobs = all_pending_jobs.filter(
+            month_jobs = list(all_pending_jobs.filter(
                 request_at__year=today.year,
                 request_at__month=today.month
-            )
+            ))
 
             # If no jobs this month, show some of the most recent pending jobs
-            if not month_jobs.exists():
+            if not month_jobs:
                 month_jobs = all_pending_jobs[:15]  # Show up to 15 recent pending jobs
 
                 # For jobs outside the current month, distribute them evenly across the weeks
@@ -1831,7 +1336,7 @@ def job_order_timeline_api(request, view_type):
             else:
                 # For jobs within the current month, place them in the correct week
                 for job in month_jobs:
-                    week_of_month = (job.request_at.day - 1) // 7 + 1
+                    week_of_month = (job['request_at'].day - 1) // 7 + 1
                     if week_of_month not in week_columns:
                         week_columns[week_of_month] = len(week_columns) + 1
                         week_rows[week_columns[week_of_month]] = 1
@@ -1855,25 +1360,23 @@ def job_order_timeline_api(request, view_type):
         return JsonResponse({'status': 'error', 'message': str(e)})
 
 @require_GET
+@conditional_etag(JO_CHANGE_MODELS, scope='global', vary=deadline_window)
 def job_order_deadlines_api(request):
     try:
         now = timezone.now()
         today = now.date()
 
-        maintenance_personnel = Users.objects.filter(job_order_maintenance=True)
-
         upcoming_deadlines = JOLogsheet.objects.filter(
-            target_date__gte=now,
-            joRouting__status='Processing',
-            joRouting__approver_sequence=6,
-            joRouting__approver__in=maintenance_personnel
-        ).order_by('target_date').distinct()[:10]
+            current_step=MAINTENANCE_STEP,
+            step_due_at__gte=now
+        ).order_by('step_due_at').values(*DEADLINE_FIELDS)[:10]
 
         deadlines_data = []
 
         for job in upcoming_deadlines:
-            if job.target_date:
-                days_until = (job.target_date.date() - today).days
+            target_date = job['target_date']
+            if target_date:
+                days_until = (target_date.date() - today).days
 
                 if days_until == 0:
                     countdown = "Today"
@@ -1882,30 +1385,19 @@ def job_order_deadlines_api(request):
                 else:
                     countdown = f"{days_until} days"
 
-                assigned_person = job.in_charge.name if job.in_charge else None
+                assigned_person = job['in_charge__name']
                 assigned_to = f"Assigned to {assigned_person}" if assigned_person else "Not yet assigned"
 
-                # Get requestor information
-                requestor = job.requestor if job.requestor else "Unknown"
-
-                # Get department/line information
-                department_line = "N/A"
-                try:
-                    if job.prepared_by and job.prepared_by.line:
-                        department_line = job.prepared_by.line.line_name
-                except Exception as e:
-                    print(f"Error getting line information: {str(e)}")
-
                 deadline = {
-                    'jo_number': job.jo_number,
-                    'category': job.jo_color,
-                    'day': job.target_date.day,
-                    'month': job.target_date.strftime('%b'),
-                    'description': f"{job.jo_tools} - {job.jo_type} - {assigned_to}",
+                    'jo_number': job['jo_number'],
+                    'category': job['jo_color'],
+                    'day': target_date.day,
+                    'month': target_date.strftime('%b'),
+                    'description': f"{job['jo_tools']} - {job['jo_type']} - {assigned_to}",
                     'countdown': countdown,
-                    'is_critical': job.jo_color.lower() == 'orange' or days_until <= 2,
-                    'requestor': requestor,
-                    'department': department_line
+                    'is_critical': (job['jo_color'] or '').lower() == 'orange' or days_until <= 2,
+                    'requestor': job['requestor'] or "Unknown",
+                    'department': job['prepared_by__line__line_name'] or "N/A"
                 }
 
                 deadlines_data.append(deadline)
@@ -1923,47 +1415,38 @@ def job_order_deadlines_api(request):
         })
 
 @require_GET
+@conditional_etag(JO_CHANGE_MODELS, scope='global', vary=deadline_window)
 def job_order_alerts_api(request):
     try:
         now = timezone.now()
         today = now.date()
-        maintenance_personnel = Users.objects.filter(job_order_maintenance=True)
         alerts_data = []
 
         overdue_jobs = JOLogsheet.objects.filter(
-            target_date__lt=now,
-            status='Routing',
-            joRouting__status='Processing',
-            joRouting__approver_sequence=6,
-            joRouting__approver__in=maintenance_personnel
-        ).distinct().order_by('target_date')[:3]
+            current_step=MAINTENANCE_STEP,
+            step_due_at__lt=now,
+            status='Routing'
+        ).order_by('step_due_at').values(*DEADLINE_FIELDS)[:3]
 
         for job in overdue_jobs:
-            days_overdue = (today - job.target_date.date()).days
-            assigned_to = job.in_charge.name if job.in_charge else "No assignee yet"
-            requestor = job.requestor if job.requestor else "Unknown"
-            department_line = "N/A"
-            try:
-                if job.prepared_by and job.prepared_by.line:
-                    department_line = job.prepared_by.line.line_name
-            except Exception as e:
-                print(f"Error getting line information: {str(e)}")
+            days_overdue = (today - job['target_date'].date()).days
+            assigned_to = job['in_charge__name'] or "No assignee yet"
 
-            message = f"{job.jo_tools} is overdue by {days_overdue} days. Assigned to {assigned_to}."
+            message = f"{job['jo_tools']} is overdue by {days_overdue} days. Assigned to {assigned_to}."
 
             alert = {
                 'type': 'critical',
                 'icon': 'exclamation-triangle',
-                'title': f"Overdue Job Order: {job.jo_number}",
+                'title': f"Overdue Job Order: {job['jo_number']}",
                 'time': f"{days_overdue} days ago",
                 'message': message,
-                'requestor': requestor,
-                'department': department_line,
+                'requestor': job['requestor'] or "Unknown",
+                'department': job['prepared_by__line__line_name'] or "N/A",
                 'actions': [
                     {
                         'text': 'View Details',
                         'icon': 'eye',
-                        'data_jo': job.jo_number
+                        'data_jo': job['jo_number']
                     },
                     {
                         'text': 'Send Reminder',
@@ -1976,43 +1459,38 @@ def job_order_alerts_api(request):
             alerts_data.append(alert)
 
         overloaded_staff = JOLogsheet.objects.filter(
+            current_step=MAINTENANCE_STEP,
             status='Routing',
-            joRouting__status='Pending',
-            joRouting__approver_sequence=6,
-            joRouting__approver__in=maintenance_personnel
-        ).values('in_charge').annotate(
+            in_charge__isnull=False
+        ).values('in_charge', 'in_charge__name').annotate(
             task_count=Count('id')
         ).filter(task_count__gte=3).order_by('-task_count')[:2]
 
         for staff in overloaded_staff:
-            if staff['in_charge']:
-                try:
-                    staff_member = Users.objects.get(id=staff['in_charge'])
-                    workload_percent = min(round((staff['task_count'] / 6) * 100), 100)
-
-                    alert = {
-                        'type': 'resource',
-                        'icon': 'cogs',
-                        'title': f"Resource Bottleneck: {staff_member.name}",
-                        'time': 'Active',
-                        'message': f"{staff_member.name} has {workload_percent}% workload capacity with {staff['task_count']} pending tasks.",
-                        'actions': [
-                            {
-                                'text': 'Reassign Tasks',
-                                'icon': 'exchange-alt',
-                                'data_jo': None
-                            },
-                            {
-                                'text': 'Resource Planning',
-                                'icon': 'users',
-                                'data_jo': None
-                            }
-                        ]
+            staff_name = staff['in_charge__name']
+            workload_percent = min(round((staff['task_count'] / 6) * 100), 100)
+
+            alert = {
+                'type': 'resource',
+                'icon': 'cogs',
+                'title': f"Resource Bottleneck: {staff_name}",
+                'time': 'Active',
+                'message': f"{staff_name} has {workload_percent}% workload capacity with {staff['task_count']} pending tasks.",
+                'actions': [
+                    {
+                        'text': 'Reassign Tasks',
+                        'icon': 'exchange-alt',
+                        'data_jo': None
+                    },
+                    {
+                        'text': 'Resource Planning',
+                        'icon': 'users',
+                        'data_jo': None
                     }
+                ]
+            }
 
-                    alerts_data.append(alert)
-                except Users.DoesNotExist:
-                    continue
+            alerts_data.append(alert)
 
         return JsonResponse({
             'status': 'success',
@@ -2034,9 +1512,7 @@ def maintenance_personnel(request):
     current_year = now().year
 
     pendingJO = JORouting.objects.filter(status = "Processing", approver=request.user).order_by("-request_at")
-    overallJO = JOLogsheet.objects.filter(joRouting__approver=request.user, joRouting__approver_sequence=6).order_by("-joRouting__request_at", "joRouting__status")
-    for job in overallJO:
-        job.has_pending_routing = job.joRouting.filter(approver_sequence=6, status='Processing').exists()
+    overallJO, next_cursor, overallJOCount = maintenance_assignments(request)
 
     joRequestsCount = JOLogsheet.objects.filter(in_charge=request.user, date_created__year=current_year, date_created__month=current_month).count()
     completedJO = JORouting.objects.filter(status = "Approved", approver=request.user, request_at__year=current_year, request_at__month=current_month).count()
@@ -2046,6 +1522,9 @@ def maintenance_personnel(request):
     context={
         'pendingRequest':pendingJO,
         'overallJO':overallJO,
+        'overallJOCount':overallJOCount,
+        'overallJONextCursor':next_cursor,
+        'page_size':MAINTENANCE_PAGE_SIZE,
         'totalAssigned':joRequestsCount,
         'completedRequest':completedJO,
         'pending':pendingRequest,
@@ -2053,42 +1532,72 @@ def maintenance_personnel(request):
     }
     return render(request, 'joborder/jo-maintenance.html', context)
 
+def maintenance_assignments(request):
+    """
+    One keyset page of the job orders assigned to the current user at the maintenance step, newest first.
+
+    Reads `cursor`, `limit`, `search` and `category` from the query string and
+    returns the job orders, the cursor of the next page and the total count.
+    """
+    routings = JORouting.objects.filter(
+        approver=request.user,
+        approver_sequence=MAINTENANCE_STEP,
+        jo_number__isnull=False
+    ).select_related('jo_number')
+
+    search = request.GET.get('search', '').strip()
+    if search:
+        routings = routings.filter(
+            Q(jo_number__jo_number__icontains=search) |
+            Q(jo_number__jo_tools__icontains=search) |
+            Q(jo_number__requestor__icontains=search) |
+            Q(jo_number__status__icontains=search)
+        )
+
+    category = request.GET.get('category', 'all')
+    if category and category != 'all':
+        routings = routings.filter(jo_number__jo_color__iexact=category)
+
+    try:
+        page_size = min(max(int(request.GET.get('limit', MAINTENANCE_PAGE_SIZE)), 1), 100)
+    except ValueError:
+        page_size = MAINTENANCE_PAGE_SIZE
+
+    page = keyset_page(routings, MAINTENANCE_ORDERING, request.GET.get('cursor'), page_size)
+
+    current_time = now()
+    job_orders = []
+    for routing in page:
+        job = routing.jo_number
+        job.has_pending_routing = job.current_step == MAINTENANCE_STEP and job.current_approver_id == request.user.id
+        job.is_overdue = bool(job.target_date and job.target_date < current_time and job.status != 'Completed')
+        job_orders.append(job)
+
+    return job_orders, page.next_cursor, routings.count()
+
 @login_required
 def maintenance_job_orders_api(request):
-    """API endpoint to get job orders for maintenance personnel"""
+    """API endpoint to get a page of job orders for maintenance personnel"""
     try:
-        # Get job orders assigned to the current user
-        job_orders = JOLogsheet.objects.filter(
-            joRouting__approver=request.user,
-            joRouting__approver_sequence=6
-        ).order_by("-joRouting__request_at", "joRouting__status")
-
-        # Prepare data for response
-        job_orders_data = []
-        for job in job_orders:
-            # Check if job has pending routing
-            has_pending_routing = job.joRouting.filter(approver_sequence=6, status='Processing').exists()
-
-            # Check if job is overdue
-            is_overdue = False
-            if job.target_date and job.target_date < now().date() and job.status != 'Completed':
-                is_overdue = True
-
-            job_orders_data.append({
-                'id': job.id,
-                'jo_number': job.jo_number,
-                'jo_color': job.jo_color,
-                'jo_tools': job.jo_tools,
-                'requestor': job.requestor,
-                'target_date': job.target_date.strftime('%b %d, %Y') if job.target_date else None,
-                'status': job.status,
-                'is_overdue': is_overdue,
-                'has_pending_routing': has_pending_routing
-            })
+        job_orders, next_cursor, total = maintenance_assignments(request)
+
+        job_orders_data = [{
+            'id': job.id,
+            'jo_number': job.jo_number,
+            'jo_color': job.jo_color,
+            'jo_tools': job.jo_tools,
+            'requestor': job.requestor,
+            'target_date': job.target_date.strftime('%b %d, %Y') if job.target_date else None,
+            'status': job.status,
+            'is_overdue': job.is_overdue,
+            'has_pending_routing': job.has_pending_routing
+        } for job in job_orders]
 
         return JsonResponse({
             'status': 'success',
-            'job_orders': job_orders_data
+            'job_orders': job_orders_data,
+            'next_cursor': next_cursor,
+            'total': total
         })
     except Exception as e:
         return JsonResponse({
@@ -2099,108 +1608,35 @@ def maintenance_job_orders_api(request):
 @login_required
 def get_job_order_trends(request):
     period = request.GET.get('period', 'month')
-    current_user = request.user
-    today = timezone.now()
-
-    if (period == 'month'):
-        start_date = today.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        next_month = today.month + 1 if today.month < 12 else 1
-        next_month_year = today.year if today.month < 12 else today.year + 1
-        days_in_month = (datetime(next_month_year, next_month, 1) - timedelta(days=1)).day
-
-        labels = [(start_date + timedelta(days=i)).strftime('%d') for i in range(days_in_month)]
-        new_orders_data = [0] * days_in_month
-        completed_data = [0] * days_in_month
-
-        new_routings = JORouting.objects.filter(
-            approver=current_user,
-            approver_sequence=6,
-            request_at__year=today.year,
-            request_at__month=today.month
-        )
-
-        completed_routings = JORouting.objects.filter(
-            approver=current_user,
-            approver_sequence=6,
-            approved_at__year=today.year,
-            approved_at__month=today.month,
-            status='Approved'
-        )
-
-        for routing in new_routings:
-            day_index = routing.request_at.day - 1
-            if 0 <= day_index < len(new_orders_data):
-                new_orders_data[day_index] += 1
-
-        for routing in completed_routings:
-            if routing.approved_at:
-                day_index = routing.approved_at.day - 1
-                if 0 <= day_index < len(completed_data):
-                    completed_data[day_index] += 1
-
-    elif period == 'quarter':
-        current_month = today.month
-        quarter_start_month = 3 * ((current_month - 1) // 3) + 1
-
-        months = []
-        for i in range(3):
-            month = (quarter_start_month + i - 1) % 12 + 1
-            year = today.year if month >= quarter_start_month or quarter_start_month > today.month else today.year - 1
-            months.append((year, month))
-
-        labels = [datetime(year, month, 1).strftime('%b') for year, month in months]
-        new_orders_data = [0] * 3
-        completed_data = [0] * 3
-
-        for i, (year, month) in enumerate(months):
-            month_new_routings = JORouting.objects.filter(
-                approver=current_user,
-                approver_sequence=6,
-                request_at__year=year,
-                request_at__month=month
-            ).count()
-            new_orders_data[i] = month_new_routings
-
-            month_completed_routings = JORouting.objects.filter(
-                approver=current_user,
-                approver_sequence=6,
-                approved_at__year=year,
-                approved_at__month=month,
-                status='Approved'
-            ).count()
-            completed_data[i] = month_completed_routings
+    today = timezone.localdate()
 
+    if period == 'quarter':
+        quarter_start_month = 3 * ((today.month - 1) // 3) + 1
+        buckets = [date(today.year, quarter_start_month + i, 1) for i in range(3)]
+        labels = [bucket.strftime('%b') for bucket in buckets]
+        kind = 'month'
     elif period == 'year':
-        months_data = []
-        for i in range(11, -1, -1):
-            target_date = today - timedelta(days=i*30)
-            year = target_date.year
-            month = target_date.month
-            months_data.append((year, month, target_date.strftime('%b %y')))
-
-        months_data.sort()
-
-        labels = [month_label for _, _, month_label in months_data]
-        new_orders_data = [0] * 12
-        completed_data = [0] * 12
-
-        for i, (year, month, _) in enumerate(months_data):
-            month_new_routings = JORouting.objects.filter(
-                approver=current_user,
-                approver_sequence=6,
-                request_at__year=year,
-                request_at__month=month
-            ).count()
-            new_orders_data[i] = month_new_routings
-
-            month_completed_routings = JORouting.objects.filter(
-                approver=current_user,
-                approver_sequence=6,
-                approved_at__year=year,
-                approved_at__month=month,
-                status='Approved'
-            ).count()
-            completed_data[i] = month_completed_routings
+        buckets = month_starts(today, 12)
+        labels = [bucket.strftime('%b %y') for bucket in buckets]
+        kind = 'month'
+    else:
+        days_in_month = calendar.monthrange(today.year, today.month)[1]
+        buckets = [today.replace(day=day) for day in range(1, days_in_month + 1)]
+        labels = [bucket.strftime('%d') for bucket in buckets]
+        kind = 'day'
+
+    start = local_midnight(buckets[0])
+
+    # Routings received and completed at the maintenance step, grouped by both dates in one query
+    counts = bucket_counts(
+        JORouting.objects.filter(approver=request.user, approver_sequence=MAINTENANCE_STEP).filter(
+            Q(request_at__gte=start) | Q(approved_at__gte=start, status='Approved')),
+        kind, buckets, {
+            'new': ('request_at', Q(request_at__gte=start)),
+            'completed': ('approved_at', Q(approved_at__gte=start, status='Approved')),
+        })
+    new_orders_data = counts['new']
+    completed_data = counts['completed']
 
     data = {
         'labels': labels,
@@ -2230,52 +1666,28 @@ def get_upcoming_deadlines(request):
     tomorrow = today + timedelta(days=1)
     next_week = today + timedelta(days=7)
     two_weeks = today + timedelta(days=14)
-
-    # Base query for JORouting objects assigned to the current user
-    base_query = JORouting.objects.filter(
-        approver=request.user,
-        approver_sequence=6,
-        status="Processing"  # Use Processing instead of Pending to match other queries
+    today_start = timezone.make_aware(datetime.combine(today, datetime.min.time()))
+
+    # Job orders currently waiting on the current user at the maintenance step, bucketed in one query
+    counts = JOLogsheet.objects.filter(
+        current_approver=request.user,
+        current_step=MAINTENANCE_STEP
+    ).aggregate(
+        overdue=Count('id', filter=Q(target_date__lt=today_start)),
+        today=Count('id', filter=Q(target_date__date=today)),
+        tomorrow=Count('id', filter=Q(target_date__date=tomorrow)),
+        # After tomorrow, up to 7 days from today
+        this_week=Count('id', filter=Q(target_date__date__gt=tomorrow, target_date__date__lte=next_week)),
+        # 8-14 days from today
+        next_week=Count('id', filter=Q(target_date__date__gt=next_week, target_date__date__lte=two_weeks)),
+        later=Count('id', filter=Q(target_date__date__gt=two_weeks)),
     )
 
-    # Count job orders with target date today
-    today_count = base_query.filter(
-        jo_number__target_date__date=today
-    ).count()
-
-    # Count job orders with target date tomorrow
-    tomorrow_count = base_query.filter(
-        jo_number__target_date__date=tomorrow
-    ).count()
-
-    # Count job orders with target date in this week (after tomorrow, up to 7 days from today)
-    this_week_count = base_query.filter(
-        jo_number__target_date__date__gt=tomorrow,
-        jo_number__target_date__date__lte=next_week
-    ).count()
-
-    # Count job orders with target date in next week (8-14 days from today)
-    next_week_count = base_query.filter(
-        jo_number__target_date__date__gt=next_week,
-        jo_number__target_date__date__lte=two_weeks
-    ).count()
-
-    # Count job orders with target date beyond two weeks
-    later_count = base_query.filter(
-        jo_number__target_date__date__gt=two_weeks
-    ).count()
-
-    # Count overdue job orders (target date before today)
-    overdue_count = base_query.filter(
-        jo_number__target_date__lt=today
-    ).count()
-
-
     data = {
         'labels': ['Overdue', 'Today', 'Tomorrow', 'This Week', 'Next Week', 'Later'],
         'datasets': [{
             'label': 'Number of Job Orders',
-            'data': [overdue_count, today_count, tomorrow_count, this_week_count, next_week_count, later_count],
+            'data': [counts['overdue'], counts['today'], counts['tomorrow'], counts['this_week'], counts['next_week'], counts['later']],
             'backgroundColor': [
                 'rgba(220, 53, 69, 0.7)',   # Overdue (red)
                 'rgba(241, 70, 104, 0.7)',  # Today (urgent)
@@ -2328,6 +1740,8 @@ def set_target_date(request):
 
         job_order.target_date = target_date
         job_order.target_date_reason = target_date_reason
+        if job_order.current_step == MAINTENANCE_STEP:
+            job_order.step_due_at = target_date
         job_order.save()
 
         return JsonResponse({
@@ -2397,28 +1811,32 @@ def complete_job_order(request):
             }, status=404)
 
         # Proceed with updating only if checker is available
-        job_order.action_taken = action_taken
-        job_order.date_complete = timezone.now()
-        job_order.status = 'Completed'
-        job_order.save()
-
-        current_routing.status = 'Approved'
-        current_routing.approved_at = timezone.now()
-        current_routing.remarks = completion_remarks
-        current_routing.save()
+        with transaction.atomic():
+            current_routing.status = 'Approved'
+            current_routing.approved_at = timezone.now()
+            current_routing.remarks = completion_remarks
+            current_routing.save()
+
+            checker_routing = JORouting.objects.filter(jo_number=job_order,approver_sequence=7,status="Rejected").first()
+            if checker_routing:
+                checker_routing.status="Processing"
+                checker_routing.save()
+                entered_at = timezone.now()
+            else:
+                checker_routing = JORouting.objects.create(
+                    jo_number=job_order,
+                    jo_request=job_order.prepared_by,
+                    approver=checker_approver.approver,
+                    approver_sequence=current_routing.approver_sequence + 1,
+                    status='Processing'
+                )
+                entered_at = None
 
-        checker_routing = JORouting.objects.filter(jo_number=job_order,approver_sequence=7,status="Rejected").first()
-        if checker_routing:
-            checker_routing.status="Processing"
-            checker_routing.save()
-        else:
-            JORouting.objects.create(
-                jo_number=job_order,
-                jo_request=job_order.prepared_by,
-                approver=checker_approver.approver,
-                approver_sequence=current_routing.approver_sequence + 1,
-                status='Processing'
-            )
+            job_order.action_taken = action_taken
+            job_order.date_complete = timezone.now()
+            job_order.status = 'Completed'
+            set_current_step(job_order, checker_routing, entered_at=entered_at, save=False)
+            job_order.save()
 
         return JsonResponse({
             'status': 'success',
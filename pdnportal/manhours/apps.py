@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class ManhoursConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'manhours'
+
+    def ready(self):
+        from pdnportal.cache import track_model_versions
+        from .models import ManhoursLogsheet, Machine
+
+        track_model_versions(ManhoursLogsheet, Machine)
@@ -0,0 +1,21 @@
+import tempfile
+from datetime import datetime
+
+from settings.background import job_handler, report_progress, save_result_file
+from .views import build_manhours_export
+
+
+@job_handler('manhours.export_reports')
+def export_reports(job):
+    start_date = datetime.strptime(job.params['start_date'], '%Y-%m-%d')
+    end_date = datetime.strptime(job.params['end_date'], '%Y-%m-%d')
+    report_progress(job, 0, message='Reading manhours logs')
+
+    export, filename = build_manhours_export(start_date, end_date, job.params['reports'],
+                                             progress=lambda done, total: report_progress(job, done, total))
+
+    report_progress(job, job.progress, message='Saving workbook', force=True)
+    with tempfile.TemporaryFile(suffix='.xlsx') as handle:
+        save_result_file(job, filename, export.save(handle))
+
+    return {'filename': filename, 'rows': job.progress}
@@ -1,3 +1,57 @@
+import io
+from datetime import datetime
+from decimal import Decimal
+
+import openpyxl
 from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from portalusers.models import Users
+from .models import Machine, ManhoursLogsheet
+
+
+class ManhoursExportTests(TestCase):
+    """The manhours export writes every selected report from one pass over the logs."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = Users.objects.create(username='operator', name='Operator')
+        press = Machine.objects.create(machine_name='Press 1')
+        for day, shift, operator, output, manhours, setup in [
+            (2, 'AM', 'Juan', '120', '8', 0),
+            (2, 'AM', 'Maria', '80', '4', 15),
+            (3, 'PM', 'Juan', '60', '6', 0),
+        ]:
+            ManhoursLogsheet.objects.create(
+                user=cls.user, operator=operator, shift=shift, machine=press, setup=setup,
+                output=Decimal(output), manhours=Decimal(manhours),
+                date_completed=timezone.make_aware(datetime(2026, 3, day, 12)))
+
+    def export(self, reports):
+        self.client.force_login(self.user)
+        response = self.client.post(reverse('export_reports'), {
+            'start_date': '2026-03-01', 'end_date': '2026-03-31', 'export_reports[]': reports,
+        })
+        self.assertEqual(response.status_code, 200)
+        return openpyxl.load_workbook(io.BytesIO(b''.join(response.streaming_content)))
+
+    def test_selected_reports_are_written_below_the_preamble(self):
+        workbook = self.export(['daily_summary', 'operator_performance', 'setup_time_analysis'])
+        self.assertEqual(workbook.sheetnames, ['Daily Manhours Summary', 'Operator Performance', 'Setup Time Analysis'])
+
+        summary = list(workbook['Daily Manhours Summary'].iter_rows(values_only=True))
+        self.assertEqual([row[0] for row in summary[:2]], ['RYONAN ELECTRIC PHILIPPINES', 'Daily Manhours Summary'])
+        self.assertEqual(summary[3:], [('Date', 'Shift', 'Total Manhours'), ('2026-03-02', 'AM', 12), ('2026-03-03', 'PM', 6)])
+
+        performance = workbook['Operator Performance']
+        self.assertEqual([cell.value for cell in performance[4]],
+                         ['Operator', 'Date', 'Shift', 'Output', 'Manhours', 'Output per Hour'])
+        self.assertEqual([cell.value for cell in performance[5]],
+                         ['Juan', datetime(2026, 3, 2), 'AM', 120, 8, 15])
+        self.assertEqual((performance['A4'].style, performance['A5'].style, performance['B5'].style),
+                         ('mh_header', 'mh_cell', 'mh_date'))
+        self.assertEqual(performance.max_row, 7)
 
-# Create your tests here.
+        setup = list(workbook['Setup Time Analysis'].iter_rows(min_row=5, values_only=True))
+        self.assertEqual(setup, [(datetime(2026, 3, 2), 'AM', 'Maria', 'Press 1', 15)])
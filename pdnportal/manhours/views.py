@@ -10,8 +10,14 @@ from django.core.paginator import Paginator
 from decimal import Decimal
 from django.db.models import Sum
 from django.db.models.functions import TruncDay, TruncWeek
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Border, Side
+from openpyxl.styles import Font
+from pdnportal.cache import conditional_etag
+from pdnportal.exports import XlsxExport, THIN_BORDER, fill, rows_of
+from portalusers.supervision import supervised_filter
+from settings.background import enqueue, job_accepted
+
+# A supervisor's charts also change when the users they approve change
+MANHOURS_CHANGE_MODELS = ['manhours.manhourslogsheet', 'manhours.machine', 'portalusers.userapprovers']
 
 @login_required(login_url="user-login")
 def manhours(request):
@@ -23,24 +29,16 @@ def manhours(request):
     is_supervisor = request.user.manhours_supervisor
 
     if is_supervisor:
-        # Get all users for which the current user is an approver in the Manhours module
-        from portalusers.models import UserApprovers
-        approved_users = UserApprovers.objects.filter(
-            approver=request.user,
-            module="Manhours"
-        ).values_list('user', flat=True)
+        # The users the current user approves in the Manhours module, from the cached supervision sets
+        supervised = supervised_filter('user', request.user, 'Manhours', include_self=True)
 
         # Include both the supervisor's own entries and entries from users they approve
         monthly_logs = ManhoursLogsheet.objects.filter(
             date_completed__gte=month_start,
             date_completed__lt=next_month
-        ).filter(
-            user__in=list(approved_users) + [request.user.id]
-        )
+        ).filter(supervised)
 
-        all_records = ManhoursLogsheet.objects.filter(
-            user__in=list(approved_users) + [request.user.id]
-        ).order_by('-date_completed')
+        all_records = ManhoursLogsheet.objects.filter(supervised).order_by('-date_completed')
     else:
         # Regular user - only show their own entries
         monthly_logs = ManhoursLogsheet.objects.filter(
@@ -230,6 +228,7 @@ def get_manhours_details(request, id):
         return JsonResponse({'status': 'error', 'message': str(e)})
 
 @login_required(login_url="user-login")
+@conditional_etag(MANHOURS_CHANGE_MODELS)
 def get_chart_data(request):
     from django.utils import timezone
 
@@ -277,20 +276,14 @@ def get_chart_data(request):
     is_supervisor = request.user.manhours_supervisor
 
     if is_supervisor:
-        # Get all users for which the current user is an approver in the Manhours module
-        from portalusers.models import UserApprovers
-        approved_users = UserApprovers.objects.filter(
-            approver=request.user,
-            module="Manhours"
-        ).values_list('user', flat=True)
+        # The users the current user approves in the Manhours module, from the cached supervision sets
+        supervised = supervised_filter('user', request.user, 'Manhours', include_self=True)
 
         # Include both the supervisor's own entries and entries from users they approve
         entries = ManhoursLogsheet.objects.filter(
             date_completed__gte=start_date,
             date_completed__lte=end_date
-        ).filter(
-            user__in=list(approved_users) + [request.user.id]
-        )
+        ).filter(supervised)
     else:
         # Regular user - only show their own entries
         entries = ManhoursLogsheet.objects.filter(
@@ -531,6 +524,7 @@ def get_chart_data(request):
     return JsonResponse(result)
 
 @login_required(login_url="user-login")
+@conditional_etag(MANHOURS_CHANGE_MODELS)
 def get_machine_performance(request):
     period = request.GET.get('period', 'month')
     today = datetime.now()
@@ -548,20 +542,14 @@ def get_machine_performance(request):
     is_supervisor = request.user.manhours_supervisor
 
     if is_supervisor:
-        # Get all users for which the current user is an approver in the Manhours module
-        from portalusers.models import UserApprovers
-        approved_users = UserApprovers.objects.filter(
-            approver=request.user,
-            module="Manhours"
-        ).values_list('user', flat=True)
+        # The users the current user approves in the Manhours module, from the cached supervision sets
+        supervised = supervised_filter('user', request.user, 'Manhours', include_self=True)
 
         # Include both the supervisor's own entries and entries from users they approve
         data = ManhoursLogsheet.objects.filter(
             date_completed__gte=start_date,
             date_completed__lte=end_date
-        ).filter(
-            user__in=list(approved_users) + [request.user.id]
-        ).values(
+        ).filter(supervised).values(
             'machine__machine_name'
         ).annotate(
             total_output=Sum('output')
@@ -614,6 +602,77 @@ def get_machine_performance(request):
 
     return JsonResponse(result)
 
+# key, sheet title, headers, column widths
+MANHOURS_REPORTS = [
+    ('daily_summary', "Daily Manhours Summary", ['Date', 'Shift', 'Total Manhours'], [14, 8, 16]),
+    ('operator_performance', "Operator Performance",
+     ['Operator', 'Date', 'Shift', 'Output', 'Manhours', 'Output per Hour'], [25, 12, 8, 10, 12, 16]),
+    ('machine_utilization', "Machine Utilization", ['Machine', 'Date', 'Shift', 'Manhours'], [30, 12, 8, 12]),
+    ('daily_output', "Daily Output Summary", ['Date', 'Shift', 'Total Output'], [14, 8, 14]),
+    ('operator_machine_pairing', "Operator-Machine Pairing", ['Date', 'Shift', 'Operator', 'Machine'], [12, 8, 25, 30]),
+    ('shift_comparison', "Shift Comparison", ['Date', 'Shift', 'Total Output', 'Total Manhours'], [14, 8, 14, 16]),
+    ('setup_time_analysis', "Setup Time Analysis", ['Date', 'Shift', 'Operator', 'Machine', 'Setup Time'], [12, 8, 25, 30, 12]),
+]
+MANHOURS_EXPORT_STYLES = {
+    'mh_bold': dict(font=Font(bold=True)),
+    'mh_header': dict(font=Font(bold=True), fill=fill("D9D9D9"), border=THIN_BORDER),
+    'mh_cell': dict(border=THIN_BORDER),
+    'mh_date': dict(border=THIN_BORDER, number_format='yyyy-mm-dd'),
+}
+
+def build_manhours_export(start_date, end_date, selected_reports, progress=None):
+    """Build the manhours workbook; `progress(done, total)` is called while the logs are read."""
+    logs = ManhoursLogsheet.objects.filter(date_completed__range=(start_date, end_date)).select_related('machine').order_by('date_completed')
+    total = logs.count() if progress else 0
+
+    export = XlsxExport(MANHOURS_EXPORT_STYLES)
+    sheets = {}
+    for key, title, headers, widths in MANHOURS_REPORTS:
+        if key in selected_reports:
+            sheets[key] = export.add_sheet(title, headers=headers, widths=widths, header_style='mh_header', preamble=[
+                (["RYONAN ELECTRIC PHILIPPINES"], 'mh_bold'),
+                ([title], None),
+                ([], None),
+            ])
+
+    # One pass over the logs feeds every detail sheet and the per day and shift totals
+    grouped = {}
+    for done, log in enumerate(rows_of(logs), start=1):
+        date = log.date_completed.date()
+        machine = log.machine.machine_name if log.machine else 'N/A'
+
+        totals = grouped.setdefault((date, log.shift), {'output': 0, 'manhours': 0})
+        totals['output'] += float(log.output)
+        totals['manhours'] += float(log.manhours)
+
+        if 'operator_performance' in sheets:
+            sheets['operator_performance'].append(
+                [log.operator, date, log.shift, float(log.output), float(log.manhours), float(log.total_output)],
+                style='mh_cell', styles={1: 'mh_date'})
+        if 'machine_utilization' in sheets:
+            sheets['machine_utilization'].append([machine, date, log.shift, float(log.manhours)], style='mh_cell',
+                                                styles={1: 'mh_date'})
+        if 'operator_machine_pairing' in sheets:
+            sheets['operator_machine_pairing'].append([date, log.shift, log.operator, machine], style='mh_cell',
+                                                     styles={0: 'mh_date'})
+        if 'setup_time_analysis' in sheets and log.setup > 0:
+            sheets['setup_time_analysis'].append([date, log.shift, log.operator, machine, log.setup], style='mh_cell',
+                                                styles={0: 'mh_date'})
+        if progress:
+            progress(done, total)
+
+    for (date, shift), totals in grouped.items():
+        day = date.strftime('%Y-%m-%d')
+        if 'daily_summary' in sheets:
+            sheets['daily_summary'].append([day, shift, totals['manhours']], style='mh_cell')
+        if 'daily_output' in sheets:
+            sheets['daily_output'].append([day, shift, totals['output']], style='mh_cell')
+        if 'shift_comparison' in sheets:
+            sheets['shift_comparison'].append([day, shift, totals['output'], totals['manhours']], style='mh_cell')
+
+    filename = f"Manhours_Export_{start_date.date()}_to_{end_date.date()}.xlsx"
+    return export, filename
+
 @login_required(login_url="user-login")
 def export_reports(request):
     if request.method == 'POST':
@@ -621,114 +680,19 @@ def export_reports(request):
         end_date = request.POST.get('end_date')
         selected_reports = request.POST.getlist('export_reports[]')
 
+        # The export page builds the workbook in the background and downloads it once the job is done
+        if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+            job = enqueue('manhours.export_reports', request.user, params={
+                'start_date': start_date,
+                'end_date': end_date,
+                'reports': selected_reports,
+            })
+            return job_accepted(job)
+
         start_date = datetime.strptime(start_date, '%Y-%m-%d')
         end_date = datetime.strptime(end_date, '%Y-%m-%d')
 
-        logs = ManhoursLogsheet.objects.filter(date_completed__range=(start_date, end_date)).order_by('date_completed')
-
-        wb = Workbook()
-        wb.remove(wb.active)
-
-        bold_font = Font(bold=True)
-        header_fill = PatternFill(start_color="D9D9D9", end_color="D9D9D9", fill_type="solid")
-        thin_border = Border(
-            left=Side(style='thin'), right=Side(style='thin'),
-            top=Side(style='thin'), bottom=Side(style='thin')
-        )
-
-        def add_sheet(title, rows, headers):
-            sheet = wb.create_sheet(title=title)
-            sheet['A1'] = "RYONAN ELECTRIC PHILIPPINES"
-            sheet['A1'].font = bold_font
-            sheet['A2'] = title
-
-            sheet.append([])
-            sheet.append(headers)
-
-            for col, cell in enumerate(sheet[4], start=1):
-                cell.font = bold_font
-                cell.fill = header_fill
-                cell.border = thin_border
-
-            for row_data in rows:
-                sheet.append(row_data)
-                for col in range(1, len(row_data) + 1):
-                    cell = sheet.cell(row=sheet.max_row, column=col)
-                    cell.border = thin_border
-
-            for col in sheet.columns:
-                max_length = max((len(str(cell.value)) for cell in col if cell.value), default=0)
-                sheet.column_dimensions[col[0].column_letter].width = max_length + 2
-
-        if 'daily_summary' in selected_reports:
-            headers = ['Date', 'Shift', 'Total Manhours']
-            grouped = {}
-            for log in logs:
-                key = (log.date_completed.date(), log.shift)
-                grouped.setdefault(key, 0)
-                grouped[key] += float(log.manhours)
-            rows = [[date.strftime('%Y-%m-%d'), shift, total] for (date, shift), total in grouped.items()]
-            add_sheet("Daily Manhours Summary", rows, headers)
-
-        if 'operator_performance' in selected_reports:
-            headers = ['Operator', 'Date', 'Shift', 'Output', 'Manhours', 'Output per Hour']
-            rows = [
-                [log.operator, log.date_completed.date(), log.shift, float(log.output),
-                 float(log.manhours), float(log.total_output)]
-                for log in logs
-            ]
-            add_sheet("Operator Performance", rows, headers)
-
-        if 'machine_utilization' in selected_reports:
-            headers = ['Machine', 'Date', 'Shift', 'Manhours']
-            rows = [
-                [log.machine.machine_name if log.machine else 'N/A', log.date_completed.date(), log.shift, float(log.manhours)]
-                for log in logs
-            ]
-            add_sheet("Machine Utilization", rows, headers)
-
-        if 'daily_output' in selected_reports:
-            headers = ['Date', 'Shift', 'Total Output']
-            grouped = {}
-            for log in logs:
-                key = (log.date_completed.date(), log.shift)
-                grouped.setdefault(key, 0)
-                grouped[key] += float(log.output)
-            rows = [[date.strftime('%Y-%m-%d'), shift, total] for (date, shift), total in grouped.items()]
-            add_sheet("Daily Output Summary", rows, headers)
-
-        if 'operator_machine_pairing' in selected_reports:
-            headers = ['Date', 'Shift', 'Operator', 'Machine']
-            rows = [
-                [log.date_completed.date(), log.shift, log.operator, log.machine.machine_name if log.machine else 'N/A']
-                for log in logs
-            ]
-            add_sheet("Operator-Machine Pairing", rows, headers)
-
-        if 'shift_comparison' in selected_reports:
-            headers = ['Date', 'Shift', 'Total Output', 'Total Manhours']
-            grouped = {}
-            for log in logs:
-                key = (log.date_completed.date(), log.shift)
-                if key not in grouped:
-                    grouped[key] = {'output': 0, 'manhours': 0}
-                grouped[key]['output'] += float(log.output)
-                grouped[key]['manhours'] += float(log.manhours)
-            rows = [[date.strftime('%Y-%m-%d'), shift, data['output'], data['manhours']] for (date, shift), data in grouped.items()]
-            add_sheet("Shift Comparison", rows, headers)
-
-        if 'setup_time_analysis' in selected_reports:
-            headers = ['Date', 'Shift', 'Operator', 'Machine', 'Setup Time']
-            rows = [
-                [log.date_completed.date(), log.shift, log.operator, log.machine.machine_name if log.machine else 'N/A', log.setup]
-                for log in logs if log.setup > 0
-            ]
-            add_sheet("Setup Time Analysis", rows, headers)
-
-        response = HttpResponse(content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
-        filename = f"Manhours_Export_{start_date.date()}_to_{end_date.date()}.xlsx"
-        response['Content-Disposition'] = f'attachment; filename={filename}'
-        wb.save(response)
-        return response
+        export, filename = build_manhours_export(start_date, end_date, selected_reports)
+        return export.response(filename)
 
-    return redirect(request, 'manhours')
\ No newline at end of file
+    return redirect('manhours')
\ No newline at end of file
@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class MonitoringConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'monitoring'
+
+    def ready(self):
+        from pdnportal.cache import track_model_versions
+        from .models import (Monitoring, SupervisorToMonitor, LineToMonitor, ProductionSchedulePlan,
+                             ProductionOutput, OutputLog, RecentActivity)
+
+        track_model_versions(Monitoring, SupervisorToMonitor, LineToMonitor, ProductionSchedulePlan,
+                             ProductionOutput, OutputLog, RecentActivity)
@@ -0,0 +1,214 @@
+from datetime import datetime
+
+import pandas as pd
+from django.db import transaction
+from django.utils import timezone
+
+from notification.models import Notification
+from settings.background import job_handler, report_progress, batches, JobError
+from .models import Monitoring, Product, ProductionSchedulePlan, RecentActivity, Line
+
+
+def read_rows(job, required_columns):
+    with job.input_file.open('rb') as handle:
+        df = pd.read_excel(handle)
+
+    missing_columns = [column for column in required_columns if column not in df.columns]
+    if missing_columns:
+        raise JobError(f"Missing required columns: {', '.join(missing_columns)}")
+    return df
+
+
+def notify_import_result(job, title, summary, errors):
+    """Let the user who queued the import know how it went, with the first few row errors."""
+    if not job.created_by:
+        return
+    lines = [summary] + errors[:5]
+    if len(errors) > 5:
+        lines.append(f"...and {len(errors) - 5} more errors")
+    Notification.objects.create(
+        sender=job.created_by,
+        recipient=job.created_by,
+        title=title,
+        message='\n'.join(lines)
+    )
+
+
+@job_handler('monitoring.import_products')
+def import_products(job):
+    monitoring = Monitoring.objects.get(id=job.params['monitoring_id'])
+    df = read_rows(job, ['product_name', 'line_id', 'qty_per_box', 'qty_per_hour'])
+
+    products_created = 0
+    products_skipped = 0
+    errors = []
+    report_progress(job, 0, len(df), 'Importing products')
+
+    done = 0
+    for batch in batches(df.iterrows()):
+        with transaction.atomic():
+            for index, row in batch:
+                try:
+                    product_name = str(row['product_name']).strip()
+                    line_id = int(row['line_id'])
+                    qty_per_box = int(row['qty_per_box'])
+                    qty_per_hour = int(row['qty_per_hour'])
+                    description = str(row.get('description', '')) if not pd.isna(row.get('description', '')) else ''
+
+                    line = Line.objects.filter(id=line_id).first()
+                    if not line:
+                        errors.append(f"Row {index+2}: Line ID {line_id} does not exist")
+                        products_skipped += 1
+                        continue
+
+                    existing_product = Product.objects.filter(
+                        monitoring=monitoring,
+                        product_name=product_name,
+                        line=line
+                    ).first()
+
+                    if existing_product:
+                        existing_product.qty_per_box = qty_per_box
+                        existing_product.qty_per_hour = qty_per_hour
+                        existing_product.description = description
+                        existing_product.save()
+                        products_created += 1
+                    else:
+                        Product.objects.create(
+                            monitoring=monitoring,
+                            product_name=product_name,
+                            line=line,
+                            qty_per_box=qty_per_box,
+                            qty_per_hour=qty_per_hour,
+                            description=description
+                        )
+                        products_created += 1
+
+                except Exception as e:
+                    errors.append(f"Row {index+2}: {str(e)}")
+                    products_skipped += 1
+        done += len(batch)
+        report_progress(job, done)
+
+    RecentActivity.objects.create(
+        monitoring=monitoring,
+        title="Products Imported",
+        description=f"{products_created} products imported, {products_skipped} skipped",
+        activity_type='info',
+        shift='AM' if timezone.now().hour < 12 else 'PM',
+        created_by=job.created_by
+    )
+
+    if errors:
+        summary = f"Imported {products_created} products with {len(errors)} errors"
+    else:
+        summary = f"Successfully imported {products_created} products"
+    notify_import_result(job, "Products Imported", summary, errors)
+
+    return {
+        'created_count': products_created,
+        'skipped_count': products_skipped,
+        'errors': errors[:50],
+    }
+
+
+@job_handler('monitoring.import_schedules')
+def import_schedules(job):
+    monitoring = Monitoring.objects.get(id=job.params['monitoring_id'])
+    df = read_rows(job, ['product_name', 'date_planned', 'shift', 'planned_qty', 'status'])
+
+    schedules_created = 0
+    schedules_updated = 0
+    schedules_skipped = 0
+    errors = []
+    report_progress(job, 0, len(df), 'Importing schedules')
+
+    done = 0
+    for batch in batches(df.iterrows()):
+        with transaction.atomic():
+            for index, row in batch:
+                try:
+                    product_name = str(row['product_name']).strip()
+
+                    if isinstance(row['date_planned'], str):
+                        date_planned = datetime.strptime(row['date_planned'], '%Y-%m-%d').date()
+                    else:
+                        date_planned = row['date_planned'].date()
+
+                    shift = str(row['shift']).strip().upper()
+                    planned_qty = int(row['planned_qty'])
+                    status = str(row['status']).strip()
+
+                    product = Product.objects.filter(
+                        product_name=product_name,
+                        monitoring=monitoring
+                    ).first()
+
+                    if not product:
+                        errors.append(f"Row {index+2}: Product '{product_name}' does not exist or doesn't belong to this monitoring group")
+                        schedules_skipped += 1
+                        continue
+
+                    if shift not in ['AM', 'PM']:
+                        errors.append(f"Row {index+2}: Invalid shift value. Must be 'AM' or 'PM'")
+                        schedules_skipped += 1
+                        continue
+
+                    valid_statuses = ['Planned', 'Change Load', 'Backlog']
+                    if status not in valid_statuses:
+                        errors.append(f"Row {index+2}: Invalid status value. Must be one of {', '.join(valid_statuses)}")
+                        schedules_skipped += 1
+                        continue
+
+                    existing_schedule = ProductionSchedulePlan.objects.filter(
+                        monitoring=monitoring,
+                        product_number=product,
+                        date_planned=date_planned,
+                        shift=shift
+                    ).first()
+
+                    if existing_schedule:
+                        existing_schedule.planned_qty = planned_qty
+                        existing_schedule.status = status
+                        existing_schedule.balance = planned_qty
+                        existing_schedule.save()
+                        schedules_updated += 1
+                    else:
+                        ProductionSchedulePlan.objects.create(
+                            monitoring=monitoring,
+                            product_number=product,
+                            date_planned=date_planned,
+                            shift=shift,
+                            planned_qty=planned_qty,
+                            balance=planned_qty,
+                            status=status
+                        )
+                        schedules_created += 1
+
+                except Exception as e:
+                    errors.append(f"Row {index+2}: {str(e)}")
+                    schedules_skipped += 1
+        done += len(batch)
+        report_progress(job, done)
+
+    RecentActivity.objects.create(
+        monitoring=monitoring,
+        title="Schedules Imported",
+        description=f"{schedules_created} created, {schedules_updated} updated, {schedules_skipped} skipped",
+        activity_type='info',
+        shift='AM' if timezone.now().hour < 12 else 'PM',
+        created_by=job.created_by
+    )
+
+    if errors:
+        summary = f"Imported {schedules_created} schedules, updated {schedules_updated}, with {len(errors)} errors"
+    else:
+        summary = f"Successfully imported {schedules_created} schedules and updated {schedules_updated}"
+    notify_import_result(job, "Schedules Imported", summary, errors)
+
+    return {
+        'created_count': schedules_created,
+        'updated_count': schedules_updated,
+        'skipped_count': schedules_skipped,
+        'errors': errors[:50],
+    }
@@ -11,10 +11,14 @@ from datetime import datetime, timedelta, time
 from .models import Monitoring, Product, ProductionSchedulePlan, ProductionOutput, Line, LineToMonitor, SupervisorToMonitor, RecentActivity, OutputLog
 from .forms import MonitoringGroupForm, ProductForm, ScheduleForm, OutputForm
 from portalusers.models import Users
-import pandas as pd
+from pdnportal.cache import cached_aggregate, conditional_etag
+from settings.background import enqueue
+
+OUTPUT_CHANGE_MODELS = ['monitoring.monitoring', 'monitoring.supervisortomonitor', 'monitoring.linetomonitor',
+                        'monitoring.productionscheduleplan', 'monitoring.productionoutput', 'monitoring.outputlog',
+                        'monitoring.recentactivity']
 import openpyxl
 from io import BytesIO
-from django.db import transaction
 
 @login_required(login_url="user-login")
 def monitoring_dashboard(request):
@@ -588,84 +592,10 @@ def import_products(request):
         messages.error(request, "Uploaded file is not an Excel file")
         return redirect('supervisor_monitoring')
 
-    try:
-        df = pd.read_excel(excel_file)
-
-        required_columns = ['product_name', 'line_id', 'qty_per_box', 'qty_per_hour']
-        for column in required_columns:
-            if column not in df.columns:
-                messages.error(request, f"Missing required column: {column}")
-                return redirect('supervisor_monitoring')
-
-        products_created = 0
-        products_skipped = 0
-        errors = []
-
-        with transaction.atomic():
-            for index, row in df.iterrows():
-                try:
-                    product_name = str(row['product_name']).strip()
-                    line_id = int(row['line_id'])
-                    qty_per_box = int(row['qty_per_box'])
-                    qty_per_hour = int(row['qty_per_hour'])
-                    description = str(row.get('description', '')) if not pd.isna(row.get('description', '')) else ''
-
-                    line = Line.objects.filter(id=line_id).first()
-                    if not line:
-                        errors.append(f"Row {index+2}: Line ID {line_id} does not exist")
-                        products_skipped += 1
-                        continue
-
-                    existing_product = Product.objects.filter(
-                        monitoring=monitoring,
-                        product_name=product_name,
-                        line=line
-                    ).first()
-
-                    if existing_product:
-                        existing_product.qty_per_box = qty_per_box
-                        existing_product.qty_per_hour = qty_per_hour
-                        existing_product.description = description
-                        existing_product.save()
-                        products_created += 1
-                    else:
-                        Product.objects.create(
-                            monitoring=monitoring,
-                            product_name=product_name,
-                            line=line,
-                            qty_per_box=qty_per_box,
-                            qty_per_hour=qty_per_hour,
-                            description=description
-                        )
-                        products_created += 1
-
-                except Exception as e:
-                    errors.append(f"Row {index+2}: {str(e)}")
-                    products_skipped += 1
-
-        RecentActivity.objects.create(
-            monitoring=monitoring,
-            title="Products Imported",
-            description=f"{products_created} products imported, {products_skipped} skipped",
-            activity_type='info',
-            shift='AM' if timezone.now().hour < 12 else 'PM',
-            created_by=request.user
-        )
-
-        if errors:
-            messages.warning(request, f"Imported {products_created} products with {len(errors)} errors")
-            for error in errors[:5]:
-                messages.error(request, error)
-            if len(errors) > 5:
-                messages.error(request, f"...and {len(errors) - 5} more errors")
-        else:
-            messages.success(request, f"Successfully imported {products_created} products")
-
-        return redirect('supervisor_monitoring')
-
-    except Exception as e:
-        messages.error(request, f"Error processing Excel file: {str(e)}")
-        return redirect('supervisor_monitoring')
+    # Rows are imported by a background worker, the result arrives as a notification
+    enqueue('monitoring.import_products', request.user, params={'monitoring_id': monitoring.id}, upload=excel_file)
+    messages.info(request, "Product import started, you will be notified when it finishes")
+    return redirect('supervisor_monitoring')
 
 
 # SCHEDULE TAB
@@ -1100,112 +1030,16 @@ def import_schedules(request):
         messages.error(request, "Uploaded file is not an Excel file")
         return redirect('supervisor_monitoring')
 
-    try:
-        df = pd.read_excel(excel_file)
-
-        required_columns = ['product_name', 'date_planned', 'shift', 'planned_qty', 'status']
-        missing_columns = [col for col in required_columns if col not in df.columns]
-
-        if missing_columns:
-            messages.error(request, f"Missing required columns: {', '.join(missing_columns)}")
-            return redirect('supervisor_monitoring')
-
-        schedules_created = 0
-        schedules_updated = 0
-        schedules_skipped = 0
-        errors = []
-
-        with transaction.atomic():
-            for index, row in df.iterrows():
-                try:
-                    product_name = str(row['product_name']).strip()
-
-                    if isinstance(row['date_planned'], str):
-                        date_planned = datetime.strptime(row['date_planned'], '%Y-%m-%d').date()
-                    else:
-                        date_planned = row['date_planned'].date()
-
-                    shift = str(row['shift']).strip().upper()
-                    planned_qty = int(row['planned_qty'])
-                    status = str(row['status']).strip()
-
-                    product = Product.objects.filter(
-                        product_name=product_name,
-                        monitoring=monitoring
-                    ).first()
-
-                    if not product:
-                        errors.append(f"Row {index+2}: Product '{product_name}' does not exist or doesn't belong to this monitoring group")
-                        schedules_skipped += 1
-                        continue
-
-                    if shift not in ['AM', 'PM']:
-                        errors.append(f"Row {index+2}: Invalid shift value. Must be 'AM' or 'PM'")
-                        schedules_skipped += 1
-                        continue
-
-                    valid_statuses = ['Planned', 'Change Load', 'Backlog']
-                    if status not in valid_statuses:
-                        errors.append(f"Row {index+2}: Invalid status value. Must be one of {', '.join(valid_statuses)}")
-                        schedules_skipped += 1
-                        continue
-
-                    existing_schedule = ProductionSchedulePlan.objects.filter(
-                        monitoring=monitoring,
-                        product_number=product,
-                        date_planned=date_planned,
-                        shift=shift
-                    ).first()
-
-                    if existing_schedule:
-                        existing_schedule.planned_qty = planned_qty
-                        existing_schedule.status = status
-                        existing_schedule.balance = planned_qty
-                        existing_schedule.save()
-                        schedules_updated += 1
-                    else:
-                        ProductionSchedulePlan.objects.create(
-                            monitoring=monitoring,
-                            product_number=product,
-                            date_planned=date_planned,
-                            shift=shift,
-                            planned_qty=planned_qty,
-                            balance=planned_qty,
-                            status=status
-                        )
-                        schedules_created += 1
-
-                except Exception as e:
-                    errors.append(f"Row {index+2}: {str(e)}")
-                    schedules_skipped += 1
-
-        RecentActivity.objects.create(
-            monitoring=monitoring,
-            title="Schedules Imported",
-            description=f"{schedules_created} created, {schedules_updated} updated, {schedules_skipped} skipped",
-            activity_type='info',
-            shift='AM' if timezone.now().hour < 12 else 'PM',
-            created_by=request.user
-        )
-
-        if errors:
-            messages.warning(request, f"Imported {schedules_created} schedules, updated {schedules_updated}, with {len(errors)} errors")
-            for error in errors[:5]:
-                messages.error(request, error)
-            if len(errors) > 5:
-                messages.error(request, f"...and {len(errors) - 5} more errors")
-        else:
-            messages.success(request, f"Successfully imported {schedules_created} schedules and updated {schedules_updated}")
-
-        return redirect('supervisor_monitoring')
-
-    except Exception as e:
-        messages.error(request, f"Error processing Excel file: {str(e)}")
-        return redirect('supervisor_monitoring')
+    # Rows are imported by a background worker, the result arrives as a notification
+    enqueue('monitoring.import_schedules', request.user, params={'monitoring_id': monitoring.id}, upload=excel_file)
+    messages.info(request, "Schedule import started, you will be notified when it finishes")
+    return redirect('supervisor_monitoring')
 
 
 # CHART DATA
 @login_required(login_url="user-login")
+@cached_aggregate('monitoring', OUTPUT_CHANGE_MODELS,
+                  scope=lambda request: 'all' if request.user.monitoring_sales else f'user-{request.user.pk}')
 def get_chart_data(request, period):
     """
     Get chart data for the dashboard based on the specified period.
@@ -1502,6 +1336,7 @@ def group_dashboard(request, group_id):
     return render(request, 'monitoring/group-dashboard.html', context)
 
 @login_required(login_url="user-login")
+@conditional_etag(OUTPUT_CHANGE_MODELS)
 def group_dashboard_data(request, group_id):
     try:
         monitoring = get_object_or_404(Monitoring, id=group_id)
@@ -1655,6 +1490,7 @@ def group_dashboard_data(request, group_id):
 
 # LINE DASHBOARD
 @login_required(login_url="user-login")
+@conditional_etag(OUTPUT_CHANGE_MODELS, ajax_only=True)
 def production_dashboard(request):
     now = localtime()
     today = now.date()
@@ -0,0 +1,167 @@
+"""
+Buffered system activity logging.
+
+log_activity() does not write a SystemActivity row itself. Events logged
+inside a transaction (every request runs in one, ATOMIC_REQUESTS) are
+collected in a batch registered with transaction.on_commit(), and the batch
+is written with one bulk_create once the transaction commits. A rolled back
+transaction drops its events together with the changes they describe.
+Events logged outside a transaction are written straight away.
+
+With SYSTEM_ACTIVITY_ASYNC set, committed batches are handed to a writer
+thread instead, which inserts whatever has queued up every
+SYSTEM_ACTIVITY_FLUSH_SECONDS, so high-volume sources never wait on the
+activity table.
+
+Old activity is rolled up by `manage.py prune_system_activity`, see
+rollup_activity().
+"""
+import logging
+import queue
+import threading
+import weakref
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections, connection, transaction
+from django.db.models import Count, Max
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from .models import SystemActivity
+
+logger = logging.getLogger(__name__)
+
+# Rows inserted per statement when a batch is written
+WRITE_BATCH_SIZE = 500
+# Ends the description of the summary rows written by rollup_activity()
+ROLLUP_SUFFIX = '(rolled up)'
+
+_queue = queue.Queue()
+_writer = None
+_writer_lock = threading.Lock()
+
+
+# Open batches of this thread by savepoint ids. The values are weak references: the only strong one is
+# held by the transaction's on_commit list, so a batch drops out of here once it has run or its
+# transaction (or savepoint) was rolled back, and a later transaction never picks up a stale one.
+_open = threading.local()
+
+
+class ActivityBatch:
+    """The events logged in one transaction, written when it commits."""
+
+    def __init__(self):
+        self.events = []
+        self.written = False
+
+    def __call__(self):
+        self.written = True
+        if settings.SYSTEM_ACTIVITY_ASYNC:
+            start_writer()
+            _queue.put(self.events)
+        else:
+            write_events(self.events)
+
+
+def open_batches():
+    if not hasattr(_open, 'batches'):
+        _open.batches = weakref.WeakValueDictionary()
+    return _open.batches
+
+
+def current_batch():
+    """The batch of the current transaction (or savepoint), registering a new one if there is none."""
+    batches = open_batches()
+    key = tuple(connection.savepoint_ids)
+    batch = batches.get(key)
+    if batch is None or batch.written:
+        batch = ActivityBatch()
+        transaction.on_commit(batch)
+        batches[key] = batch
+    return batch
+
+
+def log_activity(user, activity_type, description):
+    """Record a system activity; it is written once the current transaction commits."""
+    event = SystemActivity(user=user, activity_type=activity_type, description=description)
+    if not connection.in_atomic_block:
+        write_events([event])
+        return event
+    current_batch().events.append(event)
+    return event
+
+
+def write_events(events):
+    if events:
+        SystemActivity.objects.bulk_create(events, batch_size=WRITE_BATCH_SIZE)
+
+
+def writer_loop(stop_event=None):
+    """Write queued batches, collecting everything that arrived during each wait into one insert."""
+    stop_event = stop_event or threading.Event()
+    while not stop_event.is_set():
+        try:
+            events = _queue.get(timeout=settings.SYSTEM_ACTIVITY_FLUSH_SECONDS)
+        except queue.Empty:
+            continue
+        while True:
+            try:
+                events.extend(_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        close_old_connections()
+        try:
+            write_events(events)
+        except DatabaseError:
+            logger.exception(f"Could not write {len(events)} system activities")
+        finally:
+            connection.close()
+        stop_event.wait(settings.SYSTEM_ACTIVITY_FLUSH_SECONDS)
+
+
+def start_writer():
+    """Start the activity writer thread once per process."""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = threading.Thread(target=writer_loop, name='activity-writer', daemon=True)
+            _writer.start()
+    return _writer
+
+
+def rollup_activity(days=None, dry_run=False):
+    """
+    Replace activity older than `days` by one summary row per user, type and month.
+
+    Returns (rows removed, summary rows written).
+    """
+    days = settings.SYSTEM_ACTIVITY_RETENTION_DAYS if days is None else days
+    cutoff = timezone.now() - timedelta(days=days)
+    old = SystemActivity.objects.filter(timestamp__lt=cutoff).exclude(description__endswith=ROLLUP_SUFFIX)
+
+    groups = list(
+        old.annotate(month=TruncMonth('timestamp'))
+        .values('user_id', 'activity_type', 'month')
+        .annotate(count=Count('id'), last=Max('timestamp'))
+        .order_by('month', 'user_id', 'activity_type')
+    )
+    if dry_run:
+        return sum(group['count'] for group in groups), len(groups)
+
+    labels = dict(SystemActivity.ACTIVITY_TYPES)
+    summaries = [
+        SystemActivity(
+            user_id=group['user_id'],
+            activity_type=group['activity_type'],
+            description=f"{group['count']} {labels.get(group['activity_type'], group['activity_type'])} "
+                        f"activities in {timezone.localtime(group['last']):%B %Y} {ROLLUP_SUFFIX}",
+            timestamp=group['last'],
+        )
+        for group in groups
+    ]
+    with transaction.atomic():
+        removed, _ = old.delete()
+        write_events(summaries)
+    return removed, len(summaries)
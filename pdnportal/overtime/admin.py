@@ -3,6 +3,7 @@ from .models import (
     Employee, EmployeeGroup, OTFiling, ShiftingOT, 
     DailyOT, EmployeeOTStatus, LateFilingPassword, SystemActivity
 )
+from .utils import refresh_roster, refresh_status_counts
 
 class EmployeeAdmin(admin.ModelAdmin):
     list_display = ('id_number', 'name', 'department', 'line', 'shuttle_service', 'is_active')
@@ -32,10 +33,10 @@ class DailyOTInline(admin.StackedInline):
     can_delete = False
 
 class OTFilingAdmin(admin.ModelAdmin):
-    list_display = ('filing_id', 'filing_type', 'group', 'requestor', 'status', 'date_created')
+    list_display = ('filing_id', 'filing_type', 'group', 'requestor', 'status', 'employee_count', 'date_created')
     list_filter = ('filing_type', 'status', 'requestor')
     search_fields = ('filing_id', 'group__name', 'requestor__username')
-    readonly_fields = ('filing_id',)
+    readonly_fields = ('filing_id', 'employee_count', 'ot_count', 'not_ot_count', 'absent_count', 'leave_count')
     inlines = [ShiftingOTInline, DailyOTInline, EmployeeOTStatusInline]
     
     def get_inlines(self, request, obj=None):
@@ -49,6 +50,11 @@ class OTFilingAdmin(admin.ModelAdmin):
         
         return super().get_inlines(request, obj)
 
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        refresh_status_counts([form.instance])
+        refresh_roster([form.instance])
+
 class LateFilingPasswordAdmin(admin.ModelAdmin):
     list_display = ('get_password_type_display', 'password', 'last_updated', 'updated_by')
     list_filter = ('password_type',)
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class OvertimeConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'overtime'
+
+    def ready(self):
+        from pdnportal.cache import track_model_versions
+        from .models import OTFiling, EmployeeOTStatus, LateFilingPassword
+
+        track_model_versions(OTFiling, EmployeeOTStatus, LateFilingPassword)
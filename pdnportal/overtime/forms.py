@@ -1,8 +1,11 @@
 # overtime/forms.py
+import json
+
 from django import forms
 from django.core.exceptions import ValidationError
 from portalusers.models import Users
 from .models import Employee, EmployeeGroup, OTFiling, ShiftingOT, DailyOT, EmployeeOTStatus, LateFilingPassword
+from .policy import late_filing_passwords, password_type_for
 
 class EmployeeForm(forms.ModelForm):
     class Meta:
@@ -57,6 +60,49 @@ class ShuttleAssignmentForm(forms.Form):
 
         return employee_id
 
+def clean_employee_statuses(value):
+    """
+    Parse the submitted [{'id': ..., 'status': ...}] list into {employee id: status},
+    checking every employee exists with a single query.
+    """
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except json.JSONDecodeError as e:
+            raise ValidationError(f"Invalid employee_statuses format: {str(e)}")
+    if not isinstance(value, list) or not value:
+        raise ValidationError("Select at least one employee.")
+
+    valid_statuses = dict(EmployeeOTStatus.STATUS_CHOICES)
+    statuses = {}
+    for entry in value:
+        try:
+            employee_id = int(entry['id'])
+            status = entry['status']
+        except (KeyError, TypeError, ValueError):
+            raise ValidationError("Each employee needs an id and a status.")
+        if status not in valid_statuses:
+            raise ValidationError(f"Invalid status '{status}'.")
+        statuses[employee_id] = status
+
+    employees = Employee.objects.in_bulk(list(statuses))
+    missing = [str(employee_id) for employee_id in statuses if employee_id not in employees]
+    if missing:
+        raise ValidationError(f"Employee does not exist: {', '.join(missing)}.")
+
+    return statuses
+
+def check_late_filing_password(password, password_type):
+    """Validate a late filing password against the cached policy, see overtime/policy.py."""
+    if not password:
+        raise ValidationError("Password is required for late filing.")
+
+    stored_password = late_filing_passwords().get(password_type)
+    if stored_password is None:
+        raise ValidationError("Late filing system is not properly configured.")
+    if password != stored_password:
+        raise ValidationError("Invalid password for late filing.")
+
 class ShiftingOTForm(forms.Form):
     group_id = forms.IntegerField(required=True)
     start_date = forms.DateField(required=True)
@@ -84,6 +130,9 @@ class ShiftingOTForm(forms.Form):
 
         return group_id
 
+    def clean_employee_statuses(self):
+        return clean_employee_statuses(self.cleaned_data.get('employee_statuses'))
+
     def clean_end_date(self):
         start_date = self.cleaned_data.get('start_date')
         end_date = self.cleaned_data.get('end_date')
@@ -97,15 +146,7 @@ class ShiftingOTForm(forms.Form):
         password = self.cleaned_data.get('late_filing_password')
 
         if self.late_filing:
-            if not password:
-                raise ValidationError("Password is required for late filing.")
-
-            try:
-                stored_password = LateFilingPassword.objects.get(password_type='SHIFTING')
-                if password != stored_password.password:
-                    raise ValidationError("Invalid password for late filing.")
-            except LateFilingPassword.DoesNotExist:
-                raise ValidationError("Late filing system is not properly configured.")
+            check_late_filing_password(password, password_type_for('SHIFTING'))
 
         return password
 
@@ -139,6 +180,9 @@ class DailyOTForm(forms.Form):
 
         return group_id
 
+    def clean_employee_statuses(self):
+        return clean_employee_statuses(self.cleaned_data.get('employee_statuses'))
+
     def clean(self):
         cleaned_data = super().clean()
         start_time = cleaned_data.get('start_time')
@@ -154,19 +198,7 @@ class DailyOTForm(forms.Form):
         schedule_type = self.cleaned_data.get('schedule_type')
 
         if self.late_filing:
-            if not password:
-                raise ValidationError("Password is required for late filing.")
-
-            password_type = 'DAILY'
-            if schedule_type in ['SUNDAY', 'SATURDAY', 'HOLIDAY']:
-                password_type = 'WEEKEND'
-
-            try:
-                stored_password = LateFilingPassword.objects.get(password_type=password_type)
-                if password != stored_password.password:
-                    raise ValidationError("Invalid password for late filing.")
-            except LateFilingPassword.DoesNotExist:
-                raise ValidationError("Late filing system is not properly configured.")
+            check_late_filing_password(password, password_type_for('DAILY', schedule_type))
 
         return password
 
@@ -0,0 +1,189 @@
+from contextlib import contextmanager
+
+import openpyxl
+from django.db import transaction
+
+from settings.background import job_handler, report_progress, batches, JobError, BATCH_SIZE
+from .models import Employee
+from .utils import proper_case, create_system_activity, sync_roster_shuttles
+
+
+# Employee columns an import writes, besides id_number
+EMPLOYEE_FIELDS = ['name', 'department', 'line', 'is_active']
+# Unknown id numbers listed in an import result, the rest are only counted
+MAX_REPORTED_IDS = 100
+
+
+@contextmanager
+def open_sheet(job):
+    """
+    Yield (headers, rows, row count) for the active sheet of the job's workbook.
+
+    The workbook is opened read-only, so rows are streamed from the file as
+    value tuples instead of the whole sheet being loaded into memory.
+    """
+    with job.input_file.open('rb') as handle:
+        workbook = openpyxl.load_workbook(handle, read_only=True)
+        try:
+            sheet = workbook.active
+            rows = sheet.iter_rows(values_only=True)
+
+            # Headers are matched case insensitively
+            headers = [str(value).lower() if value is not None else '' for value in next(rows, ())]
+            total_rows = max((sheet.max_row or 1) - 1, 0)  # Exclude header
+            yield headers, rows, total_rows
+        finally:
+            workbook.close()
+
+
+def cell_text(row, col):
+    if col is None or col >= len(row) or row[col] is None:
+        return ''
+    return str(row[col]).strip()
+
+
+@job_handler('overtime.import_shuttle')
+def import_shuttle(job):
+    """
+    Import shuttle assignments from Excel file.
+
+    The sheet is compared with the employees' current shuttle services and
+    only the employees whose assignment changed are written, with one
+    bulk_update in a single transaction.
+    """
+    current = {
+        id_number: (employee_id, shuttle_service or '')
+        for id_number, employee_id, shuttle_service in Employee.objects.values_list('id_number', 'id', 'shuttle_service')
+    }
+
+    with open_sheet(job) as (headers, rows, total_rows):
+        if 'id number' not in headers or 'shuttle service' not in headers:
+            raise JobError('Invalid file format. File must contain "ID Number" and "Shuttle Service" columns.')
+
+        id_col = headers.index('id number')
+        shuttle_col = headers.index('shuttle service')
+
+        report_progress(job, 0, total_rows, 'Reading shuttle assignments')
+
+        # Keyed by id number, so the last row for an employee wins
+        assignments = {}
+        unknown_ids = []
+        done = 0
+        for batch in batches(rows):
+            for row in batch:
+                id_number = cell_text(row, id_col)
+                if not id_number:
+                    continue
+                if id_number not in current:
+                    unknown_ids.append(id_number)
+                    continue
+                assignments[id_number] = cell_text(row, shuttle_col)
+            done += len(batch)
+            report_progress(job, done)
+
+    changed = [
+        Employee(id=current[id_number][0], shuttle_service=shuttle_service)
+        for id_number, shuttle_service in assignments.items()
+        if current[id_number][1] != shuttle_service
+    ]
+    report_progress(job, done, message=f'Updating {len(changed)} shuttle assignments', force=True)
+    with transaction.atomic():
+        Employee.objects.bulk_update(changed, ['shuttle_service'], batch_size=BATCH_SIZE)
+        sync_roster_shuttles([employee.id for employee in changed])
+
+    updated_count = len(changed)
+    unchanged_count = len(assignments) - updated_count
+    create_system_activity(
+        job.created_by,
+        'OTHER',
+        f"Imported shuttle assignments from Excel file. Updated {updated_count} out of {total_rows} employees "
+        f"({unchanged_count} unchanged, {len(unknown_ids)} unknown ID numbers)."
+    )
+
+    return {
+        'total_count': total_rows,
+        'updated_count': updated_count,
+        'unchanged_count': unchanged_count,
+        'unknown_count': len(unknown_ids),
+        'unknown_ids': unknown_ids[:MAX_REPORTED_IDS],
+    }
+
+
+@job_handler('overtime.import_employees')
+def import_employees(job):
+    """
+    Import employees from Excel file.
+
+    Existing employees are read once up front; each batch of rows is then
+    written with one bulk_create for new id numbers and one bulk_update for
+    employees whose details changed. Unchanged rows are not written.
+    """
+    existing = {
+        employee['id_number']: employee
+        for employee in Employee.objects.values('id', 'id_number', *EMPLOYEE_FIELDS)
+    }
+
+    with open_sheet(job) as (headers, rows, total_rows):
+        for header in ['id number', 'employee name']:
+            if header not in headers:
+                raise JobError(f'Invalid file format. File must contain "{header.title()}" column.')
+
+        id_col = headers.index('id number')
+        name_col = headers.index('employee name')
+        dept_col = headers.index('department') if 'department' in headers else None
+        line_col = headers.index('line') if 'line' in headers else None
+
+        created_count = 0
+        updated_count = 0
+        report_progress(job, 0, total_rows, 'Importing employees')
+
+        done = 0
+        for batch in batches(rows):
+            # Keyed by id number, so a repeated row overrides the earlier one like update_or_create did
+            imported = {}
+            for row in batch:
+                id_number = cell_text(row, id_col)
+                name = cell_text(row, name_col)
+                if id_number and name:
+                    imported[id_number] = {
+                        # bulk writes skip Employee.save(), which title-cases the name
+                        'name': proper_case(name).title(),
+                        'department': cell_text(row, dept_col) or None,
+                        'line': cell_text(row, line_col) or None,
+                        'is_active': True,
+                    }
+
+            new_employees = []
+            changed_employees = []
+            for id_number, values in imported.items():
+                current = existing.get(id_number)
+                if current is None:
+                    new_employees.append(Employee(id_number=id_number, **values))
+                elif any(current[field] != values[field] for field in EMPLOYEE_FIELDS):
+                    changed_employees.append(Employee(id=current['id'], **values))
+                    current.update(values)
+
+            with transaction.atomic():
+                Employee.objects.bulk_create(new_employees)
+                Employee.objects.bulk_update(changed_employees, EMPLOYEE_FIELDS)
+
+            for employee in new_employees:
+                existing[employee.id_number] = {'id': employee.id, 'id_number': employee.id_number,
+                                                **{field: getattr(employee, field) for field in EMPLOYEE_FIELDS}}
+            created_count += len(new_employees)
+            updated_count += len(changed_employees)
+            done += len(batch)
+            report_progress(job, done)
+
+    # One summary entry, bulk_create does not send the per-employee post_save activity
+    create_system_activity(
+        job.created_by,
+        'OTHER',
+        f"Imported employees from Excel file. Created {created_count} and updated {updated_count} out of {total_rows} employees."
+    )
+
+    return {
+        'total_count': total_rows,
+        'created_count': created_count,
+        'updated_count': updated_count,
+    }
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from overtime.activity import rollup_activity
+
+
+class Command(BaseCommand):
+    help = 'Roll system activity older than SYSTEM_ACTIVITY_RETENTION_DAYS up into one row per user, type and month'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=None,
+                            help='Roll up activity logged more than this many days ago (default SYSTEM_ACTIVITY_RETENTION_DAYS)')
+        parser.add_argument('--dry-run', action='store_true', help='Only report how many rows would be rolled up')
+
+    def handle(self, *args, **options):
+        removed, summaries = rollup_activity(options['days'], dry_run=options['dry_run'])
+
+        if options['dry_run']:
+            self.stdout.write(f'{removed} activities would be rolled up into {summaries} summary rows')
+            return
+        self.stdout.write(self.style.SUCCESS(f'Rolled up {removed} activities into {summaries} summary rows'))
@@ -0,0 +1,64 @@
+# Generated by Django 5.0.3 on 2026-10-19 12:01
+
+from django.db import migrations, models
+from django.db.models import Count
+
+STATUS_COUNT_FIELDS = {'OT': 'ot_count', 'NOT-OT': 'not_ot_count', 'ABSENT': 'absent_count', 'LEAVE': 'leave_count'}
+
+
+def count_statuses(apps, schema_editor):
+    OTFiling = apps.get_model('overtime', 'OTFiling')
+    EmployeeOTStatus = apps.get_model('overtime', 'EmployeeOTStatus')
+
+    counts = {}
+    rows = EmployeeOTStatus.objects.values('filing_id', 'status').annotate(count=Count('id')).order_by()
+    for row in rows:
+        filing_counts = counts.setdefault(row['filing_id'], {'employee_count': 0})
+        filing_counts['employee_count'] += row['count']
+        field = STATUS_COUNT_FIELDS.get(row['status'])
+        if field:
+            filing_counts[field] = filing_counts.get(field, 0) + row['count']
+
+    filings = []
+    for filing_id, filing_counts in counts.items():
+        filing = OTFiling(pk=filing_id, employee_count=filing_counts['employee_count'])
+        for field in STATUS_COUNT_FIELDS.values():
+            setattr(filing, field, filing_counts.get(field, 0))
+        filings.append(filing)
+    OTFiling.objects.bulk_update(filings, ['employee_count', *STATUS_COUNT_FIELDS.values()], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('overtime', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='otfiling',
+            name='absent_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='otfiling',
+            name='employee_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='otfiling',
+            name='leave_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='otfiling',
+            name='not_ot_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='otfiling',
+            name='ot_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(count_statuses, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.0.3 on 2026-10-19 12:11
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('overtime', '0002_otfiling_status_counts'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='employee',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['name', 'id'], name='employee_directory_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='employee',
+            index=models.Index(django.db.models.functions.text.Upper('name'), name='employee_name_prefix_idx'),
+        ),
+    ]
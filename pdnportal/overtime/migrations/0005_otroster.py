@@ -0,0 +1,65 @@
+# Generated by Django 5.0.3 on 2026-10-19 12:16
+
+from datetime import timedelta
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def build_roster(apps, schema_editor):
+    EmployeeOTStatus = apps.get_model('overtime', 'EmployeeOTStatus')
+    OTRoster = apps.get_model('overtime', 'OTRoster')
+
+    statuses = EmployeeOTStatus.objects.values_list(
+        'filing_id', 'employee_id', 'status', 'employee__shuttle_service', 'filing__filing_type',
+        'filing__shifting_details__start_date', 'filing__shifting_details__end_date',
+        'filing__shifting_details__shift_type', 'filing__daily_details__date',
+    ).order_by('id')
+
+    rows = []
+    for (filing_id, employee_id, status, shuttle_service, filing_type,
+         start_date, end_date, shift_type, daily_date) in statuses.iterator(chunk_size=2000):
+        if filing_type == 'SHIFTING' and start_date and end_date:
+            days = [start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1)]
+        else:
+            days = [daily_date] if filing_type == 'DAILY' and daily_date else []
+        rows.extend(
+            OTRoster(date=day, filing_id=filing_id, employee_id=employee_id, filing_type=filing_type,
+                     status=status, shift=shift_type or '', shuttle_service=shuttle_service or '')
+            for day in days
+        )
+        if len(rows) >= 2000:
+            OTRoster.objects.bulk_create(rows, batch_size=500)
+            rows = []
+    OTRoster.objects.bulk_create(rows, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('overtime', '0004_systemactivity_logged_timestamp'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OTRoster',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('filing_type', models.CharField(choices=[('SHIFTING', 'Shifting OT'), ('DAILY', 'Daily OT')], max_length=10)),
+                ('status', models.CharField(choices=[('OT', 'OT'), ('NOT-OT', 'Not OT'), ('ABSENT', 'Absent'), ('LEAVE', 'Leave')], max_length=10)),
+                ('shift', models.CharField(blank=True, max_length=2)),
+                ('shuttle_service', models.CharField(blank=True, max_length=100)),
+                ('employee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='roster', to='overtime.employee')),
+                ('filing', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='roster', to='overtime.otfiling')),
+            ],
+            options={
+                'verbose_name': 'OT Roster Entry',
+                'verbose_name_plural': 'OT Roster',
+                'ordering': ['date'],
+                'indexes': [models.Index(fields=['date', 'status'], name='ot_roster_headcount_idx'), models.Index(fields=['date', 'shuttle_service'], name='ot_roster_shuttle_idx')],
+                'unique_together': {('filing', 'employee', 'date')},
+            },
+        ),
+        migrations.RunPython(build_roster, migrations.RunPython.noop),
+    ]
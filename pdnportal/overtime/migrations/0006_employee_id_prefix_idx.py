@@ -0,0 +1,18 @@
+# Generated by Django 5.0.3 on 2026-10-19 14:20
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('overtime', '0005_otroster'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='employee',
+            index=models.Index(django.db.models.functions.text.Upper('id_number'), name='employee_id_prefix_idx'),
+        ),
+    ]
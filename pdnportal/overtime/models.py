@@ -1,7 +1,9 @@
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils import timezone
 from portalusers.models import Users
 from django.conf import settings
+from settings.sequences import allocate, DAILY
 
 class Employee(models.Model):
     id_number = models.CharField(max_length=20, unique=True)
@@ -24,6 +26,13 @@ class Employee(models.Model):
         ordering = ['-date_added']
         verbose_name = 'Employee'
         verbose_name_plural = 'Employees'
+        indexes = [
+            # Directory pages are keyset-paged by (name, id), see employee_list()
+            models.Index(fields=['name', 'id'], condition=models.Q(is_active=True), name='employee_directory_idx'),
+            # Case-insensitive ID number and name prefix search, see prefix_filter()
+            models.Index(Upper('id_number'), name='employee_id_prefix_idx'),
+            models.Index(Upper('name'), name='employee_name_prefix_idx'),
+        ]
 
 
 class EmployeeGroup(models.Model):
@@ -61,19 +70,28 @@ class OTFiling(models.Model):
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='PENDING')
     date_created = models.DateTimeField(auto_now_add=True)
     date_updated = models.DateTimeField(auto_now=True)
+
+    # Employee statuses of the filing by status, kept in sync by utils.refresh_status_counts()
+    employee_count = models.PositiveIntegerField(default=0)
+    ot_count = models.PositiveIntegerField(default=0)
+    not_ot_count = models.PositiveIntegerField(default=0)
+    absent_count = models.PositiveIntegerField(default=0)
+    leave_count = models.PositiveIntegerField(default=0)
     
     def __str__(self):
         return f"{self.filing_id} - {self.get_filing_type_display()}"
     
+    @classmethod
+    def allocate_filing_ids(cls, filing_type, count=1):
+        """Reserve `count` filing ids for today in one sequence update."""
+        prefix = "SFT" if filing_type == "SHIFTING" else "DLY"
+        today = timezone.localdate()
+        sequences = allocate(f'overtime.{filing_type.lower()}', count, reset=DAILY, day=today)
+        return [f"{prefix}{today.strftime('%Y%m%d')}{sequence:03d}" for sequence in sequences]
+
     def save(self, *args, **kwargs):
         if not self.filing_id:
-            prefix = "SFT" if self.filing_type == "SHIFTING" else "DLY"
-            date_str = timezone.now().strftime('%Y%m%d')
-            
-            today_start = timezone.now().replace(hour=0, minute=0, second=0)
-            count = OTFiling.objects.filter(date_created__gte=today_start, filing_type=self.filing_type).count() + 1
-            
-            self.filing_id = f"{prefix}{date_str}{count:03d}"
+            self.filing_id = OTFiling.allocate_filing_ids(self.filing_type)[0]
         
         super().save(*args, **kwargs)
     
@@ -141,6 +159,38 @@ class EmployeeOTStatus(models.Model):
         verbose_name_plural = 'Employee OT Statuses'
 
 
+class OTRoster(models.Model):
+    """
+    One row per employee per OT day of a filing, a shifting filing's date range
+    expanded into its days. Generated from the employee statuses by
+    utils.refresh_roster(), so headcount and shuttle planning are date lookups.
+    """
+    date = models.DateField()
+    filing = models.ForeignKey(OTFiling, on_delete=models.CASCADE, related_name='roster')
+    employee = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name='roster')
+    filing_type = models.CharField(max_length=10, choices=OTFiling.FILING_TYPES)
+    status = models.CharField(max_length=10, choices=EmployeeOTStatus.STATUS_CHOICES)
+    # AM or PM for shifting OT, blank for daily OT
+    shift = models.CharField(max_length=2, blank=True)
+    # The employee's shuttle service, kept current for upcoming days by utils.sync_roster_shuttles()
+    shuttle_service = models.CharField(max_length=100, blank=True)
+
+    def __str__(self):
+        return f"{self.date} - {self.employee_id} ({self.get_status_display()})"
+
+    class Meta:
+        ordering = ['date']
+        unique_together = ('filing', 'employee', 'date')
+        verbose_name = 'OT Roster Entry'
+        verbose_name_plural = 'OT Roster'
+        indexes = [
+            # Today's headcount per status, see overtime_view()
+            models.Index(fields=['date', 'status'], name='ot_roster_headcount_idx'),
+            # Shuttle planning per day and route
+            models.Index(fields=['date', 'shuttle_service'], name='ot_roster_shuttle_idx'),
+        ]
+
+
 class LateFilingPassword(models.Model):
     PASSWORD_TYPES = (
         ('SHIFTING', 'Shifting OT Password'),
@@ -173,7 +223,8 @@ class SystemActivity(models.Model):
     user = models.ForeignKey(Users, on_delete=models.CASCADE, related_name='system_activities')
     activity_type = models.CharField(max_length=10, choices=ACTIVITY_TYPES)
     description = models.TextField()
-    timestamp = models.DateTimeField(auto_now_add=True)
+    # Set when the activity is logged, it is written in a batch later, see overtime/activity.py
+    timestamp = models.DateTimeField(default=timezone.now, db_index=True)
     
     def __str__(self):
         return f"{self.get_activity_type_display()} - {self.user.username} ({self.timestamp})"
@@ -0,0 +1,67 @@
+"""
+Late-filing policy: the cutoff rules and the passwords that lift them.
+
+The passwords are read into the process once and reused until the
+LateFilingPassword version counter (see pdnportal/cache.py) changes. The
+counter lives in the shared cache, so checking it is a cache read, not a
+query. Saves through the model bump it, and update_password, reset_passwords
+and ensure_default_passwords call invalidate_passwords(), so a password
+changed in one worker is used by all of them on their next check.
+"""
+from datetime import time
+
+from pdnportal.cache import bump_model_version, get_versions
+from .models import LateFilingPassword
+
+# Passwords a missing password type is created with, and reset_passwords restores
+DEFAULT_PASSWORDS = {
+    'SHIFTING': 'shifting123',
+    'DAILY': 'daily123',
+    'WEEKEND': 'weekend123',
+    'HOLIDAY': 'holiday123',
+}
+# Daily OT for these schedules is filed with the weekend password
+WEEKEND_SCHEDULES = ('SATURDAY', 'SUNDAY', 'HOLIDAY')
+# Weekday daily OT filed on the day itself after this time is late
+WEEKDAY_CUTOFF = time(10, 0)
+
+# (version of LateFilingPassword the passwords were read at, {password type: password})
+_passwords = (None, {})
+
+
+def late_filing_passwords():
+    """The stored late filing passwords by type, read from the table only when they changed."""
+    global _passwords
+    # Read the version before the rows: a write in between bumps it again, so the next call reloads
+    version = get_versions([LateFilingPassword])[0]
+    cached_version, passwords = _passwords
+    if cached_version != version:
+        passwords = dict(LateFilingPassword.objects.values_list('password_type', 'password'))
+        _passwords = (version, passwords)
+    return passwords
+
+
+def invalidate_passwords():
+    """Make every process reload the passwords, now and again once the transaction commits."""
+    bump_model_version(LateFilingPassword)
+
+
+def ensure_default_passwords():
+    """Create the password types that do not exist yet with their default password."""
+    passwords = late_filing_passwords()
+    missing = [password_type for password_type in DEFAULT_PASSWORDS if password_type not in passwords]
+    if missing:
+        LateFilingPassword.objects.bulk_create([
+            LateFilingPassword(password_type=password_type, password=DEFAULT_PASSWORDS[password_type])
+            for password_type in missing
+        ], ignore_conflicts=True)
+        invalidate_passwords()
+        passwords = late_filing_passwords()
+    return passwords
+
+
+def password_type_for(filing_type, schedule_type=None):
+    """The password type that allows a late filing of this kind."""
+    if filing_type == 'SHIFTING':
+        return 'SHIFTING'
+    return 'WEEKEND' if schedule_type in WEEKEND_SCHEDULES else 'DAILY'
@@ -1,3 +1,537 @@
-from django.test import TestCase
+import io
+import json
+import shutil
+import tempfile
+from datetime import date, time, timedelta
 
-# Create your tests here.
+import openpyxl
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from pdnportal.cache import bump_model_version
+from pdnportal.charts import local_midnight
+from portalusers.models import Users, UserApprovers
+from settings.background import run_pending
+from .activity import log_activity, rollup_activity
+from .forms import check_late_filing_password
+from .models import (Employee, EmployeeGroup, OTFiling, ShiftingOT, DailyOT, EmployeeOTStatus, OTRoster,
+                     LateFilingPassword, SystemActivity)
+from .policy import ensure_default_passwords, late_filing_passwords
+from .utils import refresh_roster, refresh_status_counts, sync_roster_shuttles
+
+
+class FilingStatusCountTests(TestCase):
+    """History listings read the filing's status count columns instead of counting statuses per filing."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.supervisor = Users.objects.create(username='supervisor', name='Supervisor', overtime_supervisor=True)
+        cls.employees = [Employee.objects.create(id_number=f'10{i}', name=f'Employee {i}') for i in range(4)]
+        cls.group = EmployeeGroup.objects.create(name='Line A', created_by=cls.supervisor)
+        cls.group.employees.set(cls.employees)
+        for i in range(2):
+            cls.add_requestor(f'requestor{i}')
+
+    @classmethod
+    def add_requestor(cls, username):
+        requestor = Users.objects.create(username=username, name=username.title(), overtime_requestor=True)
+        UserApprovers.objects.create(user=requestor, approver=cls.supervisor, module='Overtime', approver_role='Checker')
+        filings = []
+        for _ in range(6):
+            filing = OTFiling.objects.create(filing_type='SHIFTING', group=cls.group, requestor=requestor)
+            ShiftingOT.objects.create(filing=filing, start_date=date(2026, 1, 5), end_date=date(2026, 1, 10), shift_type='AM')
+            EmployeeOTStatus.objects.bulk_create([
+                EmployeeOTStatus(filing=filing, employee=employee, status='OT' if index else 'ABSENT')
+                for index, employee in enumerate(cls.employees)
+            ])
+            filings.append(filing)
+        refresh_status_counts(filings)
+        return requestor
+
+    def test_counts_follow_status_changes(self):
+        filing = OTFiling.objects.first()
+        self.assertEqual((filing.employee_count, filing.ot_count, filing.absent_count), (4, 3, 1))
+
+        EmployeeOTStatus.objects.filter(filing=filing, status='OT').update(status='LEAVE')
+        refresh_status_counts([filing.pk])
+
+        filing.refresh_from_db()
+        self.assertEqual((filing.employee_count, filing.ot_count, filing.absent_count, filing.leave_count), (4, 0, 1, 3))
+
+    def test_analytics_count_statuses_per_bucket(self):
+        last_month = local_midnight(timezone.localdate().replace(day=1)) - timedelta(hours=12)
+        OTFiling.objects.filter(pk__in=OTFiling.objects.order_by('id').values('pk')[:3]).update(date_created=last_month)
+        self.client.force_login(self.supervisor)
+
+        with CaptureQueriesContext(connection) as queries:
+            analytics = self.client.get(reverse('get-analytics'), {'period': '3M'}).json()
+        self.assertEqual(analytics['summary'], {'ot_count': 36, 'not_ot_count': 0, 'absent_count': 12, 'leave_count': 0})
+        self.assertEqual((analytics['chart']['ot_data'][-2:], analytics['chart']['absent_data'][-2:]), ([9, 27], [3, 9]))
+        self.assertEqual(len([query for query in queries if 'overtime_employeeotstatus' in query['sql']]), 1)
+
+        chart = self.client.get(reverse('get-employee-status-chart'), {'period': 'quarter'}).json()
+        self.assertEqual(sum(chart['datasets'][0]['data']), 36)
+
+        requestor = Users.objects.get(username='requestor0')
+        summary = self.client.get(reverse('get-requestor-analytics', args=[requestor.id])).json()
+        self.assertEqual(summary['summary']['total_requests'], 6)
+        self.assertEqual(summary['status_count'], {'ot': 18, 'not_ot': 0, 'absent': 6, 'leave': 0})
+
+    def test_supervisor_dashboard_queries_do_not_grow_with_requestors(self):
+        self.client.force_login(self.supervisor)
+        self.client.get(reverse('overtime'))  # first request also loads the session and user caches
+        with CaptureQueriesContext(connection) as before:
+            response = self.client.get(reverse('overtime'))
+        requestor = response.context['requestors'][0]
+        self.assertEqual((requestor['total_requests'], requestor['ot_count']), (6, 18))
+        self.assertEqual(len(requestor['recent_filings']), 5)
+        self.assertEqual(requestor['recent_filings'][0]['employee_count'], 4)
+
+        self.add_requestor('requestor2')
+        self.client.get(reverse('overtime'))  # the new approver link reloads the supervised requestors once
+        with CaptureQueriesContext(connection) as after:
+            response = self.client.get(reverse('overtime'))
+        self.assertEqual(len(response.context['requestors']), 3)
+        self.assertEqual(len(after), len(before))
+
+
+class BulkFilingSubmissionTests(TestCase):
+    """A filing's employee statuses are checked with one query and inserted in bulk."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.requestor = Users.objects.create(username='requestor', name='Requestor', overtime_requestor=True)
+        cls.employees = [Employee.objects.create(id_number=f'20{i}', name=f'Employee {i}') for i in range(30)]
+        cls.group = EmployeeGroup.objects.create(name='Line B', created_by=cls.requestor)
+        cls.group.employees.set(cls.employees)
+
+    def submit(self, employees):
+        return self.client.post(reverse('submit-daily-ot'), json.dumps({
+            'groupId': self.group.id,
+            'date': (timezone.now().date() + timedelta(days=7)).isoformat(),
+            'scheduleValue': 'WEEKDAY',
+            'startTime': '17:00',
+            'endTime': '20:00',
+            'reason': 'Backlog',
+            'employees': employees,
+        }), content_type='application/json')
+
+    def test_queries_do_not_grow_with_employees(self):
+        self.client.force_login(self.requestor)
+        self.submit([{'id': self.employees[0].id, 'status': 'OT'}])  # warm up the session
+        with CaptureQueriesContext(connection) as one:
+            self.submit([{'id': self.employees[0].id, 'status': 'OT'}])
+        with CaptureQueriesContext(connection) as many:
+            response = self.submit([
+                {'id': employee.id, 'status': 'ABSENT' if index % 10 == 0 else 'OT'}
+                for index, employee in enumerate(self.employees)
+            ])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(many), len(one))
+        filing = OTFiling.objects.get(filing_id=response.json()['filing']['id'])
+        self.assertEqual((filing.employee_count, filing.ot_count, filing.absent_count), (30, 27, 3))
+        self.assertEqual(filing.employee_statuses.count(), 30)
+        self.assertEqual(OTRoster.objects.filter(filing=filing, date=filing.daily_details.date).count(), 30)
+
+    def test_unknown_employee_is_rejected(self):
+        self.client.force_login(self.requestor)
+        response = self.submit([{'id': self.employees[0].id, 'status': 'OT'}, {'id': 999999, 'status': 'OT'}])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('999999', response.json()['errors']['employee_statuses'][0])
+        self.assertFalse(OTFiling.objects.exists())
+
+
+class OTRosterTests(TestCase):
+    """Filings are expanded into one roster row per employee per OT day."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = Users.objects.create(username='admin', name='Admin', is_admin=True)
+        cls.employees = [Employee.objects.create(id_number=f'50{i}', name=f'Employee {i}', shuttle_service='Route 1')
+                         for i in range(3)]
+        group = EmployeeGroup.objects.create(name='Line C', created_by=cls.admin)
+        today = timezone.localdate()
+        cls.filing = OTFiling.objects.create(filing_type='SHIFTING', group=group, requestor=cls.admin)
+        ShiftingOT.objects.create(filing=cls.filing, start_date=today - timedelta(days=1),
+                                  end_date=today + timedelta(days=2), shift_type='PM')
+        EmployeeOTStatus.objects.bulk_create([
+            EmployeeOTStatus(filing=cls.filing, employee=employee, status='ABSENT' if index == 2 else 'OT')
+            for index, employee in enumerate(cls.employees)
+        ])
+        refresh_roster([cls.filing])
+
+    def test_shifting_range_is_expanded_and_counted_today(self):
+        self.assertEqual(OTRoster.objects.filter(filing=self.filing).count(), 12)
+        self.assertEqual(set(OTRoster.objects.values_list('shift', flat=True)), {'PM'})
+
+        EmployeeOTStatus.objects.filter(employee=self.employees[0]).update(status='NOT-OT')
+        refresh_roster([self.filing.pk])
+
+        self.client.force_login(self.admin)
+        context = self.client.get(reverse('overtime')).context
+        self.assertEqual((context['employees_on_ot_today'], context['employees_not_ot_today'],
+                          context['absent_employees_today']), (1, 1, 1))
+
+    def test_shuttle_changes_reach_upcoming_days_only(self):
+        Employee.objects.filter(pk=self.employees[0].pk).update(shuttle_service='Route 9')
+        sync_roster_shuttles([self.employees[0].pk])
+
+        shuttles = dict(OTRoster.objects.filter(employee=self.employees[0]).values_list('date', 'shuttle_service'))
+        today = timezone.localdate()
+        self.assertEqual(shuttles[today - timedelta(days=1)], 'Route 1')
+        self.assertEqual({shuttles[today + timedelta(days=offset)] for offset in range(3)}, {'Route 9'})
+
+
+class EmployeeDirectoryTests(TestCase):
+    """The employee directory API pages by name and searches by ID number or name prefix."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.requestor = Users.objects.create(username='requestor', name='Requestor', overtime_requestor=True)
+        for i in range(30):
+            Employee.objects.create(id_number=f'30{i:02d}', name=f'Dela Cruz {i:02d}' if i % 3 else f'Santos {i:02d}',
+                                    department='Production' if i % 2 else 'Quality', line=f'Line {i % 3}')
+        Employee.objects.create(id_number='4000', name='Inactive Person', department='Quality', is_active=False)
+
+    def get_page(self, **params):
+        response = self.client.get(reverse('employee-list'), params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_pages_follow_the_cursor(self):
+        self.client.force_login(self.requestor)
+        first = self.get_page(limit=25)
+        second = self.get_page(limit=25, cursor=first['next_cursor'])
+
+        names = [employee['name'] for employee in first['employees'] + second['employees']]
+        self.assertEqual(names, sorted(Employee.objects.filter(is_active=True).values_list('name', flat=True)))
+        self.assertIsNone(second['next_cursor'])
+        self.assertNotIn('facets', second)
+        self.assertEqual(first['facets']['departments'], [{'value': 'Production', 'count': 15},
+                                                          {'value': 'Quality', 'count': 15}])
+
+    def test_search_matches_id_number_or_name_prefix(self):
+        self.client.force_login(self.requestor)
+        by_name = self.get_page(search='sant')
+        self.assertEqual(len(by_name['employees']), 10)
+        self.assertEqual(sum(facet['count'] for facet in by_name['facets']['lines']), 10)
+
+        by_id = self.get_page(search='301')
+        self.assertEqual(sorted(employee['id_number'] for employee in by_id['employees']),
+                         [f'30{i}' for i in range(10, 20)])
+        self.assertEqual(self.get_page(search='cruz')['employees'], [])
+
+    def test_search_matches_id_number_in_any_case(self):
+        Employee.objects.create(id_number='ab123', name='Lower Case')
+        Employee.objects.create(id_number='Ab124', name='Mixed Case')
+        self.client.force_login(self.requestor)
+
+        for search in ('ab12', 'AB12', 'aB1'):
+            found = self.get_page(search=search)['employees']
+            self.assertEqual(sorted(employee['id_number'] for employee in found), ['Ab124', 'ab123'])
+
+    def test_total_counts_employees_without_department(self):
+        Employee.objects.create(id_number='5000', name='No Department')
+        self.client.force_login(self.requestor)
+        facets = self.get_page()['facets']
+        self.assertEqual(facets['total'], 31)
+        self.assertEqual(sum(facet['count'] for facet in facets['departments']), 30)
+
+    def test_requestor_page_does_not_render_employees(self):
+        self.client.force_login(self.requestor)
+        response = self.client.get(reverse('overtime'))
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('employees', response.context)
+        self.assertNotContains(response, 'Dela Cruz')
+
+
+def load_workbook(response):
+    return openpyxl.load_workbook(io.BytesIO(b''.join(response.streaming_content)))
+
+
+class OTExportTests(TestCase):
+    """The OT exports stream one styled row per roster day or employee status."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = Users.objects.create(username='admin', name='Admin', is_admin=True)
+        cls.employees = [
+            Employee.objects.create(id_number='6001', name='juan dela cruz', department='Production', line='Line 1',
+                                    shuttle_service='Route 1'),
+            Employee.objects.create(id_number='6002', name='maria santos', department='Quality'),
+        ]
+        group = EmployeeGroup.objects.create(name='Line D', created_by=cls.admin)
+
+        shifting = OTFiling.objects.create(filing_type='SHIFTING', group=group, requestor=cls.admin)
+        ShiftingOT.objects.create(filing=shifting, start_date=date(2026, 3, 2), end_date=date(2026, 3, 3), shift_type='AM')
+        daily = OTFiling.objects.create(filing_type='DAILY', group=group, requestor=cls.admin)
+        DailyOT.objects.create(filing=daily, date=date(2026, 3, 7), schedule_type='SATURDAY',
+                               start_time=time(8, 0), end_time=time(17, 0), reason='Inventory')
+        for filing in (shifting, daily):
+            EmployeeOTStatus.objects.bulk_create([
+                EmployeeOTStatus(filing=filing, employee=employee, status='OT') for employee in cls.employees
+            ])
+        refresh_roster([shifting, daily])
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def test_shifting_export_highlights_missing_shuttles(self):
+        response = self.client.get(reverse('export-shifting'), {'start_date': '2026-03-01', 'end_date': '2026-03-31'})
+        self.assertEqual(response.status_code, 200)
+        sheet = load_workbook(response)['Shifting OT Export']
+        rows = list(sheet.iter_rows(values_only=True))
+
+        self.assertEqual(rows[0], ('ID Number', 'Employee Name', 'Department', 'Line', 'Date', 'Status', 'Shift',
+                                   'Shuttle Service'))
+        self.assertEqual(rows[1:], [
+            ('6001', 'Juan Dela Cruz', 'Production', 'Line 1', '2026-03-02', 'OT', 'AM', 'Route 1'),
+            ('6002', 'Maria Santos', 'Quality', None, '2026-03-02', 'OT', 'AM', 'Not Assigned'),
+            ('6001', 'Juan Dela Cruz', 'Production', 'Line 1', '2026-03-03', 'OT', 'AM', 'Route 1'),
+            ('6002', 'Maria Santos', 'Quality', None, '2026-03-03', 'OT', 'AM', 'Not Assigned'),
+        ])
+        self.assertEqual(sheet['A1'].style, 'ot_header')
+        self.assertEqual((sheet['H2'].style, sheet['H3'].style), ('ot_cell', 'ot_missing'))
+        self.assertEqual(sheet['H3'].fill.start_color.rgb, '00FFC7CE')
+
+        response = self.client.get(reverse('export-shifting'), {'start_date': '2026-03-01', 'end_date': '2026-03-31',
+                                                                'highlight_empty': 'false'})
+        self.assertEqual(load_workbook(response)['Shifting OT Export']['H3'].style, 'ot_cell')
+
+    def test_daily_export_lists_statuses_of_the_schedule(self):
+        response = self.client.get(reverse('export-daily'), {'schedule_type': 'SATURDAY', 'status': 'OT',
+                                                             'start_date': '2026-03-01', 'end_date': '2026-03-31'})
+        self.assertEqual(response.status_code, 200)
+        rows = list(load_workbook(response)['Daily OT Export'].iter_rows(values_only=True))
+
+        self.assertEqual(rows[0], ('ID Number', 'Employee Name', 'Department', 'Line', 'Date', 'Time', 'Status',
+                                   'Shuttle Service', 'Reason'))
+        self.assertEqual(rows[1:], [
+            ('6001', 'Juan Dela Cruz', 'Production', 'Line 1', '2026-03-07', '08:00 - 17:00', 'OT', 'Route 1', 'Inventory'),
+            ('6002', 'Maria Santos', 'Quality', None, '2026-03-07', '08:00 - 17:00', 'OT', 'Not Assigned', 'Inventory'),
+        ])
+
+
+def excel_upload(rows, name='employees.xlsx'):
+    workbook = openpyxl.Workbook()
+    for row in rows:
+        workbook.active.append(row)
+    handle = io.BytesIO()
+    workbook.save(handle)
+    return SimpleUploadedFile(name, handle.getvalue())
+
+
+class ImportJobTests(TestCase):
+    """The masterlist and shuttle imports run as background jobs and write only what changed, in bulk."""
+
+    def setUp(self):
+        self.job_files_root = tempfile.mkdtemp()
+        job_files = override_settings(JOB_FILES_ROOT=self.job_files_root)
+        job_files.enable()
+        self.addCleanup(job_files.disable)
+        self.addCleanup(shutil.rmtree, self.job_files_root, ignore_errors=True)
+
+        self.admin = Users.objects.create(username='admin', name='Admin', is_admin=True)
+        self.client.force_login(self.admin)
+
+    def job_status(self, status_url):
+        return self.client.get(status_url).json()
+
+    def queue_import(self, rows):
+        response = self.client.post(reverse('import-employees'), {'file': excel_upload(rows)})
+        self.assertEqual(response.status_code, 202)
+        return response.json()['status_url']
+
+    def test_import_creates_employees_with_proper_case_names(self):
+        status_url = self.queue_import([
+            ['ID Number', 'Employee Name', 'Department'],
+            ['1001', 'JUAN DELA CRUZ', 'Production'],
+            ['1002', 'maria santos', 'Quality'],
+        ])
+        run_pending()
+
+        self.assertEqual(self.job_status(status_url)['result']['created_count'], 2)
+        self.assertEqual(Employee.objects.get(id_number='1002').name, 'Maria Santos')
+
+    def test_import_upserts_in_bulk_with_one_activity_entry(self):
+        Employee.objects.create(id_number='1001', name='Juan Dela Cruz', department='Production')
+        Employee.objects.create(id_number='1002', name='Maria Santos', department='Quality')
+        status_url = self.queue_import([['ID Number', 'Employee Name', 'Department']] + [
+            ['1001', 'JUAN DELA CRUZ', 'Production'],
+            ['1002', 'maria santos', 'Molding'],
+        ] + [[str(2000 + i), f'employee {i}', 'Assembly'] for i in range(450)])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            run_pending()
+
+        status = self.job_status(status_url)
+        self.assertEqual(status['status'], 'Succeeded')
+        self.assertEqual((status['result']['created_count'], status['result']['updated_count']), (450, 1))
+        self.assertEqual(Employee.objects.get(id_number='1002').department, 'Molding')
+        self.assertEqual(Employee.objects.get(id_number='2449').name, 'Employee 449')
+        self.assertEqual(SystemActivity.objects.count(), 1)
+
+    def queue_shuttle_import(self, rows):
+        Users.objects.filter(pk=self.admin.pk).update(overtime_allocator=True)
+        response = self.client.post(reverse('import-shuttle'), {'file': excel_upload(rows, 'shuttle.xlsx')})
+        self.assertEqual(response.status_code, 202)
+        return response.json()['status_url']
+
+    def test_shuttle_import_writes_only_changed_assignments(self):
+        Employee.objects.create(id_number='1001', name='Juan Dela Cruz', shuttle_service='Route 1')
+        maria = Employee.objects.create(id_number='1002', name='Maria Santos', shuttle_service='Route 2')
+        Employee.objects.create(id_number='1003', name='Jose Rizal')
+        today = timezone.localdate()
+        group = EmployeeGroup.objects.create(name='Line E', created_by=self.admin)
+        filing = OTFiling.objects.create(filing_type='SHIFTING', group=group, requestor=self.admin)
+        ShiftingOT.objects.create(filing=filing, start_date=today - timedelta(days=1), end_date=today + timedelta(days=1),
+                                  shift_type='AM')
+        EmployeeOTStatus.objects.create(filing=filing, employee=maria, status='OT')
+        refresh_roster([filing])
+        status_url = self.queue_shuttle_import([
+            ['ID Number', 'Shuttle Service'],
+            ['1001', 'Route 1'],
+            ['1002', 'Route 3'],
+            ['1003', None],
+            ['9999', 'Route 1'],
+        ])
+
+        run_pending()
+
+        status = self.job_status(status_url)
+        self.assertEqual(status['status'], 'Succeeded')
+        result = status['result']
+        self.assertEqual((result['updated_count'], result['unchanged_count'], result['unknown_ids']), (1, 2, ['9999']))
+        self.assertEqual(Employee.objects.get(id_number='1002').shuttle_service, 'Route 3')
+
+        # The roster follows the new assignment from today on, past days keep the shuttle they ran with
+        shuttles = dict(OTRoster.objects.filter(employee=maria).values_list('date', 'shuttle_service'))
+        self.assertEqual(shuttles, {today - timedelta(days=1): 'Route 2', today: 'Route 3',
+                                    today + timedelta(days=1): 'Route 3'})
+
+    def test_shuttle_import_requires_both_columns(self):
+        status_url = self.queue_shuttle_import([['ID Number'], ['1001']])
+        run_pending()
+
+        status = self.job_status(status_url)
+        self.assertEqual(status['status'], 'Failed')
+        self.assertIn('Shuttle Service', status['error'])
+
+
+class SystemActivityLogTests(TestCase):
+    """Activities are written in one batch when the transaction commits, old ones are rolled up."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = Users.objects.create(username='admin', name='Admin', is_admin=True)
+
+    def test_activities_are_written_in_one_insert_after_commit(self):
+        with CaptureQueriesContext(connection) as logged, self.captureOnCommitCallbacks() as callbacks:
+            for i in range(5):
+                log_activity(self.user, 'OTHER', f'Event {i}')
+        self.assertEqual(len(logged), 0)
+        self.assertEqual(len(callbacks), 1)
+
+        with CaptureQueriesContext(connection) as written:
+            callbacks[0]()
+        self.assertEqual(len(written), 1)
+        self.assertEqual(SystemActivity.objects.count(), 5)
+
+    def test_rolled_back_activities_are_dropped(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            try:
+                with transaction.atomic():
+                    log_activity(self.user, 'OTHER', 'Never happened')
+                    raise ValueError
+            except ValueError:
+                pass
+        self.assertEqual(callbacks, [])
+        self.assertFalse(SystemActivity.objects.exists())
+
+    def test_old_activity_is_rolled_up_per_user_type_and_month(self):
+        old = timezone.now() - timedelta(days=400)
+        SystemActivity.objects.bulk_create(
+            [SystemActivity(user=self.user, activity_type='EXPORT', description='Export', timestamp=old) for _ in range(3)]
+            + [SystemActivity(user=self.user, activity_type='OTHER', description='Recent')]
+        )
+
+        self.assertEqual(rollup_activity(days=365), (3, 1))
+        self.assertEqual(rollup_activity(days=365), (0, 0))
+        summary = SystemActivity.objects.get(activity_type='EXPORT')
+        self.assertTrue(summary.description.startswith('3 Export activities in'))
+        self.assertEqual(SystemActivity.objects.count(), 2)
+
+
+class SystemActivityTransactionTests(TransactionTestCase):
+    """A batch belongs to one outermost transaction, a rolled back one is never reused by the next."""
+
+    def test_next_transaction_after_a_rollback_gets_a_new_batch(self):
+        user = Users.objects.create(username='admin', name='Admin', is_admin=True)
+        try:
+            with transaction.atomic():
+                log_activity(user, 'OTHER', 'Never happened')
+                raise ValueError
+        except ValueError:
+            pass
+
+        with transaction.atomic():
+            log_activity(user, 'OTHER', 'Happened')
+
+        self.assertEqual(list(SystemActivity.objects.values_list('description', flat=True)), ['Happened'])
+
+
+class LateFilingPolicyTests(TestCase):
+    """Late filing passwords are kept per process and reloaded when the shared version counter moves."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = Users.objects.create(username='admin', name='Admin', is_admin=True)
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.admin)
+
+    def post(self, name, data=None):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse(name), json.dumps(data or {}), content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+
+    def test_passwords_are_cached_until_updated_or_reset(self):
+        self.assertEqual(ensure_default_passwords()['SHIFTING'], 'shifting123')
+        # Only the cached version is checked while nothing changed
+        with self.assertNumQueries(0):
+            check_late_filing_password('shifting123', 'SHIFTING')
+            check_late_filing_password('weekend123', 'WEEKEND')
+
+        self.post('update-password', {'password_type': 'SHIFTING', 'new_password': 'changed'})
+        with self.assertRaisesMessage(ValidationError, 'Invalid password'):
+            check_late_filing_password('shifting123', 'SHIFTING')
+        check_late_filing_password('changed', 'SHIFTING')
+
+        self.post('reset-passwords')
+        self.assertEqual(late_filing_passwords()['SHIFTING'], 'shifting123')
+
+    def test_changes_made_by_another_process_are_seen(self):
+        ensure_default_passwords()
+        check_late_filing_password('daily123', 'DAILY')
+
+        # Another worker writes the row and bumps the counter in the shared cache, this process holds no signal for it
+        LateFilingPassword.objects.filter(password_type='DAILY').update(password='newsecret')
+        bump_model_version(LateFilingPassword)
+
+        check_late_filing_password('newsecret', 'DAILY')
+        with self.assertRaisesMessage(ValidationError, 'Invalid password'):
+            check_late_filing_password('daily123', 'DAILY')
+
+    def test_missing_password_type_is_not_configured(self):
+        LateFilingPassword.objects.create(password_type='DAILY', password='daily123')
+        with self.assertRaisesMessage(ValidationError, 'not properly configured'):
+            check_late_filing_password('weekend123', 'WEEKEND')
@@ -2,9 +2,26 @@ import openpyxl
 from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
 from django.http import HttpResponse
-from datetime import datetime, time, timedelta
+from datetime import timedelta
+from django.db import transaction
+from django.db.models import Count, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce, Upper
+from django.db.models.lookups import GreaterThanOrEqual, LessThan
 from django.utils import timezone
-from .models import SystemActivity
+from pdnportal.cache import bump_model_version
+from pdnportal.charts import bucket_counts
+from .activity import log_activity
+from .policy import WEEKDAY_CUTOFF, WEEKEND_SCHEDULES
+from .models import Employee, OTFiling, EmployeeOTStatus, OTRoster
+
+# EmployeeOTStatus.status -> the OTFiling column counting it
+STATUS_COUNT_FIELDS = {
+    'OT': 'ot_count',
+    'NOT-OT': 'not_ot_count',
+    'ABSENT': 'absent_count',
+    'LEAVE': 'leave_count',
+}
+COUNT_FIELDS = ['employee_count', *STATUS_COUNT_FIELDS.values()]
 
 def is_late_filing(filing_type, filing_date, schedule_type=None):
     current_date = timezone.now().date()
@@ -15,11 +32,10 @@ def is_late_filing(filing_type, filing_date, schedule_type=None):
         return current_weekday > 3
     
     elif filing_type == 'DAILY':
-        if schedule_type in ['SUNDAY', 'SATURDAY', 'HOLIDAY']:
+        if schedule_type in WEEKEND_SCHEDULES:
             return current_weekday > 4 or current_weekday == 0
         else:
-            cutoff_time = time(10, 0)
-            return current_date == filing_date and current_time > cutoff_time
+            return current_date == filing_date and current_time > WEEKDAY_CUTOFF
     
     return False
 
@@ -59,12 +75,180 @@ def proper_case(text):
     return ' '.join(result)
 
 
-def create_system_activity(user, activity_type, description):
-    return SystemActivity.objects.create(
-        user=user,
-        activity_type=activity_type,
-        description=description
+def refresh_status_counts(filings, batch_size=500):
+    """
+    Recompute the status count columns of `filings` (instances or ids) from their
+    employee statuses. Call it after creating or changing EmployeeOTStatus rows;
+    instances passed in are updated in place.
+    """
+    filings = [filing if isinstance(filing, OTFiling) else OTFiling(pk=filing) for filing in filings]
+    for start in range(0, len(filings), batch_size):
+        batch = {filing.pk: filing for filing in filings[start:start + batch_size]}
+        for filing in batch.values():
+            for field in COUNT_FIELDS:
+                setattr(filing, field, 0)
+
+        rows = (EmployeeOTStatus.objects.filter(filing_id__in=batch)
+                .values('filing_id', 'status').annotate(count=Count('id')).order_by())
+        for row in rows:
+            filing = batch[row['filing_id']]
+            filing.employee_count += row['count']
+            field = STATUS_COUNT_FIELDS.get(row['status'])
+            if field:
+                setattr(filing, field, getattr(filing, field) + row['count'])
+
+        OTFiling.objects.bulk_update(batch.values(), COUNT_FIELDS)
+    if filings:
+        bump_model_version(OTFiling)
+
+
+def count_statuses(statuses):
+    """The status count columns for a filing with the given employee statuses."""
+    counts = dict.fromkeys(COUNT_FIELDS, 0)
+    for status in statuses:
+        counts['employee_count'] += 1
+        if status in STATUS_COUNT_FIELDS:
+            counts[STATUS_COUNT_FIELDS[status]] += 1
+    return counts
+
+
+def create_employee_statuses(filing, statuses, batch_size=500):
+    """Insert the employee statuses ({employee id: status}) of a new filing in bulk."""
+    EmployeeOTStatus.objects.bulk_create([
+        EmployeeOTStatus(filing=filing, employee_id=employee_id, status=status)
+        for employee_id, status in statuses.items()
+    ], batch_size=batch_size)
+    bump_model_version(EmployeeOTStatus)
+
+
+def roster_days(filing_type, start_date, end_date, daily_date):
+    """The OT days of a filing: every day of a shifting filing's range, or the daily filing's date."""
+    if filing_type == 'SHIFTING':
+        if start_date is None or end_date is None:
+            return []
+        return [start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1)]
+    return [daily_date] if daily_date else []
+
+
+def refresh_roster(filings, batch_size=500):
+    """
+    Regenerate the OTRoster rows of `filings` (instances or ids) from their
+    employee statuses and OT dates. Call it after creating a filing or changing
+    its statuses or dates.
+    """
+    filing_ids = [filing.pk if isinstance(filing, OTFiling) else filing for filing in filings]
+    for start in range(0, len(filing_ids), batch_size):
+        batch = filing_ids[start:start + batch_size]
+        statuses = EmployeeOTStatus.objects.filter(filing_id__in=batch).values_list(
+            'filing_id', 'employee_id', 'status', 'employee__shuttle_service', 'filing__filing_type',
+            'filing__shifting_details__start_date', 'filing__shifting_details__end_date',
+            'filing__shifting_details__shift_type', 'filing__daily_details__date',
+        )
+        rows = [
+            OTRoster(date=day, filing_id=filing_id, employee_id=employee_id, filing_type=filing_type,
+                     status=status, shift=shift_type or '', shuttle_service=shuttle_service or '')
+            for (filing_id, employee_id, status, shuttle_service, filing_type,
+                 start_date, end_date, shift_type, daily_date) in statuses
+            for day in roster_days(filing_type, start_date, end_date, daily_date)
+        ]
+        with transaction.atomic():
+            OTRoster.objects.filter(filing_id__in=batch).delete()
+            OTRoster.objects.bulk_create(rows, batch_size=batch_size)
+    if filing_ids:
+        bump_model_version(OTRoster)
+
+
+def sync_roster_shuttles(employee_ids):
+    """Copy the current shuttle service of `employee_ids` onto their roster rows from today on, in one update."""
+    OTRoster.objects.filter(employee_id__in=employee_ids, date__gte=timezone.localdate()).update(
+        shuttle_service=Coalesce(Subquery(
+            Employee.objects.filter(pk=OuterRef('employee_id')).values('shuttle_service')[:1]
+        ), Value(''))
     )
+    bump_model_version(OTRoster)
+
+
+def roster_headcount(day):
+    """Distinct employees per status on the roster of `day`, in one indexed query."""
+    return OTRoster.objects.filter(date=day).aggregate(**{
+        field: Count('employee', filter=Q(status=status), distinct=True)
+        for status, field in STATUS_COUNT_FIELDS.items()
+    })
+
+
+def status_totals():
+    """Aggregates summing the status count columns over a set of filings, 0 when there are none."""
+    return {field: Coalesce(Sum(field), 0) for field in COUNT_FIELDS}
+
+
+def status_counts():
+    """Conditional counts of EmployeeOTStatus rows per status, for aggregate() or annotate()."""
+    return {field: Count('id', filter=Q(status=status)) for status, field in STATUS_COUNT_FIELDS.items()}
+
+
+def status_chart(statuses, kind, buckets, bucket_of=None):
+    """
+    Employee status counts per local day or month of the filing date, in one grouped query.
+
+    Args:
+        statuses: EmployeeOTStatus rows to count, already limited to the charted period.
+        kind, buckets, bucket_of: As for pdnportal.charts.bucket_counts().
+
+    Returns:
+        {'ot_count': [count per bucket], 'not_ot_count': [...], 'absent_count': [...], 'leave_count': [...]}
+    """
+    return bucket_counts(statuses, kind, buckets, {
+        field: ('filing__date_created', Q(status=status)) for status, field in STATUS_COUNT_FIELDS.items()
+    }, bucket_of=bucket_of)
+
+
+def next_prefix(text):
+    """The smallest string greater than every string starting with `text`."""
+    return text[:-1] + chr(ord(text[-1]) + 1)
+
+
+def prefix_filter(text):
+    """
+    Q for the employees whose ID number or name starts with `text`, case-insensitively.
+
+    The prefix is matched as a range (UPPER(name) >= 'DEL' AND UPPER(name) < 'DEM')
+    rather than with LIKE, so it is answered from the UPPER(id_number) and UPPER(name) indexes.
+    """
+    text = text.strip().upper()
+    if not text:
+        return Q()
+    upper_id = Upper('id_number')
+    upper_name = Upper('name')
+    return (
+        Q(GreaterThanOrEqual(upper_id, text), LessThan(upper_id, next_prefix(text)))
+        | Q(GreaterThanOrEqual(upper_name, text), LessThan(upper_name, next_prefix(text)))
+    )
+
+
+def directory_facets(employees):
+    """
+    Employee counts per department and per line, from one query grouped by both.
+    `total` counts every employee, including those without a department or line.
+    """
+    total = 0
+    departments = {}
+    lines = {}
+    for row in employees.values('department', 'line').annotate(count=Count('id')).order_by():
+        total += row['count']
+        if row['department']:
+            departments[row['department']] = departments.get(row['department'], 0) + row['count']
+        if row['line']:
+            lines[row['line']] = lines.get(row['line'], 0) + row['count']
+    return {
+        'total': total,
+        'departments': [{'value': value, 'count': count} for value, count in sorted(departments.items())],
+        'lines': [{'value': value, 'count': count} for value, count in sorted(lines.items())],
+    }
+
+
+def create_system_activity(user, activity_type, description):
+    # Buffered, the row is written with the other activities of the transaction when it commits
+    return log_activity(user, activity_type, description)
 
 def generate_excel_file(headers, data, filename):
 
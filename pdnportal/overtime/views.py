@@ -1,31 +1,68 @@
 import json
 import logging
 import traceback
-from datetime import datetime, time, timedelta
+from datetime import date, datetime, timedelta
 from django.shortcuts import render, get_object_or_404
 from django.http import JsonResponse, HttpResponse
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.views.decorators.http import require_POST, require_GET
 from django.db import transaction
-from django.db.models import Count, Q
+from django.db.models import Count, F, Q, Sum, Window
+from django.db.models.functions import Coalesce, RowNumber
 from django.utils import timezone
 from portalusers.models import Users
-import openpyxl
-from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
-from openpyxl.utils import get_column_letter
+from portalusers.supervision import is_supervisor, supervised_filter
+from openpyxl.styles import Font, Alignment
+from pdnportal.exports import XlsxExport, THIN_BORDER, fill, rows_of
 
 from .models import (
     Employee, EmployeeGroup, OTFiling, ShiftingOT, DailyOT,
-    EmployeeOTStatus, LateFilingPassword, SystemActivity
+    EmployeeOTStatus, OTRoster, LateFilingPassword, SystemActivity
 )
 from .forms import (
     EmployeeForm, EmployeeGroupForm, ShuttleAssignmentForm,
     ShiftingOTForm, DailyOTForm, LateFilingPasswordForm, ExcelImportForm
 )
-from .utils import is_late_filing, proper_case, create_system_activity
+from .policy import DEFAULT_PASSWORDS, ensure_default_passwords, invalidate_passwords
+from .utils import (is_late_filing, create_system_activity, refresh_status_counts, status_totals, count_statuses,
+                    create_employee_statuses, status_counts, status_chart, STATUS_COUNT_FIELDS, prefix_filter,
+                    directory_facets, refresh_roster, roster_headcount, sync_roster_shuttles)
+from pdnportal.cache import cached_aggregate
+from pdnportal.charts import local_midnight, month_starts
+from pdnportal.paging import keyset_page
+from settings.background import enqueue, job_accepted
 
 logger = logging.getLogger(__name__)
 
+# Employee directory pages, see employee_list()
+DIRECTORY_PAGE_SIZE = 25
+DIRECTORY_ORDERING = ['name', 'id']
+
+# Related rows format_ot_for_history() reads, select them with the filings
+HISTORY_RELATED = ('group', 'shifting_details', 'daily_details')
+
+
+def format_ot_for_history(filing):
+    """Format OT filing for history display"""
+    result = {
+        'id': filing.filing_id,
+        'type': 'Shifting' if filing.filing_type == 'SHIFTING' else 'Daily',
+        'group': filing.group.name,
+        'date': filing.date_created.strftime('%b %d, %Y'),
+        'employee_count': filing.employee_count,
+        'ot_count': filing.ot_count,
+        'not_ot_count': filing.not_ot_count,
+    }
+
+    # Add type-specific info
+    if filing.filing_type == 'SHIFTING':
+        shifting = filing.shifting_details
+        result['shift_type'] = shifting.shift_type
+    else:
+        daily = filing.daily_details
+        result['schedule_type'] = daily.get_schedule_type_display()
+
+    return result
 
 
 # Main View
@@ -43,107 +80,70 @@ def overtime_view(request):
     # Get current month statistics
     current_month_start = timezone.now().replace(day=1, hour=0, minute=0, second=0)
 
-    # Define helper function for formatting OT filings
-    def format_ot_for_history(filing):
-        """Format OT filing for history display"""
-        result = {
-            'id': filing.filing_id,
-            'type': 'Shifting' if filing.filing_type == 'SHIFTING' else 'Daily',
-            'group': filing.group.name,
-            'date': filing.date_created.strftime('%b %d, %Y'),
-            'employee_count': EmployeeOTStatus.objects.filter(filing=filing).count(),
-            'ot_count': EmployeeOTStatus.objects.filter(filing=filing, status='OT').count(),
-            'not_ot_count': EmployeeOTStatus.objects.filter(filing=filing, status='NOT-OT').count(),
-        }
-
-        # Add type-specific info
-        if filing.filing_type == 'SHIFTING':
-            shifting = filing.shifting_details
-            result['shift_type'] = shifting.shift_type
-        else:
-            daily = filing.daily_details
-            result['schedule_type'] = daily.get_schedule_type_display()
-
-        return result
-
     if request.user.overtime_requestor:
         # For requestor, show their groups and OT history
         employee_groups = EmployeeGroup.objects.filter(created_by=request.user)
-        ot_history = OTFiling.objects.filter(requestor=request.user).order_by('-date_created')[:10]
-
-        # Get all active employees for the employee selection in the group modal
-        employees = Employee.objects.filter(is_active=True).order_by('name')
+        ot_history = OTFiling.objects.filter(requestor=request.user).select_related(*HISTORY_RELATED).order_by('-date_created')[:10]
 
+        # The employee table and the group modal load employees page by page from employee_list()
         context.update({
             'employee_groups': employee_groups,
             'ot_history': [format_ot_for_history(filing) for filing in ot_history],
-            'employees': employees,
         })
 
     if request.user.overtime_supervisor:
         # For supervisor, show requestors they supervise
-        from django.apps import apps
-        UsersApprovers = apps.get_model('portalusers', 'UsersApprovers')
-
-        # Get requestors supervised by this user
-        supervised_users = UsersApprovers.objects.filter(
-            approver=request.user,
-            module='Overtime',
-            approver_role='Checker'
-        ).values_list('user', flat=True)
-
-        requestors = Users.objects.filter(id__in=supervised_users, overtime_requestor=True)
+        requestors = Users.objects.filter(
+            supervised_filter('id', request.user, 'Overtime', 'Checker'), overtime_requestor=True
+        ).select_related('line')
 
         # Get OT statistics for these requestors
-        this_month_filings = OTFiling.objects.filter(
-            requestor__in=supervised_users,
+        month_totals = OTFiling.objects.filter(
+            supervised_filter('requestor', request.user, 'Overtime', 'Checker'),
             date_created__gte=current_month_start
-        )
-
-        ot_count = EmployeeOTStatus.objects.filter(
-            filing__in=this_month_filings,
-            status='OT'
-        ).count()
-
-        not_ot_count = EmployeeOTStatus.objects.filter(
-            filing__in=this_month_filings,
-            status='NOT-OT'
-        ).count()
-
-        absent_count = EmployeeOTStatus.objects.filter(
-            filing__in=this_month_filings,
-            status='ABSENT'
-        ).count()
-
-        leave_count = EmployeeOTStatus.objects.filter(
-            filing__in=this_month_filings,
-            status='LEAVE'
-        ).count()
+        ).aggregate(**status_totals())
+
+        # Totals and the five latest filings of every requestor, one query each
+        requestor_totals = {
+            row['requestor']: row
+            for row in OTFiling.objects.filter(requestor__in=requestors).values('requestor').annotate(
+                total_requests=Count('pk'),
+                shifted_count=Count('pk', filter=Q(filing_type='SHIFTING')),
+                daily_count=Count('pk', filter=Q(filing_type='DAILY')),
+                **status_totals()
+            ).order_by()
+        }
+        recent_filings = {}
+        latest = OTFiling.objects.filter(requestor__in=requestors).select_related(*HISTORY_RELATED).annotate(
+            recent_rank=Window(RowNumber(), partition_by=F('requestor'), order_by=F('date_created').desc())
+        ).filter(recent_rank__lte=5).order_by('requestor', '-date_created')
+        for filing in latest:
+            recent_filings.setdefault(filing.requestor_id, []).append(format_ot_for_history(filing))
 
         # Format requestors data
         requestors_data = []
         for requestor in requestors:
-            requestor_filings = OTFiling.objects.filter(requestor=requestor)
+            totals = requestor_totals.get(requestor.id, {})
             requestor_data = {
                 'id': requestor.id,
                 'name': requestor.name,
                 'avatar': requestor.avatar.url if requestor.avatar else None,
                 'line': str(requestor.line) if requestor.line else '-',
-                'ot_count': EmployeeOTStatus.objects.filter(filing__in=requestor_filings, status='OT').count(),
-                'not_ot_count': EmployeeOTStatus.objects.filter(filing__in=requestor_filings, status='NOT-OT').count(),
-                'total_requests': requestor_filings.count(),
-                'shifted_count': requestor_filings.filter(filing_type='SHIFTING').count(),
-                'daily_count': requestor_filings.filter(filing_type='DAILY').count(),
-                'recent_filings': [format_ot_for_history(filing) for filing in requestor_filings.order_by('-date_created')[:5]]
+                'ot_count': totals.get('ot_count', 0),
+                'not_ot_count': totals.get('not_ot_count', 0),
+                'total_requests': totals.get('total_requests', 0),
+                'shifted_count': totals.get('shifted_count', 0),
+                'daily_count': totals.get('daily_count', 0),
+                'recent_filings': recent_filings.get(requestor.id, [])
             }
             requestors_data.append(requestor_data)
 
         context.update({
             'requestors': requestors_data,
-            'ot_count': ot_count,
-            'not_ot_count': not_ot_count,
-            'absent_count': absent_count,
-            'leave_count': leave_count,
+            'ot_count': month_totals['ot_count'],
+            'not_ot_count': month_totals['not_ot_count'],
+            'absent_count': month_totals['absent_count'],
+            'leave_count': month_totals['leave_count'],
         })
 
     if request.user.overtime_allocator:
@@ -167,28 +167,13 @@ def overtime_view(request):
         lines = [l for l in lines if l]  # Filter out None values
 
         # For facilitator, show password info and activity log
-        # Get or create password records
-        def get_or_create_password(password_type):
-            try:
-                return LateFilingPassword.objects.get(password_type=password_type)
-            except LateFilingPassword.DoesNotExist:
-                # Create with default password
-                defaults = {
-                    'SHIFTING': 'shifting123',
-                    'DAILY': 'daily123',
-                    'WEEKEND': 'weekend123',
-                    'HOLIDAY': 'holiday123'
-                }
-                return LateFilingPassword.objects.create(
-                    password_type=password_type,
-                    password=defaults.get(password_type, 'password123')
-                )
-
+        # Missing password types are created with their default password
+        stored_passwords = ensure_default_passwords()
         passwords = {
-            'shifting': get_or_create_password('SHIFTING').password,
-            'daily': get_or_create_password('DAILY').password,
-            'weekend': get_or_create_password('WEEKEND').password,
-            'holiday': get_or_create_password('HOLIDAY').password,
+            'shifting': stored_passwords['SHIFTING'],
+            'daily': stored_passwords['DAILY'],
+            'weekend': stored_passwords['WEEKEND'],
+            'holiday': stored_passwords['HOLIDAY'],
         }
 
         recent_activities = SystemActivity.objects.all().order_by('-timestamp')[:10]
@@ -209,27 +194,17 @@ def overtime_view(request):
             'activities': [format_activity(activity) for activity in recent_activities],
         })
 
-    # Get current date for today's statistics
-    current_date = timezone.now().date()
+    # Today's headcount comes from the roster of OT days, not from the filing dates
+    headcount = roster_headcount(timezone.localdate())
 
     # Update main statistics
     context.update({
-        'total_ot_hours': EmployeeOTStatus.objects.filter(
-            status='OT',
-            filing__date_created__gte=current_month_start
-        ).count(),
-        'employees_on_ot_today': EmployeeOTStatus.objects.filter(
-            status='OT',
-            filing__date_created__date=current_date
-        ).values('employee').distinct().count(),
-        'employees_not_ot_today': EmployeeOTStatus.objects.filter(
-            status='NOT-OT',
-            filing__date_created__date=current_date
-        ).values('employee').distinct().count(),
-        'absent_employees_today': EmployeeOTStatus.objects.filter(
-            status='ABSENT',
-            filing__date_created__date=current_date
-        ).values('employee').distinct().count(),
+        'total_ot_hours': OTFiling.objects.filter(
+            date_created__gte=current_month_start
+        ).aggregate(total=Coalesce(Sum('ot_count'), 0))['total'],
+        'employees_on_ot_today': headcount['ot_count'],
+        'employees_not_ot_today': headcount['not_ot_count'],
+        'absent_employees_today': headcount['absent_count'],
     })
 
     return render(request, 'overtime/overtime.html', context)
@@ -361,11 +336,27 @@ def delete_employee_group(request, group_id):
 
 # API Endpoints for Employees
 @login_required
-@user_passes_test(lambda u: u.is_admin)
+@user_passes_test(lambda u: u.is_admin or u.overtime_requestor)
 def employee_list(request):
-    """Get list of employees"""
+    """
+    Get a page of the employee directory.
+
+    Employees are ordered by name and keyset-paged: pass the returned
+    next_cursor as `cursor` for the following page. `search` matches the
+    start of the ID number or name. The first page also carries the
+    department and line counts of the searched employees.
+    """
     try:
         employees = Employee.objects.all()
+        if not (request.user.is_admin and request.GET.get('include_inactive') == 'true'):
+            employees = employees.filter(is_active=True)
+
+        # Apply search if provided
+        search = request.GET.get('search', '')
+        employees = employees.filter(prefix_filter(search))
+
+        cursor = request.GET.get('cursor')
+        facets = None if cursor else directory_facets(employees)
 
         # Apply filters if provided
         department = request.GET.get('department')
@@ -376,27 +367,30 @@ def employee_list(request):
         if line and line != 'all':
             employees = employees.filter(line=line)
 
-        # Apply search if provided
-        search = request.GET.get('search')
-        if search:
-            employees = employees.filter(
-                Q(id_number__icontains=search) |
-                Q(name__icontains=search)
-            )
+        try:
+            page_size = min(max(int(request.GET.get('limit', DIRECTORY_PAGE_SIZE)), 1), 100)
+        except ValueError:
+            page_size = DIRECTORY_PAGE_SIZE
+
+        page = keyset_page(employees, DIRECTORY_ORDERING, cursor, page_size)
 
         # Format response
         employee_list = []
-        for employee in employees:
+        for employee in page:
             employee_list.append({
                 'id': employee.id,
                 'id_number': employee.id_number,
                 'name': employee.name,
                 'department': employee.department or '',
                 'line': employee.line or '',
+                'shuttle_service': employee.shuttle_service or '',
                 'date_added': employee.date_added.strftime('%Y-%m-%d'),
             })
 
-        return JsonResponse({'employees': employee_list})
+        response = {'employees': employee_list, 'next_cursor': page.next_cursor}
+        if facets is not None:
+            response['facets'] = facets
+        return JsonResponse(response)
 
     except Exception as e:
         logger.error(f"Error getting employee list: {str(e)}")
@@ -566,6 +560,7 @@ def shuttle_assignment(request):
             employee = get_object_or_404(Employee, id=employee_id)
             employee.shuttle_service = shuttle_service
             employee.save()
+            sync_roster_shuttles([employee.id])
 
             # Create system activity log
             if shuttle_service:
@@ -594,59 +589,13 @@ def shuttle_assignment(request):
 @user_passes_test(lambda u: u.overtime_allocator)
 @require_POST
 def import_shuttle(request):
-    """Import shuttle assignments from Excel file"""
+    """Queue an import of shuttle assignments from Excel file"""
     try:
         form = ExcelImportForm(request.POST, request.FILES)
 
         if form.is_valid():
-            excel_file = request.FILES['file']
-
-            # Process Excel file
-            wb = openpyxl.load_workbook(excel_file)
-            sheet = wb.active
-
-            # Validate headers (case insensitive)
-            headers = [cell.value.lower() if cell.value else '' for cell in sheet[1]]
-
-            if 'id number' not in headers and 'shuttle service' not in headers:
-                return JsonResponse({
-                    'error': 'Invalid file format. File must contain "ID Number" and "Shuttle Service" columns.'
-                }, status=400)
-
-            # Find column indices
-            id_col = headers.index('id number')
-            shuttle_col = headers.index('shuttle service')
-
-            # Process rows
-            updated_count = 0
-            total_rows = sheet.max_row - 1  # Exclude header
-
-            for row in range(2, sheet.max_row + 1):
-                id_number = str(sheet.cell(row=row, column=id_col + 1).value)
-                shuttle_service = sheet.cell(row=row, column=shuttle_col + 1).value
-
-                if id_number:
-                    # Try to find employee
-                    try:
-                        employee = Employee.objects.get(id_number=id_number)
-                        employee.shuttle_service = shuttle_service or ''
-                        employee.save()
-                        updated_count += 1
-                    except Employee.DoesNotExist:
-                        pass  # Skip if employee not found
-
-            # Create system activity log
-            create_system_activity(
-                request.user,
-                'OTHER',
-                f"Imported shuttle assignments from Excel file. Updated {updated_count} out of {total_rows} employees."
-            )
-
-            return JsonResponse({
-                'success': True,
-                'total_count': total_rows,
-                'updated_count': updated_count,
-            })
+            job = enqueue('overtime.import_shuttle', request.user, upload=request.FILES['file'])
+            return job_accepted(job)
         else:
             # Return validation errors
             return JsonResponse({'errors': form.errors}, status=400)
@@ -661,84 +610,13 @@ def import_shuttle(request):
 @user_passes_test(lambda u: u.is_admin)
 @require_POST
 def import_employees(request):
-    """Import employees from Excel file"""
+    """Queue an import of employees from Excel file"""
     try:
         form = ExcelImportForm(request.POST, request.FILES)
 
         if form.is_valid():
-            excel_file = request.FILES['file']
-
-            # Process Excel file
-            wb = openpyxl.load_workbook(excel_file)
-            sheet = wb.active
-
-            # Validate headers (case insensitive)
-            headers = [cell.value.lower() if cell.value else '' for cell in sheet[1]]
-
-            required_headers = ['id number', 'employee name']
-            for header in required_headers:
-                if header not in headers:
-                    return JsonResponse({
-                        'error': f'Invalid file format. File must contain "{header.title()}" column.'
-                    }, status=400)
-
-            # Find column indices
-            id_col = headers.index('id number')
-            name_col = headers.index('employee name')
-            dept_col = headers.index('department') if 'department' in headers else None
-            line_col = headers.index('line') if 'line' in headers else None
-
-            # Process rows
-            created_count = 0
-            updated_count = 0
-            total_rows = sheet.max_row - 1  # Exclude header
-
-            for row in range(2, sheet.max_row + 1):
-                id_number = str(sheet.cell(row=row, column=id_col + 1).value).strip()
-                name = str(sheet.cell(row=row, column=name_col + 1).value).strip()
-
-                if id_number and name:
-                    # Convert name to proper case
-                    name = proper_case(name)
-
-                    # Get department and line if available
-                    department = None
-                    if dept_col is not None:
-                        department = sheet.cell(row=row, column=dept_col + 1).value
-
-                    line = None
-                    if line_col is not None:
-                        line = sheet.cell(row=row, column=line_col + 1).value
-
-                    # Try to find employee for update, otherwise create new
-                    employee, created = Employee.objects.update_or_create(
-                        id_number=id_number,
-                        defaults={
-                            'name': name,
-                            'department': department,
-                            'line': line,
-                            'is_active': True,
-                        }
-                    )
-
-                    if created:
-                        created_count += 1
-                    else:
-                        updated_count += 1
-
-            # Create system activity log
-            create_system_activity(
-                request.user,
-                'OTHER',
-                f"Imported employees from Excel file. Created {created_count} and updated {updated_count} out of {total_rows} employees."
-            )
-
-            return JsonResponse({
-                'success': True,
-                'total_count': total_rows,
-                'created_count': created_count,
-                'updated_count': updated_count,
-            })
+            job = enqueue('overtime.import_employees', request.user, upload=request.FILES['file'])
+            return job_accepted(job)
         else:
             # Return validation errors
             return JsonResponse({'errors': form.errors}, status=400)
@@ -794,13 +672,15 @@ def submit_shifting_ot(request):
         form = ShiftingOTForm(form_data, user=request.user, late_filing=late_filing)
 
         if form.is_valid():
+            statuses = form.cleaned_data['employee_statuses']
             with transaction.atomic():
                 # Create OT Filing record
                 filing = OTFiling.objects.create(
                     filing_type='SHIFTING',
                     group_id=form.cleaned_data['group_id'],
                     requestor=request.user,
-                    status='PENDING'
+                    status='PENDING',
+                    **count_statuses(statuses.values())
                 )
 
                 # Create ShiftingOT record
@@ -811,24 +691,9 @@ def submit_shifting_ot(request):
                     shift_type=form.cleaned_data['shift_type']
                 )
 
-                # Create employee status records
-                employee_data = form.cleaned_data['employee_statuses']
-
-                # Check if employee_data is already a list or needs to be parsed from JSON
-                if isinstance(employee_data, str):
-                    try:
-                        employee_data = json.loads(employee_data)
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Error parsing employee_statuses JSON: {str(e)}")
-                        raise ValueError(f"Invalid employee_statuses format: {str(e)}")
-
-                for emp in employee_data:
-                    employee = Employee.objects.get(id=emp['id'])
-                    EmployeeOTStatus.objects.create(
-                        filing=filing,
-                        employee=employee,
-                        status=emp['status']
-                    )
+                # Create employee status records, the employees were checked by the form
+                create_employee_statuses(filing, statuses)
+                refresh_roster([filing])
 
                 # Create system activity log
                 create_system_activity(
@@ -837,28 +702,6 @@ def submit_shifting_ot(request):
                     f"Created Shifting OT filing: {filing.filing_id} for {filing.group.name} ({shifting_ot.start_date} to {shifting_ot.end_date})"
                 )
 
-            # Format OT filing for history display
-            def format_ot_for_history(filing):
-                result = {
-                    'id': filing.filing_id,
-                    'type': 'Shifting' if filing.filing_type == 'SHIFTING' else 'Daily',
-                    'group': filing.group.name,
-                    'date': filing.date_created.strftime('%b %d, %Y'),
-                    'employee_count': EmployeeOTStatus.objects.filter(filing=filing).count(),
-                    'ot_count': EmployeeOTStatus.objects.filter(filing=filing, status='OT').count(),
-                    'not_ot_count': EmployeeOTStatus.objects.filter(filing=filing, status='NOT-OT').count(),
-                }
-
-                # Add type-specific info
-                if filing.filing_type == 'SHIFTING':
-                    shifting = filing.shifting_details
-                    result['shift_type'] = shifting.shift_type
-                else:
-                    daily = filing.daily_details
-                    result['schedule_type'] = daily.get_schedule_type_display()
-
-                return result
-
             # Return success with filing details for history
             return JsonResponse({
                 'success': True,
@@ -922,13 +765,15 @@ def submit_daily_ot(request):
         form = DailyOTForm(form_data, user=request.user, late_filing=late_filing)
 
         if form.is_valid():
+            statuses = form.cleaned_data['employee_statuses']
             with transaction.atomic():
                 # Create OT Filing record
                 filing = OTFiling.objects.create(
                     filing_type='DAILY',
                     group_id=form.cleaned_data['group_id'],
                     requestor=request.user,
-                    status='PENDING'
+                    status='PENDING',
+                    **count_statuses(statuses.values())
                 )
 
                 # Create DailyOT record
@@ -941,24 +786,9 @@ def submit_daily_ot(request):
                     reason=form.cleaned_data['reason']
                 )
 
-                # Create employee status records
-                employee_data = form.cleaned_data['employee_statuses']
-
-                # Check if employee_data is already a list or needs to be parsed from JSON
-                if isinstance(employee_data, str):
-                    try:
-                        employee_data = json.loads(employee_data)
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Error parsing employee_statuses JSON: {str(e)}")
-                        raise ValueError(f"Invalid employee_statuses format: {str(e)}")
-
-                for emp in employee_data:
-                    employee = Employee.objects.get(id=emp['id'])
-                    EmployeeOTStatus.objects.create(
-                        filing=filing,
-                        employee=employee,
-                        status=emp['status']
-                    )
+                # Create employee status records, the employees were checked by the form
+                create_employee_statuses(filing, statuses)
+                refresh_roster([filing])
 
                 # Create system activity log
                 create_system_activity(
@@ -967,28 +797,6 @@ def submit_daily_ot(request):
                     f"Created Daily OT filing: {filing.filing_id} for {filing.group.name} ({daily_ot.date}, {daily_ot.get_schedule_type_display()})"
                 )
 
-            # Format OT filing for history display
-            def format_ot_for_history(filing):
-                result = {
-                    'id': filing.filing_id,
-                    'type': 'Shifting' if filing.filing_type == 'SHIFTING' else 'Daily',
-                    'group': filing.group.name,
-                    'date': filing.date_created.strftime('%b %d, %Y'),
-                    'employee_count': EmployeeOTStatus.objects.filter(filing=filing).count(),
-                    'ot_count': EmployeeOTStatus.objects.filter(filing=filing, status='OT').count(),
-                    'not_ot_count': EmployeeOTStatus.objects.filter(filing=filing, status='NOT-OT').count(),
-                }
-
-                # Add type-specific info
-                if filing.filing_type == 'SHIFTING':
-                    shifting = filing.shifting_details
-                    result['shift_type'] = shifting.shift_type
-                else:
-                    daily = filing.daily_details
-                    result['schedule_type'] = daily.get_schedule_type_display()
-
-                return result
-
             # Return success with filing details for history
             return JsonResponse({
                 'success': True,
@@ -1063,118 +871,77 @@ def get_ot_details(request, filing_id):
 
 
 # Analytics Endpoints
+STATUS_DATASETS = [
+    ('OT', 'ot_count', '76, 175, 80'),
+    ('Not OT', 'not_ot_count', '33, 150, 243'),
+    ('Absent', 'absent_count', '244, 67, 54'),
+    ('Leave', 'leave_count', '156, 39, 176'),
+]
+
+
+def status_datasets(counts):
+    """Chart.js datasets for the per bucket status counts of status_chart()."""
+    return [
+        {
+            'label': label,
+            'data': counts[field],
+            'backgroundColor': f'rgba({rgb}, 0.2)',
+            'borderColor': f'rgba({rgb}, 1)',
+            'borderWidth': 2,
+            'fill': True,
+            'tension': 0.4
+        }
+        for label, field, rgb in STATUS_DATASETS
+    ]
+
+
+def months_between(first_day, last_day):
+    return (last_day.year - first_day.year) * 12 + last_day.month - first_day.month + 1
+
+
 @login_required
-@user_passes_test(lambda u: u.overtime_checker)
+@user_passes_test(lambda u: u.overtime_supervisor)
+@cached_aggregate('overtime', ['overtime.otfiling', 'overtime.employeeotstatus', 'portalusers.userapprovers'])
 def get_analytics(request):
     """Get overtime analytics data"""
     try:
         period = request.GET.get('period', '3M')
-
-        # Determine date range based on period
-        end_date = timezone.now()
-
-        if period == '3M':
-            start_date = end_date - timedelta(days=90)
-        elif period == '6M':
-            start_date = end_date - timedelta(days=180)
-        elif period == 'QTR':
-            # Current quarter
-            quarter = (end_date.month - 1) // 3 + 1
-            start_date = timezone.datetime(end_date.year, (quarter - 1) * 3 + 1, 1)
-        else:
-            # Default to 3 months
-            start_date = end_date - timedelta(days=90)
-
-        # Get supervised requestors
-        from django.apps import apps
-        UsersApprovers = apps.get_model('portalusers', 'UsersApprovers')
-
-        supervised_users = UsersApprovers.objects.filter(
-            approver=request.user,
-            module='Overtime',
-            approver_role='Checker'
-        ).values_list('user', flat=True)
-
-        # Get filings for these requestors in date range
-        filings = OTFiling.objects.filter(
-            requestor__in=supervised_users,
-            date_created__gte=start_date,
-            date_created__lte=end_date
-        )
-
-        # Prepare summary data
-        ot_count = EmployeeOTStatus.objects.filter(filing__in=filings, status='OT').count()
-        not_ot_count = EmployeeOTStatus.objects.filter(filing__in=filings, status='NOT-OT').count()
-        absent_count = EmployeeOTStatus.objects.filter(filing__in=filings, status='ABSENT').count()
-        leave_count = EmployeeOTStatus.objects.filter(filing__in=filings, status='LEAVE').count()
-
-        # Prepare chart data - group by month or week
-        labels = []
-        ot_data = []
-        not_ot_data = []
-        absent_data = []
-        leave_data = []
+        today = timezone.localdate()
 
         if period == 'QTR':
-            # Group by weeks for quarterly view
-            current_date = start_date
-            week_number = 1
-
-            while current_date <= end_date:
-                week_end = min(current_date + timedelta(days=6), end_date)
-
-                week_filings = filings.filter(
-                    date_created__gte=current_date,
-                    date_created__lte=week_end
-                )
-
-                labels.append(f"Week {week_number}")
-                ot_data.append(EmployeeOTStatus.objects.filter(filing__in=week_filings, status='OT').count())
-                not_ot_data.append(EmployeeOTStatus.objects.filter(filing__in=week_filings, status='NOT-OT').count())
-                absent_data.append(EmployeeOTStatus.objects.filter(filing__in=week_filings, status='ABSENT').count())
-                leave_data.append(EmployeeOTStatus.objects.filter(filing__in=week_filings, status='LEAVE').count())
-
-                current_date += timedelta(days=7)
-                week_number += 1
+            # Current quarter, grouped by weeks counted from its first day
+            quarter_start = date(today.year, (today.month - 1) // 3 * 3 + 1, 1)
+            start_date = local_midnight(quarter_start)
+            buckets = [quarter_start + timedelta(days=7 * week) for week in range((today - quarter_start).days // 7 + 1)]
+            labels = [f"Week {week}" for week in range(1, len(buckets) + 1)]
+            kind = 'day'
+
+            def bucket_of(day):
+                return quarter_start + timedelta(days=(day - quarter_start).days // 7 * 7)
         else:
-            # Group by months
-            current_date = start_date.replace(day=1)
-
-            while current_date <= end_date:
-                next_month = current_date.month + 1 if current_date.month < 12 else 1
-                next_year = current_date.year + 1 if current_date.month == 12 else current_date.year
-                month_end = timezone.datetime(next_year, next_month, 1) - timedelta(days=1)
-
-                month_filings = filings.filter(
-                    date_created__gte=current_date,
-                    date_created__lte=month_end
-                )
-
-                labels.append(current_date.strftime('%b %Y'))
-                ot_data.append(EmployeeOTStatus.objects.filter(filing__in=month_filings, status='OT').count())
-                not_ot_data.append(EmployeeOTStatus.objects.filter(filing__in=month_filings, status='NOT-OT').count())
-                absent_data.append(EmployeeOTStatus.objects.filter(filing__in=month_filings, status='ABSENT').count())
-                leave_data.append(EmployeeOTStatus.objects.filter(filing__in=month_filings, status='LEAVE').count())
-
-                # Move to next month
-                if current_date.month == 12:
-                    current_date = current_date.replace(year=current_date.year + 1, month=1)
-                else:
-                    current_date = current_date.replace(month=current_date.month + 1)
+            # Last 3 (default) or 6 months, grouped by month
+            start_date = timezone.now() - timedelta(days=180 if period == '6M' else 90)
+            first_month = timezone.localtime(start_date).date().replace(day=1)
+            buckets = month_starts(today, months_between(first_month, today))
+            labels = [bucket.strftime('%b %Y') for bucket in buckets]
+            kind = 'month'
+            bucket_of = None
+
+        statuses = EmployeeOTStatus.objects.filter(
+            supervised_filter('filing__requestor', request.user, 'Overtime', 'Checker'),
+            filing__date_created__gte=start_date,
+            filing__date_created__lte=timezone.now()
+        )
+        counts = status_chart(statuses, kind, buckets, bucket_of)
 
         return JsonResponse({
-            'summary': {
-                'ot_count': ot_count,
-                'not_ot_count': not_ot_count,
-                'absent_count': absent_count,
-                'leave_count': leave_count,
-            },
+            'summary': {field: sum(counts[field]) for field in STATUS_COUNT_FIELDS.values()},
             'chart': {
                 'labels': labels,
-                'ot_data': ot_data,
-                'not_ot_data': not_ot_data,
-                'absent_data': absent_data,
-                'leave_data': leave_data,
+                'ot_data': counts['ot_count'],
+                'not_ot_data': counts['not_ot_count'],
+                'absent_data': counts['absent_count'],
+                'leave_data': counts['leave_count'],
             }
         })
 
@@ -1188,165 +955,27 @@ def get_employee_status_chart(request):
     """Get employee status distribution data for charts"""
     try:
         period = request.GET.get('period', 'month')
+        today = timezone.localdate()
+
+        if period == 'quarter':
+            # The months of the last 90 days
+            first_month = (today - timedelta(days=90)).replace(day=1)
+            buckets = month_starts(today, months_between(first_month, today))
+            labels = [bucket.strftime('%b') for bucket in buckets]
+            kind = 'month'
+        else:
+            # Daily points over the last 7 days or the current month
+            first_day = today - timedelta(days=7) if period == 'week' else today.replace(day=1)
+            buckets = [first_day + timedelta(days=offset) for offset in range((today - first_day).days + 1)]
+            labels = [bucket.strftime('%d') for bucket in buckets]
+            kind = 'day'
 
-        # Determine date range based on period
-        end_date = timezone.now()
-
-        if period == 'week':
-            # Last 7 days
-            start_date = end_date - timedelta(days=7)
-            date_format = '%d'  # Day of month
-            delta = timedelta(days=1)
-        elif period == 'month':
-            # Current month
-            start_date = end_date.replace(day=1)
-            date_format = '%d'  # Day of month
-            delta = timedelta(days=1)
-        elif period == 'quarter':
-            # Last 3 months
-            start_date = end_date - timedelta(days=90)
-            date_format = '%b'  # Month abbreviation
-            # For quarterly view, we'll group by month
-            current_date = start_date.replace(day=1)
-            labels = []
-            ot_data = []
-            not_ot_data = []
-            absent_data = []
-            leave_data = []
-
-            while current_date <= end_date:
-                next_month = current_date.month + 1 if current_date.month < 12 else 1
-                next_year = current_date.year + 1 if current_date.month == 12 else current_date.year
-                month_end = timezone.datetime(next_year, next_month, 1) - timedelta(days=1)
-
-                # Get all filings for this month
-                month_filings = OTFiling.objects.filter(
-                    date_created__gte=current_date,
-                    date_created__lte=month_end
-                )
-
-                # Get status counts
-                labels.append(current_date.strftime('%b'))
-                ot_data.append(EmployeeOTStatus.objects.filter(filing__in=month_filings, status='OT').count())
-                not_ot_data.append(EmployeeOTStatus.objects.filter(filing__in=month_filings, status='NOT-OT').count())
-                absent_data.append(EmployeeOTStatus.objects.filter(filing__in=month_filings, status='ABSENT').count())
-                leave_data.append(EmployeeOTStatus.objects.filter(filing__in=month_filings, status='LEAVE').count())
-
-                # Move to next month
-                if current_date.month == 12:
-                    current_date = current_date.replace(year=current_date.year + 1, month=1)
-                else:
-                    current_date = current_date.replace(month=current_date.month + 1)
-
-            return JsonResponse({
-                'labels': labels,
-                'datasets': [
-                    {
-                        'label': 'OT',
-                        'data': ot_data,
-                        'backgroundColor': 'rgba(76, 175, 80, 0.2)',
-                        'borderColor': 'rgba(76, 175, 80, 1)',
-                        'borderWidth': 2,
-                        'fill': True,
-                        'tension': 0.4
-                    },
-                    {
-                        'label': 'Not OT',
-                        'data': not_ot_data,
-                        'backgroundColor': 'rgba(33, 150, 243, 0.2)',
-                        'borderColor': 'rgba(33, 150, 243, 1)',
-                        'borderWidth': 2,
-                        'fill': True,
-                        'tension': 0.4
-                    },
-                    {
-                        'label': 'Absent',
-                        'data': absent_data,
-                        'backgroundColor': 'rgba(244, 67, 54, 0.2)',
-                        'borderColor': 'rgba(244, 67, 54, 1)',
-                        'borderWidth': 2,
-                        'fill': True,
-                        'tension': 0.4
-                    },
-                    {
-                        'label': 'Leave',
-                        'data': leave_data,
-                        'backgroundColor': 'rgba(156, 39, 176, 0.2)',
-                        'borderColor': 'rgba(156, 39, 176, 1)',
-                        'borderWidth': 2,
-                        'fill': True,
-                        'tension': 0.4
-                    }
-                ]
-            })
-
-        # For week and month views, we'll generate daily data points
-        labels = []
-        ot_data = []
-        not_ot_data = []
-        absent_data = []
-        leave_data = []
-
-        current_date = start_date
-        while current_date <= end_date:
-            # Get all filings for this day
-            day_start = timezone.datetime.combine(current_date, time.min)
-            day_end = timezone.datetime.combine(current_date, time.max)
-
-            day_filings = OTFiling.objects.filter(
-                date_created__gte=day_start,
-                date_created__lte=day_end
-            )
-
-            # Get status counts
-            labels.append(current_date.strftime(date_format))
-            ot_data.append(EmployeeOTStatus.objects.filter(filing__in=day_filings, status='OT').count())
-            not_ot_data.append(EmployeeOTStatus.objects.filter(filing__in=day_filings, status='NOT-OT').count())
-            absent_data.append(EmployeeOTStatus.objects.filter(filing__in=day_filings, status='ABSENT').count())
-            leave_data.append(EmployeeOTStatus.objects.filter(filing__in=day_filings, status='LEAVE').count())
-
-            current_date += delta
+        statuses = EmployeeOTStatus.objects.filter(filing__date_created__gte=local_midnight(buckets[0]))
+        counts = status_chart(statuses, kind, buckets)
 
         return JsonResponse({
             'labels': labels,
-            'datasets': [
-                {
-                    'label': 'OT',
-                    'data': ot_data,
-                    'backgroundColor': 'rgba(76, 175, 80, 0.2)',
-                    'borderColor': 'rgba(76, 175, 80, 1)',
-                    'borderWidth': 2,
-                    'fill': True,
-                    'tension': 0.4
-                },
-                {
-                    'label': 'Not OT',
-                    'data': not_ot_data,
-                    'backgroundColor': 'rgba(33, 150, 243, 0.2)',
-                    'borderColor': 'rgba(33, 150, 243, 1)',
-                    'borderWidth': 2,
-                    'fill': True,
-                    'tension': 0.4
-                },
-                {
-                    'label': 'Absent',
-                    'data': absent_data,
-                    'backgroundColor': 'rgba(244, 67, 54, 0.2)',
-                    'borderColor': 'rgba(244, 67, 54, 1)',
-                    'borderWidth': 2,
-                    'fill': True,
-                    'tension': 0.4
-                },
-                {
-                    'label': 'Leave',
-                    'data': leave_data,
-                    'backgroundColor': 'rgba(156, 39, 176, 0.2)',
-                    'borderColor': 'rgba(156, 39, 176, 1)',
-                    'borderWidth': 2,
-                    'fill': True,
-                    'tension': 0.4
-                }
-            ]
+            'datasets': status_datasets(counts)
         })
 
     except Exception as e:
@@ -1359,7 +988,8 @@ def get_recent_activity(request):
     """Get recent activity data for the activity feed"""
     try:
         # Get the most recent OT filings
-        recent_filings = OTFiling.objects.filter(requestor=request.user).order_by('-date_created')[:10]
+        recent_filings = (OTFiling.objects.filter(requestor=request.user)
+                          .select_related('requestor', *HISTORY_RELATED).order_by('-date_created')[:10])
 
         activities = []
         for filing in recent_filings:
@@ -1371,7 +1001,7 @@ def get_recent_activity(request):
                 'time': filing.date_created.strftime('%H:%M'),
                 'requestor': filing.requestor.name,
                 'status': filing.status,
-                'employee_count': EmployeeOTStatus.objects.filter(filing=filing).count(),
+                'employee_count': filing.employee_count,
             }
 
             # Add type-specific info
@@ -1395,75 +1025,38 @@ def get_recent_activity(request):
 
 
 @login_required
-@user_passes_test(lambda u: u.overtime_checker)
+@user_passes_test(lambda u: u.overtime_supervisor or u.is_admin)
 def get_requestor_analytics(request, requestor_id):
     """Get analytics for a specific requestor"""
     try:
         requestor = get_object_or_404(Users, id=requestor_id, overtime_requestor=True)
 
         # Check if current user supervises this requestor
-        from django.apps import apps
-        UsersApprovers = apps.get_model('portalusers', 'UsersApprovers')
-
-        is_supervisor = UsersApprovers.objects.filter(
-            approver=request.user,
-            user=requestor,
-            module='Overtime',
-            approver_role='Checker'
-        ).exists()
-
-        if not request.user.is_admin and not is_supervisor:
+        # Checked live, the cached supervised sets can lag an approver change in another process
+        if not request.user.is_admin and not is_supervisor(request.user, requestor, 'Overtime', 'Checker'):
             return JsonResponse({'error': 'You do not have permission to view this data'}, status=403)
 
         # Get all filings by this requestor
         filings = OTFiling.objects.filter(requestor=requestor)
 
         # Prepare summary data
-        total_requests = filings.count()
-        shifted_count = filings.filter(filing_type='SHIFTING').count()
-        daily_count = filings.filter(filing_type='DAILY').count()
-
-        ot_count = EmployeeOTStatus.objects.filter(filing__in=filings, status='OT').count()
-        not_ot_count = EmployeeOTStatus.objects.filter(filing__in=filings, status='NOT-OT').count()
-        absent_count = EmployeeOTStatus.objects.filter(filing__in=filings, status='ABSENT').count()
-        leave_count = EmployeeOTStatus.objects.filter(filing__in=filings, status='LEAVE').count()
+        summary = filings.aggregate(
+            total_requests=Count('id'),
+            shifted_count=Count('id', filter=Q(filing_type='SHIFTING')),
+            daily_count=Count('id', filter=Q(filing_type='DAILY')),
+        )
+        status_count = EmployeeOTStatus.objects.filter(filing__requestor=requestor).aggregate(**status_counts())
 
         # Get recent filings
-        recent_filings = filings.order_by('-date_created')[:10]
-
-        # Format OT filing for history display
-        def format_ot_for_history(filing):
-            result = {
-                'id': filing.filing_id,
-                'type': 'Shifting' if filing.filing_type == 'SHIFTING' else 'Daily',
-                'group': filing.group.name,
-                'date': filing.date_created.strftime('%b %d, %Y'),
-                'employee_count': EmployeeOTStatus.objects.filter(filing=filing).count(),
-                'ot_count': EmployeeOTStatus.objects.filter(filing=filing, status='OT').count(),
-                'not_ot_count': EmployeeOTStatus.objects.filter(filing=filing, status='NOT-OT').count(),
-            }
-
-            # Add type-specific info
-            if filing.filing_type == 'SHIFTING':
-                shifting = filing.shifting_details
-                result['shift_type'] = shifting.shift_type
-            else:
-                daily = filing.daily_details
-                result['schedule_type'] = daily.get_schedule_type_display()
-
-            return result
+        recent_filings = filings.select_related(*HISTORY_RELATED).order_by('-date_created')[:10]
 
         return JsonResponse({
-            'summary': {
-                'total_requests': total_requests,
-                'shifted_count': shifted_count,
-                'daily_count': daily_count,
-            },
+            'summary': summary,
             'status_count': {
-                'ot': ot_count,
-                'not_ot': not_ot_count,
-                'absent': absent_count,
-                'leave': leave_count,
+                'ot': status_count['ot_count'],
+                'not_ot': status_count['not_ot_count'],
+                'absent': status_count['absent_count'],
+                'leave': status_count['leave_count'],
             },
             'recent_filings': [format_ot_for_history(filing) for filing in recent_filings],
         })
@@ -1485,31 +1078,17 @@ def update_password(request):
         password_type = data.get('password_type')
         new_password = data.get('new_password')
 
-        # Define helper function to get or create password
-        def get_or_create_password(password_type):
-            """Get or create a password record"""
-            try:
-                return LateFilingPassword.objects.get(password_type=password_type)
-            except LateFilingPassword.DoesNotExist:
-                # Create with default password
-                defaults = {
-                    'SHIFTING': 'shifting123',
-                    'DAILY': 'daily123',
-                    'WEEKEND': 'weekend123',
-                    'HOLIDAY': 'holiday123'
-                }
-                return LateFilingPassword.objects.create(
-                    password_type=password_type,
-                    password=defaults.get(password_type, 'password123')
-                )
-
         # Get or create password record
-        password_obj = get_or_create_password(password_type)
+        password_obj, _ = LateFilingPassword.objects.get_or_create(
+            password_type=password_type,
+            defaults={'password': DEFAULT_PASSWORDS.get(password_type, 'password123')}
+        )
 
         # Update password
         password_obj.password = new_password
         password_obj.updated_by = request.user
         password_obj.save()
+        invalidate_passwords()
 
         # Create system activity log
         create_system_activity(
@@ -1535,31 +1114,16 @@ def update_password(request):
 def reset_passwords(request):
     """Reset all passwords to defaults"""
     try:
-        default_passwords = {
-            'SHIFTING': 'shifting123',
-            'DAILY': 'daily123',
-            'WEEKEND': 'weekend123',
-            'HOLIDAY': 'holiday123'
-        }
-
-        # Define helper function to get or create password
-        def get_or_create_password(password_type):
-            """Get or create a password record"""
-            try:
-                return LateFilingPassword.objects.get(password_type=password_type)
-            except LateFilingPassword.DoesNotExist:
-                # Create with default password
-                return LateFilingPassword.objects.create(
-                    password_type=password_type,
-                    password=default_passwords.get(password_type, 'password123')
-                )
-
         # Reset each password
-        for password_type, default_password in default_passwords.items():
-            password_obj = get_or_create_password(password_type)
+        for password_type, default_password in DEFAULT_PASSWORDS.items():
+            password_obj, _ = LateFilingPassword.objects.get_or_create(
+                password_type=password_type,
+                defaults={'password': default_password}
+            )
             password_obj.password = default_password
             password_obj.updated_by = request.user
             password_obj.save()
+        invalidate_passwords()
 
         # Create system activity log
         create_system_activity(
@@ -1570,7 +1134,7 @@ def reset_passwords(request):
 
         return JsonResponse({
             'success': True,
-            'passwords': default_passwords
+            'passwords': DEFAULT_PASSWORDS
         })
 
     except Exception as e:
@@ -1579,6 +1143,15 @@ def reset_passwords(request):
 
 
 # Export Endpoints
+OT_EXPORT_STYLES = {
+    'ot_header': dict(font=Font(bold=True), fill=fill("D9E1F2"), border=THIN_BORDER,
+                      alignment=Alignment(horizontal='center', vertical='center')),
+    'ot_cell': dict(border=THIN_BORDER),
+    'ot_missing': dict(border=THIN_BORDER, fill=fill("FFC7CE")),
+    'ot_inactive': dict(border=THIN_BORDER, fill=fill("FFEB9C")),
+}
+
+
 @login_required
 @user_passes_test(lambda u: u.is_admin)
 def export_shifting(request):
@@ -1597,74 +1170,34 @@ def export_shifting(request):
         start_date = datetime.strptime(start_date, '%Y-%m-%d').date()
         end_date = datetime.strptime(end_date, '%Y-%m-%d').date()
 
-        # Get shifting OT filings in date range
-        shifting_filings = ShiftingOT.objects.filter(
-            start_date__gte=start_date,
-            end_date__lte=end_date
-        ).select_related('filing')
-
-        # Create workbook
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "Shifting OT Export"
-
-        # Add headers
-        headers = ['ID Number', 'Employee Name', 'Department', 'Line', 'Time', 'Status', 'Shift', 'Shuttle Service']
-        for col_num, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col_num)
-            cell.value = header
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-            cell.border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
+        # Roster days of shifting OT in the date range, one row per employee per day
+        roster = OTRoster.objects.filter(
+            date__gte=start_date,
+            date__lte=end_date,
+            filing_type='SHIFTING'
+        ).select_related('employee').order_by('date', 'shift', 'filing_id', 'employee_id')
+
+        export = XlsxExport(OT_EXPORT_STYLES)
+        ws = export.add_sheet(
+            "Shifting OT Export",
+            headers=['ID Number', 'Employee Name', 'Department', 'Line', 'Date', 'Status', 'Shift', 'Shuttle Service'],
+            widths=[15, 30, 20, 15, 20, 15, 10, 20],
+            header_style='ot_header',
+        )
 
-        # Add data
-        row_num = 2
-        for shifting in shifting_filings:
-            filing = shifting.filing
-
-            # Get employee statuses for this filing
-            statuses = EmployeeOTStatus.objects.filter(filing=filing).select_related('employee')
-
-            for status in statuses:
-                employee = status.employee
-
-                ws.cell(row=row_num, column=1, value=employee.id_number)
-                ws.cell(row=row_num, column=2, value=employee.name)
-                ws.cell(row=row_num, column=3, value=employee.department or '')
-                ws.cell(row=row_num, column=4, value=employee.line or '')
-                ws.cell(row=row_num, column=5, value=shifting.filing.date_created.strftime('%Y-%m-%d %H:%M'))
-                ws.cell(row=row_num, column=6, value=status.get_status_display())
-                ws.cell(row=row_num, column=7, value=shifting.shift_type)
-
-                shuttle_cell = ws.cell(row=row_num, column=8, value=employee.shuttle_service or 'Not Assigned')
-
-                # Highlight empty shuttle service if requested
-                if highlight_empty and not employee.shuttle_service:
-                    shuttle_cell.fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-
-                row_num += 1
-
-        # Format as table
-        table_range = f"A1:{get_column_letter(len(headers))}{row_num-1}"
-        for row in ws[table_range]:
-            for cell in row:
-                cell.border = Border(
-                    left=Side(style='thin'),
-                    right=Side(style='thin'),
-                    top=Side(style='thin'),
-                    bottom=Side(style='thin')
-                )
+        for entry in rows_of(roster):
+            employee = entry.employee
 
-        # Apply column widths
-        column_widths = [15, 30, 20, 15, 20, 15, 10, 20]
-        for i, width in enumerate(column_widths, 1):
-            ws.column_dimensions[get_column_letter(i)].width = width
+            ws.append([
+                employee.id_number,
+                employee.name,
+                employee.department or '',
+                employee.line or '',
+                entry.date.strftime('%Y-%m-%d'),
+                entry.get_status_display(),
+                entry.shift,
+                entry.shuttle_service or 'Not Assigned',
+            ], style='ot_cell', styles={7: 'ot_missing'} if highlight_empty and not entry.shuttle_service else None)
 
         # Create system activity log
         create_system_activity(
@@ -1673,14 +1206,7 @@ def export_shifting(request):
             f"Exported Shifting OT data from {start_date} to {end_date}"
         )
 
-        # Create response
-        response = HttpResponse(
-            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-        )
-        response['Content-Disposition'] = f'attachment; filename=shifting_ot_export_{start_date}_to_{end_date}.xlsx'
-
-        wb.save(response)
-        return response
+        return export.response(f'shifting_ot_export_{start_date}_to_{end_date}.xlsx')
 
     except Exception as e:
         logger.error(f"Error exporting shifting OT: {str(e)}")
@@ -1706,71 +1232,37 @@ def export_daily(request):
         start_date = datetime.strptime(start_date, '%Y-%m-%d').date()
         end_date = datetime.strptime(end_date, '%Y-%m-%d').date()
 
-        # Get daily OT filings in date range with specified schedule type
-        daily_filings = DailyOT.objects.filter(
-            date__gte=start_date,
-            date__lte=end_date,
-            schedule_type=schedule_type
-        ).select_related('filing')
-
-        # Create workbook
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "Daily OT Export"
-
-        # Add headers
-        headers = ['ID Number', 'Employee Name', 'Department', 'Line', 'Date', 'Time', 'Status', 'Shuttle Service', 'Reason']
-        for col_num, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col_num)
-            cell.value = header
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-            cell.border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
-
-        # Add data
-        row_num = 2
-        for daily in daily_filings:
-            filing = daily.filing
-
-            # Get employee statuses for this filing with specified status
-            statuses = EmployeeOTStatus.objects.filter(filing=filing, status=status).select_related('employee')
-
-            for status_obj in statuses:
-                employee = status_obj.employee
-
-                ws.cell(row=row_num, column=1, value=employee.id_number)
-                ws.cell(row=row_num, column=2, value=employee.name)
-                ws.cell(row=row_num, column=3, value=employee.department or '')
-                ws.cell(row=row_num, column=4, value=employee.line or '')
-                ws.cell(row=row_num, column=5, value=daily.date.strftime('%Y-%m-%d'))
-                ws.cell(row=row_num, column=6, value=f"{daily.start_time.strftime('%H:%M')} - {daily.end_time.strftime('%H:%M')}")
-                ws.cell(row=row_num, column=7, value=status_obj.get_status_display())
-                ws.cell(row=row_num, column=8, value=employee.shuttle_service or 'Not Assigned')
-                ws.cell(row=row_num, column=9, value=daily.reason)
-
-                row_num += 1
-
-        # Format as table
-        table_range = f"A1:{get_column_letter(len(headers))}{row_num-1}"
-        for row in ws[table_range]:
-            for cell in row:
-                cell.border = Border(
-                    left=Side(style='thin'),
-                    right=Side(style='thin'),
-                    top=Side(style='thin'),
-                    bottom=Side(style='thin')
-                )
+        # Employee statuses with the requested status on daily OT filings in the date range, in one query
+        statuses = EmployeeOTStatus.objects.filter(
+            filing__daily_details__date__gte=start_date,
+            filing__daily_details__date__lte=end_date,
+            filing__daily_details__schedule_type=schedule_type,
+            status=status
+        ).select_related('employee', 'filing__daily_details').order_by('filing_id', 'id')
+
+        export = XlsxExport(OT_EXPORT_STYLES)
+        ws = export.add_sheet(
+            "Daily OT Export",
+            headers=['ID Number', 'Employee Name', 'Department', 'Line', 'Date', 'Time', 'Status', 'Shuttle Service', 'Reason'],
+            widths=[15, 30, 20, 15, 15, 20, 15, 20, 50],
+            header_style='ot_header',
+        )
 
-        # Apply column widths
-        column_widths = [15, 30, 20, 15, 15, 20, 15, 20, 50]
-        for i, width in enumerate(column_widths, 1):
-            ws.column_dimensions[get_column_letter(i)].width = width
+        for status_obj in rows_of(statuses):
+            employee = status_obj.employee
+            daily = status_obj.filing.daily_details
+
+            ws.append([
+                employee.id_number,
+                employee.name,
+                employee.department or '',
+                employee.line or '',
+                daily.date.strftime('%Y-%m-%d'),
+                f"{daily.start_time.strftime('%H:%M')} - {daily.end_time.strftime('%H:%M')}",
+                status_obj.get_status_display(),
+                employee.shuttle_service or 'Not Assigned',
+                daily.reason,
+            ], style='ot_cell')
 
         # Create system activity log
         status_display = "OT" if status == "OT" else "Not OT"
@@ -1782,14 +1274,7 @@ def export_daily(request):
             f"Exported Daily OT data ({schedule_display}, {status_display}) from {start_date} to {end_date}"
         )
 
-        # Create response
-        response = HttpResponse(
-            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-        )
-        response['Content-Disposition'] = f'attachment; filename=daily_ot_export_{schedule_type}_{status}_{start_date}_to_{end_date}.xlsx'
-
-        wb.save(response)
-        return response
+        return export.response(f'daily_ot_export_{schedule_type}_{status}_{start_date}_to_{end_date}.xlsx')
 
     except Exception as e:
         logger.error(f"Error exporting daily OT: {str(e)}")
@@ -1816,60 +1301,31 @@ def export_masterlist(request):
         if department and department != 'all':
             employees = employees.filter(department=department)
 
-        # Create workbook
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "Employee Masterlist"
-
-        # Add headers
-        headers = ['ID Number', 'Employee Name', 'Department', 'Line', 'Shuttle Service', 'Status']
-        for col_num, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col_num)
-            cell.value = header
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-            cell.border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
-
-        # Add data
-        for row_num, employee in enumerate(employees, 2):
-            ws.cell(row=row_num, column=1, value=employee.id_number)
-            ws.cell(row=row_num, column=2, value=employee.name)
-            ws.cell(row=row_num, column=3, value=employee.department or '')
-            ws.cell(row=row_num, column=4, value=employee.line or '')
-
-            shuttle_cell = ws.cell(row=row_num, column=5, value=employee.shuttle_service or 'Not Assigned')
+        export = XlsxExport(OT_EXPORT_STYLES)
+        ws = export.add_sheet(
+            "Employee Masterlist",
+            headers=['ID Number', 'Employee Name', 'Department', 'Line', 'Shuttle Service', 'Status'],
+            widths=[15, 30, 20, 15, 20, 15],
+            header_style='ot_header',
+        )
 
+        for employee in rows_of(employees):
+            highlights = {}
             # Highlight missing shuttle service if requested
             if highlight_missing and not employee.shuttle_service:
-                shuttle_cell.fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-
-            status_cell = ws.cell(row=row_num, column=6, value='Active' if employee.is_active else 'Inactive')
-
+                highlights[4] = 'ot_missing'
             # Highlight inactive employees
             if not employee.is_active:
-                status_cell.fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
-
-        # Format as table
-        table_range = f"A1:{get_column_letter(len(headers))}{len(employees)+1}"
-        for row in ws[table_range]:
-            for cell in row:
-                cell.border = Border(
-                    left=Side(style='thin'),
-                    right=Side(style='thin'),
-                    top=Side(style='thin'),
-                    bottom=Side(style='thin')
-                )
+                highlights[5] = 'ot_inactive'
 
-        # Apply column widths
-        column_widths = [15, 30, 20, 15, 20, 15]
-        for i, width in enumerate(column_widths, 1):
-            ws.column_dimensions[get_column_letter(i)].width = width
+            ws.append([
+                employee.id_number,
+                employee.name,
+                employee.department or '',
+                employee.line or '',
+                employee.shuttle_service or 'Not Assigned',
+                'Active' if employee.is_active else 'Inactive',
+            ], style='ot_cell', styles=highlights)
 
         # Create system activity log
         dept_info = f" for {department} department" if department and department != 'all' else ''
@@ -1879,14 +1335,7 @@ def export_masterlist(request):
             f"Exported Employee Masterlist{dept_info}"
         )
 
-        # Create response
-        response = HttpResponse(
-            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-        )
-        response['Content-Disposition'] = f'attachment; filename=employee_masterlist_{timezone.now().strftime("%Y%m%d")}.xlsx'
-
-        wb.save(response)
-        return response
+        return export.response(f'employee_masterlist_{timezone.now().strftime("%Y%m%d")}.xlsx')
 
     except Exception as e:
         logger.error(f"Error exporting employee masterlist: {str(e)}")
@@ -1965,6 +1414,8 @@ def change_employee_status(request):
                 updated_count += 1
             except EmployeeOTStatus.DoesNotExist:
                 continue
+        refresh_status_counts([filing])
+        refresh_roster([filing])
 
         # Create system activity log
         create_system_activity(
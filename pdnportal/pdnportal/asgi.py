@@ -9,6 +9,10 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'pdnportal.settings')
 # Get the ASGI application first
 django_asgi_app = get_asgi_application()
 
+# Worker threads for queued imports and exports, see settings/background.py
+from settings.background import start_workers
+start_workers()
+
 application = ProtocolTypeRouter({
     "http": django_asgi_app,
     "websocket": AuthMiddlewareStack(
@@ -0,0 +1,266 @@
+"""
+Offline benchmark harness for the JSON endpoints behind the dashboards.
+
+Runs every endpoint through the Django test client against whatever database
+is configured (normally one populated with `manage.py seed_load`) and records
+latency percentiles, query counts and peak allocated memory per endpoint.
+
+Every iteration is measured twice: once right after the cache is cleared,
+so the view computes its aggregates from the database (the cold figures the
+regression check compares), and once more with the cache it just filled
+(the warm figures, what a polling dashboard mostly sees).
+"""
+import contextlib
+import io
+import json
+import logging
+import platform
+import statistics
+import time
+import tracemalloc
+import warnings
+
+import django
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+# name, url name, url kwargs, query params, seeded user role
+ENDPOINTS = [
+    # Monitoring
+    ('monitoring.chart_data.week', 'chart_data', {'period': 'week'}, {}, 'approver'),
+    ('monitoring.chart_data.month', 'chart_data', {'period': 'month'}, {}, 'approver'),
+    ('monitoring.chart_data.quarter', 'chart_data', {'period': 'quarter'}, {}, 'approver'),
+    ('monitoring.group_performance', 'group_performance', {'group_id': '{group_id}'}, {}, 'approver'),
+    ('monitoring.line_performance', 'line_performance', {'group_id': '{group_id}', 'line_id': '{line_id}'}, {}, 'approver'),
+    ('monitoring.line_performance.total', 'line_performance', {'group_id': '{group_id}', 'line_id': 'total'}, {}, 'approver'),
+    ('monitoring.group_dashboard_data', 'group_dashboard_data', {'group_id': '{group_id}'}, {'dateFilter': 'week'}, 'approver'),
+
+    # Job order
+    ('joborder.chart_data', 'jo-chart-data', {'period': '6month'}, {}, 'requestor'),
+    ('joborder.approver_chart_data', 'job_order_chart_data', {'period': '6month'}, {}, 'approver'),
+    ('joborder.stats', 'job-order-stats-api', {}, {}, 'facilitator'),
+    ('joborder.timeline.today', 'job-order-timeline-api', {'view_type': 'timeline-today'}, {}, 'facilitator'),
+    ('joborder.timeline.week', 'job-order-timeline-api', {'view_type': 'timeline-week'}, {}, 'facilitator'),
+    ('joborder.timeline.month', 'job-order-timeline-api', {'view_type': 'timeline-month'}, {}, 'facilitator'),
+    ('joborder.deadlines', 'job-order-deadlines-api', {}, {}, 'facilitator'),
+    ('joborder.alerts', 'job-order-alerts-api', {}, {}, 'facilitator'),
+    ('joborder.trends.month', 'get_job_order_trends', {}, {'period': 'month'}, 'facilitator'),
+    ('joborder.trends.year', 'get_job_order_trends', {}, {'period': 'year'}, 'facilitator'),
+    ('joborder.upcoming_deadlines', 'get_upcoming_deadlines', {}, {}, 'maintenance'),
+
+    # Overtime
+    ('overtime.analytics', 'get-analytics', {}, {'period': '6M'}, 'approver'),
+    ('overtime.employee_status_chart', 'get-employee-status-chart', {}, {'period': 'month'}, 'facilitator'),
+    ('overtime.requestor_analytics', 'get-requestor-analytics', {'requestor_id': '{requestor_id}'}, {}, 'approver'),
+    ('overtime.recent_activity', 'get-recent-activity', {}, {}, 'facilitator'),
+
+    # DCF
+    ('dcf.stats_chart', 'dcf_stats_chart', {}, {'period': 'this_month'}, 'approver'),
+    ('dcf.requestor_chart', 'dcf_requestor_chart_data', {'period': '6month'}, {}, 'requestor'),
+    ('dcf.approver_chart', 'dcf_approver_chart_data', {'period': '6month'}, {}, 'approver'),
+
+    # ECIS
+    ('ecis.chart_data', 'ecis_chart_data', {}, {'period': '6month'}, 'facilitator'),
+    ('ecis.requestor_chart_data', 'ecis_requestor_chart_data', {}, {'period': '6month'}, 'requestor'),
+
+    # Manhours
+    ('manhours.chart_data', 'get_chart_data', {}, {'type': 'shiftOutput', 'period': 'month'}, 'approver'),
+    ('manhours.machine_performance', 'get_machine_performance', {}, {'period': 'month'}, 'approver'),
+
+    # Chat
+    ('chat.list', 'get_chats', {}, {}, 'requestor'),
+    ('chat.history', 'get_chat', {'chat_id': '{chat_id}'}, {}, 'requestor'),
+]
+
+
+class BenchmarkError(Exception):
+    pass
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    index = (len(ordered) - 1) * pct / 100
+    lower = int(index)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (index - lower)
+
+
+def seeded_context():
+    """Look up the seeded users and the ids the parametrized urls need."""
+    from portalusers.models import Users, UserApprovers
+    from monitoring.models import Monitoring, LineToMonitor
+    from chat.models import ChatMember
+
+    users = {}
+    for role in ('requestor', 'approver', 'checker', 'maintenance', 'facilitator', 'manager', 'terminal'):
+        users[role] = Users.objects.filter(username=f'seed_{role}_0001').first()
+    if not users['requestor']:
+        raise BenchmarkError('No seeded data found, run `manage.py seed_load` first.')
+
+    group = Monitoring.objects.filter(created_by=users['approver']).order_by('id').first()
+    line = LineToMonitor.objects.filter(monitoring=group).order_by('id').first() if group else None
+    member = ChatMember.objects.filter(user=users['requestor']).order_by('chat_id').first()
+    # requestor_analytics is viewed by the approver, so use a requestor the approver checks in Overtime
+    supervised = UserApprovers.objects.filter(
+        approver=users['approver'], module='Overtime', approver_role='Checker'
+    ).order_by('user_id').values_list('user_id', flat=True).first()
+
+    ids = {
+        'group_id': group.id if group else 0,
+        'line_id': line.line_id if line else 0,
+        'chat_id': member.chat_id if member else 0,
+        'requestor_id': supervised or users['requestor'].id,
+    }
+    return users, ids
+
+
+def resolve_url(url_name, kwargs, ids):
+    return reverse(url_name, kwargs={key: str(value).format(**ids) for key, value in kwargs.items()})
+
+
+def measure(client, url, params, trace_memory=False):
+    # Views print debug output and warn about naive datetimes, keep that out of the report
+    with contextlib.redirect_stdout(io.StringIO()), warnings.catch_warnings(), \
+            CaptureQueriesContext(connection) as queries:
+        warnings.simplefilter('ignore')
+        if trace_memory:
+            tracemalloc.start()
+        started = time.perf_counter()
+        response = client.get(url, params)
+        elapsed = (time.perf_counter() - started) * 1000
+        peak = 0
+        if trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+    return response.status_code, elapsed, len(queries), peak, len(response.content)
+
+
+def run_benchmark(iterations=20, warmup=2, only=None):
+    users, ids = seeded_context()
+    clients = {}
+    results = {}
+
+    # Failing endpoints are reported by status code, not by a traceback per request
+    request_logger = logging.getLogger('django.request')
+    request_logger_disabled = request_logger.disabled
+    request_logger.disabled = True
+
+    try:
+        for name, url_name, kwargs, params, role in ENDPOINTS:
+            if only and not any(part in name for part in only):
+                continue
+
+            if role not in clients:
+                clients[role] = Client(raise_request_exception=False, HTTP_HOST='localhost')
+                clients[role].force_login(users[role])
+            client = clients[role]
+            url = resolve_url(url_name, kwargs, ids)
+
+            for _ in range(warmup):
+                measure(client, url, params)
+
+            latencies, query_counts, statuses = [], [], set()
+            warm_latencies, warm_query_counts = [], []
+            for _ in range(iterations):
+                cache.clear()
+                status, elapsed, queries, _, size = measure(client, url, params)
+                statuses.add(status)
+                latencies.append(elapsed)
+                query_counts.append(queries)
+
+                status, elapsed, queries, _, _ = measure(client, url, params)
+                statuses.add(status)
+                warm_latencies.append(elapsed)
+                warm_query_counts.append(queries)
+
+            # Memory is traced on a separate cold request so tracemalloc does not skew the latencies
+            cache.clear()
+            _, _, _, peak, _ = measure(client, url, params, trace_memory=True)
+
+            results[name] = {
+                'url': url,
+                'params': params,
+                'status': sorted(statuses),
+                'iterations': iterations,
+                'p50_ms': round(percentile(latencies, 50), 2),
+                'p90_ms': round(percentile(latencies, 90), 2),
+                'p99_ms': round(percentile(latencies, 99), 2),
+                'mean_ms': round(statistics.mean(latencies), 2),
+                'max_ms': round(max(latencies), 2),
+                'queries': max(query_counts),
+                'warm_p50_ms': round(percentile(warm_latencies, 50), 2),
+                'warm_p90_ms': round(percentile(warm_latencies, 90), 2),
+                'warm_queries': max(warm_query_counts),
+                'peak_kb': round(peak / 1024, 1),
+                'response_kb': round(size / 1024, 1),
+            }
+    finally:
+        request_logger.disabled = request_logger_disabled
+
+    return {
+        'generated_at': timezone.now().isoformat(),
+        'environment': {
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': connection.vendor,
+        },
+        'endpoints': results,
+    }
+
+
+def failures(report):
+    """Messages for the endpoints that answered anything but 2xx, so redirects are never timed as views."""
+    return [
+        f"{name}: status {','.join(str(code) for code in result['status'])}"
+        for name, result in report['endpoints'].items()
+        if any(not 200 <= code < 300 for code in result['status'])
+    ]
+
+
+def compare(report, baseline, tolerance=25.0):
+    """
+    Compare a report against a baseline report.
+
+    Query counts must not grow at all, latency (p90) and peak memory may grow
+    by at most `tolerance` percent. Cold and warm figures are checked alike.
+    Returns a list of regression messages.
+    """
+    regressions = []
+    factor = 1 + tolerance / 100
+
+    for name, current in report['endpoints'].items():
+        previous = baseline.get('endpoints', {}).get(name)
+        if not previous:
+            continue
+        if current['status'] != previous['status']:
+            regressions.append(f"{name}: status {previous['status']} -> {current['status']}")
+        if current['queries'] > previous['queries']:
+            regressions.append(f"{name}: queries {previous['queries']} -> {current['queries']}")
+        if current['p90_ms'] > previous['p90_ms'] * factor:
+            regressions.append(f"{name}: p90 {previous['p90_ms']}ms -> {current['p90_ms']}ms")
+        # Baselines saved before warm figures were recorded only have the cold ones
+        if 'warm_queries' in previous:
+            if current['warm_queries'] > previous['warm_queries']:
+                regressions.append(f"{name}: warm queries {previous['warm_queries']} -> {current['warm_queries']}")
+            if current['warm_p90_ms'] > previous['warm_p90_ms'] * factor:
+                regressions.append(f"{name}: warm p90 {previous['warm_p90_ms']}ms -> {current['warm_p90_ms']}ms")
+        if current['peak_kb'] > previous['peak_kb'] * factor:
+            regressions.append(f"{name}: peak memory {previous['peak_kb']}KB -> {current['peak_kb']}KB")
+
+    return regressions
+
+
+def load_report(path):
+    with open(path) as handle:
+        return json.load(handle)
+
+
+def save_report(report, path):
+    with open(path, 'w') as handle:
+        json.dump(report, handle, indent=2)
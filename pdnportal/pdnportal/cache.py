@@ -0,0 +1,259 @@
+"""
+Versioned cache for dashboard aggregates.
+
+Every tracked model has a version counter in the cache that is bumped on
+post_save/post_delete, and once more when the transaction commits (requests
+run in one, ATOMIC_REQUESTS), so nothing read before the commit stays
+cached under the new version. Cached responses are keyed by module, scope, the
+request path and the current versions of the models they read, so a write
+to any of those models makes the old entries unreachable. The timeout is
+only a backstop for writes that bypass signals (queryset.update, raw SQL).
+
+The counters are only seen by other worker processes when the cache is
+shared between them, which is why CACHES defaults to the file based cache.
+An evicted counter is seeded again from the clock, so eviction only ever
+invalidates entries.
+
+The same counters drive conditional_etag(), which lets polled endpoints
+answer 304 Not Modified without running the view. Views serving a
+shared_snapshot() use content_etag() instead, see there.
+"""
+import hashlib
+import threading
+import time
+import weakref
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models.signals import post_save, post_delete
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils import timezone
+
+DEFAULT_TIMEOUT = getattr(settings, 'AGGREGATE_CACHE_TIMEOUT', 300)
+
+
+def version_key(label):
+    return f'version:{label.lower()}'
+
+
+def model_label(model):
+    return model if isinstance(model, str) else model._meta.label_lower
+
+
+def new_version():
+    # Seed counters from the clock so an evicted counter never reuses an old version
+    return int(time.time() * 1000)
+
+
+def get_versions(models):
+    """Return the current version of each model, creating missing counters."""
+    keys = [version_key(model_label(model)) for model in models]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, new_version(), timeout=None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def _bump(label):
+    key = version_key(label)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, new_version(), timeout=None)
+
+
+class PendingBumps:
+    """The models changed in one transaction, bumped again when it commits."""
+
+    def __init__(self):
+        self.labels = set()
+        self.done = False
+
+    def __call__(self):
+        self.done = True
+        for label in self.labels:
+            _bump(label)
+
+
+# Pending bumps of this thread by savepoint ids, held weakly like the activity batches in overtime/activity.py:
+# the transaction's on_commit list keeps them alive until they have run or were rolled back.
+_pending = threading.local()
+
+
+def pending_bumps():
+    if not hasattr(_pending, 'bumps'):
+        _pending.bumps = weakref.WeakValueDictionary()
+    key = tuple(connection.savepoint_ids)
+    bumps = _pending.bumps.get(key)
+    if bumps is None or bumps.done:
+        bumps = PendingBumps()
+        transaction.on_commit(bumps)
+        _pending.bumps[key] = bumps
+    return bumps
+
+
+def bump_model_version(model):
+    """
+    Invalidate the cached entries of `model`, now and again once the current
+    transaction commits. A request polling in between still reads the old
+    rows, whatever it caches under the first bump is dropped by the second.
+    """
+    label = model_label(model)
+    _bump(label)
+    if connection.in_atomic_block:
+        pending_bumps().labels.add(label)
+
+
+def _bump_on_change(sender, **kwargs):
+    bump_model_version(sender)
+
+
+def track_model_versions(*models):
+    """Bump the version counter of each model whenever one of its rows is saved or deleted."""
+    for model in models:
+        uid = f'aggregate-cache:{model._meta.label_lower}'
+        post_save.connect(_bump_on_change, sender=model, dispatch_uid=uid)
+        post_delete.connect(_bump_on_change, sender=model, dispatch_uid=uid)
+
+
+def scope_value(request, scope):
+    if callable(scope):
+        return scope(request)
+    if scope == 'global':
+        return 'all'
+    return f'user-{request.user.pk}'
+
+
+def cached_aggregate(module, models, scope='user', timeout=None):
+    """
+    Cache a JSON view's response until one of `models` changes.
+
+    Args:
+        module: Key prefix, normally the app name.
+        models: Model labels ('app.model') the view reads from.
+        scope: 'user' for per-user results, 'global' for results shared by
+            everyone, or a callable taking the request and returning a string.
+        timeout: Backstop expiry in seconds, defaults to AGGREGATE_CACHE_TIMEOUT.
+
+    Only successful responses are cached.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if request.method != 'GET':
+                return view_func(request, *args, **kwargs)
+
+            path = hashlib.md5(request.get_full_path().encode()).hexdigest()
+            versions = '.'.join(str(version) for version in get_versions(models))
+            key = f'agg:{module}:{scope_value(request, scope)}:{path}:{versions}'
+
+            cached = cache.get(key)
+            if cached is not None:
+                content, content_type = cached
+                return HttpResponse(content, content_type=content_type)
+
+            response = view_func(request, *args, **kwargs)
+            if response.status_code == 200 and not response.streaming:
+                cache.set(key, (response.content, response['Content-Type']),
+                          DEFAULT_TIMEOUT if timeout is None else timeout)
+            return response
+        return wrapper
+    return decorator
+
+
+def conditional_etag(models, scope='user', vary=None, ajax_only=False):
+    """
+    Answer If-None-Match with 304 while none of `models` has changed.
+
+    The ETag is derived from the request path, the scope, the model version
+    counters and the current hour (or `vary(request)` if given) so results that
+    depend on the clock still refresh. The view body only runs when the client's
+    copy is stale. A tag handed out while a write was still uncommitted is
+    given up by the second bump on commit, see bump_model_version().
+
+    Args:
+        models: Model labels ('app.model') the view reads from.
+        scope: 'user', 'global' or a callable taking the request, as in cached_aggregate.
+        vary: Optional callable taking the request and returning extra ETag input.
+        ajax_only: Only apply to XMLHttpRequest calls, for views that also render pages.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if request.method != 'GET':
+                return view_func(request, *args, **kwargs)
+            if ajax_only and request.headers.get('X-Requested-With') != 'XMLHttpRequest':
+                return view_func(request, *args, **kwargs)
+
+            clock = vary(request) if vary else timezone.localtime().strftime('%Y%m%d%H')
+            versions = '.'.join(str(version) for version in get_versions(models))
+            source = f'{request.get_full_path()}|{scope_value(request, scope)}|{versions}|{clock}'
+            etag = f'"{hashlib.md5(source.encode()).hexdigest()}"'
+
+            if etag in request.headers.get('If-None-Match', ''):
+                response = HttpResponseNotModified()
+            else:
+                response = view_func(request, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+
+            response['ETag'] = etag
+            response['Cache-Control'] = 'private, no-cache'
+            return response
+        return wrapper
+    return decorator
+
+
+def content_etag(view_func):
+    """
+    Answer If-None-Match with 304 while the response body is unchanged.
+
+    For views serving a shared_snapshot(): the snapshot can lag the model
+    version counters by its refresh interval, so an ETag built from the
+    counters would pin clients to an old body. Hashing the body itself keeps
+    the ETag and the content in step; the view still runs, but reading the
+    snapshot is cheap.
+    """
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        response = view_func(request, *args, **kwargs)
+        if request.method != 'GET' or response.status_code != 200 or response.streaming:
+            return response
+
+        etag = f'"{hashlib.md5(response.content).hexdigest()}"'
+        if etag in request.headers.get('If-None-Match', ''):
+            response = HttpResponseNotModified()
+        response['ETag'] = etag
+        response['Cache-Control'] = 'private, no-cache'
+        return response
+    return wrapper
+
+
+def shared_snapshot(name, compute, refresh_every=60):
+    """
+    Return a snapshot computed at most once per `refresh_every` seconds for everyone.
+
+    When the snapshot is stale only one caller recomputes it, the others keep
+    getting the previous snapshot until the new one is stored.
+    """
+    key = f'snapshot:{name}'
+    snapshot = cache.get(key)
+    now = time.time()
+
+    if snapshot is not None and now - snapshot['computed_at'] < refresh_every:
+        return snapshot['data']
+
+    if snapshot is not None and not cache.add(f'{key}:refreshing', 1, timeout=max(refresh_every, 30)):
+        return snapshot['data']
+
+    try:
+        data = compute()
+        # Kept well past the refresh interval so stale readers always have something to serve
+        cache.set(key, {'data': data, 'computed_at': now}, timeout=refresh_every * 10)
+    finally:
+        cache.delete(f'{key}:refreshing')
+    return data
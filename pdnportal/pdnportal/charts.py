@@ -0,0 +1,65 @@
+"""
+Date bucketed counts for dashboard charts.
+
+Charts count rows per local (TIME_ZONE) day or month with one grouped query:
+the date column is truncated in the database and each series is a
+conditional Count(), so a chart costs one statement however many buckets
+and series it shows. Buckets without rows are zero-filled in Python.
+"""
+from datetime import date
+
+from django.db.models import Count, DateField
+from django.db.models.functions import TruncDay, TruncMonth
+from django.utils import timezone
+
+
+def local_midnight(day):
+    return timezone.make_aware(timezone.datetime.combine(day, timezone.datetime.min.time()))
+
+
+def month_starts(last_day, count):
+    """The first day of each of the `count` months ending with the month of `last_day`, oldest first."""
+    year, month = last_day.year, last_day.month
+    months = []
+    for _ in range(count):
+        months.append(date(year, month, 1))
+        year, month = (year - 1, 12) if month == 1 else (year, month - 1)
+    return months[::-1]
+
+
+def bucket_counts(queryset, kind, buckets, series, bucket_of=None):
+    """
+    Count rows per local day or month in one grouped query, zero-filled over `buckets`.
+
+    Args:
+        queryset: Rows to count.
+        kind: 'day' or 'month'.
+        buckets: Dates of the days or first days of the months to report, in order.
+            Rows falling outside them are ignored.
+        series: {name: (datetime field, Q or None)}. Each series counts the rows
+            matching its Q in the bucket of its own field, series on different
+            fields are grouped in the same query.
+        bucket_of: Optional function mapping a truncated day or month to its
+            bucket, e.g. to the first day of the week it falls in.
+
+    Returns:
+        {name: [count per bucket]}
+    """
+    trunc = TruncDay if kind == 'day' else TruncMonth
+    aliases = {field: f"{field.replace('__', '_')}_bucket" for field, _ in series.values()}
+
+    rows = queryset.annotate(**{
+        alias: trunc(field, output_field=DateField()) for field, alias in aliases.items()
+    }).values(*aliases.values()).annotate(**{
+        f'{name}_count': Count('pk', filter=condition) for name, (field, condition) in series.items()
+    }).order_by()
+
+    index = {bucket: position for position, bucket in enumerate(buckets)}
+    counts = {name: [0] * len(buckets) for name in series}
+    for row in rows:
+        for name, (field, condition) in series.items():
+            bucket = row[aliases[field]]
+            position = index.get(bucket_of(bucket) if bucket_of and bucket else bucket)
+            if position is not None:
+                counts[name][position] += row[f'{name}_count']
+    return counts
@@ -0,0 +1,324 @@
+"""
+In-process load simulator for the ASGI application.
+
+Drives `pdnportal.asgi.application` directly through asgiref's
+ApplicationCommunicator, so no server or external tool is needed. Each actor type
+models one kind of shop-floor traffic against the seeded dataset:
+
+- terminal:   line terminals posting output on `line_dashboard`
+- dashboard:  supervisors polling `group_dashboard_data`
+- chat:       users with an open chat socket who also poll the chat list
+- approver:   approvers refreshing their job order stats and charts
+"""
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import random
+import secrets
+import string
+import time
+import warnings
+from urllib.parse import urlencode
+
+from asgiref.testing import ApplicationCommunicator
+from django.conf import settings
+from django.test import Client
+from django.urls import reverse
+
+from pdnportal.benchmark import percentile
+
+PROFILES = {
+    # actors per type and seconds between actions per type
+    'smoke': {'terminal': 2, 'dashboard': 1, 'chat': 2, 'approver': 1},
+    'shift': {'terminal': 12, 'dashboard': 4, 'chat': 20, 'approver': 4},
+    'peak': {'terminal': 36, 'dashboard': 10, 'chat': 60, 'approver': 8},
+}
+
+INTERVALS = {'terminal': 5.0, 'dashboard': 5.0, 'chat': 1.0, 'approver': 10.0}
+
+LOCK_MARKERS = (b'database is locked', b'database table is locked')
+
+
+class SimulationError(Exception):
+    pass
+
+
+class Recorder:
+    def __init__(self):
+        self.samples = {}
+        self.errors = {}
+        self.lock_errors = {}
+
+    def record(self, kind, latency_ms, ok=True, locked=False):
+        self.samples.setdefault(kind, []).append(latency_ms)
+        if not ok:
+            self.errors[kind] = self.errors.get(kind, 0) + 1
+        if locked:
+            self.lock_errors[kind] = self.lock_errors.get(kind, 0) + 1
+
+    def summary(self, elapsed):
+        result = {}
+        for kind, samples in sorted(self.samples.items()):
+            result[kind] = {
+                'requests': len(samples),
+                'throughput_rps': round(len(samples) / elapsed, 2) if elapsed else 0,
+                'p50_ms': round(percentile(samples, 50), 2),
+                'p95_ms': round(percentile(samples, 95), 2),
+                'p99_ms': round(percentile(samples, 99), 2),
+                'max_ms': round(max(samples), 2),
+                'errors': self.errors.get(kind, 0),
+                'lock_errors': self.lock_errors.get(kind, 0),
+            }
+        return result
+
+
+def session_headers(user):
+    """Log the user in through the test client and reuse its session for ASGI requests."""
+    client = Client()
+    client.force_login(user)
+    csrf_token = ''.join(secrets.choice(string.ascii_letters + string.digits) for _ in range(32))
+    cookie = f'{settings.SESSION_COOKIE_NAME}={client.cookies[settings.SESSION_COOKIE_NAME].value}; ' \
+             f'{settings.CSRF_COOKIE_NAME}={csrf_token}'
+    return [
+        (b'host', b'localhost'),
+        (b'cookie', cookie.encode()),
+        (b'x-csrftoken', csrf_token.encode()),
+    ]
+
+
+def build_actors(counts):
+    """Pick seeded users and the ids each actor needs, round-robin over what was seeded."""
+    from portalusers.models import Users
+    from monitoring.models import Monitoring, SupervisorToMonitor
+    from chat.models import ChatMember
+
+    def seeded(role):
+        return list(Users.objects.filter(username__startswith=f'seed_{role}_').order_by('id'))
+
+    terminals, approvers, requestors = seeded('terminal'), seeded('approver'), seeded('requestor')
+    if not terminals or not approvers or not requestors:
+        raise SimulationError('No seeded data found, run `manage.py seed_load` first.')
+
+    groups = {}
+    for supervisor in approvers:
+        group = Monitoring.objects.filter(created_by=supervisor).first() or Monitoring.objects.filter(
+            id__in=SupervisorToMonitor.objects.filter(supervisor=supervisor).values('monitoring_id')).first()
+        if group:
+            groups[supervisor.id] = group.id
+    supervisors = [user for user in approvers if user.id in groups]
+
+    chat_users = list(ChatMember.objects.filter(user__username__startswith='seed_')
+                      .select_related('user').order_by('id'))
+
+    actors = []
+    for index in range(counts.get('terminal', 0)):
+        user = terminals[index % len(terminals)]
+        actors.append({'kind': 'terminal', 'headers': session_headers(user)})
+    for index in range(counts.get('dashboard', 0)):
+        user = supervisors[index % len(supervisors)]
+        actors.append({'kind': 'dashboard', 'headers': session_headers(user), 'group_id': groups[user.id]})
+    for index in range(counts.get('chat', 0)):
+        member = chat_users[index % len(chat_users)]
+        actors.append({'kind': 'chat', 'headers': session_headers(member.user), 'chat_id': member.chat_id})
+    for index in range(counts.get('approver', 0)):
+        user = approvers[index % len(approvers)]
+        actors.append({'kind': 'approver', 'headers': session_headers(user)})
+    return actors
+
+
+async def asgi_http(application, method, path, headers, body=b'', timeout=60):
+    path, _, query = path.partition('?')
+    communicator = ApplicationCommunicator(application, {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': method,
+        'scheme': 'http',
+        'path': path,
+        'raw_path': path.encode(),
+        'query_string': query.encode(),
+        'headers': headers,
+        'server': ('localhost', 80),
+        'client': ('127.0.0.1', 0),
+    })
+    await communicator.send_input({'type': 'http.request', 'body': body, 'more_body': False})
+    start = await communicator.receive_output(timeout)
+    content = b''
+    while True:
+        message = await communicator.receive_output(timeout)
+        content += message.get('body', b'')
+        if not message.get('more_body'):
+            break
+    await communicator.wait(timeout)
+    return start['status'], content
+
+
+async def http(application, recorder, kind, method, path, headers, body=b''):
+    if method == 'POST':
+        headers = headers + [(b'content-type', b'application/x-www-form-urlencoded')]
+    started = time.perf_counter()
+    try:
+        status, content = await asgi_http(application, method, path, headers, body)
+    except Exception:
+        recorder.record(kind, (time.perf_counter() - started) * 1000, ok=False)
+        return None
+    latency = (time.perf_counter() - started) * 1000
+    locked = status >= 500 and any(marker in content for marker in LOCK_MARKERS)
+    recorder.record(kind, latency, ok=status < 400, locked=locked)
+    return status
+
+
+class Socket:
+    """Minimal websocket client speaking ASGI to the application."""
+
+    def __init__(self, application, path, headers):
+        self.communicator = ApplicationCommunicator(application, {
+            'type': 'websocket',
+            'asgi': {'version': '3.0'},
+            'scheme': 'ws',
+            'path': path,
+            'raw_path': path.encode(),
+            'query_string': b'',
+            'headers': headers,
+            'subprotocols': [],
+            'server': ('localhost', 80),
+            'client': ('127.0.0.1', 0),
+        })
+
+    async def connect(self, timeout=30):
+        await self.communicator.send_input({'type': 'websocket.connect'})
+        response = await self.communicator.receive_output(timeout)
+        return response['type'] == 'websocket.accept'
+
+    async def send_json(self, data):
+        await self.communicator.send_input({'type': 'websocket.receive', 'text': json.dumps(data)})
+
+    async def receive_json(self, timeout=30):
+        response = await self.communicator.receive_output(timeout)
+        return json.loads(response['text'])
+
+    async def disconnect(self, timeout=5):
+        await self.communicator.send_input({'type': 'websocket.disconnect', 'code': 1000})
+        try:
+            await self.communicator.wait(timeout)
+        except Exception:
+            pass
+
+
+async def terminal(application, recorder, actor, deadline, interval, rng):
+    path = reverse('line_dashboard')
+    while time.monotonic() < deadline:
+        body = urlencode({'operator': 'Load Simulator', 'quantity': rng.randint(5, 40)}).encode()
+        await http(application, recorder, 'terminal', 'POST', path, actor['headers'], body)
+        await asyncio.sleep(interval * rng.uniform(0.8, 1.2))
+
+
+async def dashboard(application, recorder, actor, deadline, interval, rng):
+    path = reverse('group_dashboard_data', kwargs={'group_id': actor['group_id']}) + '?dateFilter=today'
+    while time.monotonic() < deadline:
+        await http(application, recorder, 'dashboard', 'GET', path, actor['headers'])
+        await asyncio.sleep(interval * rng.uniform(0.8, 1.2))
+
+
+async def approver(application, recorder, actor, deadline, interval, rng):
+    paths = [
+        reverse('job-order-stats-api'),
+        reverse('job_order_chart_data', kwargs={'period': '6month'}),
+        reverse('job-order-alerts-api'),
+    ]
+    while time.monotonic() < deadline:
+        for path in paths:
+            await http(application, recorder, 'approver', 'GET', path, actor['headers'])
+        await asyncio.sleep(interval * rng.uniform(0.8, 1.2))
+
+
+async def chat(application, recorder, actor, deadline, interval, rng):
+    socket = Socket(application, f"/ws/chat/{actor['chat_id']}/", actor['headers'])
+    started = time.perf_counter()
+    try:
+        connected = await socket.connect()
+    except Exception:
+        connected = False
+    recorder.record('chat.connect', (time.perf_counter() - started) * 1000, ok=connected)
+    if not connected:
+        return
+
+    poll_path = reverse('get_chats')
+    tick = 0
+    try:
+        while time.monotonic() < deadline:
+            await http(application, recorder, 'chat.poll', 'GET', poll_path, actor['headers'])
+
+            # Every tenth tick the user also sends a message and waits for the broadcast back
+            if tick % 10 == 0:
+                started = time.perf_counter()
+                await socket.send_json({'type': 'chat_message', 'chat_id': actor['chat_id'],
+                                   'content': 'Load simulator message'})
+                ok = False
+                try:
+                    while True:
+                        event = await socket.receive_json()
+                        if event.get('type') == 'chat_message':
+                            ok = True
+                            break
+                except Exception:
+                    pass
+                recorder.record('chat.message', (time.perf_counter() - started) * 1000, ok=ok)
+            tick += 1
+            await asyncio.sleep(interval * rng.uniform(0.8, 1.2))
+    finally:
+        await socket.disconnect()
+
+
+ACTORS = {'terminal': terminal, 'dashboard': dashboard, 'chat': chat, 'approver': approver}
+
+
+async def simulate(application, actors, duration, intervals, seed):
+    recorder = Recorder()
+    deadline = time.monotonic() + duration
+    tasks = []
+    for index, actor in enumerate(actors):
+        rng = random.Random(seed + index)
+        handler = ACTORS[actor['kind']]
+        tasks.append(handler(application, recorder, actor, deadline, intervals[actor['kind']], rng))
+
+    started = time.monotonic()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return recorder, time.monotonic() - started
+
+
+def run_simulation(profile='smoke', duration=30, counts=None, intervals=None, seed=2024):
+    if profile not in PROFILES:
+        raise SimulationError(f"Unknown profile '{profile}', choose from {', '.join(PROFILES)}")
+
+    actor_counts = dict(PROFILES[profile], **(counts or {}))
+    actor_intervals = dict(INTERVALS, **(intervals or {}))
+    actors = build_actors(actor_counts)
+
+    from pdnportal.asgi import application
+
+    # Keep view debug output and per-request error logs out of the report
+    request_logger = logging.getLogger('django.request')
+    request_logger_disabled = request_logger.disabled
+    request_logger.disabled = True
+    try:
+        with contextlib.redirect_stdout(io.StringIO()), warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            recorder, elapsed = asyncio.run(simulate(application, actors, duration, actor_intervals, seed))
+    finally:
+        request_logger.disabled = request_logger_disabled
+
+    summary = recorder.summary(elapsed)
+    total = sum(item['requests'] for item in summary.values())
+    return {
+        'profile': profile,
+        'duration_s': round(elapsed, 2),
+        'actors': actor_counts,
+        'intervals_s': actor_intervals,
+        'total_requests': total,
+        'throughput_rps': round(total / elapsed, 2) if elapsed else 0,
+        'lock_errors': sum(item['lock_errors'] for item in summary.values()),
+        'results': summary,
+    }
@@ -0,0 +1,104 @@
+"""
+Keyset (seek) pagination.
+
+A page is read with `WHERE (a, b) < (last a, last b) ORDER BY a DESC, b DESC
+LIMIT n` instead of an OFFSET, so the database seeks straight to the page
+through an index on the ordering columns. Deep pages cost the same as the
+first one, and rows inserted in the meantime do not shift later pages.
+
+The cursor handed to the client is the ordering values of the last row of a
+page, encoded for use in a query string. The ordering must end with a unique
+column (normally the primary key) so every row has a distinct position.
+"""
+import base64
+import binascii
+import datetime
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
+
+class KeysetPage:
+    def __init__(self, items, next_cursor):
+        self.items = items
+        self.next_cursor = next_cursor
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+
+def _plain(value):
+    # Full precision isoformat, a rounded timestamp would skip or repeat rows at the page boundary
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    return value
+
+
+def encode_cursor(values):
+    data = json.dumps([_plain(value) for value in values], separators=(',', ':'))
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip('=')
+
+
+def decode_cursor(model, ordering, cursor):
+    """Ordering values from a cursor, converted to the fields' Python types; None if the cursor is invalid."""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(ordering):
+            return None
+        return [
+            model._meta.get_field(field.lstrip('-')).to_python(value)
+            for field, value in zip(ordering, values)
+        ]
+    except (ValueError, TypeError, binascii.Error, ValidationError):
+        return None
+
+
+def keyset_filter(ordering, values):
+    """The rows after the position `values` in `ordering`, e.g. a < x OR (a = x AND b < y)."""
+    condition = Q()
+    for index, field in enumerate(ordering):
+        name = field.lstrip('-')
+        lookup = 'lt' if field.startswith('-') else 'gt'
+        clause = Q(**{f'{name}__{lookup}': values[index]})
+        for previous, value in zip(ordering[:index], values[:index]):
+            clause &= Q(**{previous.lstrip('-'): value})
+        condition |= clause
+    return condition
+
+
+def keyset_page(queryset, ordering, cursor=None, page_size=20):
+    """
+    Return the page of `queryset` that starts after `cursor`.
+
+    Args:
+        queryset: Model instances or values() rows; ordering fields must be
+            concrete fields of the queryset's model and present on each row.
+        ordering: Field names, prefixed with '-' for descending order.
+        cursor: The next_cursor of the previous page, None for the first page.
+        page_size: Rows per page.
+    """
+    values = decode_cursor(queryset.model, ordering, cursor)
+    if values is not None:
+        queryset = queryset.filter(keyset_filter(ordering, values))
+
+    rows = list(queryset.order_by(*ordering)[:page_size + 1])
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1]
+        next_cursor = encode_cursor([
+            last[field.lstrip('-')] if isinstance(last, dict) else getattr(last, field.lstrip('-'))
+            for field in ordering
+        ])
+    return KeysetPage(rows, next_cursor)
@@ -101,6 +101,59 @@ DATABASES = {
 # Database routers
 DATABASE_ROUTERS = ['pdnportal.db_router.RetryingRouter']
 
+# Cache used for dashboard aggregates, see pdnportal/cache.py. It holds the model version counters that
+# invalidate cached aggregates, so it must be shared by every worker process: a per-process cache such as
+# LocMemCache would let the other workers serve old numbers until AGGREGATE_CACHE_TIMEOUT. Keep LOCATION
+# outside STATICFILES_DIRS and MEDIA_ROOT.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / 'cache',
+        'OPTIONS': {
+            'MAX_ENTRIES': 5000,
+        },
+    }
+}
+
+# Backstop expiry (seconds) for cached aggregates, entries are normally invalidated by model version counters
+AGGREGATE_CACHE_TIMEOUT = 300
+
+# How often the shared job order dashboard stats snapshot is recomputed (seconds)
+JO_STATS_SNAPSHOT_SECONDS = 60
+
+# Hours a job order may sit on each routing step before it is due, keyed by approver_sequence.
+# The maintenance step (6) is due on the job order's own target date instead.
+JO_STEP_SLA_HOURS = {
+    1: 24, 2: 24, 3: 24, 4: 24,  # approvers
+    5: 48,                       # facilitator assignment
+    7: 24,                       # checking
+    8: 72,                       # closing by the preparer
+}
+
+# Closed and Cancelled job orders created more than this many days ago are moved to the archive tables
+# by `manage.py archive_job_orders`. Keep it above the longest dashboard window (12 months).
+JO_ARCHIVE_AFTER_DAYS = 400
+
+# Background jobs, see settings/background.py. Worker threads started with the ASGI app (0 disables them,
+# jobs then wait for `manage.py run_jobs`), how often idle workers look for queued jobs and after how many
+# seconds without a progress report a running job is considered abandoned.
+JOB_WORKERS = 2
+JOB_POLL_SECONDS = 5
+JOB_STALE_SECONDS = 15 * 60
+
+# Uploads and results of background jobs. Keep this outside STATICFILES_DIRS and MEDIA_ROOT, results are only
+# downloaded through the job_download view. Files of jobs finished more than JOB_FILE_RETENTION_DAYS ago are
+# deleted by `manage.py prune_jobs` and whenever the job workers start.
+JOB_FILES_ROOT = BASE_DIR / 'jobfiles'
+JOB_FILE_RETENTION_DAYS = 7
+
+# Overtime system activity, see overtime/activity.py. Committed batches go to a writer thread when async is on,
+# which inserts what has queued up every SYSTEM_ACTIVITY_FLUSH_SECONDS. `manage.py prune_system_activity`
+# rolls activity older than the retention period up into one row per user, type and month.
+SYSTEM_ACTIVITY_ASYNC = False
+SYSTEM_ACTIVITY_FLUSH_SECONDS = 2
+SYSTEM_ACTIVITY_RETENTION_DAYS = 365
+
 
 
 # Password validation
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class PortalusersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'portalusers'
+
+    def ready(self):
+        from pdnportal.cache import track_model_versions
+        from .models import UserApprovers
+
+        track_model_versions(UserApprovers)
@@ -0,0 +1,67 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from pdnportal.benchmark import BenchmarkError, run_benchmark, compare, failures, load_report, save_report
+
+DEFAULT_BASELINE = os.path.join(settings.BASE_DIR, 'benchmarks', 'baseline.json')
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the dashboard and chart JSON endpoints against the seeded dataset'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20,
+                            help='Measured cold (cache cleared) and warm request pairs per endpoint')
+        parser.add_argument('--warmup', type=int, default=2, help='Unmeasured requests per endpoint')
+        parser.add_argument('--only', nargs='*', help='Only run endpoints whose name contains one of these')
+        parser.add_argument('--output', help='Write the JSON report to this file')
+        parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='Baseline report to compare against')
+        parser.add_argument('--save-baseline', action='store_true', help='Store this run as the new baseline')
+        parser.add_argument('--tolerance', type=float, default=25.0,
+                            help='Allowed latency/memory growth over the baseline in percent (default 25)')
+
+    def handle(self, *args, **options):
+        try:
+            report = run_benchmark(options['iterations'], options['warmup'], options['only'])
+        except BenchmarkError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(f"{'endpoint':<40} {'status':<10} {'p50':>9} {'p90':>9} {'p99':>9} {'queries':>8} "
+                          f"{'warm p90':>9} {'warm q':>7} {'peak KB':>9}")
+        for name, result in report['endpoints'].items():
+            status = ','.join(str(code) for code in result['status'])
+            self.stdout.write(
+                f"{name:<40} {status:<10} {result['p50_ms']:>9} {result['p90_ms']:>9} "
+                f"{result['p99_ms']:>9} {result['queries']:>8} {result['warm_p90_ms']:>9} "
+                f"{result['warm_queries']:>7} {result['peak_kb']:>9}")
+
+        if options['output']:
+            save_report(report, options['output'])
+            self.stdout.write(f"Report written to {options['output']}")
+
+        failed = failures(report)
+        if failed:
+            for failure in failed:
+                self.stdout.write(self.style.ERROR(failure))
+            raise CommandError(f'{len(failed)} endpoint(s) did not answer 2xx, fix the seeded roles before benchmarking')
+
+        baseline_path = options['baseline']
+        if options['save_baseline']:
+            os.makedirs(os.path.dirname(baseline_path), exist_ok=True)
+            save_report(report, baseline_path)
+            self.stdout.write(self.style.SUCCESS(f'Baseline saved to {baseline_path}'))
+            return
+
+        if not os.path.exists(baseline_path):
+            self.stdout.write(self.style.WARNING('No baseline found, run with --save-baseline to store one.'))
+            return
+
+        regressions = compare(report, load_report(baseline_path), options['tolerance'])
+        if regressions:
+            for regression in regressions:
+                self.stdout.write(self.style.ERROR(regression))
+            raise CommandError(f'{len(regressions)} regression(s) against {baseline_path}')
+
+        self.stdout.write(self.style.SUCCESS('No regressions against baseline'))
@@ -0,0 +1,488 @@
+import random
+from contextlib import contextmanager
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from portalusers.models import Users, UserApprovers
+from settings.models import Line
+from monitoring.models import (Monitoring, SupervisorToMonitor, LineToMonitor, Product,
+                               ProductionSchedulePlan, ProductionOutput, OutputLog)
+from joborder.models import JOLogsheet, JORouting
+from joborder.utils import backfill_current_step
+from overtime.models import Employee, EmployeeGroup, OTFiling, ShiftingOT, DailyOT, EmployeeOTStatus
+from overtime.utils import refresh_roster, refresh_status_counts
+from chat.models import Chat, ChatMember, Message
+from dcf.models import DCF, DCFApprovalTimeline
+from ecis.models import ECIS
+from manhours.models import Machine, ManhoursLogsheet
+
+SEED_PREFIX = 'seed'
+SEED_PASSWORD = 'seedload123'
+
+FIRST_NAMES = ['Juan', 'Maria', 'Jose', 'Ana', 'Mark', 'Grace', 'John', 'Joy', 'Paolo', 'Liza',
+               'Carlo', 'Rica', 'Miguel', 'Andrea', 'Rafael', 'Kristine', 'Noel', 'Janine']
+LAST_NAMES = ['Dela Cruz', 'Santos', 'Reyes', 'Garcia', 'Mendoza', 'Bautista', 'Villanueva',
+              'Ramos', 'Castillo', 'Aquino', 'Navarro', 'Flores', 'Torres', 'Gonzales']
+JO_COLORS = ['Green', 'Yellow', 'White', 'Orange']
+JO_NATURES = ['repair', 'fabrication', 'modification', 'countermeasure-cri', 'countermeasure-ecc', 'safety']
+JO_TOOLS = ['Jig', 'Fixture', 'Machine', 'Gauge', 'Others']
+SHUTTLES = ['Route A', 'Route B', 'Route C', 'Route D', None]
+
+
+@contextmanager
+def keep_timestamps(*fields):
+    """Let bulk_create keep explicit values on auto_now_add fields so data can be backdated."""
+    for field in fields:
+        field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field in fields:
+            field.auto_now_add = True
+
+
+def model_field(model, name):
+    return model._meta.get_field(name)
+
+
+class Command(BaseCommand):
+    help = 'Generate a reproducible synthetic dataset for load testing every module'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', type=int, default=1,
+                            help='Multiplier applied to every base volume (default 1)')
+        parser.add_argument('--months', type=int, default=6,
+                            help='How many months of history to generate (default 6)')
+        parser.add_argument('--seed', type=int, default=2024,
+                            help='Random seed, the same seed always produces the same dataset')
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Rows per bulk insert (default 1000)')
+        parser.add_argument('--flush', action='store_true',
+                            help='Delete previously seeded data before generating')
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options['seed'])
+        self.scale = max(options['scale'], 1)
+        self.months = max(options['months'], 1)
+        self.batch_size = options['batch_size']
+        self.today = timezone.localdate()
+        self.start_date = self.today - timedelta(days=30 * self.months)
+
+        if options['flush']:
+            self.flush()
+
+        if Users.objects.filter(username__startswith=f'{SEED_PREFIX}_').exists():
+            self.stdout.write(self.style.WARNING(
+                'Seeded data already exists, run again with --flush to regenerate it.'))
+            return
+
+        with transaction.atomic():
+            self.seed_users()
+            self.seed_monitoring()
+            self.seed_job_orders()
+            self.seed_overtime()
+            self.seed_chat()
+            self.seed_dcf()
+            self.seed_ecis()
+            self.seed_manhours()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Seeded dataset (scale={self.scale}, months={self.months}, seed={options["seed"]})'))
+
+    # Helpers
+    def aware(self, day, hour=0, minute=0):
+        return timezone.make_aware(datetime.combine(day, time(hour, minute)))
+
+    def random_day(self):
+        return self.start_date + timedelta(days=self.rng.randint(0, (self.today - self.start_date).days))
+
+    def random_datetime(self):
+        return self.aware(self.random_day(), self.rng.randint(6, 20), self.rng.randint(0, 59))
+
+    def random_name(self):
+        return f'{self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)}'
+
+    def bulk(self, model, objs):
+        created = model.objects.bulk_create(objs, batch_size=self.batch_size)
+        self.stdout.write(f'  {model.__name__}: {len(created)}')
+        return created
+
+    def flush(self):
+        seed_users = Users.objects.filter(username__startswith=f'{SEED_PREFIX}_')
+        JOLogsheet.objects.filter(prepared_by__in=seed_users).delete()
+        OTFiling.objects.filter(requestor__in=seed_users).delete()
+        Chat.objects.filter(chatmember__user__in=seed_users).distinct().delete()
+        Employee.objects.filter(id_number__startswith='SEED').delete()
+        Machine.objects.filter(location='SEED').delete()
+        seed_users.delete()
+        Line.objects.filter(line_name__startswith='SEED ').delete()
+        self.stdout.write('Removed previously seeded data')
+
+    # Users
+    def seed_users(self):
+        self.stdout.write('Seeding users...')
+        self.lines = self.bulk(Line, [Line(line_name=f'SEED Line {i + 1:02}') for i in range(8 * self.scale)])
+
+        password = make_password(SEED_PASSWORD)
+        roles = [
+            ('requestor', 20, 'Staff', {'job_order_user': True, 'job_order_requestor': True, 'dcf_user': True,
+                                       'dcf_requestor': True, 'ecis_user': True, 'ecis_requestor': True,
+                                       'overtime_user': True, 'overtime_requestor': True, 'manhours_user': True,
+                                       'manhours_staff': True}),
+            ('approver', 4, 'Supervisor', {'job_order_user': True, 'job_order_approver': True, 'dcf_user': True,
+                                          'dcf_approver': True, 'overtime_user': True, 'overtime_supervisor': True,
+                                          'manhours_user': True, 'manhours_supervisor': True,
+                                          'monitoring_user': True, 'monitoring_supervisor': True}),
+            ('checker', 2, 'Supervisor', {'job_order_user': True, 'job_order_checker': True}),
+            ('maintenance', 6, 'Staff', {'job_order_user': True, 'job_order_maintenance': True}),
+            ('facilitator', 1, 'Staff', {'job_order_user': True, 'job_order_facilitator': True,
+                                        'ecis_user': True, 'ecis_facilitator': True,
+                                        'overtime_user': True, 'overtime_facilitator': True,
+                                        'overtime_importer': True}),
+            ('manager', 1, 'Manager', {'monitoring_user': True, 'monitoring_manager': True}),
+            ('terminal', 8, 'Staff', {'monitoring_user': True, 'monitoring_staff': True}),
+        ]
+
+        users = []
+        counter = 0
+        for role, count, position, flags in roles:
+            for i in range(count * self.scale):
+                counter += 1
+                users.append(Users(
+                    username=f'{SEED_PREFIX}_{role}_{i + 1:04}',
+                    password=password,
+                    name=self.random_name(),
+                    id_number=f'S{counter:06}',
+                    position=position,
+                    line=self.lines[i % len(self.lines)] if role == 'terminal' else self.rng.choice(self.lines),
+                    **flags
+                ))
+        self.bulk(Users, users)
+
+        seeded = Users.objects.filter(username__startswith=f'{SEED_PREFIX}_').order_by('id')
+        self.users = {}
+        for user in seeded:
+            self.users.setdefault(user.username.split('_')[1], []).append(user)
+
+        approvers = []
+        for requestor in self.users['requestor']:
+            approver = self.rng.choice(self.users['approver'])
+            approvers.append(UserApprovers(user=requestor, module='Job Order', approver_role='Approver', approver=approver))
+            approvers.append(UserApprovers(user=requestor, module='Manhours', approver_role='Approver', approver=approver))
+            approvers.append(UserApprovers(user=requestor, module='Overtime', approver_role='Checker', approver=approver))
+        for maintenance in self.users['maintenance']:
+            approvers.append(UserApprovers(user=maintenance, module='Job Order', approver_role='Checker',
+                                           approver=self.rng.choice(self.users['checker'])))
+        self.bulk(UserApprovers, approvers)
+
+    # Monitoring
+    def seed_monitoring(self):
+        self.stdout.write('Seeding monitoring...')
+        supervisors = self.users['approver']
+        groups = self.bulk(Monitoring, [
+            Monitoring(created_by=supervisors[i % len(supervisors)], title=f'SEED Group {i + 1}',
+                       description='Synthetic monitoring group')
+            for i in range(max(len(self.lines) // 4, 1))
+        ])
+
+        self.bulk(SupervisorToMonitor, [
+            SupervisorToMonitor(monitoring=group, supervisor=supervisors[i % len(supervisors)])
+            for i, group in enumerate(groups)
+        ])
+        line_groups = {line.id: groups[i % len(groups)] for i, line in enumerate(self.lines)}
+        self.bulk(LineToMonitor, [LineToMonitor(monitoring=line_groups[line.id], line=line) for line in self.lines])
+
+        products = self.bulk(Product, [
+            Product(monitoring=line_groups[line.id], line=line, product_name=f'SP-{line.id}-{n + 1:02}',
+                    description='Synthetic product', qty_per_box=self.rng.choice([20, 50, 100]),
+                    qty_per_hour=self.rng.randint(60, 240))
+            for line in self.lines for n in range(3)
+        ])
+        products_by_line = {}
+        for product in products:
+            products_by_line.setdefault(product.line_id, []).append(product)
+
+        schedules = []
+        day = self.start_date
+        while day <= self.today:
+            if day.weekday() != 6:
+                for line in self.lines:
+                    for shift in ('AM', 'PM'):
+                        product = self.rng.choice(products_by_line[line.id])
+                        planned = product.qty_per_hour * 10
+                        schedules.append(ProductionSchedulePlan(
+                            monitoring=line_groups[line.id], date_planned=day, product_number=product,
+                            shift=shift, planned_qty=planned, balance=planned))
+            day += timedelta(days=1)
+        schedules = self.bulk(ProductionSchedulePlan, schedules)
+
+        # One output header per schedule with hourly logs underneath, as the line terminal records them
+        outputs = []
+        hourly = []
+        for schedule in schedules:
+            start_hour = 7 if schedule.shift == 'AM' else 19
+            per_hour = schedule.product_number.qty_per_hour
+            logs = [max(int(self.rng.gauss(per_hour * 0.95, per_hour * 0.15)), 0) for _ in range(10)]
+            outputs.append(ProductionOutput(
+                monitoring_id=schedule.monitoring_id, schedule_plan=schedule,
+                line_id=schedule.product_number.line_id, shift=schedule.shift,
+                inspector=self.random_name(), quantity_produced=sum(logs),
+                recorded_at=self.aware(schedule.date_planned, start_hour)))
+            schedule.balance = schedule.planned_qty - sum(logs)
+            hourly.append((schedule, start_hour, per_hour, logs))
+
+        with keep_timestamps(model_field(ProductionOutput, 'recorded_at')):
+            outputs = self.bulk(ProductionOutput, outputs)
+        ProductionSchedulePlan.objects.bulk_update(schedules, ['balance'], batch_size=self.batch_size)
+
+        logs = []
+        for output, (schedule, start_hour, per_hour, quantities) in zip(outputs, hourly):
+            for offset, quantity in enumerate(quantities):
+                recorded = self.aware(schedule.date_planned, start_hour) + timedelta(hours=offset + 1)
+                logs.append(OutputLog(outputlog=output, output=quantity, time_recorded=recorded,
+                                      status='Met' if quantity >= per_hour else 'Not Met'))
+        with keep_timestamps(model_field(OutputLog, 'time_recorded')):
+            self.bulk(OutputLog, logs)
+
+    # Job order
+    def seed_job_orders(self):
+        self.stdout.write('Seeding job orders...')
+        requestors = self.users['requestor']
+        approver_of = {
+            ua.user_id: ua.approver for ua in UserApprovers.objects.filter(
+                user__in=requestors, module='Job Order', approver_role='Approver').select_related('approver')
+        }
+        checker_of = {
+            ua.user_id: ua.approver for ua in UserApprovers.objects.filter(
+                user__in=self.users['maintenance'], module='Job Order', approver_role='Checker').select_related('approver')
+        }
+        facilitator = self.users['facilitator'][0]
+        statuses = ['Routing'] * 3 + ['Completed', 'Checked'] + ['Closed'] * 4 + ['Cancelled', 'Rejected']
+
+        job_orders = []
+        for i in range(2000 * self.scale):
+            color = self.rng.choice(JO_COLORS)
+            created = self.random_datetime()
+            status = self.rng.choice(statuses)
+            jo = JOLogsheet(
+                jo_number=f'{color[0]}-S{i + 1:05}', prepared_by=self.rng.choice(requestors),
+                requestor=self.random_name(), jo_type=self.rng.choice(JO_NATURES),
+                jo_tools=self.rng.choice(JO_TOOLS), jo_color=color, line=self.rng.choice(self.lines),
+                details='Synthetic job order request', status=status, date_created=created)
+
+            # How far along the routing this request got; 1 approver, 5 facilitator, 6 maintenance, 7 checker, 8 preparer
+            if status in ('Cancelled', 'Rejected'):
+                reached = 1
+            elif status == 'Routing':
+                reached = self.rng.choice([1, 5, 6])
+            else:
+                reached = {'Completed': 7, 'Checked': 8, 'Closed': 8}[status]
+
+            if reached >= 6:
+                jo.in_charge = self.rng.choice(self.users['maintenance'])
+                jo.date_received = created + timedelta(days=1)
+                jo.target_date = created + timedelta(days=self.rng.randint(3, 21))
+            if reached >= 7:
+                jo.date_complete = created + timedelta(days=self.rng.randint(2, 25))
+                jo.action_taken = 'Synthetic action taken'
+            job_orders.append((jo, reached))
+
+        with keep_timestamps(model_field(JOLogsheet, 'date_created')):
+            created_jos = self.bulk(JOLogsheet, [jo for jo, _ in job_orders])
+
+        routings = []
+        for jo, (_, reached) in zip(created_jos, job_orders):
+            steps = [
+                (0, jo.prepared_by, 'Submitted'),
+                (1, approver_of.get(jo.prepared_by_id) or self.rng.choice(self.users['approver']), None),
+                (5, facilitator, None),
+                (6, jo.in_charge, None),
+                (7, checker_of.get(jo.in_charge_id), None),
+                (8, jo.prepared_by, None),
+            ]
+            for sequence, approver, fixed_status in steps:
+                if sequence > reached:
+                    break
+                if fixed_status:
+                    status = fixed_status
+                elif sequence < reached:
+                    status = 'Approved'
+                elif jo.status == 'Rejected':
+                    status = 'Rejected'
+                elif jo.status == 'Cancelled':
+                    status = 'Cancelled'
+                elif jo.status == 'Closed':
+                    status = 'Approved'
+                else:
+                    status = 'Processing'
+                request_at = jo.date_created + timedelta(hours=sequence * 6)
+                routings.append(JORouting(
+                    jo_number=jo, jo_request=jo.prepared_by, approver=approver, first_approver=sequence == 1,
+                    approver_sequence=sequence, status=status, request_at=request_at,
+                    approved_at=request_at + timedelta(hours=3) if status == 'Approved' else None))
+
+        with keep_timestamps(model_field(JORouting, 'request_at')):
+            self.bulk(JORouting, routings)
+        backfill_current_step(JOLogsheet.objects.filter(prepared_by__username__startswith=f'{SEED_PREFIX}_'),
+                              self.batch_size)
+
+    # Overtime
+    def seed_overtime(self):
+        self.stdout.write('Seeding overtime...')
+        employees = []
+        for i in range(600 * self.scale):
+            line = self.lines[i % len(self.lines)]
+            employees.append(Employee(
+                id_number=f'SEED{i + 1:06}', name=self.random_name(), department='Production',
+                line=line.line_name, shuttle_service=self.rng.choice(SHUTTLES),
+                is_active=self.rng.random() > 0.05, date_added=self.aware(self.start_date)))
+        with keep_timestamps(model_field(Employee, 'date_added')):
+            employees = self.bulk(Employee, employees)
+
+        requestors = self.users['requestor']
+        groups = self.bulk(EmployeeGroup, [
+            EmployeeGroup(name=f'SEED OT Group {i + 1}', created_by=requestors[i % len(requestors)])
+            for i in range(len(self.lines) * 2)
+        ])
+        group_members = {}
+        memberships = []
+        for index, group in enumerate(groups):
+            members = [e for n, e in enumerate(employees) if n % len(groups) == index]
+            group_members[group.id] = members
+            memberships.extend(EmployeeGroup.employees.through(employeegroup_id=group.id, employee_id=e.id)
+                               for e in members)
+        self.bulk(EmployeeGroup.employees.through, memberships)
+
+        filings = []
+        for i in range(1500 * self.scale):
+            group = self.rng.choice(groups)
+            filing_type = self.rng.choice(['SHIFTING', 'DAILY'])
+            created = self.random_datetime()
+            prefix = 'SFT' if filing_type == 'SHIFTING' else 'DLY'
+            filings.append(OTFiling(
+                filing_id=f'{prefix}{created:%Y%m%d}S{i + 1:05}', filing_type=filing_type, group=group,
+                requestor=group.created_by, status=self.rng.choice(['PENDING', 'COMPLETED', 'COMPLETED', 'CANCELLED']),
+                date_created=created))
+        with keep_timestamps(model_field(OTFiling, 'date_created')):
+            filings = self.bulk(OTFiling, filings)
+
+        shifting, daily, statuses = [], [], []
+        for filing in filings:
+            day = timezone.localtime(filing.date_created).date()
+            if filing.filing_type == 'SHIFTING':
+                shifting.append(ShiftingOT(filing=filing, start_date=day, end_date=day + timedelta(days=5),
+                                           shift_type=self.rng.choice(['AM', 'PM'])))
+            else:
+                schedule_type = {5: 'SATURDAY', 6: 'SUNDAY'}.get(day.weekday(), 'WEEKDAY')
+                daily.append(DailyOT(filing=filing, date=day, schedule_type=schedule_type,
+                                     start_time=time(17, 0), end_time=time(20, 0), reason='Synthetic backlog'))
+            for employee in group_members[filing.group_id]:
+                statuses.append(EmployeeOTStatus(
+                    filing=filing, employee=employee,
+                    status=self.rng.choices(['OT', 'NOT-OT', 'ABSENT', 'LEAVE'], weights=[70, 20, 5, 5])[0]))
+        self.bulk(ShiftingOT, shifting)
+        self.bulk(DailyOT, daily)
+        self.bulk(EmployeeOTStatus, statuses)
+        refresh_status_counts(filings)
+        refresh_roster(filings)
+
+    # Chat
+    def seed_chat(self):
+        self.stdout.write('Seeding chat...')
+        people = [user for users in self.users.values() for user in users]
+        pairs = set()
+        while len(pairs) < min(60 * self.scale, len(people) * (len(people) - 1) // 2):
+            a, b = self.rng.sample(people, 2)
+            pairs.add((min(a.id, b.id), max(a.id, b.id)))
+        pairs = sorted(pairs)
+
+        chats = self.bulk(Chat, [Chat(chat_type='direct') for _ in pairs] +
+                          [Chat(chat_type='group', name=f'SEED Team {i + 1}') for i in range(4 * self.scale)])
+
+        members, conversations = [], []
+        for chat, pair in zip(chats, pairs):
+            members.extend(ChatMember(chat=chat, user_id=user_id) for user_id in pair)
+            conversations.append((chat, list(pair)))
+        for chat in chats[len(pairs):]:
+            team = self.rng.sample(people, min(8, len(people)))
+            members.extend(ChatMember(chat=chat, user=user, role='admin' if n == 0 else 'member')
+                           for n, user in enumerate(team))
+            conversations.append((chat, [user.id for user in team]))
+        self.bulk(ChatMember, members)
+
+        messages = []
+        for chat, member_ids in conversations:
+            sent = self.random_datetime()
+            for n in range(self.rng.randint(20, 120)):
+                sent += timedelta(minutes=self.rng.randint(1, 240))
+                messages.append(Message(chat=chat, sender_id=self.rng.choice(member_ids),
+                                        content=f'Synthetic message {n + 1}', timestamp=sent))
+        with keep_timestamps(model_field(Message, 'timestamp')):
+            self.bulk(Message, messages)
+
+    # DCF
+    def seed_dcf(self):
+        self.stdout.write('Seeding DCF...')
+        natures = [choice for choice, _ in DCF.NATURE_CHOICES]
+        dcfs = []
+        for i in range(400 * self.scale):
+            filed = self.random_datetime()
+            dcfs.append(DCF(
+                dcf_number=f'SEED-DCF-{i + 1:06}', requisitioner=self.rng.choice(self.users['requestor']),
+                document_code=f'DOC-{self.rng.randint(1, 300):04}', document_title='Synthetic document',
+                revision_number=str(self.rng.randint(0, 9)), nature=self.rng.choice(natures),
+                details='Synthetic document change', effectivity_date=filed.date() + timedelta(days=14),
+                status=self.rng.choices(['on_process', 'approved', 'rejected'], weights=[30, 60, 10])[0],
+                date_filed=filed))
+        with keep_timestamps(model_field(DCF, 'date_filed')):
+            dcfs = self.bulk(DCF, dcfs)
+
+        timeline = [
+            DCFApprovalTimeline(dcf=dcf, approver=self.rng.choice(self.users['approver']), status=dcf.status,
+                                date_acted=dcf.date_filed + timedelta(days=2))
+            for dcf in dcfs if dcf.status != 'on_process'
+        ]
+        with keep_timestamps(model_field(DCFApprovalTimeline, 'date_acted')):
+            self.bulk(DCFApprovalTimeline, timeline)
+
+    # ECIS
+    def seed_ecis(self):
+        self.stdout.write('Seeding ECIS...')
+        categories = [choice for choice, _ in ECIS.CATEGORY_CHOICES]
+        statuses = [choice for choice, _ in ECIS.STATUS_CHOICES]
+        records = []
+        for i in range(400 * self.scale):
+            prepared = self.random_day()
+            records.append(ECIS(
+                category=self.rng.choice(categories), number=f'Z{i + 1:07}', department='Production',
+                requested_by=self.random_name(), customer='Synthetic Customer',
+                line_supervisor=self.random_name(), affected_parts='Synthetic parts',
+                details_change='Synthetic change details', implementation_date=prepared + timedelta(days=7),
+                status=self.rng.choices(statuses, weights=[60, 10, 15, 10, 5])[0],
+                created_by=self.rng.choice(self.users['requestor']), date_prepared=prepared))
+        with keep_timestamps(model_field(ECIS, 'date_prepared')):
+            self.bulk(ECIS, records)
+
+    # Manhours
+    def seed_manhours(self):
+        self.stdout.write('Seeding manhours...')
+        machines = self.bulk(Machine, [Machine(machine_name=f'SEED Machine {i + 1:02}', location='SEED')
+                                       for i in range(12 * self.scale)])
+        logsheets = []
+        for _ in range(3000 * self.scale):
+            manhours = Decimal(self.rng.randint(1, 16)) / 2
+            output = Decimal(self.rng.randint(50, 1200))
+            completed = self.random_datetime()
+            logsheets.append(ManhoursLogsheet(
+                user=self.rng.choice(self.users['requestor']), operator=self.random_name(),
+                shift=self.rng.choice(['AM', 'PM']), line=self.rng.choice(self.lines).line_name,
+                machine=self.rng.choice(machines), setup=self.rng.randint(0, 45), manhours=manhours,
+                output=output, total_output=(output / manhours).quantize(Decimal('0.01')),
+                date_completed=completed, date_submitted=completed))
+        with keep_timestamps(model_field(ManhoursLogsheet, 'date_submitted')):
+            self.bulk(ManhoursLogsheet, logsheets)
@@ -0,0 +1,45 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from pdnportal.loadsim import PROFILES, SimulationError, run_simulation
+
+
+class Command(BaseCommand):
+    help = 'Simulate concurrent line terminals, dashboards, chat sockets and approvers against the ASGI app'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--profile', default='smoke', choices=sorted(PROFILES),
+                            help='Deployment profile that sets the number of actors (default smoke)')
+        parser.add_argument('--duration', type=float, default=30, help='Seconds to run (default 30)')
+        parser.add_argument('--seed', type=int, default=2024, help='Random seed for actor timing')
+        for kind in ('terminal', 'dashboard', 'chat', 'approver'):
+            parser.add_argument(f'--{kind}s', type=int, dest=f'{kind}_count',
+                                help=f'Override the number of {kind} actors')
+            parser.add_argument(f'--{kind}-interval', type=float, dest=f'{kind}_interval',
+                                help=f'Override the seconds between {kind} actions')
+        parser.add_argument('--output', help='Write the JSON report to this file')
+
+    def handle(self, *args, **options):
+        kinds = ('terminal', 'dashboard', 'chat', 'approver')
+        counts = {kind: options[f'{kind}_count'] for kind in kinds if options[f'{kind}_count'] is not None}
+        intervals = {kind: options[f'{kind}_interval'] for kind in kinds if options[f'{kind}_interval'] is not None}
+
+        try:
+            report = run_simulation(options['profile'], options['duration'], counts, intervals, options['seed'])
+        except SimulationError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(f"Profile {report['profile']}: {report['actors']} for {report['duration_s']}s")
+        self.stdout.write(f"{'traffic':<14} {'requests':>9} {'req/s':>8} {'p50':>9} {'p95':>9} {'p99':>9} {'errors':>7} {'locks':>6}")
+        for kind, result in report['results'].items():
+            self.stdout.write(
+                f"{kind:<14} {result['requests']:>9} {result['throughput_rps']:>8} {result['p50_ms']:>9} "
+                f"{result['p95_ms']:>9} {result['p99_ms']:>9} {result['errors']:>7} {result['lock_errors']:>6}")
+        self.stdout.write(f"Total {report['total_requests']} requests, {report['throughput_rps']} req/s, "
+                          f"{report['lock_errors']} lock errors")
+
+        if options['output']:
+            with open(options['output'], 'w') as handle:
+                json.dump(report, handle, indent=2)
+            self.stdout.write(f"Report written to {options['output']}")
@@ -0,0 +1,78 @@
+"""
+Who supervises whom, per module and approver role.
+
+The UserApprovers links are read into per-approver id sets that are kept in
+the cache, keyed by the UserApprovers version counter (see pdnportal/cache.py),
+so dashboards do not look them up on every request. Saves and deletes through
+the model bump the counter; code that writes links in bulk (create_user,
+edit_user) calls invalidate_supervision().
+
+The counter is shared by every worker through the cache, but writes that
+skip the model and invalidate_supervision() are only seen once an entry
+expires, so the sets are kept for AGGREGATE_CACHE_TIMEOUT at most and are
+only used to scope dashboards. Permission checks read UserApprovers
+directly, see is_supervisor().
+
+supervised_filter() turns a set into a filter for the dashboard queries: an
+inline id list while it is small, a subquery on UserApprovers for supervisors
+of big lines, so no query ever carries thousands of parameters.
+"""
+from django.core.cache import cache
+from django.db.models import Q
+
+from pdnportal.cache import DEFAULT_TIMEOUT, bump_model_version, get_versions
+from .models import UserApprovers
+
+# Larger id sets are filtered with a subquery instead of an inline IN list
+INLINE_ID_LIMIT = 500
+# Expiry of a cached id set in seconds, bounds how long a write that skipped the counter leaves an old set
+SUPERVISION_TIMEOUT = DEFAULT_TIMEOUT
+
+
+def supervised_links(approver, module, role=None):
+    """UserApprovers rows linking `approver` to the users it supervises in `module` (and `role`)."""
+    links = UserApprovers.objects.filter(approver=approver, module=module, user__isnull=False)
+    if role:
+        links = links.filter(approver_role=role)
+    return links
+
+
+def is_supervisor(approver, user, module, role=None):
+    """Whether `approver` supervises `user` in `module` (and `role`), read live for permission checks."""
+    return supervised_links(approver, module, role).filter(user=user).exists()
+
+
+def supervised_user_ids(approver, module, role=None):
+    """The ids of the users `approver` supervises in `module` (and `role`), as a cached frozenset."""
+    version = get_versions([UserApprovers])[0]
+    approver_id = getattr(approver, 'pk', approver)
+    key = f'supervision:{version}:{approver_id}:{module}:{role or "*"}'
+    user_ids = cache.get(key)
+    if user_ids is None:
+        user_ids = frozenset(supervised_links(approver_id, module, role).values_list('user_id', flat=True))
+        cache.set(key, user_ids, SUPERVISION_TIMEOUT)
+    return user_ids
+
+
+def supervised_filter(field, approver, module, role=None, include_self=False):
+    """
+    Q matching rows whose `field` (e.g. 'user' or 'requestor') is a user
+    `approver` supervises, and the approver's own rows with include_self.
+    """
+    approver_id = getattr(approver, 'pk', approver)
+    user_ids = supervised_user_ids(approver_id, module, role)
+    if len(user_ids) <= INLINE_ID_LIMIT:
+        ids = set(user_ids)
+        if include_self:
+            ids.add(approver_id)
+        return Q(**{f'{field}__in': sorted(ids)})
+
+    condition = Q(**{f'{field}__in': supervised_links(approver_id, module, role).values('user_id')})
+    if include_self:
+        condition |= Q(**{field: approver_id})
+    return condition
+
+
+def invalidate_supervision():
+    """Drop every cached id set, now and again once the transaction commits."""
+    bump_model_version(UserApprovers)
@@ -1,4 +1,19 @@
 from django.contrib import admin
-from .models import Line
+from .models import Line, Sequence, BackgroundJob
 
-admin.site.register(Line)
\ No newline at end of file
+admin.site.register(Line)
+
+
+@admin.register(Sequence)
+class SequenceAdmin(admin.ModelAdmin):
+    list_display = ('key', 'period', 'last_value', 'updated_at')
+    list_filter = ('key',)
+
+
+@admin.register(BackgroundJob)
+class BackgroundJobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'kind', 'status', 'created_by', 'progress', 'total', 'created_at', 'finished_at')
+    list_filter = ('status', 'kind')
+    readonly_fields = ('created_at', 'started_at', 'heartbeat_at', 'finished_at')
+    # Job files have no public URL, results are downloaded through the job_download view
+    exclude = ('input_file', 'result_file')
@@ -0,0 +1,258 @@
+"""
+In-process background jobs for long imports and exports.
+
+A request stores its upload on a BackgroundJob row and returns straight away.
+A small pool of worker threads, started with the ASGI application (or by
+`manage.py run_jobs` when the site is served by runserver), claims queued jobs
+and runs the handler registered for the job's kind. Handlers live in each
+app's `jobs.py`:
+
+    @job_handler('overtime.import_employees')
+    def import_employees(job):
+        ...
+        report_progress(job, done, total)
+        return {'created_count': created}
+
+The returned dict is stored as the job result; files written with
+save_result_file() are kept in the private JOB_FILES_ROOT and downloaded
+through the job_download view. Files of jobs finished more than
+JOB_FILE_RETENTION_DAYS ago are removed by prune_job_files(). Handlers run outside any request transaction and commit
+their own work in chunks, so the SQLite write lock is only held while one
+chunk is written.
+"""
+import logging
+import os
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files.base import ContentFile, File
+from django.db import DatabaseError, close_old_connections, connection, transaction
+from django.db.models import Q
+from django.http import JsonResponse
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.module_loading import autodiscover_modules
+
+from .models import BackgroundJob
+
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between two progress writes of the same job
+PROGRESS_INTERVAL = 1.0
+# Rows a handler writes per transaction
+BATCH_SIZE = 200
+
+_handlers = {}
+_workers = []
+_workers_lock = threading.Lock()
+_wakeup = threading.Event()
+
+
+class JobError(Exception):
+    """A handler failure whose message is meant for the user, e.g. a missing column."""
+
+
+def job_handler(kind):
+    """Register the decorated function as the handler for jobs of `kind`."""
+    def decorator(func):
+        _handlers[kind] = func
+        return func
+    return decorator
+
+
+def get_handler(kind):
+    if kind not in _handlers:
+        autodiscover_modules('jobs')
+    return _handlers.get(kind)
+
+
+def enqueue(kind, user=None, params=None, upload=None):
+    """
+    Queue a job and wake the workers once the current transaction commits.
+
+    Args:
+        kind: Registered handler name, e.g. 'overtime.import_employees'.
+        user: The user the job runs for, only they can see its status.
+        params: JSON-serialisable arguments for the handler.
+        upload: Optional uploaded file, stored as the job's input_file.
+    """
+    if get_handler(kind) is None:
+        raise ValueError(f"No background job handler registered for '{kind}'")
+
+    job = BackgroundJob(kind=kind, created_by=user, params=params or {})
+    if upload is not None:
+        job.input_file.save(os.path.basename(upload.name), upload, save=False)
+    job.save()
+    transaction.on_commit(wake_workers)
+    return job
+
+
+def job_accepted(job):
+    """202 response pointing the client at the status endpoint of a queued job."""
+    return JsonResponse({
+        'success': True,
+        'job_id': job.id,
+        'status': job.status,
+        'status_url': reverse('job_status', args=[job.id]),
+    }, status=202)
+
+
+def report_progress(job, done, total=None, message=None, force=False):
+    """Record how far a job is; writes are throttled to one per PROGRESS_INTERVAL."""
+    job.progress = done
+    if total is not None:
+        job.total = total
+    if message is not None:
+        job.message = message[:255]
+
+    now = time.monotonic()
+    if not force and now - getattr(job, '_progress_written', 0) < PROGRESS_INTERVAL:
+        return
+    job._progress_written = now
+    job.heartbeat_at = timezone.now()
+    BackgroundJob.objects.filter(pk=job.pk).update(
+        progress=job.progress, total=job.total, message=job.message, heartbeat_at=job.heartbeat_at)
+
+
+def batches(items, size=BATCH_SIZE):
+    """Split `items` into lists of `size` so a handler can commit one list per transaction."""
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def save_result_file(job, filename, content):
+    """Store `content` (bytes or a file object) as the job's downloadable result."""
+    if isinstance(content, bytes):
+        content = ContentFile(content)
+    elif not isinstance(content, File):
+        content = File(content)
+    job.result_file.save(filename, content, save=False)
+    BackgroundJob.objects.filter(pk=job.pk).update(result_file=job.result_file.name)
+
+
+def run_job(job):
+    """Run one claimed job and record its outcome."""
+    handler = get_handler(job.kind)
+    try:
+        if handler is None:
+            raise JobError(f"No background job handler registered for '{job.kind}'")
+        result = handler(job)
+    except Exception as e:
+        if not isinstance(e, JobError):
+            logger.exception(f"Background job {job.pk} ({job.kind}) failed")
+        job.status = 'Failed'
+        job.error = str(e)
+    else:
+        job.status = 'Succeeded'
+        job.result = result
+        job.progress = max(job.progress, job.total)
+
+    job.finished_at = job.heartbeat_at = timezone.now()
+    job.save(update_fields=['status', 'result', 'error', 'progress', 'total', 'message',
+                            'heartbeat_at', 'finished_at'])
+    return job
+
+
+def claim_next(worker):
+    """Mark the oldest queued job as running for `worker`; None when the queue is empty."""
+    queued = BackgroundJob.objects.filter(status='Queued').order_by('created_at', 'id').values_list('id', flat=True)
+    for job_id in queued[:10]:
+        now = timezone.now()
+        # Another worker may claim the same row first, the status check makes the update a no-op then
+        claimed = BackgroundJob.objects.filter(pk=job_id, status='Queued').update(
+            status='Running', worker=worker, started_at=now, heartbeat_at=now)
+        if claimed:
+            return BackgroundJob.objects.get(pk=job_id)
+    return None
+
+
+def recover_stale_jobs():
+    """Fail running jobs whose worker stopped reporting, e.g. because the server restarted."""
+    cutoff = timezone.now() - timedelta(seconds=settings.JOB_STALE_SECONDS)
+    return BackgroundJob.objects.filter(status='Running', heartbeat_at__lt=cutoff).update(
+        status='Failed', finished_at=timezone.now(),
+        error='The server stopped before this job finished, please run it again.')
+
+
+def prune_job_files(days=None):
+    """Delete the input and result files of jobs finished more than `days` ago; returns how many jobs were cleared."""
+    days = settings.JOB_FILE_RETENTION_DAYS if days is None else days
+    cutoff = timezone.now() - timedelta(days=days)
+    jobs = (BackgroundJob.objects
+            .filter(status__in=('Succeeded', 'Failed'), finished_at__lt=cutoff)
+            .filter(Q(input_file__gt='') | Q(result_file__gt=''))
+            .only('id', 'input_file', 'result_file'))
+
+    cleared = 0
+    for job in jobs.iterator():
+        for field in (job.input_file, job.result_file):
+            if field:
+                field.delete(save=False)
+        BackgroundJob.objects.filter(pk=job.pk).update(input_file=None, result_file=None)
+        cleared += 1
+    return cleared
+
+
+def run_pending(worker='inline'):
+    """Run queued jobs in the calling thread until the queue is empty; returns how many ran."""
+    count = 0
+    while True:
+        job = claim_next(worker)
+        if job is None:
+            return count
+        run_job(job)
+        count += 1
+
+
+def wake_workers():
+    _wakeup.set()
+
+
+def worker_loop(name, stop_event=None, poll_seconds=None):
+    stop_event = stop_event or threading.Event()
+    poll_seconds = settings.JOB_POLL_SECONDS if poll_seconds is None else poll_seconds
+    while not stop_event.is_set():
+        close_old_connections()
+        try:
+            ran = run_pending(name)
+        except DatabaseError:
+            logger.exception(f"Background job worker {name} could not read the queue")
+            ran = 0
+        finally:
+            connection.close()
+
+        if not ran:
+            _wakeup.wait(poll_seconds)
+            _wakeup.clear()
+
+
+def start_workers(count=None):
+    """Start the worker threads once per process."""
+    count = settings.JOB_WORKERS if count is None else count
+    with _workers_lock:
+        if _workers or count <= 0:
+            return _workers
+        autodiscover_modules('jobs')
+        try:
+            recover_stale_jobs()
+            prune_job_files()
+        except DatabaseError:
+            # The job table may not exist yet before migrations have run
+            logger.warning("Background job table unavailable, stale jobs were not recovered")
+        finally:
+            connection.close()
+
+        for index in range(count):
+            name = f'{os.getpid()}-{index + 1}'
+            thread = threading.Thread(target=worker_loop, args=(name,), name=f'job-worker-{name}', daemon=True)
+            thread.start()
+            _workers.append(thread)
+    return _workers
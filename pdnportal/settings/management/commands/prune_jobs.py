@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from settings.background import prune_job_files
+
+
+class Command(BaseCommand):
+    help = 'Delete the uploaded and exported files of background jobs finished more than JOB_FILE_RETENTION_DAYS ago'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=None,
+                            help='Delete files of jobs finished more than this many days ago (default JOB_FILE_RETENTION_DAYS)')
+
+    def handle(self, *args, **options):
+        cleared = prune_job_files(options['days'])
+        self.stdout.write(self.style.SUCCESS(f'Deleted the files of {cleared} finished background jobs'))
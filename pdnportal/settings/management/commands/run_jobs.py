@@ -0,0 +1,37 @@
+import threading
+
+from django.core.management.base import BaseCommand
+
+from settings.background import prune_job_files, recover_stale_jobs, run_pending, worker_loop
+
+
+class Command(BaseCommand):
+    help = 'Run queued background jobs, for deployments that do not start workers with the ASGI app'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=1, help='Worker threads (default 1)')
+        parser.add_argument('--once', action='store_true', help='Run the jobs queued now and exit')
+
+    def handle(self, *args, **options):
+        recovered = recover_stale_jobs()
+        if recovered:
+            self.stdout.write(self.style.WARNING(f'Marked {recovered} abandoned jobs as failed'))
+        prune_job_files()
+
+        if options['once']:
+            ran = run_pending('run_jobs')
+            self.stdout.write(self.style.SUCCESS(f'Ran {ran} background jobs'))
+            return
+
+        self.stdout.write(f"Running background jobs with {options['workers']} workers, press CTRL-C to stop")
+        threads = [
+            threading.Thread(target=worker_loop, args=(f'run_jobs-{index + 1}',), daemon=True)
+            for index in range(options['workers'])
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                thread.join()
+        except KeyboardInterrupt:
+            self.stdout.write('Stopped')
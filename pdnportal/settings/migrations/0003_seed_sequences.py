@@ -0,0 +1,81 @@
+import re
+
+from django.db import migrations
+
+JO_PREFIXES = {'green': 'G', 'yellow': 'Y', 'white': 'W', 'orange': 'O'}
+OT_PREFIXES = {'SFT': 'shifting', 'DLY': 'daily'}
+
+
+def suffixes(values, pattern):
+    regex = re.compile(pattern)
+    for value in values:
+        match = regex.match(value or '')
+        if match:
+            yield match.groups()
+
+
+def seed_sequences(apps, schema_editor):
+    """Start every sequence after the highest number already issued so nothing is handed out twice."""
+    Sequence = apps.get_model('settings', 'Sequence')
+    JOLogsheet = apps.get_model('joborder', 'JOLogsheet')
+    DCF = apps.get_model('dcf', 'DCF')
+    DCFNumberSetting = apps.get_model('dcf', 'DCFNumberSetting')
+    ECIS = apps.get_model('ecis', 'ECIS')
+    CategoryCounter = apps.get_model('ecis', 'CategoryCounter')
+    OTFiling = apps.get_model('overtime', 'OTFiling')
+
+    last_values = {}
+
+    def seen(key, period, value):
+        last_values[(key, period)] = max(last_values.get((key, period), 0), int(value))
+
+    # Job orders: the old counter tables' auto ids and the numbers already on file
+    jo_numbers = JOLogsheet.objects.values_list('jo_number', flat=True).iterator()
+    prefix_keys = {prefix: f'joborder.{color}' for color, prefix in JO_PREFIXES.items()}
+    for prefix, number in suffixes(jo_numbers, r'^([GYWO])-(\d+)$'):
+        seen(prefix_keys[prefix], '', number)
+    for color in JO_PREFIXES:
+        counter = apps.get_model('joborder', f'{color.capitalize()}ControlNumber')
+        last_id = counter.objects.order_by('-id').values_list('id', flat=True).first()
+        if last_id:
+            seen(f'joborder.{color}', '', last_id)
+
+    # DCF: the setting stores the next number to hand out
+    setting = DCFNumberSetting.objects.order_by('pk').first()
+    if setting:
+        seen('dcf', '', setting.current_number - 1)
+    prefix = re.escape(setting.prefix if setting else 'DCF-')
+    for (number,) in suffixes(DCF.objects.values_list('dcf_number', flat=True).iterator(), rf'^{prefix}(\d+)$'):
+        seen('dcf', '', number)
+
+    # ECIS: yearly per category
+    for counter in CategoryCounter.objects.all():
+        seen(f'ecis.{counter.category}', f'20{counter.year}', counter.current_sequence - 1)
+    ecis_numbers = ECIS.objects.values_list('number', flat=True).iterator()
+    for category, year, number in suffixes(ecis_numbers, r'^([A-Z0-9]{1,2})-(\d{2})-(\d+)$'):
+        seen(f'ecis.{category}', f'20{year}', number)
+
+    # OT filings: daily per filing type
+    filing_ids = OTFiling.objects.values_list('filing_id', flat=True).iterator()
+    for prefix, day, number in suffixes(filing_ids, r'^(SFT|DLY)(\d{8})(\d+)$'):
+        seen(f'overtime.{OT_PREFIXES[prefix]}', day, number)
+
+    Sequence.objects.bulk_create([
+        Sequence(key=key, period=period, last_value=value)
+        for (key, period), value in last_values.items() if value > 0
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('settings', '0002_sequence'),
+        ('joborder', '0018_jologsheet_current_step'),
+        ('dcf', '0002_dcf_prepared_by'),
+        ('ecis', '0004_delete_facilitatorremark'),
+        ('overtime', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_sequences, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.0.3 on 2026-10-19 14:02
+
+import settings.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('settings', '0004_backgroundjob'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='backgroundjob',
+            name='input_file',
+            field=models.FileField(blank=True, null=True, storage=settings.models.get_job_file_storage, upload_to='input/%Y/%m/%d/'),
+        ),
+        migrations.AlterField(
+            model_name='backgroundjob',
+            name='result_file',
+            field=models.FileField(blank=True, null=True, storage=settings.models.get_job_file_storage, upload_to='result/%Y/%m/%d/'),
+        ),
+    ]
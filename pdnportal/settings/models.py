@@ -1,6 +1,97 @@
+import os
+
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
 from django.db import models
 
 class Line(models.Model):
     line_name = models.CharField(max_length=100)
     def __str__(self):
         return self.line_name
+
+
+class Sequence(models.Model):
+    key = models.CharField(max_length=50)
+    period = models.CharField(max_length=10, blank=True, default='')
+    last_value = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        period = f' ({self.period})' if self.period else ''
+        return f'{self.key}{period} - {self.last_value}'
+
+    class Meta:
+        unique_together = ('key', 'period')
+
+
+class JobFileStorage(FileSystemStorage):
+    """
+    Uploads and results of background jobs, kept in JOB_FILES_ROOT outside every served directory.
+    The files have no public URL, results are only downloaded through the job_download view.
+    """
+
+    @property
+    def base_location(self):
+        return self._value_or_setting(self._location, settings.JOB_FILES_ROOT)
+
+    @property
+    def location(self):
+        return os.path.abspath(self.base_location)
+
+    def url(self, name):
+        raise ValueError('Background job files are not served publicly, use the job_download view')
+
+
+job_file_storage = JobFileStorage()
+
+
+def get_job_file_storage():
+    return job_file_storage
+
+
+class BackgroundJob(models.Model):
+    STATUS_CHOICES = [
+        ('Queued', 'Queued'),
+        ('Running', 'Running'),
+        ('Succeeded', 'Succeeded'),
+        ('Failed', 'Failed'),
+    ]
+
+    kind = models.CharField(max_length=50)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='Queued')
+    created_by = models.ForeignKey('portalusers.Users', on_delete=models.SET_NULL, null=True, blank=True,
+                                   related_name='backgroundJobs')
+    params = models.JSONField(default=dict, blank=True)
+    input_file = models.FileField(upload_to='input/%Y/%m/%d/', storage=get_job_file_storage, null=True, blank=True)
+    result = models.JSONField(null=True, blank=True)
+    result_file = models.FileField(upload_to='result/%Y/%m/%d/', storage=get_job_file_storage,
+                                   null=True, blank=True)
+    progress = models.PositiveIntegerField(default=0)
+    total = models.PositiveIntegerField(default=0)
+    message = models.CharField(max_length=255, blank=True, default='')
+    error = models.TextField(blank=True, default='')
+    worker = models.CharField(max_length=100, blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f'{self.kind} #{self.pk} - {self.status}'
+
+    @property
+    def is_finished(self):
+        return self.status in ('Succeeded', 'Failed')
+
+    @property
+    def percent(self):
+        if self.status == 'Succeeded':
+            return 100
+        if not self.total:
+            return 0
+        return min(100, round(self.progress * 100 / self.total))
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='job_queue_idx'),
+        ]
@@ -0,0 +1,62 @@
+"""
+Shared number sequences for control numbers (job orders, DCF, ECIS, OT filings).
+
+Each sequence is a row per key and reset period. Allocation increments the row
+with a single UPDATE before reading it back inside the same transaction, so two
+requests can never receive the same value. Values of a rolled back transaction
+are returned to the sequence, values of a committed one are never reused.
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Sequence
+
+YEARLY = 'yearly'
+DAILY = 'daily'
+
+
+def sequence_period(reset=None, day=None):
+    """Period a value allocated now belongs to; an empty string for sequences that never reset."""
+    if reset is None:
+        return ''
+    day = day or timezone.localdate()
+    if reset == YEARLY:
+        return day.strftime('%Y')
+    if reset == DAILY:
+        return day.strftime('%Y%m%d')
+    raise ValueError(f"Unknown sequence reset rule '{reset}'")
+
+
+def allocate(key, count=1, reset=None, start=0, day=None):
+    """
+    Reserve `count` consecutive values of the sequence `key` and return them as a range.
+
+    Args:
+        key: Sequence name, e.g. 'joborder.green'.
+        count: Size of the block to reserve, for callers creating several records at once.
+        reset: None, YEARLY or DAILY; the sequence starts over in every new period.
+        start: Last value considered used when a period's sequence is created,
+            so the first allocation returns start + 1.
+        day: Date deciding the period, defaults to today.
+    """
+    if count < 1:
+        raise ValueError('count must be at least 1')
+    period = sequence_period(reset, day)
+
+    with transaction.atomic():
+        rows = Sequence.objects.filter(key=key, period=period)
+        if not rows.update(last_value=F('last_value') + count, updated_at=timezone.now()):
+            try:
+                with transaction.atomic():
+                    Sequence.objects.create(key=key, period=period, last_value=start + count)
+            except IntegrityError:
+                # Another request created the row first
+                rows.update(last_value=F('last_value') + count, updated_at=timezone.now())
+        last_value = rows.values_list('last_value', flat=True).get()
+
+    return range(last_value - count + 1, last_value + 1)
+
+
+def next_value(key, reset=None, start=0, day=None):
+    return allocate(key, 1, reset, start, day)[0]
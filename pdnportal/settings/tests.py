@@ -1,3 +1,194 @@
-from django.test import TestCase
+import io
+import json
+import os
+import shutil
+import tempfile
+from datetime import timedelta
+from unittest import mock
+
+import openpyxl
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.http import JsonResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from overtime.models import Employee
+from pdnportal.cache import cached_aggregate, conditional_etag, version_key
+from portalusers.models import Users, UserApprovers
+from portalusers.supervision import supervised_filter, supervised_user_ids
+from .background import prune_job_files, run_pending
+from .models import BackgroundJob, Line
+
+
+def excel_upload(rows, name='employees.xlsx'):
+    workbook = openpyxl.Workbook()
+    for row in rows:
+        workbook.active.append(row)
+    handle = io.BytesIO()
+    workbook.save(handle)
+    return SimpleUploadedFile(name, handle.getvalue())
+
+
+class BackgroundJobTests(TestCase):
+    """Imports are queued by the request and run by a worker, the client polls the job status."""
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.job_files_root = tempfile.mkdtemp()
+        media = override_settings(MEDIA_ROOT=self.media_root, JOB_FILES_ROOT=self.job_files_root)
+        media.enable()
+        self.addCleanup(media.disable)
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        self.addCleanup(shutil.rmtree, self.job_files_root, ignore_errors=True)
+
+        self.admin = Users.objects.create(username='admin', name='Admin', is_admin=True)
+        self.client.force_login(self.admin)
+
+    def queue_import(self, rows):
+        response = self.client.post(reverse('import-employees'), {'file': excel_upload(rows)})
+        self.assertEqual(response.status_code, 202)
+        return json.loads(response.content)['status_url']
+
+    def test_import_runs_in_worker_and_reports_result(self):
+        status_url = self.queue_import([
+            ['ID Number', 'Employee Name', 'Department'],
+            ['1001', 'JUAN DELA CRUZ', 'Production'],
+            ['1002', 'maria santos', 'Quality'],
+        ])
+        self.assertFalse(Employee.objects.exists())
+        self.assertEqual(json.loads(self.client.get(status_url).content)['status'], 'Queued')
+
+        self.assertEqual(run_pending(), 1)
+
+        status = json.loads(self.client.get(status_url).content)
+        self.assertEqual(status['status'], 'Succeeded')
+        self.assertEqual(status['percent'], 100)
+        self.assertTrue(Employee.objects.exists())
+
+    def test_invalid_file_fails_job_with_message(self):
+        status_url = self.queue_import([['Name'], ['Juan']])
+        run_pending()
+
+        status = json.loads(self.client.get(status_url).content)
+        self.assertEqual(status['status'], 'Failed')
+        self.assertIn('Id Number', status['error'])
+
+    def test_job_files_are_private_and_pruned_after_retention(self):
+        self.queue_import([['ID Number', 'Employee Name'], ['1001', 'Juan Dela Cruz']])
+        run_pending()
+
+        job = BackgroundJob.objects.get()
+        self.assertTrue(os.path.isfile(job.input_file.path))
+        self.assertTrue(job.input_file.path.startswith(os.path.abspath(self.job_files_root)))
+        self.assertEqual(os.listdir(self.media_root), [])
+
+        self.assertEqual(prune_job_files(), 0)
+        BackgroundJob.objects.filter(pk=job.pk).update(finished_at=timezone.now() - timedelta(days=8))
+        path = job.input_file.path
+        self.assertEqual(prune_job_files(), 1)
+
+        self.assertFalse(os.path.exists(path))
+        self.assertFalse(BackgroundJob.objects.get(pk=job.pk).input_file)
+
+    def test_status_is_private_to_the_job_owner(self):
+        job = BackgroundJob.objects.create(kind='overtime.import_employees', created_by=self.admin)
+        other = Users.objects.create(username='other', name='Other')
+        self.client.force_login(other)
+
+        response = self.client.get(reverse('job_status', args=[job.id]))
+        self.assertEqual(response.status_code, 404)
+
+
+class SupervisionCacheTests(TestCase):
+    """Supervised user sets are cached per approver and dropped when an admin edits approvers."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = Users.objects.create(username='admin', name='Admin', is_admin=True)
+        cls.supervisor = Users.objects.create(username='supervisor', name='Supervisor', overtime_supervisor=True)
+        cls.requestor = Users.objects.create(username='requestor', name='Requestor', overtime_requestor=True)
+        cls.line = Line.objects.create(line_name='Line 1')
+
+    def setUp(self):
+        cache.clear()
+        UserApprovers.objects.create(user=self.requestor, approver=self.supervisor, module='Overtime', approver_role='Checker')
+
+    def test_edit_user_drops_cached_sets(self):
+        self.assertEqual(supervised_user_ids(self.supervisor, 'Overtime', 'Checker'), {self.requestor.id})
+        with self.assertNumQueries(0):
+            supervised_user_ids(self.supervisor, 'Overtime', 'Checker')
+
+        self.client.force_login(self.admin)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse('edit', args=[self.requestor.id]), {
+                'id_number': '1', 'name': 'Requestor', 'position': 'Clerk', 'username': 'requestor',
+                'line': self.line.id, 'approver_module[]': ['Manhours'], 'approver_role[]': ['Approver'],
+                'approver_user[]': [self.supervisor.id],
+            })
+
+        self.assertEqual(supervised_user_ids(self.supervisor, 'Overtime', 'Checker'), frozenset())
+        self.assertEqual(supervised_user_ids(self.supervisor, 'Manhours'), {self.requestor.id})
+
+    def test_access_check_does_not_trust_a_stale_cached_set(self):
+        self.assertEqual(supervised_user_ids(self.supervisor, 'Overtime', 'Checker'), {self.requestor.id})
+        counter = cache.get(version_key('portalusers.userapprovers'))
+
+        # Removed without moving the version counter, as a bulk write that skipped invalidate_supervision()
+        UserApprovers.objects.filter(approver=self.supervisor).delete()
+        cache.set(version_key('portalusers.userapprovers'), counter, timeout=None)
+        self.assertEqual(supervised_user_ids(self.supervisor, 'Overtime', 'Checker'), {self.requestor.id})
+
+        self.client.force_login(self.supervisor)
+        response = self.client.get(reverse('get-requestor-analytics', args=[self.requestor.id]))
+        self.assertEqual(response.status_code, 403)
+
+    def test_large_sets_are_filtered_with_a_subquery(self):
+        expected = {self.requestor.id, self.supervisor.id}
+        inline = supervised_filter('id', self.supervisor, 'Overtime', 'Checker', include_self=True)
+        with mock.patch('portalusers.supervision.INLINE_ID_LIMIT', 0):
+            subquery = supervised_filter('id', self.supervisor, 'Overtime', 'Checker', include_self=True)
+
+        self.assertEqual(set(Users.objects.filter(inline).values_list('id', flat=True)), expected)
+        self.assertEqual(set(Users.objects.filter(subquery).values_list('id', flat=True)), expected)
+
+
+class AggregateCacheTests(TestCase):
+    """Writes invalidate cached aggregates again when they commit, so nothing read before the commit is kept."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.supervisor = Users.objects.create(username='supervisor', name='Supervisor')
+        cls.requestor = Users.objects.create(username='requestor', name='Requestor')
+
+    def setUp(self):
+        cache.clear()
+        # What another connection sees: the old rows until the write commits
+        self.visible = {'links': 0}
+        self.request = RequestFactory().get('/links/')
+
+    def view(self, request):
+        return JsonResponse(dict(self.visible))
+
+    def test_aggregate_read_before_commit_is_not_kept(self):
+        view = cached_aggregate('test', ['portalusers.userapprovers'], scope='global')(self.view)
+        with self.captureOnCommitCallbacks(execute=True):
+            UserApprovers.objects.create(user=self.requestor, approver=self.supervisor, module='Overtime')
+            self.assertEqual(json.loads(view(self.request).content), {'links': 0})
+            self.visible['links'] = 1
+
+        self.assertEqual(json.loads(view(self.request).content), {'links': 1})
+
+    def test_etag_handed_out_before_commit_is_not_kept(self):
+        view = conditional_etag(['portalusers.userapprovers'], scope='global')(self.view)
+        with self.captureOnCommitCallbacks(execute=True):
+            UserApprovers.objects.create(user=self.requestor, approver=self.supervisor, module='Overtime')
+            stale = view(self.request)
+            self.visible['links'] = 1
+
+        request = RequestFactory().get('/links/', HTTP_IF_NONE_MATCH=stale['ETag'])
+        response = view(request)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content), {'links': 1})
 
-# Create your tests here.
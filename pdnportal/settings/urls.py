@@ -16,4 +16,8 @@ urlpatterns = [
     # Toggle user status
     path('toggle-status/<int:user_id>/', views.toggle_user_status, name='toggle_status'),
     path('get-potential-approvers/', views.get_potential_approvers, name='get_potential_approvers'),
+
+    # Background jobs
+    path('jobs/<int:job_id>/', views.job_status, name='job_status'),
+    path('jobs/<int:job_id>/download/', views.job_download, name='job_download'),
 ]
@@ -1,10 +1,13 @@
+import os
 from django.shortcuts import render, redirect, get_object_or_404
-from django.http import JsonResponse
+from django.http import JsonResponse, FileResponse, Http404
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.core.paginator import Paginator
 from django.contrib import messages
 from portalusers.models import Users, UserApprovers
-from settings.models import Line
+from portalusers.supervision import invalidate_supervision
+from settings.models import Line, BackgroundJob
+from django.urls import reverse
 from django.views.decorators.http import require_http_methods
 
 def is_admin(user):
@@ -150,14 +153,13 @@ def create_user(request):
             approver_roles = request.POST.getlist('approver_role[]')
             approver_users = request.POST.getlist('approver_user[]')
 
-            for i in range(len(approver_modules)):
-                if i < len(approver_roles) and i < len(approver_users) and approver_modules[i] and approver_roles[i] and approver_users[i]:
-                    UserApprovers.objects.create(
-                        user=user,
-                        module=approver_modules[i],
-                        approver_role=approver_roles[i],
-                        approver_id=approver_users[i]
-                    )
+            UserApprovers.objects.bulk_create([
+                UserApprovers(user=user, module=module, approver_role=role, approver_id=approver_id)
+                for module, role, approver_id in zip(approver_modules, approver_roles, approver_users)
+                if module and role and approver_id
+            ])
+            # bulk_create sends no signals, drop the cached supervision sets explicitly
+            invalidate_supervision()
 
             messages.success(request, 'User created successfully')
             return redirect('account_settings')
@@ -301,14 +303,13 @@ def edit_user(request, user_id):
             approver_roles = request.POST.getlist('approver_role[]')
             approver_users = request.POST.getlist('approver_user[]')
 
-            for i in range(len(approver_modules)):
-                if i < len(approver_roles) and i < len(approver_users) and approver_modules[i] and approver_roles[i] and approver_users[i]:
-                    UserApprovers.objects.create(
-                        user=user,
-                        module=approver_modules[i],
-                        approver_role=approver_roles[i],
-                        approver_id=approver_users[i]
-                    )
+            UserApprovers.objects.bulk_create([
+                UserApprovers(user=user, module=module, approver_role=role, approver_id=approver_id)
+                for module, role, approver_id in zip(approver_modules, approver_roles, approver_users)
+                if module and role and approver_id
+            ])
+            # bulk_create sends no signals, drop the cached supervision sets explicitly
+            invalidate_supervision()
 
             messages.success(request, 'User updated successfully')
             return redirect('account_settings')
@@ -475,4 +476,44 @@ def get_potential_approvers(request):
         is_active=True
     ).values('id', 'name', 'position')
     approvers_list = list(approvers)
-    return JsonResponse(approvers_list, safe=False)
\ No newline at end of file
+    return JsonResponse(approvers_list, safe=False)
+
+
+def get_user_job(request, job_id):
+    job = get_object_or_404(BackgroundJob, id=job_id)
+    if job.created_by_id != request.user.id and not request.user.is_admin:
+        raise Http404
+    return job
+
+@login_required(login_url="user-login")
+@require_http_methods(["GET"])
+def job_status(request, job_id):
+    """Progress of a background import or export, polled by static/js/background-jobs.js"""
+    job = get_user_job(request, job_id)
+
+    return JsonResponse({
+        'id': job.id,
+        'kind': job.kind,
+        'status': job.status,
+        'finished': job.is_finished,
+        'progress': job.progress,
+        'total': job.total,
+        'percent': job.percent,
+        'message': job.message,
+        'result': job.result,
+        'error': job.error,
+        'download_url': reverse('job_download', args=[job.id]) if job.result_file else None,
+        'created_at': job.created_at.isoformat(),
+        'started_at': job.started_at.isoformat() if job.started_at else None,
+        'finished_at': job.finished_at.isoformat() if job.finished_at else None,
+    })
+
+@login_required(login_url="user-login")
+@require_http_methods(["GET"])
+def job_download(request, job_id):
+    job = get_user_job(request, job_id)
+    if job.status != 'Succeeded' or not job.result_file:
+        raise Http404
+
+    return FileResponse(job.result_file.open('rb'), as_attachment=True,
+                        filename=os.path.basename(job.result_file.name))
@@ -0,0 +1,44 @@
+/**
+ * Polling for background jobs.
+ *
+ * Views that queue an import or export answer 202 with a status_url
+ * (see settings/background.py). waitForJob() polls it until the job has
+ * finished, passing each intermediate status to onProgress, and resolves
+ * with the final status or rejects with the job's error message.
+ */
+(function() {
+    function waitForJob(statusUrl, options = {}) {
+        const interval = options.interval || 1500;
+        const onProgress = options.onProgress || function() {};
+
+        return new Promise((resolve, reject) => {
+            function poll() {
+                fetch(statusUrl, {
+                    headers: { 'X-Requested-With': 'XMLHttpRequest' },
+                    cache: 'no-store'
+                })
+                .then(response => {
+                    if (!response.ok) {
+                        throw new Error(`Job status request failed with status: ${response.status}`);
+                    }
+                    return response.json();
+                })
+                .then(job => {
+                    if (!job.finished) {
+                        onProgress(job);
+                        setTimeout(poll, interval);
+                    } else if (job.status === 'Succeeded') {
+                        resolve(job);
+                    } else {
+                        reject(new Error(job.error || 'Background job failed'));
+                    }
+                })
+                .catch(reject);
+            }
+
+            poll();
+        });
+    }
+
+    window.waitForJob = waitForJob;
+})();
@@ -0,0 +1,50 @@
+/**
+ * Conditional fetch for polled JSON endpoints.
+ *
+ * Remembers the ETag and body of the last successful GET per URL and sends
+ * it back as If-None-Match. When the server answers 304 Not Modified the
+ * stored body is returned as a normal 200 response, so callers can keep
+ * using response.ok / response.json() unchanged.
+ */
+(function() {
+    const validators = new Map();
+
+    function conditionalFetch(url, options = {}) {
+        const method = (options.method || 'GET').toUpperCase();
+        if (method !== 'GET') {
+            return fetch(url, options);
+        }
+
+        const key = typeof url === 'string' ? url : url.toString();
+        const cached = validators.get(key);
+        const headers = new Headers(options.headers || {});
+        if (cached) {
+            headers.set('If-None-Match', cached.etag);
+        }
+
+        return fetch(url, { ...options, headers, cache: 'no-store' }).then(response => {
+            if (response.status === 304 && cached) {
+                return new Response(cached.body, {
+                    status: 200,
+                    statusText: 'OK',
+                    headers: { 'Content-Type': cached.contentType }
+                });
+            }
+
+            const etag = response.headers.get('ETag');
+            if (response.ok && etag) {
+                return response.clone().text().then(body => {
+                    validators.set(key, {
+                        etag: etag,
+                        body: body,
+                        contentType: response.headers.get('Content-Type') || 'application/json'
+                    });
+                    return response;
+                });
+            }
+            return response;
+        });
+    }
+
+    window.conditionalFetch = conditionalFetch;
+})();
@@ -546,7 +546,7 @@ function initializeApproverChart() {
         }
 
         // Fetch stats for selected period
-        fetch(`/dcf/api/stats/chart/?period=${period}`, {
+        conditionalFetch(`/dcf/api/stats/chart/?period=${period}`, {
             headers: {
                 'X-Requested-With': 'XMLHttpRequest',
                 'X-CSRFToken': document.querySelector('input[name="csrfmiddlewaretoken"]').value
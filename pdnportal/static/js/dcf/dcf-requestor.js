@@ -640,7 +640,7 @@ function initializeChart() {
         chart.update();
 
         // Fetch data from the server
-        fetch(`/dcf/api/stats/chart/?period=${period}&user_only=true`, {
+        conditionalFetch(`/dcf/api/stats/chart/?period=${period}&user_only=true`, {
             headers: {
                 'X-Requested-With': 'XMLHttpRequest',
                 'X-CSRFToken': document.querySelector('input[name="csrfmiddlewaretoken"]').value
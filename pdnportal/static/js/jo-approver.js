@@ -352,38 +352,29 @@ function setupModalFunctionality() {
 }
 
 // Setup search functionality
+// Search, filter and paging run on the server, each change reloads the history table with the new query
 function setupSearch() {
     const searchInput = document.querySelector('.JO-search-input');
     const searchButton = document.querySelector('.JO-search-button');
     const filterSelect = document.querySelector('.JO-filter-select');
 
     if (searchInput) {
-        // Add input event listener to search as you type
+        // Search once the user stops typing
         let typingTimer;
-        const doneTypingInterval = 300; // Wait for 300ms after user stops typing
-        let previousValue = searchInput.value;
+        const doneTypingInterval = 600; // Wait for 600ms after user stops typing
 
         searchInput.addEventListener('input', function() {
             clearTimeout(typingTimer);
 
-            // If the search field was cleared (previous value had content but now it's empty)
-            // immediately filter the table to show all results
-            if (previousValue && this.value === '') {
+            // If the search field was cleared, immediately show all results
+            if (this.value === '') {
                 filterTable();
-                previousValue = '';
                 return;
             }
 
-            // Otherwise, use the typing timer for normal search behavior
-            previousValue = this.value;
             typingTimer = setTimeout(filterTable, doneTypingInterval);
         });
 
-        // Clear the timer if user continues typing
-        searchInput.addEventListener('keydown', function() {
-            clearTimeout(typingTimer);
-        });
-
         // Also handle Enter key for immediate search
         searchInput.addEventListener('keypress', function(e) {
             if (e.key === 'Enter') {
@@ -397,6 +388,7 @@ function setupSearch() {
         if (searchButton) {
             searchButton.addEventListener('click', function(e) {
                 e.preventDefault(); // Prevent default form submission
+                clearTimeout(typingTimer);
                 filterTable();
             });
         }
@@ -411,313 +403,52 @@ function setupSearch() {
 
     // Initialize pagination
     initializePagination();
-
-    // Check if there are URL parameters and update the UI
-    const urlParams = new URLSearchParams(window.location.search);
-    const searchQuery = urlParams.get('search');
-    const filterValue = urlParams.get('filter');
-
-    if (searchInput && searchQuery) {
-        searchInput.value = searchQuery;
-        previousValue = searchQuery;
-        // Apply the search filter
-        setTimeout(filterTable, 100);
-    }
-
-    if (filterSelect && filterValue) {
-        filterSelect.value = filterValue;
-        // Apply the filter
-        if (!searchQuery) {
-            setTimeout(filterTable, 100);
-        }
-    }
 }
 
-// Pagination variables
-let currentPage = 1;
-let rowsPerPage = 10;
-let filteredRows = [];
-let filteredPendingItems = [];
-
 /**
  * Initialize pagination functionality
  */
 function initializePagination() {
-    // Get all table rows
-    const tableRows = document.querySelectorAll('.JO-table tbody tr:not(.JO-empty-row)');
-    filteredRows = Array.from(tableRows);
-
-    // Get all pending items
-    const pendingItems = document.querySelectorAll('.AD-priority-item');
-    filteredPendingItems = Array.from(pendingItems);
-
-    // Update pagination display
-    updatePagination();
-
-    // Add event listeners to pagination buttons
-    const prevPageBtn = document.querySelector('.JO-pagination-btn:first-child');
-    const nextPageBtn = document.querySelector('.JO-pagination-btn:last-child');
-
-    if (prevPageBtn) {
-        prevPageBtn.addEventListener('click', function() {
-            if (!this.classList.contains('disabled') && currentPage > 1) {
-                currentPage--;
-                updatePagination();
-            }
-        });
-    }
-
-    if (nextPageBtn) {
-        nextPageBtn.addEventListener('click', function() {
-            const totalPages = Math.ceil(filteredRows.length / rowsPerPage);
-            if (!this.classList.contains('disabled') && currentPage < totalPages) {
-                currentPage++;
-                updatePagination();
-            }
+    document.querySelectorAll('.JO-pagination [data-page]').forEach(button => {
+        button.addEventListener('click', function(e) {
+            e.preventDefault();
+            navigateToPage(this.dataset.page);
         });
-    }
-}
-
-/**
- * Update pagination display and show appropriate rows
- */
-function updatePagination() {
-    const totalRows = filteredRows.length;
-    const totalPages = Math.ceil(totalRows / rowsPerPage);
-
-    // Get pagination container
-    const paginationContainer = document.querySelector('.JO-pagination');
-
-    // Show/hide pagination container based on whether we have results
-    if (paginationContainer) {
-        paginationContainer.style.display = totalRows > 0 ? '' : 'none';
-    }
-
-    // Update showing info
-    const paginationInfo = document.querySelector('.JO-pagination-info');
-    if (paginationInfo) {
-        const start = totalRows === 0 ? 0 : (currentPage - 1) * rowsPerPage + 1;
-        const end = Math.min(currentPage * rowsPerPage, totalRows);
-        paginationInfo.innerHTML = `Showing ${start} to ${end} of ${totalRows} entries`;
-    }
-
-    // Update pagination buttons state
-    const prevBtn = document.querySelector('.JO-pagination-btn:first-child');
-    const nextBtn = document.querySelector('.JO-pagination-btn:last-child');
-
-    if (prevBtn) {
-        prevBtn.classList.toggle('disabled', currentPage === 1);
-    }
-
-    if (nextBtn) {
-        nextBtn.classList.toggle('disabled', currentPage === totalPages || totalPages === 0);
-    }
-
-    // Generate page numbers
-    const paginationPages = document.querySelector('.JO-pagination-pages');
-    if (paginationPages) {
-        paginationPages.innerHTML = '';
-
-        if (totalPages > 0) {
-            // First page
-            if (currentPage > 1) {
-                const firstPageBtn = document.createElement('a');
-                firstPageBtn.href = 'javascript:void(0);';
-                firstPageBtn.className = 'JO-pagination-page';
-                firstPageBtn.textContent = '1';
-                firstPageBtn.addEventListener('click', function() {
-                    currentPage = 1;
-                    updatePagination();
-                });
-                paginationPages.appendChild(firstPageBtn);
-
-                // Ellipsis if needed
-                if (currentPage > 3) {
-                    const ellipsis = document.createElement('span');
-                    ellipsis.className = 'JO-pagination-ellipsis';
-                    ellipsis.textContent = '...';
-                    paginationPages.appendChild(ellipsis);
-                }
-            }
-
-            // Previous page
-            if (currentPage > 1) {
-                const prevPageBtn = document.createElement('a');
-                prevPageBtn.href = 'javascript:void(0);';
-                prevPageBtn.className = 'JO-pagination-page';
-                prevPageBtn.textContent = currentPage - 1;
-                prevPageBtn.addEventListener('click', function() {
-                    currentPage--;
-                    updatePagination();
-                });
-                paginationPages.appendChild(prevPageBtn);
-            }
-
-            // Current page
-            const currentPageBtn = document.createElement('a');
-            currentPageBtn.href = 'javascript:void(0);';
-            currentPageBtn.className = 'JO-pagination-page active';
-            currentPageBtn.textContent = currentPage;
-            paginationPages.appendChild(currentPageBtn);
-
-            // Next page
-            if (currentPage < totalPages) {
-                const nextPageBtn = document.createElement('a');
-                nextPageBtn.href = 'javascript:void(0);';
-                nextPageBtn.className = 'JO-pagination-page';
-                nextPageBtn.textContent = currentPage + 1;
-                nextPageBtn.addEventListener('click', function() {
-                    currentPage++;
-                    updatePagination();
-                });
-                paginationPages.appendChild(nextPageBtn);
-            }
-
-            // Ellipsis if needed
-            if (currentPage < totalPages - 2) {
-                const ellipsis = document.createElement('span');
-                ellipsis.className = 'JO-pagination-ellipsis';
-                ellipsis.textContent = '...';
-                paginationPages.appendChild(ellipsis);
-            }
-
-            // Last page
-            if (currentPage < totalPages) {
-                const lastPageBtn = document.createElement('a');
-                lastPageBtn.href = 'javascript:void(0);';
-                lastPageBtn.className = 'JO-pagination-page';
-                lastPageBtn.textContent = totalPages;
-                lastPageBtn.addEventListener('click', function() {
-                    currentPage = totalPages;
-                    updatePagination();
-                });
-                paginationPages.appendChild(lastPageBtn);
-            }
-        }
-    }
-
-    // Show/hide rows based on current page
-    showPageRows();
+    });
 }
 
 /**
- * Show rows for the current page
+ * Reload the page with the given search, filter and page number
  */
-function showPageRows() {
-    // Hide all rows first
-    const allRows = document.querySelectorAll('.JO-table tbody tr');
-    allRows.forEach(row => {
-        row.style.display = 'none';
-    });
-
-    // Remove any existing no results row
-    const existingNoResultsRow = document.querySelector('.JO-empty-row');
-    if (existingNoResultsRow) {
-        existingNoResultsRow.remove();
+function loadHistoryPage(searchText, filterValue, pageNumber) {
+    const params = new URLSearchParams();
+    if (searchText) {
+        params.set('search', searchText);
     }
-
-    // Get the table container
-    const tableContainer = document.querySelector('.JO-table-container');
-
-    // Show no results message if no filtered rows
-    if (filteredRows.length === 0) {
-        // Remove overflow-y when showing no results message
-        if (tableContainer) {
-            tableContainer.style.overflowY = 'visible';
-        }
-
-        // Create no results message
-        const tbody = document.querySelector('.JO-table tbody');
-        if (tbody) {
-            const noResultsRow = document.createElement('tr');
-            noResultsRow.className = 'JO-empty-row';
-            noResultsRow.innerHTML = `
-                <td colspan="8">
-                    <div class="JO-no-results">
-                        <div class="JO-no-results-icon">
-                            <i class="fas fa-search"></i>
-                        </div>
-                        <p class="JO-no-results-message">No matching Job Order requests found</p>
-                        <p class="JO-no-results-hint">Try adjusting your search criteria</p>
-                    </div>
-                </td>
-            `;
-            tbody.appendChild(noResultsRow);
-        }
-        return;
+    if (filterValue && filterValue !== 'all') {
+        params.set('filter', filterValue);
     }
-
-    // Restore overflow-y when showing results
-    if (tableContainer) {
-        tableContainer.style.overflowY = 'auto';
+    if (pageNumber && String(pageNumber) !== '1') {
+        params.set('page', pageNumber);
     }
 
-    // Calculate start and end indices for current page
-    const startIndex = (currentPage - 1) * rowsPerPage;
-    const endIndex = Math.min(startIndex + rowsPerPage, filteredRows.length);
-
-    // Show rows for current page
-    for (let i = startIndex; i < endIndex; i++) {
-        const row = filteredRows[i];
-        row.style.display = '';
+    const query = params.toString();
+    if (query !== window.location.search.replace(/^\?/, '')) {
+        window.location.search = query;
     }
 }
 
 /**
- * Filter table based on search text and filter value
+ * Filter table based on search text and filter value, starting again from the first page
  */
 function filterTable() {
     const searchInput = document.querySelector('.JO-search-input');
     const filterSelect = document.querySelector('.JO-filter-select');
 
-    const searchText = searchInput ? searchInput.value.trim().toLowerCase() : '';
+    const searchText = searchInput ? searchInput.value.trim() : '';
     const filterValue = filterSelect ? filterSelect.value : 'all';
 
-    // Filter table rows (only affects the "All Job Order Requests" table)
-    const allRows = document.querySelectorAll('.JO-table tbody tr:not(.JO-empty-row)');
-    filteredRows = Array.from(allRows).filter(row => {
-        const text = row.textContent.toLowerCase();
-        const matchesSearch = searchText === '' || text.includes(searchText);
-
-        const categoryCell = row.querySelector('.JO-category-pill');
-        const matchesFilter = filterValue === 'all' ||
-                             (categoryCell && categoryCell.classList.contains(`JO-category-${filterValue.toLowerCase()}`));
-
-        return matchesSearch && matchesFilter;
-    });
-
-    // Do NOT filter the "Action Required" section
-    // Make sure all pending items are visible regardless of search/filter
-    const allPendingItems = document.querySelectorAll('.AD-priority-item');
-    filteredPendingItems = Array.from(allPendingItems);
-
-    // Make sure all pending items are visible
-    allPendingItems.forEach(item => {
-        item.style.display = '';
-    });
-
-    // Show the "All caught up!" message if there are no pending items
-    const pendingList = document.getElementById('priority-list');
-    const noPendingRequests = document.querySelector('.AD-no-requests');
-
-    if (pendingList) {
-        // Remove any existing no results message that might have been added previously
-        const existingNoResults = pendingList.querySelector('.AD-no-requests.search-no-results');
-        if (existingNoResults) {
-            existingNoResults.remove();
-        }
-
-        // Show original "All caught up!" message if there are no pending items at all
-        if (allPendingItems.length === 0 && noPendingRequests) {
-            noPendingRequests.style.display = '';
-        }
-    }
-
-    // Reset to first page for the table pagination
-    currentPage = 1;
-
-    // Update pagination for the table
-    updatePagination();
+    loadHistoryPage(searchText, filterValue, 1);
 }
 
 // Perform search with the current search and filter values (for backward compatibility)
@@ -725,10 +456,10 @@ function performSearch() {
     filterTable();
 }
 
-// Navigate to a specific page (for backward compatibility)
+// Navigate to a specific page, keeping the current search and filter
 function navigateToPage(pageNumber) {
-    currentPage = pageNumber;
-    updatePagination();
+    const urlParams = new URLSearchParams(window.location.search);
+    loadHistoryPage(urlParams.get('search') || '', urlParams.get('filter') || 'all', pageNumber);
 }
 
 // Open Job Order Details Modal
@@ -214,11 +214,13 @@ function setupModalCloseEvents() {
 
 // Setup table search and filters
 function setupTableSearch() {
-    // Table search functionality
+    // Table search functionality, searched on the server once typing pauses
     const searchInput = document.querySelector('.JO-search-input');
+    let searchTimer = null;
     if (searchInput) {
         searchInput.addEventListener('input', function() {
-            filterWorkloadTable();
+            clearTimeout(searchTimer);
+            searchTimer = setTimeout(filterWorkloadTable, 300);
         });
     }
 
@@ -231,105 +233,11 @@ function setupTableSearch() {
     }
 }
 
-// Filter workload table based on search and category filter
+// Filter workload table based on search and category filter, starting again from the first page
 function filterWorkloadTable() {
-    const searchInput = document.querySelector('.JO-search-input');
-    const categoryFilter = document.querySelector('.JO-priority-filter');
-
-    const searchTerm = searchInput ? searchInput.value.trim().toLowerCase() : '';
-    const categoryValue = categoryFilter ? categoryFilter.value : 'all';
-
-    // Get all rows from the table
-    const tableRows = document.querySelectorAll('#workload-table-body tr');
-    let visibleCount = 0;
-
-    // Filter the rows
-    tableRows.forEach(row => {
-        // Skip empty table message rows
-        if (row.querySelector('.JO-empty-table') || row.querySelector('.JO-no-results')) {
-            return;
-        }
-
-        const joNumber = row.querySelector('[data-label="JO Number"]')?.textContent.trim().toLowerCase() || '';
-        const tools = row.querySelector('[data-label="Tool"]')?.textContent.trim().toLowerCase() || '';
-        const requestor = row.querySelector('[data-label="Requestor"]')?.textContent.trim().toLowerCase() || '';
-        const status = row.querySelector('[data-label="Status"] .JO-status')?.textContent.trim().toLowerCase() || '';
-        const targetDate = row.querySelector('[data-label="Target Date"] span')?.textContent.trim().toLowerCase() || '';
-        const category = row.getAttribute('data-jo-category') || '';
-
-        // Category filter
-        const matchesCategory = categoryValue === 'all' || category === categoryValue;
-
-        // Search term filter
-        const matchesSearch =
-            joNumber.includes(searchTerm) ||
-            tools.includes(searchTerm) ||
-            requestor.includes(searchTerm) ||
-            status.includes(searchTerm) ||
-            targetDate.includes(searchTerm);
-
-        // Show or hide the row
-        if (matchesCategory && matchesSearch) {
-            row.style.display = '';
-            visibleCount++;
-        } else {
-            row.style.display = 'none';
-        }
-    });
-
-    // Show "No matching Job Order requests found" message if no visible rows
-    const tableBody = document.getElementById('workload-table-body');
-    const tableContainer = document.querySelector('.JO-table-container');
-    const paginationContainer = document.getElementById('workload-pagination');
-
-    if (visibleCount === 0 && tableBody) {
-        // Check if the message already exists
-        if (!tableBody.querySelector('.JO-no-results')) {
-            const noResultsRow = document.createElement('tr');
-            noResultsRow.className = 'JO-no-results-row';
-            noResultsRow.innerHTML = `
-                <td colspan="7">
-                    <div class="JO-no-results">
-                        <div class="JO-no-results-icon">
-                            <i class="fas fa-search"></i>
-                        </div>
-                        <p class="JO-no-results-message">No matching Job Order requests found</p>
-                        <p class="JO-no-results-suggestion">Try adjusting your search criteria</p>
-                    </div>
-                </td>
-            `;
-            tableBody.appendChild(noResultsRow);
-
-            // Remove overflow-y when no results
-            if (tableContainer) {
-                tableContainer.style.overflowY = 'hidden';
-            }
-
-            // Hide pagination when no results
-            if (paginationContainer) {
-                paginationContainer.style.display = 'none';
-            }
-        }
-    } else {
-        // Remove the message if it exists
-        const noResultsRow = tableBody?.querySelector('.JO-no-results-row');
-        if (noResultsRow) {
-            noResultsRow.remove();
-        }
-
-        // Restore overflow-y when there are results
-        if (tableContainer) {
-            tableContainer.style.overflowY = 'auto';
-        }
-
-        // Show pagination when there are results
-        if (paginationContainer) {
-            paginationContainer.style.display = '';
-        }
-    }
-
-    // Update pagination
-    updatePaginationInfo(visibleCount);
+    currentPage = 1;
+    workloadCursors = [null];
+    loadWorkloadData(null);
 }
 
 // Function to initialize the maintenance trends chart
@@ -1916,49 +1824,21 @@ function generateTimelineItems(routingData, joStatus) {
 }
 
 // WORKLOAD TABLE PAGINATION FUNCTIONS
-function initializeWorkloadTable() {
-    // Get all rows from the table
-    const tableRows = document.querySelectorAll('#workload-table-body tr');
-    let totalRows = 0;
-
-    // Count rows (excluding empty table message rows)
-    tableRows.forEach(row => {
-        if (!row.querySelector('.JO-empty-table') && !row.querySelector('.JO-no-results')) {
-            totalRows++;
-
-            // Add data attributes for easier filtering if they don't exist
-            if (!row.hasAttribute('data-jo-category')) {
-                const categoryElement = row.querySelector('[data-label="Category"] .JO-category-pill');
-                if (categoryElement) {
-                    const categoryClass = categoryElement.className.match(/JO-category-([a-z]+)/);
-                    if (categoryClass && categoryClass[1]) {
-                        row.setAttribute('data-jo-category', categoryClass[1]);
-                    }
-                }
-            }
-        }
-    });
+// The table is paged on the server with keyset cursors. The first page is rendered with the
+// page, later pages come from the maintenance job orders API. A cursor can only move forward,
+// so the cursor of every visited page is kept for the Previous button.
+let workloadCursors = [null];
+let nextWorkloadCursor = null;
 
-    // Check if there are any rows and adjust overflow-y and pagination accordingly
-    const tableContainer = document.querySelector('.JO-table-container');
-    const paginationContainer = document.getElementById('workload-pagination');
+function initializeWorkloadTable() {
+    const pagination = document.getElementById('workload-pagination');
+    if (!pagination || pagination.dataset.initialized) return;
+    pagination.dataset.initialized = 'true';
 
-    if (totalRows === 0 && tableContainer) {
-        tableContainer.style.overflowY = 'hidden';
-        if (paginationContainer) {
-            paginationContainer.style.display = 'none';
-        }
-    } else if (tableContainer) {
-        tableContainer.style.overflowY = 'auto';
-        if (paginationContainer) {
-            paginationContainer.style.display = '';
-        }
-    }
+    itemsPerPage = parseInt(pagination.dataset.pageSize || itemsPerPage, 10);
+    totalItems = parseInt(pagination.dataset.total || '0', 10);
+    nextWorkloadCursor = pagination.dataset.nextCursor || null;
 
-    // Update pagination info
-    updatePaginationInfo(totalRows);
-
-    // Set up pagination controls
     const prevButton = document.getElementById('pagination-prev');
     const nextButton = document.getElementById('pagination-next');
 
@@ -1966,115 +1846,25 @@ function initializeWorkloadTable() {
         prevButton.addEventListener('click', function() {
             if (currentPage > 1) {
                 currentPage--;
-                paginateTable();
-                updatePaginationControls();
+                loadWorkloadData(workloadCursors[currentPage - 1]);
             }
         });
     }
 
     if (nextButton) {
         nextButton.addEventListener('click', function() {
-            const visibleRows = getVisibleRowCount();
-            const totalPages = Math.ceil(visibleRows / itemsPerPage);
-            if (currentPage < totalPages) {
+            if (nextWorkloadCursor) {
                 currentPage++;
-                paginateTable();
-                updatePaginationControls();
+                workloadCursors[currentPage - 1] = nextWorkloadCursor;
+                loadWorkloadData(nextWorkloadCursor);
             }
         });
     }
 
-    // Initial pagination
-    paginateTable();
     updatePaginationControls();
 }
 
-// Function to get the count of visible rows
-function getVisibleRowCount() {
-    const tableRows = document.querySelectorAll('#workload-table-body tr');
-    let visibleCount = 0;
-
-    tableRows.forEach(row => {
-        if (!row.querySelector('.JO-empty-table') &&
-            !row.querySelector('.JO-no-results') &&
-            row.style.display !== 'none') {
-            visibleCount++;
-        }
-    });
-
-    return visibleCount;
-}
-
-// Function to update pagination info
-function updatePaginationInfo(totalRows) {
-    const paginationStart = document.getElementById('pagination-start');
-    const paginationEnd = document.getElementById('pagination-end');
-    const paginationTotal = document.getElementById('pagination-total');
-
-    if (paginationTotal) paginationTotal.textContent = totalRows;
-
-    // Calculate start and end based on current page
-    const startIndex = (currentPage - 1) * itemsPerPage + 1;
-    const endIndex = Math.min(startIndex + itemsPerPage - 1, totalRows);
-
-    if (paginationStart) paginationStart.textContent = totalRows > 0 ? startIndex : 0;
-    if (paginationEnd) paginationEnd.textContent = endIndex;
-}
-
-// Function to paginate the table
-function paginateTable() {
-    const tableRows = document.querySelectorAll('#workload-table-body tr');
-    let visibleRows = [];
-
-    // Get all visible rows (excluding message rows)
-    tableRows.forEach(row => {
-        if (!row.querySelector('.JO-empty-table') &&
-            !row.querySelector('.JO-no-results') &&
-            !row.classList.contains('JO-no-results-row') &&
-            row.style.display !== 'none') {
-            visibleRows.push(row);
-        }
-    });
-
-    // Calculate pagination
-    const startIndex = (currentPage - 1) * itemsPerPage;
-    const endIndex = Math.min(startIndex + itemsPerPage, visibleRows.length);
-
-    // Hide all rows first
-    visibleRows.forEach(row => {
-        row.classList.add('JO-hidden-row');
-        row.style.display = 'none';
-    });
-
-    // Show only rows for current page
-    for (let i = startIndex; i < endIndex; i++) {
-        if (visibleRows[i]) {
-            visibleRows[i].classList.remove('JO-hidden-row');
-            visibleRows[i].style.display = '';
-        }
-    }
-
-    // Check if there are any visible rows and adjust overflow-y and pagination accordingly
-    const tableContainer = document.querySelector('.JO-table-container');
-    const paginationContainer = document.getElementById('workload-pagination');
-
-    if (visibleRows.length === 0 && tableContainer) {
-        tableContainer.style.overflowY = 'hidden';
-        if (paginationContainer) {
-            paginationContainer.style.display = 'none';
-        }
-    } else if (tableContainer) {
-        tableContainer.style.overflowY = 'auto';
-        if (paginationContainer) {
-            paginationContainer.style.display = '';
-        }
-    }
-
-    // Update pagination info
-    updatePaginationInfo(visibleRows.length);
-}
-
-function loadWorkloadData() {
+function loadWorkloadData(cursor = workloadCursors[currentPage - 1]) {
     const tableBody = document.getElementById('workload-table-body');
     if (!tableBody) return;
 
@@ -2090,8 +1880,20 @@ function loadWorkloadData() {
         </tr>
     `;
 
+    const searchInput = document.querySelector('.JO-search-input');
+    const categoryFilter = document.querySelector('.JO-priority-filter');
+    const params = new URLSearchParams({
+        limit: itemsPerPage,
+        search: searchInput ? searchInput.value.trim() : '',
+        category: categoryFilter ? categoryFilter.value : 'all',
+        timestamp: Date.now()
+    });
+    if (cursor) {
+        params.set('cursor', cursor);
+    }
+
     // Fetch data from API
-    fetch('/joborder/api/maintenance/job-orders/?timestamp=' + Date.now(), {
+    fetch('/joborder/api/maintenance/job-orders/?' + params.toString(), {
         headers: {
             'X-Requested-With': 'XMLHttpRequest',
             'Accept': 'application/json'
@@ -2104,106 +1906,39 @@ function loadWorkloadData() {
         return response.json();
     })
     .then(data => {
-        // Clear existing data
-        allWorkloadData = [];
-
-        // Process the data
-        if (data.job_orders && data.job_orders.length > 0) {
-            data.job_orders.forEach(job => {
-                allWorkloadData.push({
-                    id: job.id,
-                    joNumber: job.jo_number,
-                    category: job.jo_color.toLowerCase(),
-                    tools: job.jo_tools,
-                    requestor: job.requestor || 'Unknown',
-                    targetDate: job.target_date || 'Not Set',
-                    status: job.status.toLowerCase(),
-                    isOverdue: job.is_overdue,
-                    hasPendingRouting: job.has_pending_routing
-                });
-            });
-        } else {
-            // If no data from API, try to extract from existing table rows
-            extractDataFromTable();
-        }
-
-        // Initialize filtered data
-        filteredWorkloadData = [...allWorkloadData];
-        totalItems = filteredWorkloadData.length;
+        allWorkloadData = (data.job_orders || []).map(job => ({
+            id: job.id,
+            joNumber: job.jo_number,
+            category: job.jo_color.toLowerCase(),
+            tools: job.jo_tools,
+            requestor: job.requestor || 'Unknown',
+            targetDate: job.target_date || 'Not Set',
+            status: job.status.toLowerCase(),
+            isOverdue: job.is_overdue,
+            hasPendingRouting: job.has_pending_routing
+        }));
+
+        filteredWorkloadData = allWorkloadData;
+        totalItems = data.total || 0;
+        nextWorkloadCursor = data.next_cursor || null;
 
-        // Render the table with pagination
         renderWorkloadTable();
         updatePaginationControls();
     })
     .catch(error => {
         console.error('Error fetching workload data:', error);
 
-        // Try to extract data from existing table as fallback
-        extractDataFromTable();
-
-        // Show error message if no data
-        if (allWorkloadData.length === 0) {
-            tableBody.innerHTML = `
-                <tr>
-                    <td colspan="7">
-                        <div class="JO-error">
-                            <i class="fas fa-exclamation-circle"></i>
-                            <p>Error loading job orders. Please try again later.</p>
-                        </div>
-                    </td>
-                </tr>
-            `;
-        }
-    });
-}
-
-// Extract data from existing table rows as fallback
-function extractDataFromTable() {
-    // Get all rows from the table
-    const tableRows = document.querySelectorAll('#workload-table-body tr');
-
-    // Clear existing data
-    allWorkloadData = [];
-
-    // Extract data from each row
-    tableRows.forEach(row => {
-        // Skip empty table message rows
-        if (row.querySelector('.JO-empty-table') || row.querySelector('.JO-no-results') || row.querySelector('.JO-loading')) {
-            return;
-        }
-
-        // Get data from the row
-        const joId = row.getAttribute('data-jo-id') || row.querySelector('.view-details-btn')?.dataset.id;
-        const joNumber = row.getAttribute('data-jo-number') || row.querySelector('[data-label="JO Number"]')?.textContent.trim();
-        const categoryElement = row.querySelector('[data-label="Category"] .JO-category-pill');
-        const category = row.getAttribute('data-jo-category') ||
-                        (categoryElement ? categoryElement.className.split('JO-category-')[1]?.split(' ')[0] : '');
-        const statusElement = row.querySelector('[data-label="Status"] .JO-status');
-        const status = row.getAttribute('data-jo-status') ||
-                      (statusElement ? statusElement.textContent.trim().toLowerCase() : '');
-
-        if (joId && joNumber) {
-            const tools = row.querySelector('[data-label="Tool"]')?.textContent.trim() || '';
-            const requestor = row.querySelector('[data-label="Requestor"]')?.textContent.trim() || '';
-            const targetDateElement = row.querySelector('[data-label="Target Date"] span');
-            const targetDate = targetDateElement ? targetDateElement.textContent.trim() : '';
-
-            allWorkloadData.push({
-                id: joId,
-                joNumber: joNumber,
-                category: category,
-                tools: tools,
-                requestor: requestor,
-                targetDate: targetDate,
-                status: status,
-                element: row.outerHTML
-            });
-        }
+        tableBody.innerHTML = `
+            <tr>
+                <td colspan="7">
+                    <div class="JO-error">
+                        <i class="fas fa-exclamation-circle"></i>
+                        <p>Error loading job orders. Please try again later.</p>
+                    </div>
+                </td>
+            </tr>
+        `;
     });
-
-    // Initialize filtered data
-    filteredWorkloadData = [...allWorkloadData];
-    totalItems = filteredWorkloadData.length;
 }
 
 function renderWorkloadTable() {
@@ -2231,13 +1966,12 @@ function renderWorkloadTable() {
         return;
     }
 
-    // Calculate pagination
+    // The server already returned a single page
     const startIndex = (currentPage - 1) * itemsPerPage;
-    const endIndex = Math.min(startIndex + itemsPerPage, filteredWorkloadData.length);
-    const pageData = filteredWorkloadData.slice(startIndex, endIndex);
+    const endIndex = startIndex + filteredWorkloadData.length;
 
     // Add rows to the table
-    pageData.forEach(job => {
+    filteredWorkloadData.forEach(job => {
         // Create a new row
         const row = document.createElement('tr');
         row.setAttribute('data-jo-id', job.id);
@@ -2357,7 +2091,7 @@ function renderWorkloadTable() {
 
     if (paginationStart) paginationStart.textContent = filteredWorkloadData.length > 0 ? startIndex + 1 : 0;
     if (paginationEnd) paginationEnd.textContent = endIndex;
-    if (paginationTotal) paginationTotal.textContent = filteredWorkloadData.length;
+    if (paginationTotal) paginationTotal.textContent = totalItems;
 }
 
 function updatePaginationControls() {
@@ -2367,94 +2101,23 @@ function updatePaginationControls() {
 
     if (!prevButton || !nextButton || !paginationNumbers) return;
 
-    // Calculate total pages based on visible rows
-    const visibleRows = getVisibleRowCount();
-    const totalPages = Math.ceil(visibleRows / itemsPerPage);
+    const totalPages = Math.max(1, Math.ceil(totalItems / itemsPerPage));
 
-    // Update prev/next buttons
     prevButton.disabled = currentPage <= 1;
-    nextButton.disabled = currentPage >= totalPages;
+    nextButton.disabled = !nextWorkloadCursor;
+    prevButton.classList.toggle('disabled', prevButton.disabled);
+    nextButton.classList.toggle('disabled', nextButton.disabled);
 
-    if (currentPage <= 1) {
-        prevButton.classList.add('disabled');
-    } else {
-        prevButton.classList.remove('disabled');
-    }
-
-    if (currentPage >= totalPages) {
-        nextButton.classList.add('disabled');
-    } else {
-        nextButton.classList.remove('disabled');
-    }
-
-    // Generate page numbers
+    // Keyset pages can only be stepped through, so show where we are instead of page links
     paginationNumbers.innerHTML = '';
+    const pageIndicator = document.createElement('div');
+    pageIndicator.className = 'JO-pagination-page active';
+    pageIndicator.textContent = `${currentPage} / ${totalPages}`;
+    paginationNumbers.appendChild(pageIndicator);
 
-    // Determine which page numbers to show
-    let startPage = Math.max(1, currentPage - 2);
-    let endPage = Math.min(totalPages, startPage + 4);
-
-    // Adjust if we're near the end
-    if (endPage - startPage < 4 && startPage > 1) {
-        startPage = Math.max(1, endPage - 4);
-    }
-
-    // Add first page button if not starting from page 1
-    if (startPage > 1) {
-        const firstPageButton = document.createElement('div');
-        firstPageButton.className = 'JO-pagination-page';
-        firstPageButton.textContent = '1';
-        firstPageButton.addEventListener('click', () => {
-            currentPage = 1;
-            paginateTable();
-            updatePaginationControls();
-        });
-        paginationNumbers.appendChild(firstPageButton);
-
-        // Add ellipsis if there's a gap
-        if (startPage > 2) {
-            const ellipsis = document.createElement('div');
-            ellipsis.className = 'JO-pagination-ellipsis';
-            ellipsis.textContent = '...';
-            paginationNumbers.appendChild(ellipsis);
-        }
-    }
-
-    // Add page number buttons
-    for (let i = startPage; i <= endPage; i++) {
-        const pageButton = document.createElement('div');
-        pageButton.className = 'JO-pagination-page';
-        if (i === currentPage) {
-            pageButton.classList.add('active');
-        }
-        pageButton.textContent = i;
-        pageButton.addEventListener('click', () => {
-            currentPage = i;
-            paginateTable();
-            updatePaginationControls();
-        });
-        paginationNumbers.appendChild(pageButton);
-    }
-
-    // Add last page button if not ending at the last page
-    if (endPage < totalPages) {
-        // Add ellipsis if there's a gap
-        if (endPage < totalPages - 1) {
-            const ellipsis = document.createElement('div');
-            ellipsis.className = 'JO-pagination-ellipsis';
-            ellipsis.textContent = '...';
-            paginationNumbers.appendChild(ellipsis);
-        }
-
-        const lastPageButton = document.createElement('div');
-        lastPageButton.className = 'JO-pagination-page';
-        lastPageButton.textContent = totalPages;
-        lastPageButton.addEventListener('click', () => {
-            currentPage = totalPages;
-            paginateTable();
-            updatePaginationControls();
-        });
-        paginationNumbers.appendChild(lastPageButton);
+    const paginationContainer = document.getElementById('workload-pagination');
+    if (paginationContainer) {
+        paginationContainer.style.display = totalItems > 0 ? '' : 'none';
     }
 }
 
@@ -75,7 +75,7 @@ function clearStatsRefresh() {
 }
 
 function refreshStats() {
-    fetch('/joborder/api/job-order/stats/', {
+    conditionalFetch('/joborder/api/job-order/stats/', {
         headers: {
             'X-Requested-With': 'XMLHttpRequest',
             'Accept': 'application/json',
@@ -618,7 +618,7 @@ function refreshTimeline(viewType = null) {
     }
 
     // Update the endpoint URL based on the view type
-    fetch(`/joborder/api/job-order/timeline/${viewType}/`, {
+    conditionalFetch(`/joborder/api/job-order/timeline/${viewType}/`, {
         headers: {
             'X-Requested-With': 'XMLHttpRequest',
             'Accept': 'application/json',
@@ -1371,7 +1371,7 @@ function refreshDeadlines() {
 
     const csrftoken = getCookie('csrftoken');
 
-    fetch('/joborder/api/job-order/deadlines/', {
+    conditionalFetch('/joborder/api/job-order/deadlines/', {
         method: 'GET',
         headers: {
             'X-Requested-With': 'XMLHttpRequest',
@@ -1611,7 +1611,7 @@ function refreshAlerts() {
 
     const csrftoken = getCookie('csrftoken');
 
-    fetch('/joborder/api/job-order/alerts/', {
+    conditionalFetch('/joborder/api/job-order/alerts/', {
         method: 'GET',
         headers: {
             'X-Requested-With': 'XMLHttpRequest',
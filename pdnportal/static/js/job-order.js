@@ -523,11 +523,28 @@ function setupEventListeners() {
         });
     }
 
+    // Search runs on the server once the user stops typing
     const searchInput = document.querySelector('.JO-search-input');
     if (searchInput) {
-        searchInput.addEventListener('keyup', function() {
-            const searchText = this.value.toLowerCase();
-            filterAndPaginateTable(searchText);
+        let typingTimer;
+        searchInput.addEventListener('input', function() {
+            clearTimeout(typingTimer);
+            typingTimer = setTimeout(filterAndPaginateTable, this.value === '' ? 0 : 600);
+        });
+        searchInput.addEventListener('keypress', function(e) {
+            if (e.key === 'Enter') {
+                e.preventDefault();
+                clearTimeout(typingTimer);
+                filterAndPaginateTable();
+            }
+        });
+    }
+
+    const searchButton = document.querySelector('.JO-search-button');
+    if (searchButton) {
+        searchButton.addEventListener('click', function(e) {
+            e.preventDefault();
+            filterAndPaginateTable();
         });
     }
 
@@ -535,8 +552,7 @@ function setupEventListeners() {
     const filterSelect = document.querySelector('.JO-filter-select');
     if (filterSelect) {
         filterSelect.addEventListener('change', function() {
-            const searchText = searchInput ? searchInput.value.toLowerCase() : '';
-            filterAndPaginateTable(searchText);
+            filterAndPaginateTable();
         });
     }
 
@@ -1213,218 +1229,60 @@ function addToastStyles() {
 // Pagination Functionality
 // ========================================================================
 
-// Pagination variables
-let currentPage = 1;
-let rowsPerPage = 10;
-let filteredRows = [];
+// The table shows one page rendered by the server; searching, filtering and
+// paging reload it with the new query
 
 /**
  * Initialize pagination functionality
  */
 function initializePagination() {
-    // Get all table rows
-    const tableRows = document.querySelectorAll('.jo-table-row');
-    filteredRows = Array.from(tableRows);
-
-    // Set total items count
-    document.getElementById('jo-total-items').textContent = filteredRows.length;
-
-    // Update pagination display
-    updatePagination();
-
-    // Add event listeners to pagination buttons
-    document.getElementById('jo-prev-page').addEventListener('click', function() {
-        if (!this.classList.contains('disabled') && currentPage > 1) {
-            currentPage--;
-            updatePagination();
-        }
+    document.querySelectorAll('.JO-pagination [data-page]').forEach(button => {
+        button.addEventListener('click', function() {
+            const urlParams = new URLSearchParams(window.location.search);
+            loadRequestsPage(urlParams.get('search') || '', urlParams.get('filter') || 'all', this.dataset.page);
+        });
     });
 
-    document.getElementById('jo-next-page').addEventListener('click', function() {
-        const totalPages = Math.ceil(filteredRows.length / rowsPerPage);
-        if (!this.classList.contains('disabled') && currentPage < totalPages) {
-            currentPage++;
-            updatePagination();
-        }
+    // Animate the rows of the page
+    document.querySelectorAll('.jo-table-row').forEach((row, index) => {
+        row.style.animation = `JO-row-appear 0.5s ease forwards ${index * 0.05}s`;
     });
 }
 
 /**
- * Update pagination display and show appropriate rows
- */
-function updatePagination() {
-    const totalRows = filteredRows.length;
-    const totalPages = Math.ceil(totalRows / rowsPerPage);
-
-    // Update showing info
-    const start = totalRows === 0 ? 0 : (currentPage - 1) * rowsPerPage + 1;
-    const end = Math.min(currentPage * rowsPerPage, totalRows);
-    document.getElementById('jo-showing-start').textContent = start;
-    document.getElementById('jo-showing-end').textContent = end;
-    document.getElementById('jo-total-items').textContent = totalRows;
-
-    // Update pagination buttons state
-    const prevBtn = document.getElementById('jo-prev-page');
-    const nextBtn = document.getElementById('jo-next-page');
-
-    prevBtn.classList.toggle('disabled', currentPage === 1);
-    nextBtn.classList.toggle('disabled', currentPage === totalPages || totalPages === 0);
-
-    // Generate page numbers - simplified to match the design in the image
-    const paginationPages = document.getElementById('jo-pagination-pages');
-    paginationPages.innerHTML = '';
-
-    // Just show the current page number
-    if (totalPages > 0) {
-        paginationPages.appendChild(createPageButton(currentPage));
-    }
-
-    // Show/hide rows based on current page
-    showPageRows();
-}
-
-/**
- * Create a page number button
- * @param {number} pageNum - Page number
- * @returns {HTMLElement} - Page button element
- */
-function createPageButton(pageNum) {
-    const button = document.createElement('button');
-    button.className = 'JO-pagination-page';
-    button.textContent = pageNum;
-
-    if (pageNum === currentPage) {
-        button.classList.add('active');
-    }
-
-    button.addEventListener('click', function() {
-        currentPage = pageNum;
-        updatePagination();
-    });
-
-    return button;
-}
-
-/**
- * Create ellipsis element for pagination
- * @returns {HTMLElement} - Ellipsis element
- */
-function createEllipsis() {
-    const span = document.createElement('span');
-    span.className = 'JO-pagination-ellipsis';
-    span.textContent = '...';
-    return span;
-}
-
-/**
- * Show rows for the current page
+ * Reload the page with the given search, filter and page number
+ * @param {string} searchText - Text to search for
+ * @param {string} filterValue - Status to show, 'all' for every status
+ * @param {number|string} pageNumber - Page to show
  */
-function showPageRows() {
-    const noResultsElement = document.getElementById('jo-no-results');
-    const emptyRow = document.getElementById('jo-empty-row');
-
-    // Hide all rows first
-    const allRows = document.querySelectorAll('.jo-table-row');
-    allRows.forEach(row => {
-        row.style.display = 'none';
-    });
-
-    // Hide empty row if it exists
-    if (emptyRow) {
-        emptyRow.style.display = 'none';
+function loadRequestsPage(searchText, filterValue, pageNumber) {
+    const params = new URLSearchParams();
+    if (searchText) {
+        params.set('search', searchText);
     }
-
-    // Show no results message if no filtered rows
-    if (filteredRows.length === 0) {
-        if (noResultsElement) {
-            noResultsElement.style.display = 'flex';
-
-            // Make sure the table container has enough height to display the message properly
-            const tableContainer = document.querySelector('.JO-table-container');
-            if (tableContainer) {
-                tableContainer.style.minHeight = '300px';
-            }
-        }
-        return;
+    if (filterValue && filterValue !== 'all') {
+        params.set('filter', filterValue);
     }
-
-    // Hide no results message
-    if (noResultsElement) {
-        noResultsElement.style.display = 'none';
-
-        // Reset the table container min-height
-        const tableContainer = document.querySelector('.JO-table-container');
-        if (tableContainer) {
-            tableContainer.style.minHeight = '';
-        }
+    if (pageNumber && String(pageNumber) !== '1') {
+        params.set('page', pageNumber);
     }
 
-    // Calculate start and end indices for current page
-    const startIndex = (currentPage - 1) * rowsPerPage;
-    const endIndex = Math.min(startIndex + rowsPerPage, filteredRows.length);
-
-    // Show rows for current page with animation
-    for (let i = startIndex; i < endIndex; i++) {
-        const row = filteredRows[i];
-        row.style.display = '';
-
-        // Apply animation
-        row.style.animation = 'none';
-        row.offsetHeight; // Force reflow
-        row.style.animation = `JO-row-appear 0.5s ease forwards ${(i - startIndex) * 0.05}s`;
+    const query = params.toString();
+    if (query !== window.location.search.replace(/^\?/, '')) {
+        window.location.search = query;
     }
 }
 
 /**
- * Filter and paginate table based on search text and filter value
- * @param {string} searchText - Text to search for
+ * Search and filter the table from the first page
  */
-function filterAndPaginateTable(searchText) {
+function filterAndPaginateTable() {
+    const searchInput = document.querySelector('.JO-search-input');
     const filterSelect = document.querySelector('.JO-filter-select');
+    const searchText = searchInput ? searchInput.value.trim() : '';
     const filterValue = filterSelect ? filterSelect.value : 'all';
-    const allRows = document.querySelectorAll('.jo-table-row');
-    const tableContainer = document.querySelector('.JO-table-container');
-
-    // Save scroll position
-    const scrollPosition = tableContainer.scrollTop;
-
-    // Filter rows
-    filteredRows = Array.from(allRows).filter(row => {
-        const text = row.textContent.toLowerCase();
-        const matchesSearch = searchText === '' || text.includes(searchText);
-
-        const statusCell = row.querySelector('.JO-status');
-        const matchesFilter = filterValue === 'all' ||
-                             (statusCell && statusCell.classList.contains(`JO-status-${filterValue}`));
-
-        return matchesSearch && matchesFilter;
-    });
-
-    // Reset to first page
-    currentPage = 1;
-
-    // Update pagination
-    updatePagination();
 
-    // Restore scroll position
-    tableContainer.scrollTop = scrollPosition;
-
-    // Ensure the no-results message is properly contained within the table container
-    const noResultsElement = document.getElementById('jo-no-results');
-    if (noResultsElement && filteredRows.length === 0) {
-        noResultsElement.style.display = 'flex';
-        tableContainer.style.minHeight = '300px';
-    } else if (noResultsElement) {
-        noResultsElement.style.display = 'none';
-        tableContainer.style.minHeight = '';
-    }
-
-    // Make sure the empty state in Pending Approval section remains visible
-    // This ensures the "All caught up!" message doesn't disappear during search/filter operations
-    const pendingEmptyState = document.getElementById('pending-empty-state');
-    if (pendingEmptyState) {
-        pendingEmptyState.style.display = 'flex';
-    }
+    loadRequestsPage(searchText, filterValue, 1);
 }
 
 /**
@@ -341,75 +341,47 @@ function setupEventListeners() {
         });
     }
 
-    // Export form submission
-    // const exportForm = document.querySelector('#export-options-modal form');
-    // if (exportForm) {
-    //     exportForm.addEventListener('submit', function(e) {
-    //         e.preventDefault();
-
-    //         // Get form data
-    //         const formData = new FormData(this);
-    //         const startDate = formData.get('start_date');
-    //         const endDate = formData.get('end_date');
-    //         const format = formData.get('export_format');
-
-    //         // Validate dates
-    //         if (!startDate || !endDate) {
-    //             createToast('Please select both start and end dates', 'error');
-    //             return;
-    //         }
-
-    //         // Show loading state
-    //         const submitBtn = document.getElementById('confirm-export-btn');
-    //         if (submitBtn) {
-    //             submitBtn.classList.add('loading');
-    //             submitBtn.innerText = '';
-    //         }
-
-    //         // Send export request
-    //         fetch('/manhours/export-data/', {
-    //             method: 'POST',
-    //             body: formData
-    //         })
-    //         .then(response => {
-    //             if (!response.ok) {
-    //                 throw new Error('Export request failed');
-    //             }
-    //             return response.blob();
-    //         })
-    //         .then(blob => {
-    //             // Create download link
-    //             const url = window.URL.createObjectURL(blob);
-    //             const a = document.createElement('a');
-    //             a.style.display = 'none';
-    //             a.href = url;
-    //             a.download = `manhours_${startDate}_to_${endDate}.${format}`;
-    //             document.body.appendChild(a);
-    //             a.click();
-    //             window.URL.revokeObjectURL(url);
-
-    //             // Reset button and close modal
-    //             if (submitBtn) {
-    //                 submitBtn.classList.remove('loading');
-    //                 submitBtn.innerText = 'Export';
-    //             }
-
-    //             closeModal('export-options-modal');
-    //             createToast('Data exported successfully', 'success');
-    //         })
-    //         .catch(error => {
-    //             console.error('Export error:', error);
-
-    //             // Reset button
-    //             if (submitBtn) {
-    //                 submitBtn.classList.remove('loading');
-    //                 submitBtn.innerText = 'Export';
-    //             }
-
-    //             createToast('Failed to export data. Please try again.', 'error');
-    //         });
-    //     });
-    // }
+    // Export form submission, the workbook is built by a background job and downloaded once it is ready
+    const exportForm = document.querySelector('#export-options-modal form');
+    if (exportForm) {
+        exportForm.addEventListener('submit', function(e) {
+            e.preventDefault();
+
+            const submitBtn = this.querySelector('button[type="submit"]');
+            submitBtn.disabled = true;
+            submitBtn.innerText = 'Preparing...';
+
+            fetch(this.action, {
+                method: 'POST',
+                headers: { 'X-Requested-With': 'XMLHttpRequest' },
+                body: new FormData(this)
+            })
+            .then(response => {
+                if (!response.ok) {
+                    throw new Error('Export request failed');
+                }
+                return response.json();
+            })
+            .then(data => waitForJob(data.status_url, {
+                onProgress: job => {
+                    submitBtn.innerText = `Preparing... ${job.percent}%`;
+                }
+            }))
+            .then(job => {
+                window.location.href = job.download_url;
+                closeModal('export-options-modal');
+                createToast('Export ready, the download has started', 'success');
+            })
+            .catch(error => {
+                console.error('Export error:', error);
+                createToast('Failed to export data. Please try again.', 'error');
+            })
+            .finally(() => {
+                submitBtn.disabled = false;
+                submitBtn.innerText = 'Export';
+            });
+        });
+    }
 }
 
 /**
@@ -1031,7 +1003,7 @@ function fetchShiftOutputData(period, showLoading = true) {
     const url = `/manhours/chart-data/?type=shiftOutput&period=${period}`;
 
     // Fetch data from the API
-    fetch(url)
+    conditionalFetch(url)
         .then(response => {
             if (!response.ok) {
                 throw new Error('Network response was not ok');
@@ -1367,7 +1339,7 @@ function fetchMachinePerformance(period = 'month', showLoading = true) {
     }
 
     // Fetch data from the API with period parameter
-    fetch(`/manhours/machine-performance/?period=${period}`)
+    conditionalFetch(`/manhours/machine-performance/?period=${period}`)
         .then(response => {
             if (!response.ok) {
                 throw new Error('Network response was not ok');
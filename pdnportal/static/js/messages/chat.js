@@ -969,7 +969,7 @@ document.addEventListener('DOMContentLoaded', function() {
         // Add smooth-update class to messages container for transitions
         messagesContainer.classList.add('smooth-update');
 
-        fetch(`/chat/api/chats/${chatId}/`)
+        conditionalFetch(`/chat/api/chats/${chatId}/`)
             .then(response => {
                 if (!response.ok) {
                     throw new Error('Failed to refresh messages');
@@ -6141,7 +6141,7 @@ document.addEventListener('DOMContentLoaded', function() {
         // Only add it to the specific components being updated
         existingChatList.classList.add('no-transition');
 
-        fetch('/chat/api/chats/')
+        conditionalFetch('/chat/api/chats/')
             .then(response => {
                 if (!response.ok) {
                     throw new Error(`Failed to fetch chat list: ${response.status} ${response.statusText}`);
@@ -59,7 +59,7 @@ document.addEventListener('DOMContentLoaded', function() {
                 shiftFilter: shiftFilter.value
             });
     
-            const response = await fetch(`/monitoring/group-dashboard/${groupId}/data/?${params}`);
+            const response = await conditionalFetch(`/monitoring/group-dashboard/${groupId}/data/?${params}`);
             
             if (!response.ok) {
                 let errorMsg = `Failed to fetch dashboard data: ${response.status} ${response.statusText}`;
@@ -369,7 +369,7 @@ function startChartAutoRefresh() {
  * Fetch latest production data from the server
  */
 function fetchLatestData() {
-    fetch(window.location.href, {
+    conditionalFetch(window.location.href, {
         headers: {
             'X-Requested-With': 'XMLHttpRequest',
             'X-CSRFToken': csrfToken
@@ -157,6 +157,16 @@ function initializeFormEvents() {
         });
     }
 
+    // Next page of available employees
+    const loadMoreEmployees = document.getElementById('available-employees-more');
+    if (loadMoreEmployees) {
+        loadMoreEmployees.addEventListener('click', function() {
+            if (availableEmployees.nextCursor) {
+                loadAvailableEmployees(availableEmployees.nextCursor);
+            }
+        });
+    }
+
     // Add employee buttons
     document.addEventListener('click', function(e) {
         if (e.target.closest('.OT-add-employee')) {
@@ -875,97 +885,123 @@ function initializeCharts() {
     }
 }
 
+/**
+ * Fetch a page of the employee directory
+ * @param {string} search - ID number or name prefix
+ * @param {string|null} cursor - next_cursor of the previous page, null for the first page
+ */
+function fetchEmployeePage(search, cursor) {
+    const params = new URLSearchParams();
+    if (search) params.set('search', search);
+    if (cursor) params.set('cursor', cursor);
+
+    return fetch(`/overtime/api/employees/?${params.toString()}`, {
+        headers: { 'X-Requested-With': 'XMLHttpRequest' }
+    })
+    .then(response => {
+        if (!response.ok) {
+            throw new Error('Failed to load employees');
+        }
+        return response.json();
+    });
+}
+
+// Employee groups table paging: the cursor each visited page was loaded with
+const employeeDirectory = {
+    cursors: [null],
+    page: 0,
+    search: '',
+    pageSize: 25
+};
+
 /**
  * Initialize pagination for the employee groups table
+ * Pages are loaded from the server one at a time, following the API's next_cursor
  */
 function initializePagination() {
     const table = document.getElementById('employee-groups-table');
     if (!table) return;
 
-    const tbody = table.querySelector('tbody');
-    const rows = tbody.querySelectorAll('tr');
-    const rowsPerPage = 10;
-    const totalPages = Math.ceil(rows.length / rowsPerPage);
-
-    // Update pagination info
-    document.getElementById('showing-start').textContent = rows.length > 0 ? '1' : '0';
-    document.getElementById('showing-end').textContent = Math.min(rowsPerPage, rows.length);
-    document.getElementById('total-entries').textContent = rows.length;
-
-    // Create pagination buttons
-    const paginationPages = document.querySelector('.OT-pagination-pages');
-    if (paginationPages) {
-        paginationPages.innerHTML = '';
-
-        for (let i = 1; i <= totalPages; i++) {
-            const pageButton = document.createElement('button');
-            pageButton.className = 'OT-pagination-page' + (i === 1 ? ' active' : '');
-            pageButton.textContent = i;
-            pageButton.addEventListener('click', function() {
-                goToPage(i);
-            });
-            paginationPages.appendChild(pageButton);
-        }
-    }
-
-    // Initialize prev/next buttons
     const prevButton = document.getElementById('prev-page');
     const nextButton = document.getElementById('next-page');
 
     if (prevButton) {
-        prevButton.disabled = true;
         prevButton.addEventListener('click', function() {
-            const activePage = document.querySelector('.OT-pagination-page.active');
-            if (activePage && activePage.textContent > 1) {
-                goToPage(parseInt(activePage.textContent) - 1);
+            if (employeeDirectory.page > 0) {
+                loadEmployeeDirectoryPage(employeeDirectory.page - 1);
             }
         });
     }
 
     if (nextButton) {
-        nextButton.disabled = totalPages <= 1;
         nextButton.addEventListener('click', function() {
-            const activePage = document.querySelector('.OT-pagination-page.active');
-            if (activePage && parseInt(activePage.textContent) < totalPages) {
-                goToPage(parseInt(activePage.textContent) + 1);
+            if (employeeDirectory.cursors[employeeDirectory.page + 1]) {
+                loadEmployeeDirectoryPage(employeeDirectory.page + 1);
             }
         });
     }
 
-    // Function to go to a specific page
-    function goToPage(page) {
-        // Update active page button
-        const pageButtons = document.querySelectorAll('.OT-pagination-page');
-        pageButtons.forEach(button => {
-            button.classList.remove('active');
-            if (parseInt(button.textContent) === page) {
-                button.classList.add('active');
-            }
-        });
-
-        // Update prev/next button states
-        if (prevButton) prevButton.disabled = page === 1;
-        if (nextButton) nextButton.disabled = page === totalPages;
+    loadEmployeeDirectoryPage(0);
+}
 
-        // Show/hide rows based on current page
-        const startIndex = (page - 1) * rowsPerPage;
-        const endIndex = startIndex + rowsPerPage;
+/**
+ * Load one page of the employee groups table
+ * @param {number} page - Zero based page index, must already have a cursor
+ */
+function loadEmployeeDirectoryPage(page) {
+    const tbody = document.querySelector('#employee-groups-table tbody');
+    const search = employeeDirectory.search;
+
+    fetchEmployeePage(search, employeeDirectory.cursors[page])
+    .then(data => {
+        // A newer search replaced this one while it was loading
+        if (search !== employeeDirectory.search) return;
+
+        employeeDirectory.page = page;
+        employeeDirectory.cursors = employeeDirectory.cursors.slice(0, page + 1);
+        if (data.next_cursor) {
+            employeeDirectory.cursors.push(data.next_cursor);
+        }
 
-        rows.forEach((row, index) => {
-            if (index >= startIndex && index < endIndex) {
-                row.style.display = '';
-            } else {
-                row.style.display = 'none';
-            }
-        });
+        if (data.employees.length === 0) {
+            tbody.innerHTML = '<tr><td colspan="6" class="OT-empty-table">No employees found.</td></tr>';
+        } else {
+            tbody.innerHTML = data.employees.map(employee => `
+                <tr data-employee-id="${employee.id}">
+                    <td data-label="Employee ID">${employee.id_number}</td>
+                    <td data-label="Name">${employee.name}</td>
+                    <td data-label="Department">${employee.department || '-'}</td>
+                    <td data-label="Line">${employee.line || '-'}</td>
+                    <td data-label="Shuttle Service">${employee.shuttle_service || '-'}</td>
+                    <td data-label="Actions">
+                        <button class="OT-button OT-text-button OT-edit-group-btn" data-employee-id="${employee.id}" title="Edit Group">
+                            <i class="fas fa-edit"></i> Edit Group
+                        </button>
+                        <button class="OT-button OT-text-button OT-danger-button OT-delete-employee-btn" data-employee-id="${employee.id}" title="Delete">
+                            <i class="fas fa-trash-alt"></i> Delete
+                        </button>
+                    </td>
+                </tr>
+            `).join('');
+        }
 
         // Update showing info
-        document.getElementById('showing-start').textContent = rows.length > 0 ? startIndex + 1 : '0';
-        document.getElementById('showing-end').textContent = Math.min(endIndex, rows.length);
-    }
+        const start = page * employeeDirectory.pageSize;
+        document.getElementById('showing-start').textContent = data.employees.length > 0 ? start + 1 : '0';
+        document.getElementById('showing-end').textContent = start + data.employees.length;
+        if (data.facets) {
+            document.getElementById('total-entries').textContent = data.facets.total;
+        }
 
-    // Initialize with page 1
-    goToPage(1);
+        const activePage = document.querySelector('#employee-groups-table-pages .OT-pagination-page');
+        if (activePage) activePage.textContent = page + 1;
+        document.getElementById('prev-page').disabled = page === 0;
+        document.getElementById('next-page').disabled = !data.next_cursor;
+    })
+    .catch(error => {
+        console.error('Error loading employees:', error);
+        showToast('Failed to load employees. Please try again.', 'error');
+    });
 }
 
 /**
@@ -1118,38 +1154,29 @@ function initializeGroupsTable() {
         });
     }
 
-    // Search functionality
+    // Search functionality, the ID number or name prefix is searched on the server
     const searchInput = document.getElementById('group-search-input');
     if (searchInput) {
+        let searchTimer = null;
         searchInput.addEventListener('input', function() {
-            const searchTerm = this.value.toLowerCase();
-            const tableRows = document.querySelectorAll('#employee-groups-table tbody tr');
-
-            tableRows.forEach(row => {
-                const employeeId = row.querySelector('td[data-label="Employee ID"]').textContent.toLowerCase();
-                const employeeName = row.querySelector('td[data-label="Name"]').textContent.toLowerCase();
-                const department = row.querySelector('td[data-label="Department"]').textContent.toLowerCase();
-                const line = row.querySelector('td[data-label="Line"]').textContent.toLowerCase();
-                const shuttle = row.querySelector('td[data-label="Shuttle Service"]').textContent.toLowerCase();
-
-                if (employeeId.includes(searchTerm) ||
-                    employeeName.includes(searchTerm) ||
-                    department.includes(searchTerm) ||
-                    line.includes(searchTerm) ||
-                    shuttle.includes(searchTerm)) {
-                    row.style.display = '';
-                } else {
-                    row.style.display = 'none';
-                }
-            });
+            clearTimeout(searchTimer);
+            searchTimer = setTimeout(() => {
+                employeeDirectory.search = this.value.trim();
+                employeeDirectory.cursors = [null];
+                loadEmployeeDirectoryPage(0);
+            }, 300);
         });
     }
 
-    // Edit Group button functionality
-    const editGroupButtons = document.querySelectorAll('.OT-edit-group-btn');
-    editGroupButtons.forEach(button => {
-        button.addEventListener('click', function() {
-            const employeeId = this.getAttribute('data-employee-id');
+    // Rows are replaced on every page load, so the row buttons are handled on the table
+    const groupsTable = document.getElementById('employee-groups-table');
+    if (!groupsTable) return;
+
+    groupsTable.addEventListener('click', function(e) {
+        // Edit Group button functionality
+        const editButton = e.target.closest('.OT-edit-group-btn');
+        if (editButton) {
+            const employeeId = editButton.getAttribute('data-employee-id');
 
             // Open the group modal
             openModal('group-modal');
@@ -1161,32 +1188,21 @@ function initializeGroupsTable() {
             // For now, just show a toast notification
             console.log(`Editing group for employee ${employeeId}`);
             showToast(`Opening group editor for employee`, 'info');
+            return;
+        }
 
-            // This would be replaced with actual API call to get the employee's group
-            // and then populate the modal with that data
-        });
-    });
+        // Delete button functionality
+        const deleteButton = e.target.closest('.OT-delete-employee-btn');
+        if (deleteButton) {
+            const employeeId = deleteButton.getAttribute('data-employee-id');
 
-    // Delete button functionality
-    const deleteButtons = document.querySelectorAll('.OT-delete-employee-btn');
-    deleteButtons.forEach(button => {
-        button.addEventListener('click', function() {
-            const employeeId = this.getAttribute('data-employee-id');
-            const row = document.querySelector(`tr[data-employee-id="${employeeId}"]`);
-
-            if (row) {
-                // Show a confirmation dialog
-                if (confirm('Are you sure you want to remove this employee from their group?')) {
-                    // In a real implementation, this would be an API call
-                    console.log(`Removed employee ${employeeId} from group`);
-                    showToast(`Employee removed from group successfully`, 'success');
-
-                    // For demonstration purposes, we'll just hide the row
-                    // In a real implementation, this would be handled by the server response
-                    // row.style.display = 'none';
-                }
+            // Show a confirmation dialog
+            if (confirm('Are you sure you want to remove this employee from their group?')) {
+                // In a real implementation, this would be an API call
+                console.log(`Removed employee ${employeeId} from group`);
+                showToast(`Employee removed from group successfully`, 'success');
             }
-        });
+        }
     });
 }
 
@@ -1452,6 +1468,14 @@ function resetGroupModal() {
     reloadAvailableEmployees();
 }
 
+// Group modal available employees: the search shown, the cursor of its next page and
+// a counter that tells a stale response from the latest reload
+const availableEmployees = {
+    search: '',
+    nextCursor: null,
+    reload: 0
+};
+
 /**
  * Reload available employees from the server
  */
@@ -1467,28 +1491,41 @@ function reloadAvailableEmployees() {
         </div>
     `;
 
-    // In a real implementation, this would be an API call to get all employees
-    // For now, we'll use the template's employees
-    setTimeout(() => {
-        // Get all employee elements from the template
-        const employeeElements = document.querySelectorAll('#available-employees-template .OT-employee-item');
+    availableEmployees.search = document.getElementById('employee-search').value.trim();
+    availableEmployees.nextCursor = null;
+    availableEmployees.reload += 1;
+    loadAvailableEmployees(null);
+}
+
+/**
+ * Append a page of employees to the available list, leaving out the selected ones
+ * @param {string|null} cursor - null for the first page
+ */
+function loadAvailableEmployees(cursor) {
+    const availableEmployeesList = document.getElementById('available-employees');
+    const loadMoreButton = document.getElementById('available-employees-more');
+    const reload = availableEmployees.reload;
+
+    if (loadMoreButton) loadMoreButton.disabled = true;
 
-        if (employeeElements.length > 0) {
-            // Clear the loading message
+    fetchEmployeePage(availableEmployees.search, cursor)
+    .then(data => {
+        // The list was reloaded, e.g. for a newer search, while this page was loading
+        if (reload !== availableEmployees.reload) return;
+
+        if (!cursor) {
             availableEmployeesList.innerHTML = '';
+        }
 
-            // Clone and add each employee to the available list
-            employeeElements.forEach(employee => {
-                const clone = employee.cloneNode(true);
-                availableEmployeesList.appendChild(clone);
-            });
-        } else {
-            // If no template exists, use the sample employees
-            const employees = getSampleEmployees();
-            let html = '';
+        const selectedIds = new Set(
+            Array.from(document.querySelectorAll('#selected-employees .OT-employee-item'))
+                .map(item => item.getAttribute('data-id'))
+        );
 
-            employees.forEach(employee => {
-                html += `
+        data.employees
+            .filter(employee => !selectedIds.has(employee.id.toString()))
+            .forEach(employee => {
+                availableEmployeesList.insertAdjacentHTML('beforeend', `
                     <div class="OT-employee-item" data-id="${employee.id}">
                         <div class="OT-employee-info">
                             <p class="OT-employee-id">${employee.id_number}</p>
@@ -1498,12 +1535,29 @@ function reloadAvailableEmployees() {
                             <i class="fas fa-plus"></i>
                         </button>
                     </div>
-                `;
+                `);
             });
 
-            availableEmployeesList.innerHTML = html;
+        if (!availableEmployeesList.querySelector('.OT-employee-item') && !data.next_cursor) {
+            availableEmployeesList.innerHTML = `
+                <div class="OT-empty-selection">
+                    <i class="fas fa-users"></i>
+                    <p>No employees found</p>
+                </div>
+            `;
         }
-    }, 300);
+
+        availableEmployees.nextCursor = data.next_cursor;
+        if (loadMoreButton) {
+            loadMoreButton.style.display = data.next_cursor ? '' : 'none';
+            loadMoreButton.disabled = false;
+        }
+    })
+    .catch(error => {
+        console.error('Error loading employees:', error);
+        showToast('Failed to load employees. Please try again.', 'error');
+        if (loadMoreButton) loadMoreButton.disabled = false;
+    });
 }
 
 /**
@@ -1613,68 +1667,9 @@ function loadGroupData(groupId) {
         // Update group name
         document.getElementById('group-name').value = groupData.name;
 
-        // Get all available employees from the template
-        const allEmployees = [];
-        const templateEmployees = document.querySelectorAll('#available-employees-template .OT-employee-item');
-
-        templateEmployees.forEach(empElement => {
-            const id = empElement.getAttribute('data-id');
-            const idNumber = empElement.querySelector('.OT-employee-id').textContent;
-            const name = empElement.querySelector('.OT-employee-name').textContent;
-
-            allEmployees.push({
-                id: id,
-                id_number: idNumber,
-                name: name
-            });
-        });
-
-        // If no template employees, use sample data
-        if (allEmployees.length === 0) {
-            Array.prototype.push.apply(allEmployees, getSampleEmployees());
-        }
-
-        // Create a map of group employee IDs for quick lookup
-        const groupEmployeeIds = new Set(groupData.employees.map(emp => emp.id.toString()));
-
-        // Get the group members
-        const groupMembers = allEmployees.filter(emp => groupEmployeeIds.has(emp.id.toString()));
-
-        // Filter out employees that are already in the group
-        const availableEmployees = allEmployees.filter(emp => !groupEmployeeIds.has(emp.id.toString()));
-
-        // Update available employees list
-        let availableHtml = '';
-        if (availableEmployees.length === 0) {
-            availableHtml = `
-                <div class="OT-empty-selection">
-                    <i class="fas fa-users"></i>
-                    <p>All employees are already in this group</p>
-                </div>
-            `;
-        } else {
-            availableEmployees.forEach(employee => {
-                availableHtml += `
-                    <div class="OT-employee-item" data-id="${employee.id}">
-                        <div class="OT-employee-info">
-                            <p class="OT-employee-id">${employee.id_number}</p>
-                            <p class="OT-employee-name">${employee.name}</p>
-                        </div>
-                        <button type="button" class="OT-button OT-icon-button OT-add-employee">
-                            <i class="fas fa-plus"></i>
-                        </button>
-                    </div>
-                `;
-            });
-        }
-
-        // Update the available employees container
-        if (availableEmployeesContainer) {
-            availableEmployeesContainer.innerHTML = availableHtml;
-        }
-
-        // Update selected employees
-        updateSelectedEmployees(groupMembers);
+        // Update selected employees, then list the employees outside the group
+        updateSelectedEmployees(groupData.employees);
+        reloadAvailableEmployees();
     })
     .catch(error => {
         console.error('Error loading group data:', error);
@@ -1772,35 +1767,13 @@ function resetSelectedEmployees() {
 }
 
 /**
- * Filter available employees based on search query
+ * Search available employees by ID number or name prefix
  * @param {string} query - The search query
  */
+let availableEmployeesSearchTimer = null;
 function filterAvailableEmployees(query) {
-    const availableEmployees = document.querySelectorAll('#available-employees .OT-employee-item');
-
-    if (!query) {
-        // If no query, show all employees
-        availableEmployees.forEach(employee => {
-            employee.style.display = 'flex';
-        });
-        return;
-    }
-
-    // Convert query to lowercase for case-insensitive search
-    query = query.toLowerCase();
-
-    // Filter employees
-    availableEmployees.forEach(employee => {
-        const id = employee.querySelector('.OT-employee-id').textContent.toLowerCase();
-        const name = employee.querySelector('.OT-employee-name').textContent.toLowerCase();
-
-        // Show employee if any field contains the query
-        if (id.includes(query) || name.includes(query)) {
-            employee.style.display = 'flex';
-        } else {
-            employee.style.display = 'none';
-        }
-    });
+    clearTimeout(availableEmployeesSearchTimer);
+    availableEmployeesSearchTimer = setTimeout(reloadAvailableEmployees, 300);
 }
 
 /**